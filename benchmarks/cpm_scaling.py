@@ -0,0 +1,79 @@
+"""Critical Path Method timings on large synthetic schedules.
+
+Builds P6-sized activity networks with mixed FS/SS/FF/SF links and lags,
+then times network construction, the forward/backward pass, rendering the
+float report rows and incremental single-activity duration edits (median
+and 90th percentile over random edits).
+
+    PYTHONPATH=src python benchmarks/cpm_scaling.py --activities 50000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from construction.scheduling.cpm import CPMActivity, CPMNetwork, Relationship
+from construction.scheduling.incremental import IncrementalCPM
+
+# Roughly the mix of a contractor P6 schedule: mostly FS, some SS/FF
+_TYPES = ("FS",) * 7 + ("SS", "SS", "FF")
+
+
+def synthetic_schedule(n: int, seed: int = 0) -> list[CPMActivity]:
+    """Random DAG where each activity links to up to 3 of the previous 50."""
+    rng = np.random.default_rng(seed)
+    activities = []
+    for i in range(n):
+        preds = sorted(set(rng.integers(max(0, i - 50), i, size=3).tolist())) if i else []
+        links = tuple(
+            Relationship(f"A{j}", _TYPES[rng.integers(len(_TYPES))], float(rng.integers(0, 3)))
+            for j in preds
+        )
+        activities.append(CPMActivity(f"A{i}", f"A{i}", float(rng.integers(1, 30)), links))
+    return activities
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, nargs="+", default=[5000, 20000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--edits", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'activities':>10} {'links':>8} {'levels':>7} {'build s':>8} {'pass s':>8}"
+        f" {'rows s':>8} {'edit p50 ms':>12} {'edit p90 ms':>12}"
+    )
+    for n in args.activities:
+        activities = synthetic_schedule(n)
+        start = time.perf_counter()
+        network = CPMNetwork(activities)
+        build = time.perf_counter() - start
+        passes = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = network.compute()
+            passes.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        result.records()
+        rows = time.perf_counter() - start
+
+        schedule = IncrementalCPM(network)
+        rng = np.random.default_rng(1)
+        edits = []
+        for _ in range(args.edits):
+            activity_id = network.ids[rng.integers(n)]
+            duration = float(rng.integers(1, 30))
+            start = time.perf_counter()
+            schedule.update(activity_id, duration=duration)
+            edits.append((time.perf_counter() - start) * 1000)
+        p50, p90 = np.percentile(edits, [50, 90])
+        print(
+            f"{n:>10} {len(network.edge_src):>8} {network.n_levels:>7}"
+            f" {build:>8.3f} {min(passes):>8.3f} {rows:>8.3f} {p50:>12.3f} {p90:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
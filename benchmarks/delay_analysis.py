@@ -0,0 +1,89 @@
+"""Time impact / windows delay analysis timings on synthetic schedules.
+
+Builds the ``cpm_scaling`` synthetic schedule as monthly updates (one
+snapshot per window), scatters one-activity fragnets from three parties
+across the windows, and times a TIA of every event against the first
+update and the windows analysis per worker count.
+
+    PYTHONPATH=src python benchmarks/delay_analysis.py --activities 50000 --events 300
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+import numpy as np
+from cpm_scaling import synthetic_schedule
+
+from construction.scheduling.cpm import CPMNetwork
+from construction.scheduling.delay import DelayEvent, time_impact_analysis, windows_analysis
+from construction.scheduling.snapshot import ScheduleSnapshot
+
+_START = date(2026, 3, 2)
+_PARTIES = ("Owner", "Contractor", "Force Majeure")
+
+
+def monthly_updates(n: int, windows: int) -> list[ScheduleSnapshot]:
+    activities = synthetic_schedule(n)
+    return [
+        ScheduleSnapshot.from_result(
+            CPMNetwork(activities, start=_START + timedelta(days=30 * w)).compute(),
+            label=f"Update {w}",
+        )
+        for w in range(windows)
+    ]
+
+
+def delay_events(
+    snapshots: list[ScheduleSnapshot], n_events: int, seed: int = 3
+) -> list[DelayEvent]:
+    """One-activity fragnets on each update's next 200 activities, dated in its window."""
+    rng = np.random.default_rng(seed)
+    events = []
+    for snapshot in snapshots:
+        upcoming = np.argsort(snapshot.start, kind="stable")[1:200]
+        for k in rng.choice(upcoming, n_events // len(snapshots)).tolist():
+            day = snapshot.data_date + timedelta(days=int(rng.integers(0, 30)))
+            i = len(events)
+            events.append(
+                DelayEvent.from_record(
+                    {
+                        "id": f"E{i}",
+                        "party": _PARTIES[i % len(_PARTIES)],
+                        "activity": str(snapshot.ids[k]),
+                        "days": int(rng.integers(5, 60)),
+                        "date": min(day, snapshot.start[k].item()).isoformat(),
+                    }
+                )
+            )
+    return events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, default=50000)
+    parser.add_argument("--events", type=int, default=300)
+    parser.add_argument("--windows", type=int, default=12)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    snapshots = monthly_updates(args.activities, args.windows)
+    events = delay_events(snapshots, args.events)
+
+    start = time.perf_counter()
+    tia = time_impact_analysis(snapshots[0], events)
+    print(
+        f"TIA: {args.events} events on {args.activities} activities in"
+        f" {time.perf_counter() - start:.2f} s, delay {tia.delay_days:.1f} working days"
+    )
+    print(f"{'workers':>7} {'windows':>7} {'seconds':>8} {'delay days':>11}")
+    for workers in args.workers:
+        start = time.perf_counter()
+        windows = windows_analysis(snapshots, events, workers=workers)
+        elapsed = time.perf_counter() - start
+        delay = sum(window.delay_days for window in windows)
+        print(f"{workers:>7} {len(windows):>7} {elapsed:>8.2f} {delay:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Inter-agent event transport throughput and end-to-end latency.
+
+Publishes ``--messages`` distinct agent events on a fresh channel through
+``AgentPubSub`` (PUBLISH/SUBSCRIBE) and ``AgentStreamBus`` (XADD +
+XREADGROUP), with one subscriber listening in the same process, and
+reports published and delivered messages per second and the p50/p99 time
+from ``publish`` to the subscriber's callback. Needs a Redis server at
+``REDIS_URL``; dedup keys are written with a 60 s TTL.
+
+    REDIS_URL=redis://localhost:6379/0 PYTHONPATH=src python benchmarks/event_bus.py
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+from construction.redis_.client import close_redis_pool, get_redis_client
+from construction.redis_.pubsub import AgentPubSub
+from construction.redis_.streams import AgentStreamBus
+
+
+async def run(transport: str, messages: int, timeout: float) -> dict:
+    client = await get_redis_client()
+    channel = f"bench:events:{uuid.uuid4().hex}"
+    bus = AgentPubSub(client) if transport == "pubsub" else AgentStreamBus(client, block_ms=100)
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def callback(data: dict) -> None:
+        latencies.append(time.perf_counter() - data["sent"])
+        if len(latencies) == messages:
+            done.set()
+
+    await bus.subscribe(channel, callback)
+    await bus.start_listening()
+    try:
+        start = time.perf_counter()
+        for i in range(messages):
+            await bus.publish(channel, {"n": i, "sent": time.perf_counter()})
+        published = time.perf_counter() - start
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except TimeoutError:
+            pass
+        delivered = time.perf_counter() - start
+    finally:
+        await bus.stop()
+        if transport == "streams":
+            await client.delete(channel)
+    await close_redis_pool()
+    latencies.sort()
+    return {
+        "received": len(latencies),
+        "publish_rate": messages / published,
+        "delivery_rate": len(latencies) / delivered,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else float("nan"),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else float("nan"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+    # Settings are read when the buses are built
+    os.environ.setdefault("DEDUP_TTL_SECONDS", "60")
+
+    print(
+        f"{'transport':>9} {'received':>8} {'publish/s':>10} {'deliver/s':>10}"
+        f" {'p50 ms':>7} {'p99 ms':>7}"
+    )
+    for transport in ("pubsub", "streams"):
+        result = asyncio.run(run(transport, args.messages, args.timeout))
+        print(
+            f"{transport:>9} {result['received']:>8} {result['publish_rate']:>10.0f}"
+            f" {result['delivery_rate']:>10.0f} {result['p50_ms']:>7.2f} {result['p99_ms']:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Monte Carlo throughput versus process-pool size.
+
+Runs the same seeded simulation on a synthetic activity network with 1, 2,
+4, ... workers, prints iterations per second and speedup, and checks that
+every worker count produced bit-for-bit identical results.
+
+    PYTHONPATH=src python benchmarks/monte_carlo_scaling.py --activities 5000
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from construction.scheduling.monte_carlo import simulate
+from construction.scheduling.network import ActivitySpec, ScheduleNetwork
+
+
+def synthetic_network(n: int, seed: int = 0) -> ScheduleNetwork:
+    """Random DAG where each activity depends on up to 3 of the previous 50."""
+    rng = np.random.default_rng(seed)
+    specs = []
+    for i in range(n):
+        preds = {f"A{j}" for j in rng.integers(max(0, i - 50), i, size=3)} if i else set()
+        mode = float(rng.integers(2, 30))
+        specs.append(ActivitySpec(f"A{i}", f"A{i}", mode * 0.8, mode, mode * 1.5, tuple(preds)))
+    return ScheduleNetwork(specs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    network = synthetic_network(args.activities)
+    counts = [1]
+    while counts[-1] * 2 <= args.max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != args.max_workers:
+        counts.append(args.max_workers)
+
+    print(f"{args.activities} activities x {args.iterations} iterations, seed {args.seed}")
+    print(f"{'workers':>7} {'seconds':>8} {'iter/s':>10} {'speedup':>8}")
+    reference = None
+    base = None
+    for workers in counts:
+        start = time.perf_counter()
+        result = simulate(
+            network,
+            args.iterations,
+            seed=args.seed,
+            batch_size=args.batch_size,
+            workers=workers,
+        )
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print(
+            f"{workers:>7} {elapsed:>8.2f} {args.iterations / elapsed:>10.0f}"
+            f" {base / elapsed:>7.2f}x"
+        )
+        if reference is None:
+            reference = result
+        elif not (
+            np.array_equal(result.finish_digest.means, reference.finish_digest.means)
+            and np.array_equal(result.criticality, reference.criticality)
+        ):
+            raise SystemExit(f"results with {workers} workers differ from 1 worker")
+    print("results identical across worker counts")
+
+
+if __name__ == "__main__":
+    main()
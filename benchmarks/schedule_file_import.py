@@ -0,0 +1,131 @@
+"""Streaming XER / MSPDI import throughput and memory ceiling.
+
+Writes the ``cpm_scaling`` synthetic schedule as a P6 XER and an MS Project
+XML file, then streams each through ``ScheduleImporter`` into a sink that
+only counts rows, reporting file size, rows per second and the peak Python
+heap (tracemalloc, on a second run) against the file size.
+
+    PYTHONPATH=src python benchmarks/schedule_file_import.py --activities 100000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+from cpm_scaling import synthetic_schedule
+
+from construction.integrations.schedule_files import schedule_file_source
+from construction.integrations.schedule_import import ScheduleImporter
+
+_START = date(2026, 3, 2)
+_CLNDR = (
+    "(0||CalendarData()((0||DaysOfWeek()((0||1()())"
+    + "".join(f"(0||{d}()((0||0(s|08:00|f|16:00)())))" for d in range(2, 7))
+    + "(0||7()()))(0||Exceptions()()))"
+)
+_MSP_TYPES = {"FF": 0, "FS": 1, "SF": 2, "SS": 3}
+
+
+class CountingSink:
+    def __init__(self):
+        self.rows = 0
+
+    async def load_checkpoint(self, project_id, source):
+        return None
+
+    async def activity_hashes(self, project_id):
+        return {}
+
+    async def write_batch(self, project_id, source, rows, checkpoint, keep=None):
+        self.rows += len(rows)
+        return len(rows), 0
+
+
+def write_xer(path: Path, activities) -> None:
+    with path.open("w", encoding="cp1252", newline="") as f:
+        f.write("ERMHDR\t19.12\t2026-03-01\tProject\tbench\r\n")
+        f.write("%T\tCALENDAR\r\n%F\tclndr_id\tclndr_name\tday_hr_cnt\tclndr_data\r\n")
+        f.write(f"%R\t1\tStandard\t8\t{_CLNDR}\r\n")
+        f.write("%T\tTASK\r\n%F\ttask_id\tproj_id\tclndr_id\ttask_code\ttask_name")
+        f.write("\ttotal_float_hr_cnt\tearly_start_date\tearly_end_date\r\n")
+        for i, activity in enumerate(activities):
+            end = _START + timedelta(days=int(activity.duration))
+            f.write(
+                f"%R\t{i}\t1\t1\t{activity.id}\t{activity.name}\t{(i % 5) * 8}"
+                f"\t{_START} 08:00\t{end} 16:00\r\n"
+            )
+        f.write(
+            "%T\tTASKPRED\r\n%F\ttask_pred_id\ttask_id\tpred_task_id\tpred_type\tlag_hr_cnt\r\n"
+        )
+        n = 0
+        for i, activity in enumerate(activities):
+            for link in activity.predecessors:
+                n += 1
+                f.write(f"%R\t{n}\t{i}\t{link.predecessor[1:]}\tPR_{link.type}\t{link.lag * 8}\r\n")
+        f.write("%E\r\n")
+
+
+def write_mspdi(path: Path, activities) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<Project xmlns="http://schemas.microsoft.com/project">\n')
+        f.write("<MinutesPerDay>480</MinutesPerDay><Tasks>\n")
+        for i, activity in enumerate(activities, start=1):
+            end = _START + timedelta(days=int(activity.duration))
+            links = "".join(
+                f"<PredecessorLink><PredecessorUID>{int(link.predecessor[1:]) + 1}"
+                f"</PredecessorUID><Type>{_MSP_TYPES[link.type]}</Type>"
+                f"<LinkLag>{int(link.lag * 4800)}</LinkLag><LagFormat>7</LagFormat>"
+                "</PredecessorLink>"
+                for link in activity.predecessors
+            )
+            f.write(
+                f"<Task><UID>{i}</UID><ID>{i}</ID><Name>{activity.name}</Name>"
+                f"<Start>{_START}T08:00:00</Start><Finish>{end}T16:00:00</Finish>"
+                f"<Duration>PT{int(activity.duration) * 8}H0M0S</Duration>"
+                f"<TotalSlack>{(i % 5) * 4800}</TotalSlack>{links}</Task>\n"
+            )
+        f.write("</Tasks></Project>\n")
+
+
+async def import_file(path: Path) -> tuple[int, float]:
+    sink = CountingSink()
+    start = time.perf_counter()
+    await ScheduleImporter(sink).run(uuid.uuid4(), schedule_file_source(path))
+    return sink.rows, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    print(
+        f"{'format':>6} {'activities':>10} {'file MB':>8} {'import s':>9}"
+        f" {'rows/s':>9} {'peak MB':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.activities:
+            activities = synthetic_schedule(n)
+            for kind, writer in (("xer", write_xer), ("xml", write_mspdi)):
+                path = Path(tmp) / f"schedule_{n}.{kind}"
+                writer(path, activities)
+                rows, elapsed = asyncio.run(import_file(path))
+                tracemalloc.start()
+                asyncio.run(import_file(path))
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(
+                    f"{kind:>6} {rows:>10} {path.stat().st_size / 1e6:>8.1f} {elapsed:>9.2f}"
+                    f" {rows / elapsed:>9.0f} {peak / 1e6:>8.1f}"
+                )
+                path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Schedule snapshot and diff timings on synthetic schedules.
+
+Snapshots the ``cpm_scaling`` synthetic schedule, then an update with 1% of
+durations slipped and 1% of activities re-linked, and times the diff, its
+JSON summary and the stored payload round-trip.
+
+    PYTHONPATH=src python benchmarks/snapshot_diff.py --activities 50000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from cpm_scaling import synthetic_schedule
+
+from construction.scheduling.cpm import CPMActivity, CPMNetwork, Relationship
+from construction.scheduling.snapshot import ScheduleSnapshot, diff_snapshots
+
+
+def updated_schedule(activities: list[CPMActivity], seed: int = 1) -> list[CPMActivity]:
+    """Slip 1% of durations by 3 days and re-link 1% of activities."""
+    rng = np.random.default_rng(seed)
+    n = len(activities)
+    slipped = set(rng.integers(0, n, max(n // 100, 1)).tolist())
+    relinked = set(rng.integers(1, n, max(n // 100, 1)).tolist())
+    updated = []
+    for i, activity in enumerate(activities):
+        duration = activity.duration + 3 if i in slipped else activity.duration
+        links = activity.predecessors
+        if i in relinked:
+            links = (Relationship(f"A{rng.integers(max(0, i - 50), i)}", "FS", 1.0),)
+        updated.append(CPMActivity(activity.id, activity.name, duration, links))
+    return updated
+
+
+def _timed(fn, repeat: int) -> tuple[object, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        times.append(time.perf_counter() - start)
+    return value, min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'activities':>10} {'snapshot ms':>12} {'diff ms':>8} {'summary ms':>11}"
+        f" {'changed':>8} {'links':>6} {'payload KB':>11} {'load ms':>8}"
+    )
+    for n in args.activities:
+        activities = synthetic_schedule(n)
+        base_result = CPMNetwork(activities).compute()
+        current_result = CPMNetwork(updated_schedule(activities)).compute()
+        base, snap = _timed(lambda: ScheduleSnapshot.from_result(base_result), args.repeat)
+        current = ScheduleSnapshot.from_result(current_result)
+        diff, diff_s = _timed(lambda: diff_snapshots(base, current), args.repeat)
+        _, summary_s = _timed(lambda: (diff.summary(), diff.to_delta()), args.repeat)
+        payload = base.to_bytes()
+        _, load_s = _timed(lambda: ScheduleSnapshot.from_bytes(payload), args.repeat)
+        counts = diff.counts()
+        links = counts["links_added"] + counts["links_removed"] + counts["links_changed"]
+        print(
+            f"{n:>10} {snap * 1000:>12.1f} {diff_s * 1000:>8.1f} {summary_s * 1000:>11.1f}"
+            f" {counts['changed']:>8} {links:>6} {len(payload) / 1024:>11.0f}"
+            f" {load_s * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,55 @@
 """Core agent implementation."""
 
-from anthropic import Anthropic
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from anthropic import Anthropic, AsyncAnthropic
+
+from ai_agent.clients import get_shared_client
+from ai_agent.compaction import CompactionResult, ConversationCompactor
 from ai_agent.config import Settings, get_settings
 from ai_agent.tools import ToolRegistry
 
+# Token counters reported by the Messages API ``usage`` block
+_USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
+
+def _empty_usage() -> dict[str, int]:
+    return dict.fromkeys(_USAGE_FIELDS, 0)
+
+
+# Process-wide pools for sync tools dispatched from achat(), per pool size
+_executor_lock = threading.Lock()
+_tool_executors: dict[int, ThreadPoolExecutor] = {}
+
+
+def get_tool_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared sync-tool thread pool with ``max_workers`` threads."""
+    with _executor_lock:
+        executor = _tool_executors.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="agent-tool",
+            )
+            _tool_executors[max_workers] = executor
+        return executor
+
+
+def shutdown_tool_executors(wait: bool = True) -> None:
+    """Shut down the shared tool pools (e.g. on worker shutdown)."""
+    with _executor_lock:
+        executors = list(_tool_executors.values())
+        _tool_executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
 
 class Agent:
     """An AI agent that interacts with Claude via the Anthropic API."""
@@ -16,10 +61,22 @@ class Agent:
         system_prompt: str | None = None,
     ):
         self.settings = settings or get_settings()
-        self.client = Anthropic(api_key=self.settings.anthropic_api_key)
+        self.client = get_shared_client(Anthropic, self.settings)
         self.conversation: list[dict] = []
         self.tool_registry = tool_registry or ToolRegistry()
         self.system_prompt = system_prompt
+        self.last_usage: dict[str, int] = _empty_usage()
+        self.compactor = ConversationCompactor(
+            token_budget=self.settings.context_token_budget,
+            keep_recent_turns=self.settings.context_keep_turns,
+            max_turns=self.settings.context_max_turns,
+        )
+        self.last_compaction: CompactionResult | None = None
+
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        """The shared async client for the running event loop."""
+        return get_shared_client(AsyncAnthropic, self.settings)
 
     def chat(self, user_message: str) -> str:
         """Send a message and get a response from the agent.
@@ -28,23 +85,16 @@ class Agent:
         executes the tools, sends results back, and repeats until Claude
         produces a final text response.
         """
+        self.compact()
         self.conversation.append({"role": "user", "content": user_message})
 
-        tools = self.tool_registry.to_api_format() if len(self.tool_registry) > 0 else None
+        tools = self._tools_param()
         self.last_tool_calls: list[dict] = []
+        self.last_usage = _empty_usage()
 
         while True:
-            kwargs: dict = {
-                "model": self.settings.model,
-                "max_tokens": self.settings.max_tokens,
-                "messages": self.conversation,
-            }
-            if self.system_prompt:
-                kwargs["system"] = self.system_prompt
-            if tools:
-                kwargs["tools"] = tools
-
-            response = self.client.messages.create(**kwargs)
+            response = self.client.messages.create(**self._request_kwargs(tools))
+            self._record_usage(response)
 
             # Store the full content blocks for multi-turn correctness
             self.conversation.append({"role": "assistant", "content": response.content})
@@ -53,30 +103,130 @@ class Agent:
                 tool_results = []
                 for block in response.content:
                     if block.type == "tool_use":
-                        tool = self.tool_registry.get(block.name)
-                        if tool:
-                            result = tool.execute(**block.input)
-                        else:
-                            result = f"Error: unknown tool '{block.name}'"
-                        self.last_tool_calls.append(
-                            {
-                                "tool": block.name,
-                                "input": block.input,
-                                "result": result,
-                            }
-                        )
-                        tool_results.append(
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": block.id,
-                                "content": result,
-                            }
-                        )
+                        result = self.tool_registry.execute(block.name, block.input).to_text()
+                        tool_results.append(self._record_tool_result(block, result))
                 self.conversation.append({"role": "user", "content": tool_results})
             else:
-                # End of turn — extract text from the final response
-                text_parts = [block.text for block in response.content if block.type == "text"]
-                return text_parts[0] if text_parts else ""
+                return self._final_text(response)
+
+    async def achat(self, user_message: str) -> str:
+        """Async variant of ``chat`` built on ``AsyncAnthropic``.
+
+        All ``tool_use`` blocks of a turn run concurrently: ``AsyncTool``s
+        are awaited via ``asyncio.gather`` and sync tools are dispatched to a
+        bounded thread pool, so a turn costs the slowest tool rather than the
+        sum of all of them. Results are sent back in ``tool_use_id`` order.
+        """
+        self.compact()
+        self.conversation.append({"role": "user", "content": user_message})
+
+        tools = self._tools_param()
+        self.last_tool_calls = []
+        self.last_usage = _empty_usage()
+
+        while True:
+            response = await self.async_client.messages.create(**self._request_kwargs(tools))
+            self._record_usage(response)
+
+            self.conversation.append({"role": "assistant", "content": response.content})
+
+            if response.stop_reason == "tool_use":
+                blocks = [block for block in response.content if block.type == "tool_use"]
+                results = await asyncio.gather(
+                    *(self._aexecute_tool(block) for block in blocks)
+                )
+                tool_results = [
+                    self._record_tool_result(block, result)
+                    for block, result in zip(blocks, results, strict=True)
+                ]
+                self.conversation.append({"role": "user", "content": tool_results})
+            else:
+                return self._final_text(response)
+
+    async def _aexecute_tool(self, block) -> str:
+        """Run one tool_use block without blocking the event loop."""
+        result = await self.tool_registry.aexecute(
+            block.name,
+            block.input,
+            get_tool_executor(self.settings.tool_max_workers),
+        )
+        return result.to_text()
+
+    def _tools_param(self) -> list[dict] | None:
+        """Return the tool schemas to send, or None when no tools are registered."""
+        if len(self.tool_registry) == 0:
+            return None
+        if self.settings.prompt_caching:
+            return self.tool_registry.to_cached_api_format()
+        return self.tool_registry.to_api_format()
+
+    def _request_kwargs(self, tools: list[dict] | None) -> dict:
+        """Build the ``messages.create`` arguments for the next turn.
+
+        With prompt caching on, the system prompt is sent as a text block with
+        a ``cache_control`` breakpoint so the tools + system prefix is cached
+        across turns and runs.
+        """
+        kwargs: dict = {
+            "model": self.settings.model,
+            "max_tokens": self.settings.max_tokens,
+            "messages": self.conversation,
+        }
+        if self.system_prompt:
+            if self.settings.prompt_caching:
+                kwargs["system"] = [
+                    {
+                        "type": "text",
+                        "text": self.system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            else:
+                kwargs["system"] = self.system_prompt
+        if tools:
+            kwargs["tools"] = tools
+        return kwargs
+
+    def _record_usage(self, response) -> None:
+        """Accumulate token usage, including cache reads/writes, for this chat call."""
+        usage = getattr(response, "usage", None)
+        for field in _USAGE_FIELDS:
+            value = getattr(usage, field, None)
+            if isinstance(value, int):
+                self.last_usage[field] += value
+
+    def _record_tool_result(self, block, result: str) -> dict:
+        """Track a tool call and return its ``tool_result`` content block."""
+        self.last_tool_calls.append(
+            {
+                "tool": block.name,
+                "input": block.input,
+                "result": result,
+            }
+        )
+        return {
+            "type": "tool_result",
+            "tool_use_id": block.id,
+            "content": result,
+        }
+
+    @staticmethod
+    def _final_text(response) -> str:
+        """End of turn — extract text from the final response."""
+        text_parts = [block.text for block in response.content if block.type == "text"]
+        return text_parts[0] if text_parts else ""
+
+    def compact(self) -> CompactionResult:
+        """Shrink the conversation to the configured token budget.
+
+        Runs automatically before each new user message. The result exposes
+        the before/after token estimates for the pass.
+        """
+        result = self.compactor.compact(self.conversation)
+        if result.compacted:
+            self.conversation = result.messages
+        self.last_compaction = result
+        return result
 
     def reset(self):
         """Clear conversation history."""
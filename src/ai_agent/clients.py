@@ -0,0 +1,106 @@
+"""Process-wide registry of pooled Anthropic clients shared by all agents."""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
+
+from ai_agent.config import Settings
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_lock = threading.Lock()
+_sync_clients: dict[tuple, object] = {}
+# Async HTTP pools are bound to the event loop that opened them
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, object]]" = (
+    weakref.WeakKeyDictionary()
+)
+_no_loop_clients: dict[tuple, object] = {}
+
+
+def _pool_options(settings: Settings) -> dict:
+    """httpx options for the shared connection pool."""
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        "http2": settings.http2 and _HTTP2_AVAILABLE,
+    }
+
+
+def _cache_key(client_cls: type, settings: Settings) -> tuple:
+    return (
+        client_cls,
+        settings.anthropic_api_key,
+        settings.http_max_connections,
+        settings.http_max_keepalive_connections,
+        settings.http_keepalive_expiry,
+        settings.http2,
+    )
+
+
+def _is_async(client_cls: type) -> bool:
+    return isinstance(client_cls, type) and issubclass(client_cls, AsyncAnthropic)
+
+
+def get_shared_client[T](client_cls: type[T], settings: Settings) -> T:
+    """Return the process-wide client for ``client_cls`` and these settings.
+
+    ``client_cls`` is ``Anthropic`` or ``AsyncAnthropic``. Clients are created
+    once per (class, API key, pool config) and reused by every agent, so
+    connections, TLS sessions and keep-alives survive across agent runs.
+    Async clients are additionally scoped to the running event loop.
+    """
+    key = _cache_key(client_cls, settings)
+    with _lock:
+        clients = _clients_for(client_cls)
+        client = clients.get(key)
+        if client is None:
+            if _is_async(client_cls):
+                http_client_cls = DefaultAsyncHttpxClient
+            else:
+                http_client_cls = DefaultHttpxClient
+            client = client_cls(
+                api_key=settings.anthropic_api_key,
+                http_client=http_client_cls(**_pool_options(settings)),
+            )
+            clients[key] = client
+        return client
+
+
+def _clients_for(client_cls: type) -> dict[tuple, object]:
+    if not _is_async(client_cls):
+        return _sync_clients
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _no_loop_clients
+    return _async_clients.setdefault(loop, {})
+
+
+def close_shared_clients() -> None:
+    """Close pooled sync clients and forget all clients (e.g. on worker shutdown)."""
+    with _lock:
+        for client in _sync_clients.values():
+            client.close()
+        _sync_clients.clear()
+        _no_loop_clients.clear()
+        _async_clients.clear()
+
+
+async def aclose_shared_clients() -> None:
+    """Close every pooled client owned by the running loop, then the sync ones."""
+    with _lock:
+        owned = list(_no_loop_clients.values())
+        _no_loop_clients.clear()
+        loop = asyncio.get_running_loop()
+        owned += list(_async_clients.pop(loop, {}).values())
+    for client in owned:
+        await client.close()
+    close_shared_clients()
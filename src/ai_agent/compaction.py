@@ -0,0 +1,206 @@
+"""Token-budgeted conversation compaction for long-lived agents."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel
+
+# Rough chars-per-token ratio for English prose and JSON payloads
+_CHARS_PER_TOKEN = 4
+_ELIDED_PREFIX = "[elided"
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of a compaction pass, with before/after token estimates."""
+
+    messages: list[dict]
+    tokens_before: int
+    tokens_after: int
+    dropped_turns: int = 0
+    elided_results: int = 0
+    summary: str | None = None
+
+    @property
+    def compacted(self) -> bool:
+        return self.dropped_turns > 0 or self.elided_results > 0
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    """Estimate the token count of a conversation without calling the API."""
+    return sum(_content_chars(m.get("content")) for m in messages) // _CHARS_PER_TOKEN
+
+
+def _content_chars(content) -> int:
+    """Count characters in message content: strings, dicts, lists or SDK blocks."""
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, dict):
+        return sum(_content_chars(v) for v in content.values())
+    if isinstance(content, list | tuple):
+        return sum(_content_chars(item) for item in content)
+    if isinstance(content, BaseModel):
+        return _content_chars(content.model_dump())
+    if content is None:
+        return 0
+    return len(str(content))
+
+
+def _is_turn_start(message: dict) -> bool:
+    """True for a user message that is a new prompt rather than tool results."""
+    if message.get("role") != "user":
+        return False
+    content = message.get("content")
+    if isinstance(content, str):
+        return True
+    return not any(
+        isinstance(block, dict) and block.get("type") == "tool_result"
+        for block in content or []
+    )
+
+
+def split_turns(messages: list[dict]) -> list[list[dict]]:
+    """Group messages into turns: a user prompt plus every message up to the next one.
+
+    A turn always contains complete ``tool_use``/``tool_result`` pairs, so
+    dropping whole turns keeps the conversation valid for the API.
+    """
+    turns: list[list[dict]] = []
+    for message in messages:
+        if _is_turn_start(message) or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+def default_summary(turns: list[list[dict]]) -> str:
+    """Extractive summary of dropped turns: the user prompts that started them."""
+    prompts = []
+    for turn in turns:
+        content = turn[0].get("content")
+        text = content if isinstance(content, str) else ""
+        if not text and isinstance(content, list):
+            text = " ".join(
+                b.get("text", "") for b in content if isinstance(b, dict)
+            )
+        prompts.append(f"- {text[:200]}")
+    return (
+        f"[Earlier conversation compacted: {len(turns)} turn(s) removed."
+        " Prior requests were:\n" + "\n".join(prompts) + "]"
+    )
+
+
+@dataclass
+class ConversationCompactor:
+    """Keeps a conversation within a token budget.
+
+    Compaction runs in three stages, stopping as soon as the budget is met:
+
+    1. Sliding window — when ``max_turns`` is set, only the most recent
+       ``max_turns`` turns are kept regardless of size.
+    2. Stale tool results — ``tool_result`` payloads outside the most recent
+       ``keep_recent_turns`` turns are replaced with a short placeholder.
+       The blocks themselves stay, so every ``tool_use`` keeps its result.
+    3. Trimming — the oldest whole turns are dropped until the estimate fits,
+       never touching the most recent ``keep_recent_turns``. Dropped turns are
+       folded into a note prepended to the first kept prompt, produced by
+       ``summarizer`` (``default_summary`` if not given).
+
+    A ``token_budget`` of 0 disables stages 2 and 3.
+    """
+
+    token_budget: int
+    keep_recent_turns: int = 2
+    max_turns: int = 0
+    summarizer: Callable[[list[list[dict]]], str] | None = field(default=None)
+
+    def compact(self, messages: list[dict]) -> CompactionResult:
+        """Return a compacted copy of ``messages``; the input is not modified."""
+        tokens_before = estimate_tokens(messages)
+        turns = split_turns(messages)
+        keep = max(self.keep_recent_turns, 1)
+        dropped: list[list[dict]] = []
+        elided = 0
+
+        if self.max_turns and len(turns) > self.max_turns:
+            cut = len(turns) - max(self.max_turns, keep)
+            dropped, turns = turns[:cut], turns[cut:]
+
+        over_budget = self.token_budget > 0 and (
+            estimate_tokens(_flatten(turns)) > self.token_budget
+        )
+        if over_budget:
+            stale = max(len(turns) - keep, 0)
+            for i in range(stale):
+                turns[i], count = _elide_tool_results(turns[i])
+                elided += count
+
+            tokens = estimate_tokens(_flatten(turns))
+            while tokens > self.token_budget and len(turns) > keep:
+                oldest = turns.pop(0)
+                tokens -= estimate_tokens(oldest)
+                dropped.append(oldest)
+
+        summary = None
+        compacted = _flatten(turns)
+        while dropped:
+            summary = (self.summarizer or default_summary)(dropped)
+            compacted = _flatten([_prepend_summary(turns[0], summary), *turns[1:]])
+            # The summary note itself costs tokens; trim again if it tipped us over
+            if (
+                self.token_budget <= 0
+                or len(turns) <= keep
+                or estimate_tokens(compacted) <= self.token_budget
+            ):
+                break
+            dropped.append(turns.pop(0))
+
+        return CompactionResult(
+            messages=compacted,
+            tokens_before=tokens_before,
+            tokens_after=estimate_tokens(compacted),
+            dropped_turns=len(dropped),
+            elided_results=elided,
+            summary=summary,
+        )
+
+
+def _flatten(turns: list[list[dict]]) -> list[dict]:
+    return [message for turn in turns for message in turn]
+
+
+def _elide_tool_results(turn: list[dict]) -> tuple[list[dict], int]:
+    """Replace tool_result payloads in a turn with placeholders."""
+    count = 0
+    compacted = []
+    for message in turn:
+        content = message.get("content")
+        if message.get("role") != "user" or not isinstance(content, list):
+            compacted.append(message)
+            continue
+        blocks = []
+        for block in content:
+            payload = block.get("content") if isinstance(block, dict) else None
+            if (
+                isinstance(block, dict)
+                and block.get("type") == "tool_result"
+                and not (isinstance(payload, str) and payload.startswith(_ELIDED_PREFIX))
+            ):
+                size = _content_chars(payload)
+                block = {**block, "content": f"{_ELIDED_PREFIX} {size} chars of stale tool output]"}
+                count += 1
+            blocks.append(block)
+        compacted.append({**message, "content": blocks})
+    return compacted, count
+
+
+def _prepend_summary(turn: list[dict], summary: str) -> list[dict]:
+    """Attach the summary note to the prompt that opens ``turn``."""
+    first = turn[0]
+    content = first.get("content")
+    if isinstance(content, str):
+        new_content = f"{summary}\n\n{content}"
+    else:
+        new_content = [{"type": "text", "text": summary}, *(content or [])]
+    return [{**first, "content": new_content}, *turn[1:]]
@@ -13,6 +13,19 @@ class Settings(BaseSettings):
     anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
     model: str = Field(default="claude-sonnet-4-5-20250929", alias="MODEL")
     max_tokens: int = Field(default=4096, alias="MAX_TOKENS")
+    tool_max_workers: int = Field(default=8, alias="TOOL_MAX_WORKERS")
+    prompt_caching: bool = Field(default=True, alias="PROMPT_CACHING")
+    context_token_budget: int = Field(default=100_000, alias="CONTEXT_TOKEN_BUDGET")
+    context_keep_turns: int = Field(default=2, alias="CONTEXT_KEEP_TURNS")
+    context_max_turns: int = Field(default=0, alias="CONTEXT_MAX_TURNS")
+
+    # Shared Anthropic HTTP connection pool
+    http_max_connections: int = Field(default=100, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(
+        default=20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_keepalive_expiry: float = Field(default=60.0, alias="HTTP_KEEPALIVE_EXPIRY")
+    http2: bool = Field(default=True, alias="HTTP2")
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
@@ -0,0 +1,234 @@
+"""Shared tool-result cache with per-tool TTLs and single-flight coalescing."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Protocol
+
+from ai_agent.tools import ToolResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long a tool's results stay fresh.
+
+    ``actions`` restricts caching to read-only actions of multi-action tools
+    (e.g. ``query`` but not ``create``); any other action invalidates the
+    tool's local entries and moves its shared entries to a new generation,
+    so a write is visible to the next read.
+    """
+
+    ttl: float
+    actions: frozenset[str] | None = None
+
+    def applies_to(self, tool_input: Mapping) -> bool:
+        return self.actions is None or tool_input.get("action") in self.actions
+
+
+class CacheBackend(Protocol):
+    """Second-tier store shared across workers (e.g. Redis)."""
+
+    async def get(self, key: str) -> str | None: ...
+
+    async def set(self, key: str, value: str, ttl: float) -> None: ...
+
+
+@dataclass
+class CacheStats:
+    """Per-tool cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+
+def cache_key(tool_name: str, tool_input: Mapping) -> str:
+    """Stable key for a call: tool name plus a hash of the normalized input.
+
+    Keys are sorted and ``None`` values dropped, so ``{"a": 1, "b": None}``
+    and ``{"a": 1}`` share an entry.
+    """
+    normalized = {k: v for k, v in tool_input.items() if v is not None}
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(payload.encode()).hexdigest()[:32]
+    return f"{tool_name}:{digest}"
+
+
+def _dump(result: ToolResult) -> str:
+    if result.data is None:
+        return json.dumps({"text": result.to_text()})
+    return json.dumps({"data": result.data}, separators=(",", ":"), default=str)
+
+
+def _load(raw: str) -> ToolResult:
+    payload = json.loads(raw)
+    if "data" in payload:
+        return ToolResult(payload["data"])
+    return ToolResult.from_text(payload["text"])
+
+
+class ToolResultCache:
+    """Caches tool results across agents.
+
+    Lookups go through an in-process LRU, then the optional shared
+    ``backend``; concurrent identical calls on one event loop are coalesced
+    so the tool runs once. Only tools with a policy are cached, and error
+    results never are. Cached ``ToolResult`` objects are shared between
+    callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, CachePolicy],
+        max_entries: int = 1024,
+        backend: CacheBackend | None = None,
+    ):
+        self.policies = dict(policies)
+        self.max_entries = max_entries
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, ToolResult]] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._stats: dict[str, CacheStats] = {}
+
+    async def get_or_run(
+        self,
+        tool_name: str,
+        tool_input: Mapping,
+        run: Callable[[], Awaitable[ToolResult]],
+    ) -> ToolResult:
+        """Return a fresh cached result for this call, or run the tool once."""
+        policy = self.policies.get(tool_name)
+        if policy is None:
+            return await run()
+        if not policy.applies_to(tool_input):
+            result = await run()
+            # After the write, so reads racing it can't cache what it replaced
+            self.invalidate(tool_name)
+            await self._bump_generation(tool_name, policy.ttl)
+            return result
+
+        key = cache_key(tool_name, tool_input)
+        stats = self._stats.setdefault(tool_name, CacheStats())
+        cached = self._get_local(key)
+        if cached is not None:
+            stats.hits += 1
+            return cached
+
+        flight_key = (asyncio.get_running_loop(), key)
+        pending = self._inflight.get(flight_key)
+        if pending is not None:
+            stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            remote_key = await self._remote_key(tool_name, key, policy)
+            result = await self._get_remote(remote_key)
+            if result is not None:
+                stats.hits += 1
+                self._put_local(key, result, policy.ttl)
+            else:
+                stats.misses += 1
+                result = await run()
+                if not result.is_error:
+                    self._put_local(key, result, policy.ttl)
+                    await self._put_remote(remote_key, result, policy.ttl)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; don't warn if nobody was waiting
+            future.exception()
+            raise
+        finally:
+            del self._inflight[flight_key]
+
+    def invalidate(self, tool_name: str | None = None) -> None:
+        """Drop local entries for one tool, or all of them."""
+        with self._lock:
+            if tool_name is None:
+                self._entries.clear()
+                return
+            prefix = f"{tool_name}:"
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss/coalesced counters per tool."""
+        return {name: vars(s).copy() for name, s in self._stats.items()}
+
+    def _get_local(self, key: str) -> ToolResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def _put_local(self, key: str, result: ToolResult, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def _remote_key(self, tool_name: str, key: str, policy: CachePolicy) -> str | None:
+        """Shared-tier key for a call; None skips the shared tier.
+
+        Tools with write actions key their shared entries by the tool's
+        current generation, which ``_bump_generation`` replaces on every
+        write. The generation expires after the policy TTL, by which time
+        every entry written under the one before it has expired too.
+        """
+        if self.backend is None or policy.actions is None:
+            return key
+        try:
+            generation = await self.backend.get(f"{tool_name}:generation")
+        except Exception as exc:
+            logger.warning("Tool cache backend read failed: %s", exc)
+            return None
+        return f"{key}:{generation}" if generation else key
+
+    async def _bump_generation(self, tool_name: str, ttl: float) -> None:
+        if self.backend is None:
+            return
+        try:
+            await self.backend.set(f"{tool_name}:generation", uuid.uuid4().hex, ttl)
+        except Exception as exc:
+            logger.warning("Tool cache backend write failed: %s", exc)
+
+    async def _get_remote(self, key: str | None) -> ToolResult | None:
+        if self.backend is None or key is None:
+            return None
+        try:
+            raw = await self.backend.get(key)
+            return _load(raw) if raw is not None else None
+        except Exception as exc:
+            logger.warning("Tool cache backend read failed: %s", exc)
+            return None
+
+    async def _put_remote(self, key: str | None, result: ToolResult, ttl: float) -> None:
+        if self.backend is None or key is None:
+            return
+        try:
+            await self.backend.set(key, _dump(result), ttl)
+        except Exception as exc:
+            logger.warning("Tool cache backend write failed: %s", exc)
@@ -1,12 +1,57 @@
 """Tool definitions and registry for the AI agent."""
 
 import ast
+import asyncio
+import functools
+import json
 import operator
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from duckduckgo_search import DDGS
 
+if TYPE_CHECKING:
+    from ai_agent.tool_cache import ToolResultCache
+
+
+class ToolResult:
+    """Tool output that keeps structured data and serializes it only on demand.
+
+    Direct callers read ``data`` (the object the tool built, not a copy).
+    The model-facing text is produced lazily by ``to_text()`` with compact
+    separators and cached, so it is rendered at most once.
+    """
+
+    __slots__ = ("_text", "data", "is_error")
+
+    def __init__(self, data=None, *, text: str | None = None, is_error: bool = False):
+        self.data = data
+        self.is_error = is_error
+        self._text = text
+
+    @classmethod
+    def error(cls, message: str) -> "ToolResult":
+        """An error result carrying only a message."""
+        return cls(text=message, is_error=True)
+
+    @classmethod
+    def from_text(cls, text: str) -> "ToolResult":
+        """Wrap a plain string result from a tool that returns text."""
+        return cls(text=text, is_error=text.startswith("Error"))
+
+    def to_text(self) -> str:
+        """Token-lean rendering of the result for the model."""
+        if self._text is None:
+            self._text = json.dumps(self.data, separators=(",", ":"), ensure_ascii=False)
+        return self._text
+
+    def __str__(self) -> str:
+        return self.to_text()
+
 
 class Tool(ABC):
     """Base class for all agent tools."""
@@ -22,6 +67,14 @@ class Tool(ABC):
     def execute(self, **kwargs) -> str:
         """Run the tool and return a string result."""
 
+    def execute_structured(self, **kwargs) -> ToolResult:
+        """Run the tool and return a ``ToolResult``.
+
+        Text-returning tools are wrapped as-is; ``StructuredTool`` subclasses
+        return their data directly without a JSON round-trip.
+        """
+        return ToolResult.from_text(self.execute(**kwargs))
+
     def to_api_format(self) -> dict:
         """Convert to the Anthropic API tool format."""
         return {
@@ -31,24 +84,167 @@ class Tool(ABC):
         }
 
 
+class StructuredTool(Tool):
+    """Base class for tools that build structured (dict/list) results."""
+
+    @abstractmethod
+    def execute_structured(self, **kwargs) -> ToolResult:
+        """Run the tool and return its structured result."""
+
+    def execute(self, **kwargs) -> str:
+        """String interface for existing callers: the compact JSON rendering."""
+        return self.execute_structured(**kwargs).to_text()
+
+
+class AsyncTool(Tool):
+    """Base class for tools whose work is async I/O (e.g. integration clients).
+
+    The agent loop awaits ``aexecute`` directly on the running event loop.
+    The sync ``execute``/``execute_structured`` entry points stay available
+    for sync callers and drive the coroutine to completion on the shared
+    bridge loop; from a coroutine, await ``aexecute`` instead.
+    """
+
+    @abstractmethod
+    async def aexecute(self, **kwargs) -> ToolResult:
+        """Run the tool on the event loop and return its result."""
+
+    def execute_structured(self, **kwargs) -> ToolResult:
+        """Blocking bridge: run ``aexecute`` to completion."""
+        return _run_coroutine(self.aexecute(**kwargs))
+
+    def execute(self, **kwargs) -> str:
+        """String interface for existing callers: the compact JSON rendering."""
+        return self.execute_structured(**kwargs).to_text()
+
+
+# One event loop on a daemon thread runs every sync call of an async tool,
+# so clients bound to a loop survive from one call to the next
+_bridge_lock = threading.Lock()
+_bridge: tuple[asyncio.AbstractEventLoop, threading.Thread] | None = None
+
+
+def _bridge_loop() -> asyncio.AbstractEventLoop:
+    global _bridge
+    with _bridge_lock:
+        if _bridge is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="tool-bridge", daemon=True)
+            thread.start()
+            _bridge = (loop, thread)
+        return _bridge[0]
+
+
+def _run_coroutine(coro):
+    """Run ``coro`` to completion on the bridge loop from sync code.
+
+    Blocking a running event loop on it would stall every other task on
+    that loop, so calls from a coroutine are refused.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run_coroutine_threadsafe(coro, _bridge_loop()).result()
+    coro.close()
+    raise RuntimeError(
+        "Sync tool execution would block the running event loop;"
+        " await ToolRegistry.aexecute() or the tool's aexecute() instead"
+    )
+
+
+def shutdown_tool_bridge(cleanup: Callable[[], Awaitable] | None = None) -> None:
+    """Stop the bridge loop, first awaiting ``cleanup()`` on it (e.g. to close
+    clients it owns). The next sync call starts a new one."""
+    global _bridge
+    with _bridge_lock:
+        bridge, _bridge = _bridge, None
+    if bridge is None:
+        return
+    loop, thread = bridge
+    if cleanup is not None:
+        asyncio.run_coroutine_threadsafe(cleanup(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+async def _arun_tool(tool: Tool, tool_input: dict, executor: Executor | None) -> ToolResult:
+    if isinstance(tool, AsyncTool):
+        return await tool.aexecute(**tool_input)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(tool.execute_structured, **tool_input)
+    )
+
+
 class ToolRegistry:
     """Holds registered tools and converts them to the Anthropic API format."""
 
-    def __init__(self):
+    def __init__(self, cache: "ToolResultCache | None" = None):
         self._tools: dict[str, Tool] = {}
+        self._frozen_api_format: list[dict] | None = None
+        self.cache = cache
 
     def register(self, tool: Tool) -> None:
         """Register a tool by its name."""
         self._tools[tool.name] = tool
+        self._frozen_api_format = None
 
     def get(self, name: str) -> Tool | None:
         """Look up a tool by name."""
         return self._tools.get(name)
 
+    def execute(self, name: str, tool_input: dict) -> ToolResult:
+        """Run a tool by name from sync code, through ``cache`` like ``aexecute``.
+
+        Tools the cache has no policy for run directly on the calling
+        thread; cached calls drive the async lookup to completion on the
+        bridge loop, so like ``AsyncTool.execute`` this can't be called
+        from a coroutine.
+        """
+        tool = self.get(name)
+        if tool is None:
+            return ToolResult.error(f"Error: unknown tool '{name}'")
+        if self.cache is None or name not in self.cache.policies:
+            return tool.execute_structured(**tool_input)
+        return _run_coroutine(self.aexecute(name, tool_input))
+
+    async def aexecute(
+        self, name: str, tool_input: dict, executor: Executor | None = None
+    ) -> ToolResult:
+        """Run a tool by name without blocking the event loop.
+
+        ``AsyncTool`` instances are awaited natively; sync tools are bridged
+        through ``executor`` (the loop's default thread pool when None).
+        Calls go through ``cache`` when the registry has one.
+        """
+        tool = self.get(name)
+        if tool is None:
+            return ToolResult.error(f"Error: unknown tool '{name}'")
+        run = functools.partial(_arun_tool, tool, tool_input, executor)
+        if self.cache is None:
+            return await run()
+        return await self.cache.get_or_run(name, tool_input, run)
+
     def to_api_format(self) -> list[dict]:
         """Return all tools in the format expected by the Anthropic API."""
         return [tool.to_api_format() for tool in self._tools.values()]
 
+    def to_cached_api_format(self) -> list[dict]:
+        """Return the tool list frozen once per registry, marked for prompt caching.
+
+        The list is built on first use and reused until another tool is
+        registered, so every request sends a byte-identical tools prefix.
+        The last tool carries a ``cache_control`` breakpoint, which caches
+        the whole tool block. Callers must not mutate the returned list.
+        """
+        if self._frozen_api_format is None:
+            tools = self.to_api_format()
+            if tools:
+                tools[-1] = {**tools[-1], "cache_control": {"type": "ephemeral"}}
+            self._frozen_api_format = tools
+        return self._frozen_api_format
+
     def __len__(self) -> int:
         return len(self._tools)
 
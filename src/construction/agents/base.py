@@ -1,17 +1,30 @@
 """Base class for all construction PM agents."""
 
+import logging
 import uuid
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 
-from ai_agent.agent import Agent
+from ai_agent.agent import Agent, get_tool_executor
 from ai_agent.config import Settings
-from ai_agent.tools import ToolRegistry
+from ai_agent.tools import ToolRegistry, ToolResult
 from construction.config import ConstructionSettings, get_construction_settings
 from construction.redis_.pubsub import AgentPubSub
 from construction.redis_.shared_memory import SharedMemory
+from construction.redis_.tool_cache import get_tool_cache
 from construction.schemas.common import AgentEvent, DataSource
 
+logger = logging.getLogger(__name__)
+
+
+def build_agent_settings(settings: ConstructionSettings) -> Settings:
+    """Map construction settings onto the core agent settings."""
+    return Settings(
+        anthropic_api_key=settings.anthropic_api_key,
+        model=settings.model,
+        max_tokens=settings.max_tokens,
+    )
+
 
 class ConstructionAgent(ABC):
     """Base class for all 13 construction PM agents."""
@@ -29,14 +42,13 @@ class ConstructionAgent(ABC):
         self.settings = settings or get_construction_settings()
         self.shared_memory = shared_memory
         self.pubsub = pubsub
-        self._tools = ToolRegistry()
+        self._tools = ToolRegistry(
+            cache=get_tool_cache() if self.settings.tool_cache_enabled else None
+        )
         self._register_tools()
+        self._agent_settings = build_agent_settings(self.settings)
         self._agent = Agent(
-            settings=Settings(
-                anthropic_api_key=self.settings.anthropic_api_key,
-                model=self.settings.model,
-                max_tokens=self.settings.max_tokens,
-            ),
+            settings=self._agent_settings,
             tool_registry=self._tools,
             system_prompt=self.get_system_prompt(),
         )
@@ -55,7 +67,40 @@ class ConstructionAgent(ABC):
 
     def chat(self, message: str) -> str:
         """Send a message to the underlying Claude agent."""
-        return self._agent.chat(message)
+        response = self._agent.chat(message)
+        self._log_token_usage()
+        return response
+
+    async def achat(self, message: str) -> str:
+        """Send a message without blocking the event loop."""
+        response = await self._agent.achat(message)
+        self._log_token_usage()
+        return response
+
+    async def call_tool(self, name: str, **tool_input) -> ToolResult:
+        """Run one of this agent's tools without blocking the event loop.
+
+        Sync tools run on the shared tool thread pool; calls go through the
+        registry's cache like the model's own tool calls.
+        """
+        executor = get_tool_executor(self._agent_settings.tool_max_workers)
+        return await self._tools.aexecute(name, tool_input, executor)
+
+    @property
+    def token_usage(self) -> dict[str, int]:
+        """Token counts for the last run, split into cache reads and writes."""
+        return self._agent.last_usage
+
+    def _log_token_usage(self) -> None:
+        usage = self.token_usage
+        logger.info(
+            "%s tokens: input=%s output=%s cache_read=%s cache_write=%s",
+            self.name,
+            usage.get("input_tokens"),
+            usage.get("output_tokens"),
+            usage.get("cache_read_input_tokens"),
+            usage.get("cache_creation_input_tokens"),
+        )
 
     async def publish_event(
         self,
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from construction.agents.base import ConstructionAgent
 from construction.schemas.common import AgentEvent, DataSource
 from construction.tools.claims import ClaimsQuery
+from construction.tools.schedule import ScheduleCompareTool
 
 
 class ClaimsDisputeAgent(ConstructionAgent):
@@ -20,6 +21,7 @@ class ClaimsDisputeAgent(ConstructionAgent):
 
     def _register_tools(self) -> None:
         self._tools.register(ClaimsQuery())
+        self._tools.register(ScheduleCompareTool())
 
     def get_system_prompt(self) -> str:
         return (
@@ -35,7 +37,10 @@ class ClaimsDisputeAgent(ConstructionAgent):
             " evidence references\n"
             "2. Delay analysis — perform TIA (Time Impact"
             " Analysis) and Windows analysis to quantify"
-            " delay responsibility\n"
+            " delay responsibility, comparing the baseline"
+            " and each schedule update with schedule_compare"
+            " (finish movement, float erosion, logic"
+            " changes)\n"
             "3. Notice tracking — monitor contractual notice"
             " deadlines, flag notices due within 7 days,"
             " track notice status (pending/sent/acknowledged)\n"
@@ -62,7 +67,7 @@ class ClaimsDisputeAgent(ConstructionAgent):
             " documentation."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Reviewed pending notice deadlines",
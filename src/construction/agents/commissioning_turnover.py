@@ -61,7 +61,7 @@ class CommissioningTurnoverAgent(ConstructionAgent):
             " Identify any tests that need witness scheduling."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Checked IST sequence and prerequisites",
@@ -1,6 +1,5 @@
 """Compliance Verifier agent — BIM + code compliance checking."""
 
-import json
 from datetime import UTC, datetime
 
 from construction.agents.base import ConstructionAgent
@@ -73,16 +72,15 @@ class ComplianceVerifier(ConstructionAgent):
         data_sources = []
 
         # Step 1: Run BIM compliance checks
-        bim_tool = self._tools.get("bim_query")
         all_checks = []
 
         for check_type in check_types:
-            result = bim_tool.execute(
+            check_data = (await self.call_tool(
+                "bim_query",
                 action="check_compliance",
                 project_id=project_id,
                 check_type=check_type,
-            )
-            check_data = json.loads(result)
+            )).data
             all_checks.extend(
                 check_data.get("checks", [])
             )
@@ -99,19 +97,16 @@ class ComplianceVerifier(ConstructionAgent):
         ))
 
         # Step 2: Get existing deviations
-        deviation_result = bim_tool.execute(
+        deviation_data = (await self.call_tool(
+            "bim_query",
             action="get_deviations",
             project_id=project_id,
-        )
-        deviation_data = json.loads(deviation_result)
+        )).data
         transparency_log.append(
             "Retrieved existing BIM deviations"
         )
 
         # Step 3: Create tickets for critical/major issues
-        compliance_tool = self._tools.get(
-            "compliance_database"
-        )
         critical_checks = [
             c for c in all_checks
             if c.get("severity") in ("critical", "major")
@@ -119,7 +114,8 @@ class ComplianceVerifier(ConstructionAgent):
         tickets_created = []
 
         for check in critical_checks:
-            ticket_result = compliance_tool.execute(
+            ticket_data = (await self.call_tool(
+                "compliance_database",
                 action="create",
                 project_id=project_id,
                 data={
@@ -139,8 +135,7 @@ class ComplianceVerifier(ConstructionAgent):
                         "required_value"
                     ),
                 },
-            )
-            ticket_data = json.loads(ticket_result)
+            )).data
             tickets_created.append(ticket_data)
             transparency_log.append(
                 f"Created ticket {ticket_data['check_id']}"
@@ -156,11 +151,11 @@ class ComplianceVerifier(ConstructionAgent):
         ))
 
         # Step 4: Get summary
-        summary_result = compliance_tool.execute(
+        summary_data = (await self.call_tool(
+            "compliance_database",
             action="get_summary",
             project_id=project_id,
-        )
-        summary_data = json.loads(summary_result)
+        )).data
 
         critical_count = len([
             c for c in all_checks
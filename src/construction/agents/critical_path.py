@@ -1,13 +1,21 @@
 """Critical Path Optimizer agent — dynamic resequencing + Monte Carlo."""
 
-import json
 import uuid
 from datetime import UTC, datetime
 
 from construction.agents.base import ConstructionAgent
+from construction.scheduling.service import get_simulation_service
 from construction.schemas.common import ApprovalRequest, DataSource, ImpactSummary
-from construction.tools.monte_carlo import MonteCarloSimulationTool
-from construction.tools.schedule import ScheduleQueryTool
+from construction.tools.monte_carlo import (
+    MonteCarloSimulationTool,
+    ScheduleWhatIfTool,
+)
+from construction.tools.schedule import (
+    ScheduleCompareTool,
+    ScheduleQueryTool,
+    ScheduleResequenceTool,
+    project_activity_records,
+)
 
 
 class CriticalPathOptimizer(ConstructionAgent):
@@ -20,6 +28,9 @@ class CriticalPathOptimizer(ConstructionAgent):
     def _register_tools(self) -> None:
         self._tools.register(ScheduleQueryTool())
         self._tools.register(MonteCarloSimulationTool())
+        self._tools.register(ScheduleWhatIfTool())
+        self._tools.register(ScheduleResequenceTool())
+        self._tools.register(ScheduleCompareTool())
 
     def get_system_prompt(self) -> str:
         return (
@@ -45,7 +56,9 @@ class CriticalPathOptimizer(ConstructionAgent):
             " accelerate the schedule without violating"
             " Tier constraints.\n"
             "4. Output schedule deltas with float"
-            " consumption and commissioning impact.\n\n"
+            " consumption and commissioning impact,"
+            " comparing against the baseline and earlier"
+            " schedule snapshots.\n\n"
             "Always provide transparency on data sources"
             " and confidence levels. Request PM approval"
             " for any schedule change that consumes"
@@ -65,12 +78,11 @@ class CriticalPathOptimizer(ConstructionAgent):
         data_sources = []
 
         # Step 1: Get critical path
-        schedule_tool = self._tools.get("schedule_query")
-        cp_result = schedule_tool.execute(
+        cp_data = (await self.call_tool(
+            "schedule_query",
             action="get_critical_path",
             project_id=project_id,
-        )
-        cp_data = json.loads(cp_result)
+        )).data
         transparency_log.append(
             "Retrieved critical path from P6 schedule"
         )
@@ -82,22 +94,75 @@ class CriticalPathOptimizer(ConstructionAgent):
         ))
 
         # Step 2: Get float report
-        float_result = schedule_tool.execute(
+        float_data = (await self.call_tool(
+            "schedule_query",
             action="get_float_report",
             project_id=project_id,
-        )
-        float_data = json.loads(float_result)
+        )).data
         transparency_log.append(
             "Retrieved float report for all activities"
         )
 
-        # Step 3: Run Monte Carlo simulation
-        mc_tool = self._tools.get("monte_carlo_simulation")
-        mc_result = mc_tool.execute(
+        # Step 2b: Changes since the last snapshot; snapshot if any
+        comparison = await self.call_tool(
+            "schedule_compare",
+            action="compare",
             project_id=project_id,
-            iterations=10000,
+            base="latest",
+            max_listed=10,
         )
-        mc_data = json.loads(mc_result)
+        schedule_changes = None
+        if comparison.is_error:
+            take_snapshot = True
+            transparency_log.append(
+                "No earlier schedule snapshot to compare"
+                " against"
+            )
+        else:
+            changes = comparison.data
+            counts = changes["counts"]
+            take_snapshot = any(
+                counts[key] for key in (
+                    "added", "removed", "changed",
+                    "links_added", "links_removed",
+                    "links_changed",
+                )
+            )
+            schedule_changes = {
+                "compared_to": changes["base"],
+                "project_finish_delta_days": changes[
+                    "project_finish_delta_days"
+                ],
+                "counts": counts,
+                "float_consumed": changes["delta"][
+                    "float_consumed"
+                ],
+                "became_critical": changes["became_critical"],
+                "logic_changes": changes["logic_changes"],
+            }
+            transparency_log.append(
+                f"Compared with the"
+                f" {changes['base']['taken_at'][:10]}"
+                f" snapshot: finish"
+                f" {changes['project_finish_delta_days']:+d}"
+                f" days, {counts['changed']} activities"
+                f" changed"
+            )
+        if take_snapshot:
+            await self.call_tool(
+                "schedule_compare",
+                action="snapshot",
+                project_id=project_id,
+                label=f"{self.name} run",
+            )
+
+        # Step 3: Run Monte Carlo simulation (shared, fingerprint-cached)
+        mc_data = (await get_simulation_service().simulate(
+            project_id,
+            iterations=10000,
+            sampling="lhs",
+            tolerance=0.5,
+        )).data
         transparency_log.append(
             f"Ran Monte Carlo simulation with"
             f" {mc_data['iterations']} iterations"
@@ -109,7 +174,42 @@ class CriticalPathOptimizer(ConstructionAgent):
             confidence=mc_data.get("confidence", 0.5),
         ))
 
-        # Step 4: Analyze resequencing options
+        # Step 3b: Delay impact on the baseline with shared samples
+        what_if = None
+        if delay_days > 0 and affected_activities:
+            # The network schedule_query reports on, so its
+            # activity ids resolve
+            activities = await get_simulation_service(
+            ).load_activities(
+                project_id
+            ) or project_activity_records(project_id)
+            what_if_result = await self.call_tool(
+                "schedule_what_if",
+                project_id=project_id,
+                activities=activities,
+                activity_durations={
+                    activity: {"delay_days": delay_days}
+                    for activity in affected_activities
+                },
+            )
+            if what_if_result.is_error:
+                transparency_log.append(
+                    f"What-if skipped: {what_if_result.to_text()}"
+                )
+            else:
+                what_if = what_if_result.data
+                transparency_log.append(
+                    f"What-if: {delay_days}-day delay on"
+                    f" {len(affected_activities)} activities"
+                    f" moves P80 by"
+                    f" {what_if['percentiles']['p80']['delta_days']}"
+                    f" days (recomputed"
+                    f" {what_if['recomputed_activities']}"
+                    f" of {what_if['total_activities']}"
+                    f" activities)"
+                )
+
+        # Step 4: Search crew-feasible resequencing alternatives
         critical_activities = cp_data.get(
             "critical_path", {}
         ).get("activities", [])
@@ -117,26 +217,56 @@ class CriticalPathOptimizer(ConstructionAgent):
             a for a in critical_activities
             if a.get("tier_critical")
         ]
-        non_tier_critical = [
-            a for a in critical_activities
-            if not a.get("tier_critical")
-        ]
 
         resequencing_options = []
-        for activity in non_tier_critical:
-            resequencing_options.append({
-                "activity_id": activity["id"],
-                "activity_name": activity["name"],
-                "potential_savings_days": min(
-                    delay_days, 5
-                ),
-                "tier_impact": "none",
-                "commissioning_impact": "minimal",
-            })
+        reseq_result = await self.call_tool(
+            "schedule_resequence",
+            project_id=project_id,
+            crews=ctx.get("crews"),
+        )
+        if reseq_result.is_error:
+            transparency_log.append(
+                f"Resequencing skipped: {reseq_result.to_text()}"
+            )
+        else:
+            reseq = reseq_result.data
+            for alternative in reseq["alternatives"]:
+                resequencing_options.append({
+                    "option": alternative["rank"],
+                    "activity_ids": [
+                        change["successor"]
+                        for change in alternative["changes"]
+                    ],
+                    "changes": alternative["changes"],
+                    "potential_savings_days": (
+                        alternative["days_saved"]
+                    ),
+                    "project_finish": (
+                        alternative["project_finish"]
+                    ),
+                    "tier_impact": "none",
+                    "commissioning_impact": (
+                        "sequence preserved, starts earlier"
+                        if alternative["tier_critical_moved"]
+                        else "none"
+                    ),
+                })
+            transparency_log.append(
+                f"Searched {reseq['evaluations']} crew-"
+                f"feasible sequences against a"
+                f" {reseq['baseline_duration_days']}-day"
+                f" baseline"
+            )
 
+        best_savings = max(
+            (o["potential_savings_days"]
+             for o in resequencing_options),
+            default=0,
+        )
         transparency_log.append(
             f"Identified {len(resequencing_options)}"
-            f" resequencing options;"
+            f" resequencing options (best saves"
+            f" {best_savings} days);"
             f" {len(tier_critical)} tier-critical"
             f" activities protected"
         )
@@ -144,20 +274,23 @@ class CriticalPathOptimizer(ConstructionAgent):
         # Step 5: Create approval request if needed
         approval = None
         if delay_days > 0 and resequencing_options:
+            best = resequencing_options[0]
             approval = ApprovalRequest(
                 id=str(uuid.uuid4()),
                 agent_name=self.name,
                 action_type="schedule_resequence",
                 title=(
                     f"Resequence to recover"
-                    f" {delay_days} day delay"
+                    f" {min(delay_days, best_savings)} of"
+                    f" {delay_days} delay days"
                 ),
                 description=(
-                    f"Proposed resequencing of"
-                    f" {len(resequencing_options)}"
-                    f" non-tier-critical activities to"
-                    f" recover schedule. Tier-critical"
-                    f" activities remain untouched."
+                    f"Fast-track {len(best['changes'])}"
+                    f" finish-to-start links"
+                    f" ({', '.join(best['activity_ids'])})"
+                    f" within current crew capacities."
+                    f" Tier-critical activities keep their"
+                    f" sequence and are never parallelized."
                 ),
                 confidence=mc_data.get(
                     "confidence", 0.5
@@ -165,11 +298,9 @@ class CriticalPathOptimizer(ConstructionAgent):
                 data_sources=data_sources,
                 transparency_log=transparency_log,
                 impact=ImpactSummary(
-                    schedule_delta_days=-min(
-                        delay_days, 5
-                    ),
+                    schedule_delta_days=-best_savings,
                     description=(
-                        "Potential schedule recovery via"
+                        "Schedule recovery via"
                         " resequencing"
                     ),
                 ),
@@ -194,6 +325,16 @@ class CriticalPathOptimizer(ConstructionAgent):
                 "affected_activities": affected_activities,
             },
         }
+        if schedule_changes:
+            event_data["schedule_changes"] = schedule_changes
+        if what_if:
+            event_data["what_if"] = {
+                "percentiles": what_if["percentiles"],
+                "mean_delta_days": what_if["mean_delta_days"],
+                "probability_later": what_if[
+                    "probability_later"
+                ],
+            }
         if approval:
             event_data["approval_request"] = (
                 approval.model_dump()
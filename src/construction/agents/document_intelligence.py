@@ -59,17 +59,17 @@ class DocumentIntelligenceAgent(ConstructionAgent):
         project_id = context.get("project_id", "")
         query = context.get("query", "")
 
-        tool = self._tools.get("document_search")
-        if not tool:
+        if not self._tools.get("document_search"):
             return await self._error_event(
                 "document_search tool not registered"
             )
 
-        result = tool.execute(
+        result = (await self.call_tool(
+            "document_search",
             action=action,
             project_id=project_id,
             query=query,
-        )
+        )).to_text()
 
         event_type = (
             "contradiction_detected"
@@ -67,7 +67,7 @@ class EnvironmentalSustainabilityAgent(ConstructionAgent):
             " weather forecast for environmental risk triggers."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Checked environmental permit status",
@@ -64,7 +64,7 @@ class FinancialIntelligenceAgent(ConstructionAgent):
             " Provide a confidence score for the forecast."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Queried current budget status",
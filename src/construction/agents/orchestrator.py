@@ -3,9 +3,13 @@
 import hashlib
 import json
 import uuid
+from collections.abc import Iterable
 from datetime import UTC, date, datetime
 
+from ai_agent.tools import ToolRegistry
 from construction.agents.base import ConstructionAgent
+from construction.agents.rules import Rule, RuleTable, load_rules
+from construction.agents.triggers import TriggerExecutor
 from construction.config import ConstructionSettings
 from construction.redis_.pubsub import AgentPubSub
 from construction.redis_.shared_memory import SharedMemory
@@ -24,7 +28,8 @@ from construction.tools.notifications import SendNotification
 class Orchestrator:
     """Rule-based coordinator for all construction agents.
 
-    NOT an AI agent — purely deterministic routing logic.
+    NOT an AI agent — purely deterministic routing logic, declared as
+    ``construction.agents.rules.Rule``s.
     """
 
     def __init__(
@@ -33,435 +38,33 @@ class Orchestrator:
         shared_memory: SharedMemory | None,
         pubsub: AgentPubSub | None,
         agents: dict[str, ConstructionAgent],
+        rules: Iterable[Rule] | None = None,
+        executor: TriggerExecutor | None = None,
     ):
         self.settings = settings
         self.shared_memory = shared_memory
         self.pubsub = pubsub
         self.agents = agents
-        self._notification_tool = SendNotification()
+        # Routing rules (built-in plus ORCHESTRATOR_RULES unless given),
+        # compiled once into a dispatch table
+        self.rules = RuleTable(
+            load_rules(settings) if rules is None else rules,
+            settings,
+        )
+        # Runs the triggers handle_event emits, if given
+        self.executor = executor
+        self._tools = ToolRegistry()
+        self._tools.register(SendNotification())
 
     async def handle_event(
         self, event: AgentEvent
     ) -> list[CrossAgentTrigger]:
         """Process an agent event and trigger cross-agent actions."""
-        triggers: list[CrossAgentTrigger] = []
-
-        source = event.source_agent
-        event_type = event.event_type
-        data = event.data
-
-        # SUPPLY_CHAIN.critical_delay
-        # -> CRITICAL_PATH.reoptimize
-        # -> if >$250k: escalate SMS
-        if (
-            source == "supply_chain"
-            and event_type == "critical_delay"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="supply_chain",
-                source_event_type="critical_delay",
-                target_agent="critical_path",
-                target_action="reoptimize",
-                data=data,
-                priority=2,
-            ))
-            impact = data.get("impact_dollars", 0)
-            if impact > self.settings.escalation_impact_threshold:
-                await self._escalate_sms(event)
-
-        # RISK_FORECASTER.safety_critical
-        # -> IMMEDIATE SMS escalation
-        # -> COMPLIANCE.focused_check
-        if (
-            source == "risk_forecaster"
-            and event_type == "safety_critical"
-        ):
+        triggers, escalate = self.rules.dispatch(event)
+        if escalate:
             await self._escalate_sms(event)
-            triggers.append(CrossAgentTrigger(
-                source_agent="risk_forecaster",
-                source_event_type="safety_critical",
-                target_agent="compliance",
-                target_action="focused_check",
-                data=data,
-                priority=1,
-            ))
-
-        # COMPLIANCE.critical_deviation
-        # -> RISK_FORECASTER.reassess
-        if (
-            source == "compliance"
-            and event_type == "critical_deviation"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="compliance",
-                source_event_type="critical_deviation",
-                target_agent="risk_forecaster",
-                target_action="reassess",
-                data=data,
-                priority=3,
-            ))
-
-        # DOCUMENT_INTELLIGENCE.contradiction_detected
-        # -> COMPLIANCE.focused_check
-        if (
-            source == "document_intelligence"
-            and event_type == "contradiction_detected"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="document_intelligence",
-                source_event_type="contradiction_detected",
-                target_agent="compliance",
-                target_action="focused_check",
-                data=data,
-                priority=3,
-            ))
-
-        # FINANCIAL.budget_variance > 10%
-        # -> CRITICAL_PATH.reoptimize
-        # -> SUPPLY_CHAIN.cost_reduction_scan
-        if (
-            source == "financial"
-            and event_type == "budget_variance"
-        ):
-            variance = data.get("variance_pct", 0)
-            if variance > 10:
-                triggers.append(CrossAgentTrigger(
-                    source_agent="financial",
-                    source_event_type="budget_variance",
-                    target_agent="critical_path",
-                    target_action="reoptimize",
-                    data=data,
-                    priority=3,
-                ))
-                triggers.append(CrossAgentTrigger(
-                    source_agent="financial",
-                    source_event_type="budget_variance",
-                    target_agent="supply_chain",
-                    target_action="cost_reduction_scan",
-                    data=data,
-                    priority=3,
-                ))
-
-        # WORKFORCE.labor_shortage_detected
-        # -> CRITICAL_PATH.reoptimize
-        # -> SITE_LOGISTICS.headcount_update
-        if (
-            source == "workforce"
-            and event_type == "labor_shortage_detected"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="workforce",
-                source_event_type="labor_shortage_detected",
-                target_agent="critical_path",
-                target_action="reoptimize",
-                data=data,
-                priority=3,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="workforce",
-                source_event_type="labor_shortage_detected",
-                target_agent="site_logistics",
-                target_action="headcount_update",
-                data=data,
-                priority=4,
-            ))
-
-        # COMMISSIONING.prerequisite_blocked
-        # -> CRITICAL_PATH.reoptimize
-        # -> SUPPLY_CHAIN.expedite_check
-        if (
-            source == "commissioning_turnover"
-            and event_type == "prerequisite_blocked"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="commissioning_turnover",
-                source_event_type="prerequisite_blocked",
-                target_agent="critical_path",
-                target_action="reoptimize",
-                data=data,
-                priority=3,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="commissioning_turnover",
-                source_event_type="prerequisite_blocked",
-                target_agent="supply_chain",
-                target_action="expedite_check",
-                data=data,
-                priority=4,
-            ))
-
-        # ENVIRONMENTAL.permit_violation_risk
-        # -> COMPLIANCE.focused_check
-        # -> RISK_FORECASTER.reassess
-        if (
-            source == "environmental_sustainability"
-            and event_type == "permit_violation_risk"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="environmental_sustainability",
-                source_event_type="permit_violation_risk",
-                target_agent="compliance",
-                target_action="focused_check",
-                data=data,
-                priority=2,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="environmental_sustainability",
-                source_event_type="permit_violation_risk",
-                target_agent="risk_forecaster",
-                target_action="reassess",
-                data=data,
-                priority=3,
-            ))
-
-        # SITE_LOGISTICS.crane_conflict
-        # -> CRITICAL_PATH.reoptimize
-        # -> SAFETY.crane_safety_check
-        if (
-            source == "site_logistics"
-            and event_type == "crane_conflict"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="site_logistics",
-                source_event_type="crane_conflict",
-                target_agent="critical_path",
-                target_action="reoptimize",
-                data=data,
-                priority=3,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="site_logistics",
-                source_event_type="crane_conflict",
-                target_agent="safety_compliance",
-                target_action="crane_safety_check",
-                data=data,
-                priority=2,
-            ))
-
-        # SAFETY.stop_work_recommended (HIGHEST PRIORITY)
-        # -> ALL agents notified
-        # -> IMMEDIATE SMS escalation
-        # -> SITE_LOGISTICS.halt_operations
-        # -> CRITICAL_PATH.reoptimize
-        if (
-            source == "safety_compliance"
-            and event_type == "stop_work_recommended"
-        ):
-            await self._escalate_sms(event)
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="stop_work_recommended",
-                target_agent="site_logistics",
-                target_action="halt_operations",
-                data=data,
-                priority=1,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="stop_work_recommended",
-                target_agent="critical_path",
-                target_action="reoptimize",
-                data=data,
-                priority=1,
-            ))
-
-        # SAFETY.contractor_high_risk
-        # -> SUPPLY_CHAIN.contractor_review
-        # -> RISK_FORECASTER.reassess
-        if (
-            source == "safety_compliance"
-            and event_type == "contractor_high_risk"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="contractor_high_risk",
-                target_agent="supply_chain",
-                target_action="contractor_review",
-                data=data,
-                priority=2,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="contractor_high_risk",
-                target_agent="risk_forecaster",
-                target_action="reassess",
-                data=data,
-                priority=3,
-            ))
-
-        # SAFETY.exposure_threshold_exceeded
-        # -> ENVIRONMENTAL.exposure_response
-        # -> WORKFORCE.affected_workers
-        if (
-            source == "safety_compliance"
-            and event_type == "exposure_threshold_exceeded"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="exposure_threshold_exceeded",
-                target_agent="environmental_sustainability",
-                target_action="exposure_response",
-                data=data,
-                priority=2,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="exposure_threshold_exceeded",
-                target_agent="workforce",
-                target_action="affected_workers",
-                data=data,
-                priority=2,
-            ))
-
-        # SAFETY.training_expired
-        # -> WORKFORCE.certification_alert
-        # -> SITE_LOGISTICS.access_restriction
-        if (
-            source == "safety_compliance"
-            and event_type == "training_expired"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="training_expired",
-                target_agent="workforce",
-                target_action="certification_alert",
-                data=data,
-                priority=3,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="training_expired",
-                target_agent="site_logistics",
-                target_action="access_restriction",
-                data=data,
-                priority=3,
-            ))
-
-        # SAFETY.nfpa_violation
-        # -> COMPLIANCE.focused_check (fire/life safety)
-        # -> RISK_FORECASTER.reassess
-        if (
-            source == "safety_compliance"
-            and event_type == "nfpa_violation"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="nfpa_violation",
-                target_agent="compliance",
-                target_action="focused_check",
-                data=data,
-                priority=2,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="safety_compliance",
-                source_event_type="nfpa_violation",
-                target_agent="risk_forecaster",
-                target_action="reassess",
-                data=data,
-                priority=3,
-            ))
-
-        # COMPLIANCE.tier_certification_risk
-        # -> CRITICAL_PATH.reoptimize
-        # -> RISK_FORECASTER.reassess
-        if (
-            source == "compliance_verifier"
-            and event_type == "tier_certification_risk"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="compliance_verifier",
-                source_event_type="tier_certification_risk",
-                target_agent="critical_path",
-                target_action="reoptimize",
-                data=data,
-                priority=2,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="compliance_verifier",
-                source_event_type="tier_certification_risk",
-                target_agent="risk_forecaster",
-                target_action="reassess",
-                data=data,
-                priority=2,
-            ))
-
-        # COMPLIANCE.icc_code_violation
-        # -> RISK_FORECASTER.reassess
-        # -> COMMUNICATION.draft_notice
-        if (
-            source == "compliance_verifier"
-            and event_type == "icc_code_violation"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="compliance_verifier",
-                source_event_type="icc_code_violation",
-                target_agent="risk_forecaster",
-                target_action="reassess",
-                data=data,
-                priority=3,
-            ))
-
-        # ENVIRONMENTAL.epa_enforcement_risk
-        # -> RISK_FORECASTER.reassess
-        # -> SITE_LOGISTICS.restrict_activity
-        # -> escalate if critical
-        if (
-            source == "environmental_sustainability"
-            and event_type == "epa_enforcement_risk"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="environmental_sustainability",
-                source_event_type="epa_enforcement_risk",
-                target_agent="risk_forecaster",
-                target_action="reassess",
-                data=data,
-                priority=2,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="environmental_sustainability",
-                source_event_type="epa_enforcement_risk",
-                target_agent="site_logistics",
-                target_action="restrict_activity",
-                data=data,
-                priority=2,
-            ))
-            impact = data.get("impact_dollars", 0)
-            if impact > self.settings.escalation_impact_threshold:
-                await self._escalate_sms(event)
-
-        # WEATHER.heat_index > NIOSH_threshold
-        # -> SAFETY.heat_illness_check
-        # -> WORKFORCE.schedule_adjustment
-        # -> SITE_LOGISTICS.schedule_adjustment
-        if (
-            source == "risk_forecaster"
-            and event_type == "heat_index_exceeded"
-        ):
-            triggers.append(CrossAgentTrigger(
-                source_agent="risk_forecaster",
-                source_event_type="heat_index_exceeded",
-                target_agent="safety_compliance",
-                target_action="heat_illness_check",
-                data=data,
-                priority=2,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="risk_forecaster",
-                source_event_type="heat_index_exceeded",
-                target_agent="workforce",
-                target_action="schedule_adjustment",
-                data=data,
-                priority=3,
-            ))
-            triggers.append(CrossAgentTrigger(
-                source_agent="risk_forecaster",
-                source_event_type="heat_index_exceeded",
-                target_agent="site_logistics",
-                target_action="schedule_adjustment",
-                data=data,
-                priority=3,
-            ))
-
+        if self.executor:
+            await self.executor.submit(triggers)
         return triggers
 
     async def generate_daily_brief(
@@ -497,29 +100,27 @@ class Orchestrator:
         )
 
     async def check_dedup(self, event: AgentEvent) -> bool:
-        """Check if similar alert was sent within 4h TTL."""
+        """Check if similar alert was sent within 4h TTL.
+
+        Claims the alert atomically, so of several workers handling
+        the same alert exactly one sees it as new.
+        """
         if not self.shared_memory:
             return False
-
-        alert_content = json.dumps(
-            {
-                "source": event.source_agent,
-                "type": event.event_type,
-                "data": event.data,
-            },
-            sort_keys=True,
-            default=str,
+        return not await self.shared_memory.claim_dedup(
+            _alert_hash(event)
         )
-        alert_hash = hashlib.sha256(
-            alert_content.encode()
-        ).hexdigest()
 
-        is_dup = await self.shared_memory.check_dedup(
-            alert_hash
+    async def check_dedup_many(
+        self, events: list[AgentEvent]
+    ) -> list[bool]:
+        """``check_dedup`` for a burst of events in one round trip."""
+        if not self.shared_memory:
+            return [False] * len(events)
+        claimed = await self.shared_memory.claim_dedup_many(
+            [_alert_hash(event) for event in events]
         )
-        if not is_dup:
-            await self.shared_memory.mark_dedup(alert_hash)
-        return is_dup
+        return [not first for first in claimed]
 
     async def process_approval(
         self,
@@ -558,11 +159,14 @@ class Orchestrator:
         if data_desc:
             message += f" — {data_desc}"
 
-        self._notification_tool.execute(
-            method="sms",
-            recipient=self.settings.pm_phone_number,
-            message=message,
-            priority="critical",
+        await self._tools.aexecute(
+            "send_notification",
+            {
+                "method": "sms",
+                "recipient": self.settings.pm_phone_number,
+                "message": message,
+                "priority": "critical",
+            },
         )
 
         if self.pubsub:
@@ -715,3 +319,17 @@ class Orchestrator:
                 f" @ ${accel.cost:,.0f}"
             )
         return "\n".join(lines)
+
+
+def _alert_hash(event: AgentEvent) -> str:
+    """Dedup hash of an alert's source, type and data."""
+    alert_content = json.dumps(
+        {
+            "source": event.source_agent,
+            "type": event.event_type,
+            "data": event.data,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(alert_content.encode()).hexdigest()
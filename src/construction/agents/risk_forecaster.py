@@ -65,7 +65,7 @@ class RiskForecasterAgent(ConstructionAgent):
             " or any safety-critical items."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Checked 14-day weather forecast",
@@ -0,0 +1,296 @@
+"""Declarative cross-agent routing rules for the orchestrator.
+
+A ``Rule`` maps one ``(source_agent, event_type)`` to the triggers it fires,
+guarded by predicates on the event data such as ``"variance_pct > 10"``. A
+predicate's right-hand side is a number, ``true``/``false`` or the name of a
+setting (``"impact_dollars > escalation_impact_threshold"``); a field
+missing from the event data compares as 0.
+
+``RuleTable`` compiles the rules once into a dict keyed by
+``(source_agent, event_type)`` holding predicate closures and prebuilt
+trigger fields, so routing an event is one lookup plus that key's own
+predicates however many rules exist. ``load_rules`` returns the built-in
+``DEFAULT_RULES`` with the ``ORCHESTRATOR_RULES`` setting applied: rules in
+the setting replace the built-in rules for their key, so a rule with no
+targets and no escalation switches a route off.
+"""
+
+import operator
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+from construction.schemas.common import AgentEvent
+from construction.schemas.orchestrator import CrossAgentTrigger
+
+_OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_PREDICATE = re.compile(r"^\s*(\w+)\s*(>=|<=|==|!=|>|<)\s*(\S+)\s*$")
+_LITERALS = {"true": True, "false": False}
+
+Predicate = Callable[[Mapping], bool]
+
+
+@dataclass(frozen=True)
+class Target:
+    """An agent action a rule triggers."""
+
+    agent: str
+    action: str
+    priority: int = 5  # 1=highest, 10=lowest
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Route one agent event type to other agents' actions.
+
+    The rule fires when every ``when`` predicate holds; it then triggers
+    ``targets`` and, if ``escalate`` and every ``escalate_when`` predicate
+    holds, sends the PM an SMS escalation.
+    """
+
+    source: str
+    event_type: str
+    targets: tuple[Target, ...] = ()
+    when: tuple[str, ...] = ()
+    escalate: bool = False
+    escalate_when: tuple[str, ...] = ()
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.source, self.event_type)
+
+    @classmethod
+    def from_record(cls, record: Mapping) -> "Rule":
+        """Rule from a dict: ``source``, ``event_type``, ``targets`` (each an
+        ``agent``, ``action`` and optional ``priority``), and optional
+        ``when``, ``escalate`` and ``escalate_when``."""
+        return cls(
+            source=record["source"],
+            event_type=record["event_type"],
+            targets=tuple(
+                Target(target["agent"], target["action"], int(target.get("priority", 5)))
+                for target in record.get("targets", ())
+            ),
+            when=tuple(record.get("when", ())),
+            escalate=bool(record.get("escalate", False)),
+            escalate_when=tuple(record.get("escalate_when", ())),
+        )
+
+
+class _CompiledRule:
+    __slots__ = ("escalate", "escalate_when", "targets", "when")
+
+    def __init__(self, rule: Rule, settings):
+        self.when = _compile_all(rule.when, settings)
+        self.escalate = rule.escalate
+        self.escalate_when = _compile_all(rule.escalate_when, settings)
+        self.targets = tuple(
+            {
+                "source_agent": rule.source,
+                "source_event_type": rule.event_type,
+                "target_agent": target.agent,
+                "target_action": target.action,
+                "priority": target.priority,
+            }
+            for target in rule.targets
+        )
+
+    def fire(self, data: Mapping, triggers: list[CrossAgentTrigger]) -> bool:
+        """Append the rule's triggers for ``data``; returns whether to escalate."""
+        if self.when is not None and not self.when(data):
+            return False
+        triggers.extend(CrossAgentTrigger(data=data, **target) for target in self.targets)
+        return self.escalate and (self.escalate_when is None or self.escalate_when(data))
+
+
+class RuleTable:
+    """Rules compiled into an ``(source_agent, event_type)`` dispatch table."""
+
+    def __init__(self, rules: Iterable[Rule], settings):
+        table: dict[tuple[str, str], list[_CompiledRule]] = {}
+        for rule in rules:
+            table.setdefault(rule.key, []).append(_CompiledRule(rule, settings))
+        self._table = {key: tuple(compiled) for key, compiled in table.items()}
+
+    def __len__(self) -> int:
+        return sum(len(compiled) for compiled in self._table.values())
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._table
+
+    def dispatch(self, event: AgentEvent) -> tuple[list[CrossAgentTrigger], bool]:
+        """(triggers, whether to escalate) for an event."""
+        compiled = self._table.get((event.source_agent, event.event_type))
+        if compiled is None:
+            return [], False
+        triggers: list[CrossAgentTrigger] = []
+        escalate = False
+        for rule in compiled:
+            escalate = rule.fire(event.data, triggers) or escalate
+        return triggers, escalate
+
+
+def load_rules(settings) -> list[Rule]:
+    """``DEFAULT_RULES`` with the rules from ``settings.orchestrator_rules`` applied."""
+    configured = [Rule.from_record(record) for record in settings.orchestrator_rules]
+    replaced = {rule.key for rule in configured}
+    return [rule for rule in DEFAULT_RULES if rule.key not in replaced] + configured
+
+
+def _compile_all(predicates: tuple[str, ...], settings) -> Predicate | None:
+    """One callable testing every predicate, or None for none."""
+    if not predicates:
+        return None
+    compiled = [_compile(predicate, settings) for predicate in predicates]
+    if len(compiled) == 1:
+        return compiled[0]
+    return lambda data: all(test(data) for test in compiled)
+
+
+def _compile(predicate: str, settings) -> Predicate:
+    match = _PREDICATE.match(predicate)
+    if match is None:
+        raise ValueError(f"Invalid rule predicate '{predicate}'")
+    field, symbol, operand = match.groups()
+    compare = _OPERATORS[symbol]
+    value = _operand(operand, settings)
+    return lambda data: compare(data.get(field, 0), value)
+
+
+def _operand(text: str, settings):
+    """A predicate's right-hand side: literal or setting value."""
+    if text.lower() in _LITERALS:
+        return _LITERALS[text.lower()]
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        return getattr(settings, text)
+    except AttributeError:
+        raise ValueError(f"Rule predicate names unknown setting '{text}'") from None
+
+
+def _rule(source, event_type, *targets, when=(), escalate=False, escalate_when=()):
+    return Rule(
+        source,
+        event_type,
+        tuple(Target(*target) for target in targets),
+        tuple(when),
+        escalate,
+        tuple(escalate_when),
+    )
+
+
+_OVER_THRESHOLD = ("impact_dollars > escalation_impact_threshold",)
+
+DEFAULT_RULES: tuple[Rule, ...] = (
+    _rule(
+        "supply_chain",
+        "critical_delay",
+        ("critical_path", "reoptimize", 2),
+        escalate=True,
+        escalate_when=_OVER_THRESHOLD,
+    ),
+    _rule(
+        "risk_forecaster",
+        "safety_critical",
+        ("compliance", "focused_check", 1),
+        escalate=True,
+    ),
+    _rule("compliance", "critical_deviation", ("risk_forecaster", "reassess", 3)),
+    _rule("document_intelligence", "contradiction_detected", ("compliance", "focused_check", 3)),
+    _rule(
+        "financial",
+        "budget_variance",
+        ("critical_path", "reoptimize", 3),
+        ("supply_chain", "cost_reduction_scan", 3),
+        when=("variance_pct > 10",),
+    ),
+    _rule(
+        "workforce",
+        "labor_shortage_detected",
+        ("critical_path", "reoptimize", 3),
+        ("site_logistics", "headcount_update", 4),
+    ),
+    _rule(
+        "commissioning_turnover",
+        "prerequisite_blocked",
+        ("critical_path", "reoptimize", 3),
+        ("supply_chain", "expedite_check", 4),
+    ),
+    _rule(
+        "environmental_sustainability",
+        "permit_violation_risk",
+        ("compliance", "focused_check", 2),
+        ("risk_forecaster", "reassess", 3),
+    ),
+    _rule(
+        "site_logistics",
+        "crane_conflict",
+        ("critical_path", "reoptimize", 3),
+        ("safety_compliance", "crane_safety_check", 2),
+    ),
+    # Highest priority: halt operations, re-plan and page the PM
+    _rule(
+        "safety_compliance",
+        "stop_work_recommended",
+        ("site_logistics", "halt_operations", 1),
+        ("critical_path", "reoptimize", 1),
+        escalate=True,
+    ),
+    _rule(
+        "safety_compliance",
+        "contractor_high_risk",
+        ("supply_chain", "contractor_review", 2),
+        ("risk_forecaster", "reassess", 3),
+    ),
+    _rule(
+        "safety_compliance",
+        "exposure_threshold_exceeded",
+        ("environmental_sustainability", "exposure_response", 2),
+        ("workforce", "affected_workers", 2),
+    ),
+    _rule(
+        "safety_compliance",
+        "training_expired",
+        ("workforce", "certification_alert", 3),
+        ("site_logistics", "access_restriction", 3),
+    ),
+    _rule(
+        "safety_compliance",
+        "nfpa_violation",
+        ("compliance", "focused_check", 2),
+        ("risk_forecaster", "reassess", 3),
+    ),
+    _rule(
+        "compliance_verifier",
+        "tier_certification_risk",
+        ("critical_path", "reoptimize", 2),
+        ("risk_forecaster", "reassess", 2),
+    ),
+    _rule("compliance_verifier", "icc_code_violation", ("risk_forecaster", "reassess", 3)),
+    _rule(
+        "environmental_sustainability",
+        "epa_enforcement_risk",
+        ("risk_forecaster", "reassess", 2),
+        ("site_logistics", "restrict_activity", 2),
+        escalate=True,
+        escalate_when=_OVER_THRESHOLD,
+    ),
+    # Heat index over the NIOSH threshold
+    _rule(
+        "risk_forecaster",
+        "heat_index_exceeded",
+        ("safety_compliance", "heat_illness_check", 2),
+        ("workforce", "schedule_adjustment", 3),
+        ("site_logistics", "schedule_adjustment", 3),
+    ),
+)
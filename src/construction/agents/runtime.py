@@ -0,0 +1,121 @@
+"""Long-running orchestrator: agent events in, cross-agent trigger runs out.
+
+``OrchestratorRuntime`` subscribes the orchestrator to
+``channel:agent_events`` on the event bus and runs the triggers it emits
+through a ``TriggerExecutor`` on one instance of every agent. The API
+starts one in its lifespan (``ORCHESTRATOR_RUNTIME``); without Redis it is
+skipped with a warning and the API serves requests as before.
+"""
+
+import logging
+from collections.abc import Mapping
+
+import redis.asyncio as redis
+
+from construction.agents.base import ConstructionAgent
+from construction.agents.orchestrator import Orchestrator
+from construction.agents.triggers import TriggerExecutor
+from construction.config import ConstructionSettings, get_construction_settings
+from construction.redis_.client import get_redis_client
+from construction.redis_.pubsub import AGENT_EVENTS
+from construction.redis_.shared_memory import SharedMemory
+from construction.redis_.streams import build_agent_bus
+from construction.redis_.trigger_queue import build_trigger_executor
+from construction.schemas.common import AgentEvent
+
+logger = logging.getLogger(__name__)
+
+# Names the orchestrator rules target that differ from the agent's own
+_RULE_ALIASES = {
+    "compliance": "compliance_verifier",
+    "workforce": "workforce_labor",
+}
+
+
+def build_agents(
+    settings: ConstructionSettings,
+    shared_memory: SharedMemory | None = None,
+    pubsub=None,
+) -> dict[str, ConstructionAgent]:
+    """One instance of every agent, keyed by its name and by the names the
+    orchestrator rules use for it."""
+    from construction.agents.claims_dispute import ClaimsDisputeAgent
+    from construction.agents.commissioning_turnover import CommissioningTurnoverAgent
+    from construction.agents.compliance_verifier import ComplianceVerifier
+    from construction.agents.critical_path import CriticalPathOptimizer
+    from construction.agents.document_intelligence import DocumentIntelligenceAgent
+    from construction.agents.environmental_sustainability import (
+        EnvironmentalSustainabilityAgent,
+    )
+    from construction.agents.financial_intelligence import FinancialIntelligenceAgent
+    from construction.agents.risk_forecaster import RiskForecasterAgent
+    from construction.agents.safety_compliance import SafetyComplianceAgent
+    from construction.agents.site_logistics import SiteLogisticsAgent
+    from construction.agents.stakeholder_communication import StakeholderCommunicationAgent
+    from construction.agents.supply_chain import SupplyChainAgent
+    from construction.agents.workforce_labor import WorkforceLaborAgent
+
+    classes = (
+        ClaimsDisputeAgent,
+        CommissioningTurnoverAgent,
+        ComplianceVerifier,
+        CriticalPathOptimizer,
+        DocumentIntelligenceAgent,
+        EnvironmentalSustainabilityAgent,
+        FinancialIntelligenceAgent,
+        RiskForecasterAgent,
+        SafetyComplianceAgent,
+        SiteLogisticsAgent,
+        StakeholderCommunicationAgent,
+        SupplyChainAgent,
+        WorkforceLaborAgent,
+    )
+    agents = {cls.name: cls(settings, shared_memory, pubsub) for cls in classes}
+    for alias, name in _RULE_ALIASES.items():
+        agents[alias] = agents[name]
+    return agents
+
+
+class OrchestratorRuntime:
+    """Routes bus events through the orchestrator and runs its triggers."""
+
+    def __init__(self, orchestrator: Orchestrator, bus, executor: TriggerExecutor):
+        self.orchestrator = orchestrator
+        self.bus = bus
+        self.executor = executor
+
+    async def start(self) -> None:
+        await self.bus.subscribe(AGENT_EVENTS, self._on_event)
+        await self.bus.start_listening()
+        await self.executor.start()
+
+    async def stop(self) -> None:
+        """Stop taking events, then cancel the trigger runs in flight."""
+        await self.bus.stop()
+        await self.executor.stop()
+
+    async def _on_event(self, data: Mapping) -> None:
+        await self.orchestrator.handle_event(AgentEvent.model_validate(data))
+
+
+async def start_orchestrator_runtime(
+    settings: ConstructionSettings | None = None,
+    redis_client: redis.Redis | None = None,
+    agents: Mapping[str, ConstructionAgent] | None = None,
+) -> OrchestratorRuntime | None:
+    """Build and start the runtime, or None when Redis is unreachable."""
+    settings = settings or get_construction_settings()
+    redis_client = redis_client or await get_redis_client()
+    shared_memory = SharedMemory(redis_client)
+    bus = build_agent_bus(redis_client, settings)
+    if agents is None:
+        agents = build_agents(settings, shared_memory, bus)
+    executor = build_trigger_executor(agents, settings, redis_client)
+    orchestrator = Orchestrator(settings, shared_memory, bus, dict(agents), executor=executor)
+    runtime = OrchestratorRuntime(orchestrator, bus, executor)
+    try:
+        await runtime.start()
+    except (redis.ConnectionError, redis.TimeoutError) as exc:
+        logger.warning("Orchestrator runtime not started, Redis unavailable: %s", exc)
+        return None
+    return runtime
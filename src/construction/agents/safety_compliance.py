@@ -90,7 +90,7 @@ class SafetyComplianceAgent(ConstructionAgent):
             " readiness. Flag any stop-work conditions."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Checked Focus Four hazard status",
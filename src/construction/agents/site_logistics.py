@@ -59,7 +59,7 @@ class SiteLogisticsAgent(ConstructionAgent):
             " against plan, and check site permit status."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Checked crane schedule for conflicts",
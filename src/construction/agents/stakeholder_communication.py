@@ -68,7 +68,7 @@ class StakeholderCommunicationAgent(ConstructionAgent):
             " PM review — do not make any decisions."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             f"Drafted {action} for project {project_id}",
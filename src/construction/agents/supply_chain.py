@@ -60,7 +60,7 @@ class SupplyChainAgent(ConstructionAgent):
             " might affect port operations or deliveries."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Checked all vendor statuses",
@@ -0,0 +1,322 @@
+"""Execution of the cross-agent triggers the orchestrator emits.
+
+``Orchestrator.handle_event`` turns one agent's event into
+``CrossAgentTrigger``s for other agents; ``TriggerExecutor`` runs them.
+Triggers are queued per coalescing key (target agent, action and project):
+triggers for a key already waiting are merged into it, so a storm of five
+``critical_path.reoptimize`` triggers inside ``window`` seconds becomes one
+run whose context holds the merged ``data``, the triggering events and the
+count. Queued batches run highest priority first, at most ``concurrency``
+runs per target agent at a time.
+
+Priority-1 (safety) triggers skip the coalescing window and never wait for
+a busy agent: if the agent is at its limit, its lowest-priority run is
+cancelled and put back on the queue, or the trigger runs over the limit
+when everything running is priority 1 too.
+
+``LocalTriggerQueue`` keeps the queue in process; ``RedisTriggerQueue`` in
+``construction.redis_.trigger_queue`` shares it between workers.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from construction.schemas.orchestrator import CrossAgentTrigger
+
+logger = logging.getLogger(__name__)
+
+SAFETY_PRIORITY = 1
+
+
+@dataclass
+class TriggerBatch:
+    """Queued triggers for one agent action, coalesced into a single run."""
+
+    key: str
+    target_agent: str
+    target_action: str
+    priority: int
+    data: dict
+    # "source_agent.event_type" of each distinct triggering event
+    sources: list[str]
+    count: int
+
+    @classmethod
+    def merge(cls, key: str, items: Sequence[Mapping]) -> "TriggerBatch":
+        """Batch from queued items (``trigger_item`` records) in queue order."""
+        agent, action, _ = key.split("|", 2)
+        data: dict = {}
+        sources: list[str] = []
+        for item in items:
+            data.update(item["data"])
+            sources.extend(s for s in item["sources"] if s not in sources)
+        return cls(
+            key=key,
+            target_agent=agent,
+            target_action=action,
+            priority=min(item["priority"] for item in items),
+            data=data,
+            sources=sources,
+            count=sum(item["count"] for item in items),
+        )
+
+    def item(self) -> dict:
+        """The batch as one queue item, to put it back on the queue."""
+        return {
+            "priority": self.priority,
+            "data": self.data,
+            "sources": self.sources,
+            "count": self.count,
+        }
+
+    def context(self) -> dict:
+        """``ConstructionAgent.run`` context for the batch."""
+        return {
+            **self.data,
+            "trigger_action": self.target_action,
+            "trigger_priority": self.priority,
+            "triggered_by": self.sources,
+            "coalesced_triggers": self.count,
+        }
+
+
+def trigger_key(trigger: CrossAgentTrigger) -> str:
+    """Coalescing key: triggers with the same key share one run."""
+    project_id = trigger.data.get("project_id", "")
+    return f"{trigger.target_agent}|{trigger.target_action}|{project_id}"
+
+
+def trigger_item(trigger: CrossAgentTrigger) -> dict:
+    """A trigger as a JSON-ready queue item."""
+    return {
+        "priority": trigger.priority,
+        "data": trigger.data,
+        "sources": [f"{trigger.source_agent}.{trigger.source_event_type}"],
+        "count": 1,
+    }
+
+
+class TriggerQueue(Protocol):
+    async def push(self, triggers: Iterable[CrossAgentTrigger]) -> None: ...
+
+    async def requeue(self, batch: TriggerBatch) -> None: ...
+
+    async def pop(self, busy: Collection[str] = ()) -> TriggerBatch | None: ...
+
+
+@dataclass
+class _Pending:
+    items: list[dict]
+    priority: int
+    ready_at: float
+
+
+class LocalTriggerQueue:
+    """In-process coalescing priority queue of triggers."""
+
+    def __init__(self, window: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self._clock = clock
+        self._pending: dict[str, _Pending] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def push(self, triggers: Iterable[CrossAgentTrigger]) -> None:
+        for trigger in triggers:
+            self._add(trigger_key(trigger), trigger_item(trigger), self.window)
+
+    async def requeue(self, batch: TriggerBatch) -> None:
+        self._add(batch.key, batch.item(), 0.0)
+
+    async def pop(self, busy: Collection[str] = ()) -> TriggerBatch | None:
+        """The ready batch that runs next, skipping non-safety batches for ``busy`` agents."""
+        now = self._clock()
+        best = None
+        for key, pending in self._pending.items():
+            if pending.ready_at > now:
+                continue
+            if pending.priority > SAFETY_PRIORITY and key.split("|", 1)[0] in busy:
+                continue
+            if best is None or (pending.priority, pending.ready_at) < best[0]:
+                best = ((pending.priority, pending.ready_at), key)
+        if best is None:
+            return None
+        key = best[1]
+        return TriggerBatch.merge(key, self._pending.pop(key).items)
+
+    def _add(self, key: str, item: dict, window: float) -> None:
+        priority = item["priority"]
+        ready_at = self._clock() + (0.0 if priority <= SAFETY_PRIORITY else window)
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = _Pending([item], priority, ready_at)
+            return
+        pending.items.append(item)
+        if priority < pending.priority:
+            pending.priority = priority
+        pending.ready_at = min(pending.ready_at, ready_at)
+
+
+@dataclass
+class _Run:
+    batch: TriggerBatch
+    task: asyncio.Task
+
+
+@dataclass
+class ExecutorStats:
+    """Counts since the executor started."""
+
+    triggers: int = 0
+    # Runs completed; failed and preempted runs are counted apart
+    runs: int = 0
+    preempted: int = 0
+    failed: int = 0
+    unknown_agent: int = 0
+    # Triggers folded into another trigger's run
+    coalesced: int = 0
+
+    def record(self, batch: TriggerBatch) -> None:
+        """Count a completed run."""
+        self.runs += 1
+        self.coalesced += batch.count - 1
+
+
+class TriggerExecutor:
+    """Runs queued trigger batches on the target agents.
+
+    ``agents`` maps agent names to ``ConstructionAgent``s; batches for
+    agents not in it are dropped with a warning. ``concurrency`` overrides
+    ``default_concurrency`` per agent.
+    """
+
+    def __init__(
+        self,
+        queue: TriggerQueue,
+        agents: Mapping,
+        concurrency: Mapping[str, int] | None = None,
+        default_concurrency: int = 1,
+        poll_interval: float = 0.5,
+    ):
+        self.queue = queue
+        self.agents = agents
+        self.concurrency = dict(concurrency or {})
+        self.default_concurrency = default_concurrency
+        self.poll_interval = poll_interval
+        self.stats = ExecutorStats()
+        self._running: dict[str, list[_Run]] = {}
+        self._wake = asyncio.Event()
+        self._loop_task: asyncio.Task | None = None
+
+    async def submit(self, triggers: Sequence[CrossAgentTrigger]) -> None:
+        """Queue triggers; priority-1 ones start right away."""
+        if not triggers:
+            return
+        await self.queue.push(triggers)
+        self.stats.triggers += len(triggers)
+        self._wake.set()
+
+    async def start(self) -> None:
+        """Start the background dispatch loop."""
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop dispatching and cancel the runs in flight."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+        tasks = [run.task for runs in self._running.values() for run in runs]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def running(self, agent: str | None = None) -> list[TriggerBatch]:
+        """Batches running now, for one agent or all."""
+        return [
+            run.batch
+            for name, runs in self._running.items()
+            if agent is None or name == agent
+            for run in runs
+        ]
+
+    async def dispatch(self) -> list[asyncio.Task]:
+        """Start every ready batch the concurrency limits allow."""
+        started = []
+        while True:
+            busy = [
+                agent for agent, runs in self._running.items() if len(runs) >= self._limit(agent)
+            ]
+            batch = await self.queue.pop(busy)
+            if batch is None:
+                return started
+            agent = self.agents.get(batch.target_agent)
+            if agent is None:
+                self.stats.unknown_agent += 1
+                logger.warning("Dropping trigger for unknown agent %s", batch.target_agent)
+                continue
+            if batch.target_agent in busy:
+                await self._preempt(batch.target_agent)
+            started.append(self._start(agent, batch))
+
+    async def drain(self) -> None:
+        """Dispatch until nothing is ready or running (for tests and shutdown)."""
+        while True:
+            await self.dispatch()
+            tasks = [run.task for runs in self._running.values() for run in runs]
+            if not tasks:
+                return
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+    async def _loop(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                await self.dispatch()
+            except Exception:
+                logger.exception("Trigger dispatch failed")
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except TimeoutError:
+                pass
+
+    def _limit(self, agent: str) -> int:
+        return self.concurrency.get(agent, self.default_concurrency)
+
+    def _start(self, agent, batch: TriggerBatch) -> asyncio.Task:
+        task = asyncio.create_task(self._run(agent, batch))
+        self._running.setdefault(batch.target_agent, []).append(_Run(batch, task))
+        return task
+
+    async def _run(self, agent, batch: TriggerBatch) -> None:
+        try:
+            await agent.run(batch.context())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.stats.failed += 1
+            logger.exception("Trigger run %s failed", batch.key)
+        else:
+            self.stats.record(batch)
+        finally:
+            runs = self._running.get(batch.target_agent, [])
+            runs[:] = [run for run in runs if run.batch is not batch]
+            # A slot freed up
+            self._wake.set()
+
+    async def _preempt(self, agent: str) -> None:
+        """Make room for a safety batch: cancel and requeue the agent's lowest-priority run."""
+        runs = [run for run in self._running.get(agent, []) if run.batch.priority > SAFETY_PRIORITY]
+        if not runs:
+            return
+        victim = max(runs, key=lambda run: run.batch.priority)
+        victim.task.cancel()
+        await asyncio.gather(victim.task, return_exceptions=True)
+        self.stats.preempted += 1
+        await self.queue.requeue(victim.batch)
@@ -65,7 +65,7 @@ class WorkforceLaborAgent(ConstructionAgent):
             " certifications expiring within 30 days."
         )
 
-        response = self.chat(prompt)
+        response = await self.achat(prompt)
 
         transparency_log = [
             "Checked crew status for all trades",
@@ -2,15 +2,38 @@
 
 from contextlib import asynccontextmanager
 
+from anthropic import Anthropic, AsyncAnthropic
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from ai_agent.agent import shutdown_tool_executors
+from ai_agent.clients import aclose_shared_clients, get_shared_client
+from ai_agent.tools import shutdown_tool_bridge
+from construction.agents.base import build_agent_settings
+from construction.agents.runtime import start_orchestrator_runtime
+from construction.config import get_construction_settings
+from construction.integrations.clients import aclose_integration_clients
+from construction.redis_.client import close_redis_pool
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: init DB pool, Redis connection
+    # Startup: init DB pool, Redis connection, shared Anthropic clients,
+    # orchestrator and trigger executor
+    settings = get_construction_settings()
+    agent_settings = build_agent_settings(settings)
+    get_shared_client(Anthropic, agent_settings)
+    get_shared_client(AsyncAnthropic, agent_settings)
+    runtime = await start_orchestrator_runtime(settings) if settings.orchestrator_runtime else None
     yield
-    # Shutdown: close connections
+    # Shutdown: stop trigger runs, close connections
+    if runtime is not None:
+        await runtime.stop()
+    await close_redis_pool()
+    await aclose_shared_clients()
+    await aclose_integration_clients()
+    shutdown_tool_bridge(aclose_integration_clients)
+    shutdown_tool_executors()
 
 
 def create_app() -> FastAPI:
@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter
 
+from construction.redis_.tool_cache import get_tool_cache
+
 router = APIRouter()
 
 _AGENT_NAMES = [
@@ -37,6 +39,12 @@ async def get_agent_statuses():
     ]
 
 
+@router.get("/tool-cache")
+async def get_tool_cache_stats():
+    """Per-tool hit/miss counters for the shared tool result cache."""
+    return get_tool_cache().stats()
+
+
 @router.post("/{agent_name}/run")
 async def trigger_agent_run(agent_name: str):
     """Trigger an agent run."""
@@ -1,93 +1,126 @@
 """Schedule management API endpoints."""
 
-from datetime import UTC, date, datetime
+import asyncio
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException
 
+from construction.scheduling.service import SimulationService, get_simulation_service
+from construction.scheduling.snapshot import BASELINE
+from construction.scheduling.versions import ScheduleVersionService, get_version_service
 from construction.schemas.schedule import (
-    Activity,
     CriticalPath,
     FloatReport,
     MonteCarloRequest,
     MonteCarloResult,
+    ScheduleComparison,
+    ScheduleSnapshotInfo,
+    ScheduleSnapshotRequest,
 )
+from construction.tools.schedule import CURRENT, ScheduleQueryTool
 
 router = APIRouter()
 
 
 @router.get("/critical-path", response_model=CriticalPath)
-async def get_critical_path():
-    """Get current critical path."""
-    return CriticalPath(
-        activities=[
-            Activity(
-                id="ACT-001",
-                external_id="A1010",
-                name="Foundation Pour - Zone A",
-                start_date=date(2025, 3, 1),
-                end_date=date(2025, 3, 15),
-                total_float=0.0,
-                is_critical=True,
-                tier_critical=True,
-                predecessors=[],
-                successors=["ACT-002"],
-            ),
-            Activity(
-                id="ACT-002",
-                external_id="A1020",
-                name="Steel Erection - Zone A",
-                start_date=date(2025, 3, 16),
-                end_date=date(2025, 4, 15),
-                total_float=0.0,
-                is_critical=True,
-                tier_critical=True,
-                predecessors=["ACT-001"],
-                successors=["ACT-003"],
-            ),
-        ],
-        total_duration_days=120,
-        float_summary={"Zone A": 0.0, "Zone B": 5.0},
-    )
+async def get_critical_path(
+    project_id: str = "default",
+    service: SimulationService = Depends(get_simulation_service),
+):
+    """Get the current critical path from a CPM pass over the schedule."""
+    result = await _query_schedule(service, "get_critical_path", project_id)
+    return CriticalPath(**result["critical_path"])
 
 
 @router.post("/simulate", response_model=MonteCarloResult)
-async def run_simulation(request: MonteCarloRequest):
-    """Run Monte Carlo schedule simulation."""
-    return MonteCarloResult(
+async def run_simulation(
+    request: MonteCarloRequest,
+    service: SimulationService = Depends(get_simulation_service),
+):
+    """Run Monte Carlo schedule simulation, reusing identical earlier runs."""
+    result = await service.simulate(
+        request.project_id,
         iterations=request.iterations,
-        p50_completion=date(2025, 12, 15),
-        p80_completion=date(2026, 1, 10),
-        p95_completion=date(2026, 2, 28),
-        confidence=0.88,
-        float_consumed={"Zone A": 0.45, "Zone B": 0.20},
-        histogram=[
-            {"month": "2025-12", "probability": 0.50},
-            {"month": "2026-01", "probability": 0.30},
-            {"month": "2026-02", "probability": 0.15},
-            {"month": "2026-03", "probability": 0.05},
-        ],
-        run_at=datetime.now(UTC),
+        overrides=request.activity_overrides,
+        seed=request.seed,
+        sampling=request.sampling,
+        tolerance=request.tolerance_days,
     )
+    if result.is_error:
+        raise HTTPException(status_code=422, detail=result.to_text())
+    return MonteCarloResult(**result.data)
+
+
+@router.get("/simulate/stats")
+async def get_simulation_stats(
+    service: SimulationService = Depends(get_simulation_service),
+):
+    """Hit/miss/coalesced counters for fingerprinted simulation runs."""
+    return service.stats()
 
 
 @router.get(
     "/float-report", response_model=list[FloatReport]
 )
-async def get_float_report():
-    """Get float consumption report."""
-    return [
-        FloatReport(
-            activity_id="ACT-001",
-            activity_name="Foundation Pour - Zone A",
-            total_float=0.0,
-            free_float=0.0,
-            status="critical",
-        ),
-        FloatReport(
-            activity_id="ACT-003",
-            activity_name="MEP Rough-in - Zone B",
-            total_float=5.0,
-            free_float=3.0,
-            status="healthy",
-        ),
-    ]
+async def get_float_report(
+    project_id: str = "default",
+    service: SimulationService = Depends(get_simulation_service),
+):
+    """Get total and free float of every activity, least float first."""
+    result = await _query_schedule(service, "get_float_report", project_id)
+    return [FloatReport(**row) for row in result["float_report"]]
+
+
+@router.post("/snapshots", response_model=ScheduleSnapshotInfo)
+async def take_snapshot(
+    request: ScheduleSnapshotRequest,
+    service: SimulationService = Depends(get_simulation_service),
+    versions: ScheduleVersionService = Depends(get_version_service),
+):
+    """Snapshot the project's current schedule as a baseline or update."""
+    activities = await service.load_activities(request.project_id)
+    snapshot = await versions.take(
+        request.project_id, activities, label=request.label, kind=request.kind
+    )
+    return ScheduleSnapshotInfo(**snapshot.info())
+
+
+@router.get("/snapshots", response_model=list[ScheduleSnapshotInfo])
+async def list_snapshots(
+    project_id: str = "default",
+    versions: ScheduleVersionService = Depends(get_version_service),
+):
+    """List the project's schedule snapshots, oldest first."""
+    return [ScheduleSnapshotInfo(**info) for info in await versions.history(project_id)]
+
+
+@router.get("/compare", response_model=ScheduleComparison)
+async def compare_schedules(
+    project_id: str = "default",
+    base: str = BASELINE,
+    current: str = CURRENT,
+    max_listed: int = 50,
+    service: SimulationService = Depends(get_simulation_service),
+    versions: ScheduleVersionService = Depends(get_version_service),
+):
+    """Compare two snapshots (ids, baseline/latest/previous or current)."""
+    activities = await service.load_activities(project_id) if CURRENT in (base, current) else None
+    try:
+        diff = await versions.compare(project_id, base, current, activities)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return ScheduleComparison(**diff.summary(max_listed), delta=diff.to_delta(max_listed))
+
+
+async def _query_schedule(
+    service: SimulationService, action: str, project_id: str
+) -> dict:
+    activities = await service.load_activities(project_id)
+    result = await asyncio.to_thread(
+        ScheduleQueryTool().execute_structured,
+        action=action,
+        project_id=project_id,
+        activities=activities,
+    )
+    if result.is_error:
+        raise HTTPException(status_code=422, detail=result.to_text())
+    return result.data
@@ -36,6 +36,21 @@ class ConstructionSettings(BaseSettings):
     confidence_threshold: float = 0.70
     escalation_impact_threshold: float = 250000.0
 
+    # Orchestrator routing rules (JSON list of rule records); each replaces
+    # the built-in rules for its (source, event_type)
+    orchestrator_rules: list[dict] = []
+
+    # Cross-agent trigger execution: seconds triggers for the same agent
+    # action are coalesced, runs per target agent (with per-agent
+    # overrides), and whether the queue is shared through Redis
+    trigger_coalesce_window: float = 30.0
+    trigger_default_concurrency: int = 1
+    trigger_concurrency: dict[str, int] = {}
+    trigger_queue_redis: bool = True
+    # Whether the API runs the orchestrator on agent events and executes
+    # its triggers (needs Redis; skipped with a warning when unreachable)
+    orchestrator_runtime: bool = True
+
     # External API keys
     openweathermap_api_key: str = ""
     procore_client_id: str = ""
@@ -61,9 +76,61 @@ class ConstructionSettings(BaseSettings):
     epa_echo_api_key: str = ""
     icc_api_key: str = ""
     uptime_api_key: str = ""
+    # Query the public (no-auth) OSHA, MSHA and NIOSH APIs instead of mock data
+    regulatory_live_lookups: bool = False
 
     # Alert dedup
     dedup_ttl_seconds: int = 14400
+    # Recently seen alert hashes answered in process without a Redis round trip
+    dedup_local_max_entries: int = 4096
+
+    # Inter-agent event transport: "pubsub" (PUBLISH/SUBSCRIBE) or "streams"
+    # (Redis Streams with consumer groups)
+    event_transport: str = "pubsub"
+    # Consumer group; workers in one group share each channel's entries
+    event_stream_group: str = "agents"
+    # Approximate entries kept per stream (XADD MAXLEN ~)
+    event_stream_maxlen: int = 100_000
+    # Entries unacked this long are reclaimed by another consumer
+    event_stream_claim_idle_ms: int = 60_000
+    # Deliveries before an entry is moved to the "<channel>:dead" stream
+    event_stream_max_deliveries: int = 5
+
+    # Pub/sub delivery: bounded queue and worker tasks per channel
+    pubsub_queue_size: int = 1000
+    # More than one worker delivers a channel's messages out of order
+    pubsub_channel_workers: int = 1
+    # Callbacks each subscriber runs at once
+    pubsub_subscriber_concurrency: int = 1
+    # When a channel's queue is full: "block", "drop_oldest" or "spill"
+    pubsub_overflow: str = "block"
+
+    # Cross-agent tool result cache
+    tool_cache_enabled: bool = True
+    tool_cache_redis: bool = True
+    tool_cache_max_entries: int = 1024
+    # Per-tool TTL overrides in seconds; 0 disables caching for a tool
+    tool_cache_ttls: dict[str, float] = {}
+
+    # Monte Carlo process pool size; 0 means one worker per CPU
+    monte_carlo_workers: int = 1
+    # Windows delay analysis process pool size; 0 means one worker per CPU
+    delay_analysis_workers: int = 0
+    # Fingerprinted simulation results: in-process/Redis TTL (seconds),
+    # local LRU size, and whether to read/write ScheduleSimulation rows
+    simulation_cache_ttl: float = 86400.0
+    simulation_cache_max_entries: int = 256
+    simulation_store_db: bool = True
+
+    # Nightly schedule sync from P6 ("primavera") or "ms_project"; skipped
+    # unless both project ids are set
+    schedule_sync_project_id: str = ""
+    schedule_sync_source: str = "primavera"
+    schedule_sync_source_project_id: str = ""
+    schedule_import_page_size: int = 1000
+    schedule_import_batch_size: int = 5000
+    # Whether schedule snapshots are stored as ScheduleVersion rows
+    schedule_versions_db: bool = True
 
 
 @lru_cache
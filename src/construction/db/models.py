@@ -12,8 +12,10 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Integer,
+    LargeBinary,
     String,
     Text,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -127,6 +129,7 @@ class DocumentContradiction(TimestampMixin, Base):
 
 class ScheduleActivity(TimestampMixin, Base):
     __tablename__ = "schedule_activities"
+    __table_args__ = (UniqueConstraint("project_id", "external_id"),)
 
     project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id"))
     external_id: Mapped[str] = mapped_column(String, nullable=False)
@@ -138,11 +141,27 @@ class ScheduleActivity(TimestampMixin, Base):
     tier_critical: Mapped[bool] = mapped_column(Boolean, default=False)
     predecessors: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     successors: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Hash of the imported source fields; re-syncs skip rows that match
+    source_hash: Mapped[str | None] = mapped_column(String, nullable=True)
 
     project: Mapped["Project"] = relationship(back_populates="schedule_activities")
     simulations: Mapped[list["ScheduleSimulation"]] = relationship(back_populates="activity")
 
 
+class ScheduleImportCheckpoint(TimestampMixin, Base):
+    __tablename__ = "schedule_import_checkpoints"
+    __table_args__ = (UniqueConstraint("project_id", "source"),)
+
+    project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id"))
+    # e.g. "primavera:<P6 project ObjectId>"
+    source: Mapped[str] = mapped_column(String, nullable=False)
+    # Source position after the last committed batch (None once complete)
+    cursor: Mapped[str | None] = mapped_column(String, nullable=True)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    rows_seen: Mapped[int] = mapped_column(Integer, default=0)
+    rows_written: Mapped[int] = mapped_column(Integer, default=0)
+
+
 class ScheduleSimulation(TimestampMixin, Base):
     __tablename__ = "schedule_simulations"
 
@@ -156,10 +175,28 @@ class ScheduleSimulation(TimestampMixin, Base):
     p95_completion: Mapped[date | None] = mapped_column(Date, nullable=True)
     float_consumed: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     run_params: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Hash of (schedule graph, overrides, iterations, seed, ...) identifying the run
+    fingerprint: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
     activity: Mapped["ScheduleActivity | None"] = relationship(back_populates="simulations")
 
 
+class ScheduleVersion(TimestampMixin, Base):
+    __tablename__ = "schedule_versions"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("projects.id"), index=True)
+    label: Mapped[str] = mapped_column(String, default="")
+    kind: Mapped[str] = mapped_column(String, nullable=False)  # baseline/update
+    taken_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    data_date: Mapped[date] = mapped_column(Date, nullable=False)
+    project_finish: Mapped[date] = mapped_column(Date, nullable=False)
+    activity_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    relationship_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Compressed columnar arrays (ScheduleSnapshot.to_bytes)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
 class ComplianceCheck(TimestampMixin, Base):
     __tablename__ = "compliance_checks"
 
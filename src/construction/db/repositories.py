@@ -1,10 +1,12 @@
 """Repository classes for Construction PM database access."""
 
+import json
 import uuid
 from datetime import date
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from construction.db.models import (
     ApprovalRequest,
@@ -16,10 +18,77 @@ from construction.db.models import (
     SafetyInspection,
     SafetyMetric,
     ScheduleActivity,
+    ScheduleImportCheckpoint,
+    ScheduleSimulation,
+    ScheduleVersion,
     Shipment,
     Vendor,
 )
 
+# Bulk schedule imports COPY into a per-transaction staging table and
+# upsert only rows whose source hash changed
+_IMPORT_COLUMNS = (
+    "id",
+    "project_id",
+    "external_id",
+    "name",
+    "start_date",
+    "end_date",
+    "total_float",
+    "is_critical",
+    "predecessors",
+    "source_hash",
+)
+_CREATE_IMPORT_STAGE = """
+CREATE TEMP TABLE schedule_import_stage (
+    id uuid, project_id uuid, external_id varchar, name varchar,
+    start_date date, end_date date, total_float double precision,
+    is_critical boolean, predecessors json, source_hash varchar
+) ON COMMIT DROP
+"""
+_UPSERT_FROM_STAGE = """
+INSERT INTO schedule_activities AS a (
+    id, project_id, external_id, name, start_date, end_date,
+    total_float, is_critical, tier_critical, predecessors, source_hash
+)
+SELECT id, project_id, external_id, name, start_date, end_date,
+       total_float, is_critical, false, predecessors, source_hash
+FROM schedule_import_stage
+ON CONFLICT (project_id, external_id) DO UPDATE SET
+    name = EXCLUDED.name,
+    start_date = EXCLUDED.start_date,
+    end_date = EXCLUDED.end_date,
+    total_float = EXCLUDED.total_float,
+    is_critical = EXCLUDED.is_critical,
+    predecessors = EXCLUDED.predecessors,
+    source_hash = EXCLUDED.source_hash,
+    updated_at = now()
+WHERE a.source_hash IS DISTINCT FROM EXCLUDED.source_hash
+"""
+# Imported rows (those with a source hash) that the finished sync didn't list;
+# references to them are cleared first so the delete can't violate a key
+_STALE_IMPORTED = """
+SELECT id FROM schedule_activities
+WHERE project_id = $1 AND source_hash IS NOT NULL AND NOT (external_id = ANY($2::varchar[]))
+"""
+_DETACH_STALE = tuple(
+    f"UPDATE {table} SET activity_id = NULL WHERE activity_id IN ({_STALE_IMPORTED})"
+    for table in ("schedule_simulations", "crane_schedules")
+)
+_DELETE_STALE = f"DELETE FROM schedule_activities WHERE id IN ({_STALE_IMPORTED})"
+_SAVE_IMPORT_CHECKPOINT = """
+INSERT INTO schedule_import_checkpoints (
+    id, project_id, source, cursor, status, rows_seen, rows_written
+)
+VALUES ($1, $2, $3, $4, $5, $6, $7)
+ON CONFLICT (project_id, source) DO UPDATE SET
+    cursor = EXCLUDED.cursor,
+    status = EXCLUDED.status,
+    rows_seen = EXCLUDED.rows_seen,
+    rows_written = EXCLUDED.rows_written,
+    updated_at = now()
+"""
+
 
 class BaseRepository:
     """Generic async CRUD operations."""
@@ -143,6 +212,121 @@ class ScheduleRepository(BaseRepository):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_activities(self, project_id: uuid.UUID):
+        """Return every activity in the project schedule."""
+        stmt = (
+            select(ScheduleActivity)
+            .where(ScheduleActivity.project_id == project_id)
+            .order_by(ScheduleActivity.start_date)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def activity_hashes(self, project_id: uuid.UUID) -> dict[str, str | None]:
+        """Return the stored source hash of every activity, by external id."""
+        stmt = select(ScheduleActivity.external_id, ScheduleActivity.source_hash).where(
+            ScheduleActivity.project_id == project_id
+        )
+        result = await self.session.execute(stmt)
+        return dict(result.tuples().all())
+
+    async def get_import_checkpoint(self, project_id: uuid.UUID, source: str):
+        """Return the import checkpoint for a project and source, if any."""
+        stmt = select(ScheduleImportCheckpoint).where(
+            ScheduleImportCheckpoint.project_id == project_id,
+            ScheduleImportCheckpoint.source == source,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def bulk_upsert_activities(
+        self,
+        project_id: uuid.UUID,
+        rows: list[dict],
+        source: str,
+        cursor: str | None,
+        status: str,
+        rows_seen: int,
+        rows_written: int,
+        keep_ids: list[str] | None = None,
+    ) -> tuple[int, int]:
+        """COPY activity rows in and upsert those whose source hash changed.
+
+        Runs on the session's asyncpg connection in its own transaction,
+        which also stores the import checkpoint (``rows_written`` counts
+        rows before this batch). With ``keep_ids`` -- every external id a
+        finished sync listed -- imported activities not among them are
+        deleted in the same transaction; rows created by hand (no source
+        hash) are left alone. Returns the rows written and deleted.
+        """
+        connection = await self.session.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+        written = deleted = 0
+        async with driver.transaction():
+            if rows:
+                await driver.execute(_CREATE_IMPORT_STAGE)
+                await driver.copy_records_to_table(
+                    "schedule_import_stage",
+                    records=[
+                        (
+                            uuid.uuid4(),
+                            project_id,
+                            row["external_id"],
+                            row["name"],
+                            row["start_date"],
+                            row["end_date"],
+                            row["total_float"],
+                            row["is_critical"],
+                            json.dumps(row["predecessors"]),
+                            row["source_hash"],
+                        )
+                        for row in rows
+                    ],
+                    columns=_IMPORT_COLUMNS,
+                )
+                # Status is "INSERT 0 <rows inserted or updated>"
+                written = int((await driver.execute(_UPSERT_FROM_STAGE)).split()[-1])
+            if keep_ids is not None:
+                for detach in _DETACH_STALE:
+                    await driver.execute(detach, project_id, keep_ids)
+                # Status is "DELETE <rows>"
+                deleted = int(
+                    (await driver.execute(_DELETE_STALE, project_id, keep_ids)).split()[-1]
+                )
+            await driver.execute(
+                _SAVE_IMPORT_CHECKPOINT,
+                uuid.uuid4(),
+                project_id,
+                source,
+                cursor,
+                status,
+                rows_seen,
+                rows_written + written,
+            )
+        return written, deleted
+
+    async def list_versions(self, project_id: uuid.UUID):
+        """Schedule snapshots of a project, oldest first, without payloads loaded."""
+        stmt = (
+            select(ScheduleVersion)
+            .where(ScheduleVersion.project_id == project_id)
+            .order_by(ScheduleVersion.taken_at)
+            .options(defer(ScheduleVersion.payload))
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_simulation_by_fingerprint(self, fingerprint: str):
+        """Return the most recent stored simulation with this fingerprint."""
+        stmt = (
+            select(ScheduleSimulation)
+            .where(ScheduleSimulation.fingerprint == fingerprint)
+            .order_by(ScheduleSimulation.created_at.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
 
 class ComplianceRepository(BaseRepository):
     """Queries specific to compliance checks."""
@@ -96,3 +96,9 @@ class BaseAsyncClient(ABC):
     async def close(self):
         if self._client and not self._client.is_closed:
             await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
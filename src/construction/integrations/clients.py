@@ -0,0 +1,39 @@
+"""Integration clients shared by every call of the tools that use them."""
+
+import asyncio
+import threading
+import weakref
+
+from construction.integrations.base_client import BaseAsyncClient
+
+_lock = threading.Lock()
+# Each client's httpx pool is bound to the event loop that opened it
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, BaseAsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_integration_client[T: BaseAsyncClient](client_cls: type[T], *args, **kwargs) -> T:
+    """Return the running loop's ``client_cls`` client for these arguments.
+
+    Clients are created once per (class, arguments) and event loop, so
+    tools reuse connections and TLS sessions across calls instead of
+    opening a client per call. Call from a coroutine on the loop that
+    will use the client.
+    """
+    key = (client_cls, args, tuple(sorted(kwargs.items())))
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = client_cls(*args, **kwargs)
+        return client
+
+
+async def aclose_integration_clients() -> None:
+    """Close the clients owned by the running loop (e.g. on shutdown)."""
+    with _lock:
+        owned = list(_clients.pop(asyncio.get_running_loop(), {}).values())
+    for client in owned:
+        await client.close()
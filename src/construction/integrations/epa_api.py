@@ -13,9 +13,15 @@ class EPAClient(BaseAsyncClient):
     def __init__(
         self,
         base_url: str = "https://api.epa.gov/echo/v1",
+        api_key: str | None = None,
         **kwargs,
     ):
-        super().__init__(base_url=base_url, **kwargs)
+        auth_headers = {"X-Api-Key": api_key} if api_key else None
+        super().__init__(
+            base_url=base_url,
+            auth_headers=auth_headers,
+            **kwargs,
+        )
 
     async def search_facilities(
         self,
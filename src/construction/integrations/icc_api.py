@@ -13,9 +13,15 @@ class ICCClient(BaseAsyncClient):
     def __init__(
         self,
         base_url: str = "https://api.iccsafe.org/codes/v1",
+        api_key: str | None = None,
         **kwargs,
     ):
-        super().__init__(base_url=base_url, **kwargs)
+        auth_headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        super().__init__(
+            base_url=base_url,
+            auth_headers=auth_headers,
+            **kwargs,
+        )
 
     async def search_codes(
         self,
@@ -1,6 +1,7 @@
 """Microsoft Project REST API client."""
 
 import logging
+from collections.abc import AsyncIterator
 
 from construction.integrations.base_client import BaseAsyncClient
 
@@ -27,6 +28,31 @@ class MSProjectClient(BaseAsyncClient):
         resp = await self.get(f"/projects/{project_id}/tasks")
         return resp.json()
 
+    async def iter_tasks(
+        self,
+        project_id: str,
+        page_size: int = 1000,
+        skip: int = 0,
+    ) -> AsyncIterator[list[dict]]:
+        """Page through a project's tasks with OData ``$top``/``$skip``.
+
+        Accepts bare lists or OData ``{"value": [...]}`` bodies; ``skip``
+        resumes after that many tasks.
+        """
+        while True:
+            resp = await self.get(
+                f"/projects/{project_id}/tasks",
+                params={"$top": page_size, "$skip": skip},
+            )
+            body = resp.json()
+            page = body.get("value", []) if isinstance(body, dict) else body
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            skip += len(page)
+
     async def get_assignments(self, project_id: str) -> list[dict]:
         """List resource assignments for a project."""
         resp = await self.get(f"/projects/{project_id}/assignments")
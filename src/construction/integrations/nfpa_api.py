@@ -13,9 +13,15 @@ class NFPAClient(BaseAsyncClient):
     def __init__(
         self,
         base_url: str = "https://api.nfpa.org/codes/v1",
+        api_key: str | None = None,
         **kwargs,
     ):
-        super().__init__(base_url=base_url, **kwargs)
+        auth_headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        super().__init__(
+            base_url=base_url,
+            auth_headers=auth_headers,
+            **kwargs,
+        )
 
     async def search_codes(
         self,
@@ -46,6 +46,18 @@ class OpenWeatherMapClient(BaseAsyncClient):
         )
         return resp.json()
 
+    async def get_daily_forecast(
+        self, lat: float, lon: float, units: str = "imperial"
+    ) -> dict:
+        """Get daily forecast and alerts via the One Call API."""
+        resp = await self.get(
+            "/data/3.0/onecall",
+            params=self._params(
+                lat=lat, lon=lon, exclude="minutely,hourly", units=units
+            ),
+        )
+        return resp.json()
+
     async def get_alerts(self, lat: float, lon: float) -> dict:
         """Get weather alerts via the One Call API."""
         resp = await self.get(
@@ -1,6 +1,7 @@
 """Primavera P6 REST API client with API key authentication."""
 
 import logging
+from collections.abc import AsyncIterator
 
 from construction.integrations.base_client import BaseAsyncClient
 
@@ -36,6 +37,58 @@ class PrimaveraClient(BaseAsyncClient):
         )
         return resp.json()
 
+    async def iter_activities(
+        self,
+        project_id: str,
+        page_size: int = 1000,
+        after: str | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Page through a project's activities in ObjectId order.
+
+        Pages are fetched by keyset (``ObjectId gt <last>``), so a sync
+        can resume after the last ObjectId it stored.
+        """
+        async for page in self._pages(
+            "/activity", project_id, page_size, after
+        ):
+            yield page
+
+    async def iter_relationships(
+        self,
+        project_id: str,
+        page_size: int = 1000,
+        after: str | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Page through a project's relationships in ObjectId order."""
+        async for page in self._pages(
+            "/relationship", project_id, page_size, after
+        ):
+            yield page
+
+    async def _pages(
+        self,
+        path: str,
+        project_id: str,
+        page_size: int,
+        after: str | None,
+    ) -> AsyncIterator[list[dict]]:
+        while True:
+            params = {
+                "ProjectObjectId": project_id,
+                "OrderBy": "ObjectId",
+                "PageSize": page_size,
+            }
+            if after is not None:
+                params["Filter"] = f"ObjectId gt {after}"
+            resp = await self.get(path, params=params)
+            page = resp.json()
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = page[-1]["ObjectId"]
+
     async def get_resources(self, project_id: str) -> list[dict]:
         """List resources assigned to a project."""
         resp = await self.get(
@@ -0,0 +1,422 @@
+"""Streaming readers for exported P6 ``.xer`` and MS Project XML (MSPDI) files.
+
+Both are ``ScheduleSource``s for ``ScheduleImporter``, producing the same
+activity records as the API sources, so file imports bulk-load through
+``DatabaseScheduleSink`` and resume from its checkpoints.
+
+Neither reader holds the file in memory. An XER is read line by line
+twice: the first pass keeps calendars, the task id -> code map and the
+relationships (which follow the TASK table), the second emits tasks in
+pages. MSPDI is parsed with ``iterparse`` and each ``Task`` is cleared
+once mapped; links are nested in their successor, so one pass suffices.
+
+Hours and tenths of minutes (float and lags) become working days using
+the activity's calendar: P6 ``day_hr_cnt`` per calendar (lags on the
+predecessor's calendar, P6's default), MS Project's ``MinutesPerDay``.
+Each calendar's working weekdays and holidays are kept as a
+``WorkCalendar`` on ``calendars``.
+"""
+
+import logging
+import re
+import uuid
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+from construction.config import get_construction_settings
+from construction.integrations.schedule_import import (
+    DatabaseScheduleSink,
+    ImportReport,
+    ScheduleImporter,
+)
+from construction.scheduling.calendars import WorkCalendar
+
+logger = logging.getLogger(__name__)
+
+# P6 dates are days since 1899-12-30; weekdays run 1 (Sunday) to 7
+_P6_EPOCH = date(1899, 12, 30)
+_DAY_ENTRY = re.compile(r"\(0\|\|([1-7])\(\)\(")
+_EXCEPTION_ENTRY = re.compile(r"\(0\|\|\d+\(d\|(\d+)\)\(")
+# P6 and MSPDI link types; MSPDI lag formats (DurationFormat codes)
+_P6_LINK_TYPES = {"PR_FS": "FS", "PR_SS": "SS", "PR_FF": "FF", "PR_SF": "SF"}
+_MSP_LINK_TYPES = {"0": "FF", "1": "FS", "2": "SF", "3": "SS"}
+_MSP_ELAPSED = {4, 6, 8, 10, 12, 20}
+_MSP_PERCENT = {19, 20}
+
+
+@dataclass
+class ScheduleCalendar:
+    name: str
+    calendar: WorkCalendar = field(default_factory=WorkCalendar)
+    hours_per_day: float = 8.0
+
+
+class XERScheduleSource:
+    """Activities of a P6 XER export, streamed from its TASK table.
+
+    ``project`` picks one P6 ``proj_id`` from a multi-project export.
+    The cursor counts tasks emitted, in file order.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        project: str | None = None,
+        page_size: int = 1000,
+        encoding: str = "cp1252",
+    ):
+        self.path = Path(path)
+        self.project = project
+        self.page_size = page_size
+        self.encoding = encoding
+        self.name = _file_source_name("xer", self.path)
+        self.calendars: dict[str, ScheduleCalendar] = {}
+
+    async def pages(self, cursor: str | None) -> AsyncIterator[tuple[list[dict], str]]:
+        codes, task_hours, links = self._scan()
+        done = int(cursor or 0)
+        seen = 0
+        page = []
+        for _, task in self._rows({"TASK"}):
+            if not self._in_project(task):
+                continue
+            seen += 1
+            if seen <= done:
+                continue
+            page.append(self._record(task, codes, task_hours, links))
+            if len(page) >= self.page_size:
+                yield page, str(seen)
+                page = []
+        if page:
+            yield page, str(seen)
+
+    def _scan(self):
+        """Calendars, then task codes and hours per day and links by integer task id."""
+        codes: dict[int, str] = {}
+        task_hours: dict[int, float] = {}
+        links = defaultdict(list)
+        for table, row in self._rows({"CALENDAR", "TASK", "TASKPRED"}):
+            if table == "CALENDAR":
+                self.calendars[row["clndr_id"]] = _xer_calendar(row)
+            elif table == "TASK":
+                if self._in_project(row):
+                    task_id = int(row["task_id"])
+                    codes[task_id] = row.get("task_code") or row["task_id"]
+                    task_hours[task_id] = self._hours_per_day(row.get("clndr_id"))
+            else:
+                pred_type = row.get("pred_type") or "PR_FS"
+                links[int(row["task_id"])].append(
+                    (
+                        int(row["pred_task_id"]),
+                        _P6_LINK_TYPES.get(pred_type, pred_type),
+                        _number(row.get("lag_hr_cnt")) or 0.0,
+                    )
+                )
+        return codes, task_hours, links
+
+    def _record(self, task: dict, codes, task_hours, links) -> dict:
+        hours = self._hours_per_day(task.get("clndr_id"))
+        total_float = _number(task.get("total_float_hr_cnt"))
+        predecessors = [
+            {"id": codes[pred_id], "type": pred_type, "lag": lag / task_hours[pred_id]}
+            for pred_id, pred_type, lag in links.get(int(task["task_id"]), ())
+            if pred_id in codes
+        ]
+        return {
+            "external_id": task.get("task_code") or task["task_id"],
+            "name": task.get("task_name"),
+            "start_date": _as_date(
+                task.get("act_start_date")
+                or task.get("early_start_date")
+                or task.get("target_start_date")
+            ),
+            "end_date": _as_date(
+                task.get("act_end_date")
+                or task.get("early_end_date")
+                or task.get("target_end_date")
+            ),
+            "total_float": (total_float or 0.0) / hours,
+            "is_critical": total_float is not None and total_float <= 0,
+            "predecessors": predecessors,
+        }
+
+    def _hours_per_day(self, calendar_id: str | None) -> float:
+        calendar = self.calendars.get(calendar_id or "")
+        return calendar.hours_per_day if calendar else 8.0
+
+    def _in_project(self, task: dict) -> bool:
+        return self.project is None or task.get("proj_id") == self.project
+
+    def _rows(self, tables: set[str]) -> Iterator:
+        """``(table, row)`` for each ``%R`` line of ``tables``, stopping after the last."""
+        remaining = set(tables)
+        table, fields = None, []
+        with self.path.open(encoding=self.encoding, errors="replace", newline="") as f:
+            for line in f:
+                kind = line[:2]
+                if kind == "%R":
+                    if table in tables:
+                        row = dict(zip(fields, line.rstrip("\r\n").split("\t")[1:]))
+                        yield table, row
+                elif kind == "%T":
+                    remaining.discard(table)
+                    if not remaining:
+                        return
+                    table = line[2:].strip()
+                elif kind == "%F":
+                    fields = line.rstrip("\r\n").split("\t")[1:]
+
+
+class MSPDIScheduleSource:
+    """Tasks of an MS Project XML export, keyed by their stable ``UID``.
+
+    Summary tasks are skipped. A percentage lag needs its predecessor's
+    duration; a task linking to a predecessor further down the file is
+    held back and emitted last. The cursor counts tasks consumed.
+    """
+
+    def __init__(self, path: str | Path, page_size: int = 1000):
+        self.path = Path(path)
+        self.page_size = page_size
+        self.name = _file_source_name("mspdi", self.path)
+        self.calendars: dict[str, ScheduleCalendar] = {}
+        self.minutes_per_day = 480.0
+        self.project_calendar: str | None = None
+
+    async def pages(self, cursor: str | None) -> AsyncIterator[tuple[list[dict], str]]:
+        done = int(cursor or 0)
+        durations: dict[str, float] = {}
+        # Held-back tasks by position: the cursor never passes the first of them
+        pending: dict[int, tuple[dict, list[tuple[dict, float]]]] = {}
+        position = 0
+        page = []
+        for tag, element in self._elements():
+            if tag == "Calendar":
+                _strip_namespaces(element)
+                uid, calendar = self._calendar(element)
+                self.calendars[uid] = calendar
+                continue
+            task = _fields(element)
+            uid = task.get("UID")
+            durations[uid] = _msp_duration(task.get("Duration")) / self.minutes_per_day
+            position += 1
+            if position <= done or task.get("Summary") == "1" or uid == "0":
+                continue
+            record, percent_links = self._record(task, uid)
+            if any(link["id"] not in durations for link, _ in percent_links):
+                pending[position] = (record, percent_links)
+            else:
+                _resolve_percent_lags(percent_links, durations)
+                page.append(record)
+            if len(page) >= self.page_size:
+                yield page, str(min(pending, default=position + 1) - 1)
+                page = []
+        for record, percent_links in pending.values():
+            _resolve_percent_lags(percent_links, durations)
+            page.append(record)
+        if page:
+            yield page, str(position)
+
+    def _elements(self) -> Iterator[tuple[str, ET.Element]]:
+        """Each ``Calendar`` and ``Task``, dropped once consumed; reads header fields."""
+        depth = 0
+        container = None
+        for event, element in ET.iterparse(self.path, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 2:
+                    container = element
+                continue
+            depth -= 1
+            if depth > 2:
+                continue
+            tag = _local(element.tag)
+            if depth == 2 and tag in ("Calendar", "Task"):
+                yield tag, element
+                container.clear()
+            elif depth == 1:
+                if tag == "MinutesPerDay" and element.text:
+                    self.minutes_per_day = float(element.text)
+                elif tag == "CalendarUID":
+                    self.project_calendar = element.text
+                element.clear()
+
+    def _calendar(self, element: ET.Element) -> tuple[str, ScheduleCalendar]:
+        uid = _text(element, "UID")
+        base = self.calendars.get(_text(element, "BaseCalendarUID"))
+        workdays = set(base.calendar.workdays) if base else set()
+        holidays = set(base.calendar.holidays) if base else set()
+        own_weekdays = {}
+        for day in element.iterfind("WeekDays/WeekDay"):
+            day_type, working = _text(day, "DayType"), _text(day, "DayWorking") == "1"
+            if day_type == "0":
+                if not working:
+                    holidays.update(_period_days(day.find("TimePeriod")))
+            elif day_type:
+                # DayType 1 is Sunday; WorkCalendar counts from Monday = 0
+                own_weekdays[(int(day_type) + 5) % 7] = working
+        for exception in element.iterfind("Exceptions/Exception"):
+            if _text(exception, "DayWorking") != "1":
+                holidays.update(_period_days(exception.find("TimePeriod")))
+        if own_weekdays:
+            workdays = {d for d in workdays if own_weekdays.get(d, True)}
+            workdays |= {d for d, working in own_weekdays.items() if working}
+        calendar = WorkCalendar(workdays or range(5), holidays)
+        return uid, ScheduleCalendar(
+            _text(element, "Name") or uid, calendar, self.minutes_per_day / 60
+        )
+
+    def _record(self, task: dict, uid: str) -> tuple[dict, list[tuple[dict, float]]]:
+        workdays = self._workdays(task.get("CalendarUID"))
+        predecessors, percent_links = [], []
+        for link in task["PredecessorLink"]:
+            lag = float(link.get("LinkLag") or 0) / 10
+            lag_format = int(link.get("LagFormat") or 7)
+            entry = {
+                "id": link.get("PredecessorUID"),
+                "type": _MSP_LINK_TYPES.get(link.get("Type"), "FS"),
+                "lag": 0.0,
+            }
+            if lag_format in _MSP_PERCENT:
+                # LinkLag is the percentage of the predecessor's duration
+                percent_links.append((entry, lag / 100))
+            elif lag_format in _MSP_ELAPSED:
+                # Elapsed minutes, spread over the task calendar's working week
+                entry["lag"] = lag / 1440 * workdays / 7
+            else:
+                entry["lag"] = lag / self.minutes_per_day
+            predecessors.append(entry)
+        critical = task.get("Critical")
+        total_float = float(task.get("TotalSlack") or 0) / 10 / self.minutes_per_day
+        record = {
+            "external_id": uid,
+            "name": task.get("Name"),
+            "start_date": _as_date(task.get("Start")),
+            "end_date": _as_date(task.get("Finish")),
+            "total_float": total_float,
+            "is_critical": critical == "1" if critical else total_float <= 0,
+            "predecessors": predecessors,
+        }
+        return record, percent_links
+
+    def _workdays(self, calendar_uid: str | None) -> int:
+        if calendar_uid in (None, "", "-1"):
+            calendar_uid = self.project_calendar
+        calendar = self.calendars.get(calendar_uid or "")
+        return len(calendar.calendar.workdays) if calendar else 5
+
+
+def schedule_file_source(path: str | Path, page_size: int = 1000, **kwargs):
+    """The source for an ``.xer`` or MS Project ``.xml`` file."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".xer":
+        return XERScheduleSource(path, page_size=page_size, **kwargs)
+    if suffix == ".xml":
+        return MSPDIScheduleSource(path, page_size=page_size, **kwargs)
+    raise ValueError(f"Unsupported schedule file '{path}' (expected .xer or .xml)")
+
+
+async def run_schedule_file_import(
+    project_id: str,
+    path: str | Path,
+    session_factory=None,
+    **kwargs,
+) -> ImportReport:
+    """Bulk-load a schedule export into ``schedule_activities``."""
+    settings = get_construction_settings()
+    importer = ScheduleImporter(
+        DatabaseScheduleSink(session_factory), settings.schedule_import_batch_size
+    )
+    source = schedule_file_source(path, settings.schedule_import_page_size, **kwargs)
+    return await importer.run(uuid.UUID(project_id), source)
+
+
+def _xer_calendar(row: dict) -> ScheduleCalendar:
+    """Working weekdays and holidays from a P6 ``clndr_data`` blob.
+
+    A weekday or exception with no time ranges (``s|08:00|f|17:00``)
+    is non-working; exceptions that add working time are ignored.
+    """
+    data = row.get("clndr_data") or ""
+    week, _, exceptions = data.partition("Exceptions()")
+    workdays = set()
+    days = _DAY_ENTRY.split(week.partition("DaysOfWeek()")[2])
+    for day, body in zip(days[1::2], days[2::2]):
+        if "s|" in body:
+            workdays.add((int(day) + 5) % 7)
+    holidays = set()
+    entries = _EXCEPTION_ENTRY.split(exceptions)
+    for serial, body in zip(entries[1::2], entries[2::2]):
+        if "s|" not in body:
+            holidays.add(_P6_EPOCH + timedelta(days=int(serial)))
+    return ScheduleCalendar(
+        row.get("clndr_name") or row.get("clndr_id", ""),
+        WorkCalendar(workdays or range(5), holidays),
+        _number(row.get("day_hr_cnt")) or 8.0,
+    )
+
+
+def _resolve_percent_lags(links: list[tuple[dict, float]], durations: dict[str, float]) -> None:
+    for entry, fraction in links:
+        entry["lag"] = fraction * durations.get(entry["id"], 0.0)
+
+
+def _msp_duration(value: str | None) -> float:
+    """Minutes in an ISO 8601 duration such as ``PT40H0M0S``."""
+    match = re.fullmatch(r"-?P(?:(\d+)D)?T?(?:([\d.]+)H)?(?:([\d.]+)M)?(?:([\d.]+)S)?", value or "")
+    if not match:
+        return 0.0
+    days, hours, minutes, seconds = (float(part or 0) for part in match.groups())
+    return days * 1440 + hours * 60 + minutes + seconds / 60
+
+
+def _period_days(period: ET.Element | None) -> list[date]:
+    if period is None:
+        return []
+    start, end = _as_date(_text(period, "FromDate")), _as_date(_text(period, "ToDate"))
+    if start is None or end is None:
+        return []
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _fields(task: ET.Element) -> dict:
+    """A task's child texts by local name, with its ``PredecessorLink``s as dicts."""
+    fields = {"PredecessorLink": []}
+    for child in task:
+        tag = _local(child.tag)
+        if tag == "PredecessorLink":
+            fields[tag].append({_local(node.tag): node.text for node in child})
+        else:
+            fields[tag] = child.text
+    return fields
+
+
+def _strip_namespaces(element: ET.Element) -> None:
+    for node in element.iter():
+        node.tag = _local(node.tag)
+
+
+def _local(tag: str) -> str:
+    return tag[tag.index("}") + 1 :] if tag[0] == "{" else tag
+
+
+def _text(element: ET.Element, path: str) -> str | None:
+    return element.findtext(path)
+
+
+def _file_source_name(kind: str, path: Path) -> str:
+    """Source name for checkpoints; a changed export is a new source."""
+    stat = path.stat()
+    return f"{kind}:{path.name}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _number(value: str | None) -> float | None:
+    return float(value) if value not in (None, "") else None
+
+
+def _as_date(value: str | None) -> date | None:
+    return date.fromisoformat(value[:10]) if value else None
@@ -0,0 +1,130 @@
+"""Atomic alert deduplication with an in-process front cache.
+
+``AlertDeduplicator.claim`` marks a hash as seen and reports whether this
+caller was first in one ``SET NX EX`` round trip, so two workers racing on
+the same alert can never both get "not a duplicate" (a separate GET and SET
+let both through and double-sent the SMS). ``publish_once`` does the same
+and publishes the message in one Lua call.
+
+Hashes already seen are kept in a TTL-LRU front cache until their Redis key
+expires, so repeats of a recent alert are answered without a round trip;
+``claim_many`` settles a burst of hashes in one pipelined round trip.
+``add_once`` is ``publish_once`` for the Redis Streams transport.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import redis.asyncio as redis
+
+# Claim the key and publish only if this call created it
+_PUBLISH_ONCE = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    redis.call('PUBLISH', ARGV[2], ARGV[3])
+    return 1
+end
+return 0
+"""
+# Claim the key and append to the stream only if this call created it
+_ADD_ONCE = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], '*', 'data', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+
+class AlertDeduplicator:
+    """Claims alert hashes for ``ttl`` seconds across every worker."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        ttl: int,
+        prefix: str = "dedup:",
+        max_entries: int = 4096,
+    ):
+        self._redis = redis_client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.max_entries = max_entries
+        # hash -> monotonic time its Redis key expires
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self._publish_script = None
+        self._add_script = None
+
+    async def claim(self, alert_hash: str) -> bool:
+        """Mark the hash seen; True if it was not seen within the TTL."""
+        return (await self.claim_many([alert_hash]))[0]
+
+    async def claim_many(self, alert_hashes: Sequence[str]) -> list[bool]:
+        """``claim`` for a burst of hashes in one round trip; repeats in the
+        burst count as duplicates of the first."""
+        claimed = [False] * len(alert_hashes)
+        first: dict[str, int] = {}
+        for i, alert_hash in enumerate(alert_hashes):
+            if alert_hash not in first and not self._seen_locally(alert_hash):
+                first[alert_hash] = i
+        if not first:
+            return claimed
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for alert_hash in first:
+                pipe.set(self.prefix + alert_hash, "1", nx=True, ex=self.ttl)
+                pipe.pttl(self.prefix + alert_hash)
+            replies = await pipe.execute()
+        for (alert_hash, i), created, pttl in zip(
+            first.items(), replies[::2], replies[1::2], strict=True
+        ):
+            claimed[i] = bool(created)
+            self._remember(alert_hash, self.ttl if created else pttl / 1000)
+        return claimed
+
+    async def publish_once(self, channel: str, alert_hash: str, payload: str) -> bool:
+        """Publish ``payload`` unless the hash was seen within the TTL, in one call."""
+        if self._seen_locally(alert_hash):
+            return False
+        if self._publish_script is None:
+            self._publish_script = self._redis.register_script(_PUBLISH_ONCE)
+        published = await self._publish_script(
+            keys=[self.prefix + alert_hash], args=[self.ttl, channel, payload]
+        )
+        return self._settle(alert_hash, published)
+
+    async def add_once(self, stream: str, alert_hash: str, payload: str, maxlen: int) -> bool:
+        """Append ``payload`` as the ``data`` field of a stream entry, trimming
+        the stream to about ``maxlen`` entries, unless the hash was seen
+        within the TTL, in one call."""
+        if self._seen_locally(alert_hash):
+            return False
+        if self._add_script is None:
+            self._add_script = self._redis.register_script(_ADD_ONCE)
+        added = await self._add_script(
+            keys=[self.prefix + alert_hash, stream], args=[self.ttl, maxlen, payload]
+        )
+        return self._settle(alert_hash, added)
+
+    def _settle(self, alert_hash: str, sent) -> bool:
+        # Seen either way; a duplicate's key may expire sooner, which only
+        # costs one more round trip then
+        self._remember(alert_hash, self.ttl if sent else min(self.ttl, 1.0))
+        return bool(sent)
+
+    def _seen_locally(self, alert_hash: str) -> bool:
+        expires_at = self._seen.get(alert_hash)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._seen[alert_hash]
+            return False
+        self._seen.move_to_end(alert_hash)
+        return True
+
+    def _remember(self, alert_hash: str, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self._seen[alert_hash] = time.monotonic() + ttl
+        self._seen.move_to_end(alert_hash)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
@@ -3,12 +3,21 @@
 import asyncio
 import hashlib
 import json
+import logging
+import os
+import socket
+import time
+import uuid
 from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 import redis.asyncio as redis
 
 from construction.config import get_construction_settings
+from construction.redis_.dedup import AlertDeduplicator
+
+logger = logging.getLogger(__name__)
 
 # Standard channels
 AGENT_EVENTS = "channel:agent_events"
@@ -22,73 +31,253 @@ SITE_LOGISTICS = "channel:site_logistics"
 SAFETY_ALERTS = "channel:safety_alerts"
 
 
+@dataclass
+class ChannelStats:
+    """Delivery counts and lag for one subscribed channel."""
+
+    received: int = 0
+    # Messages whose callbacks all ran (a failing callback still counts)
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    spilled: int = 0
+    # Messages waiting in the queue or the spill stream
+    depth: int = 0
+    # Seconds between a message arriving and its callbacks starting
+    lag: float = 0.0
+    max_lag: float = 0.0
+
+
+class _Subscriber:
+    __slots__ = ("callback", "limit")
+
+    def __init__(self, callback: Callable, concurrency: int):
+        self.callback = callback
+        self.limit = asyncio.Semaphore(concurrency)
+
+
+class _Channel:
+    def __init__(self, name: str, queue_size: int, spill_key: str):
+        self.name = name
+        self.spill_key = spill_key
+        self.queue: asyncio.Queue[tuple[float, bytes | str]] = asyncio.Queue(queue_size)
+        self.subscribers: list[_Subscriber] = []
+        self.workers: list[asyncio.Task] = []
+        self.stats = ChannelStats()
+        # Messages in the spill stream; while any are, new ones spill too
+        self.spilled = 0
+        self.refill_lock = asyncio.Lock()
+
+
 class AgentPubSub:
-    """Manages Redis pub/sub for inter-agent communication."""
+    """Manages Redis pub/sub for inter-agent communication.
+
+    The listener blocks on the subscription and hands each message to its
+    channel's bounded queue, drained by ``channel_workers`` worker tasks, so
+    a slow callback only holds up its own channel. Each subscriber runs at
+    most ``concurrency`` callbacks at a time. With the default of one
+    worker per channel, messages are delivered in the order they arrived;
+    more workers trade that order for throughput. When a channel's queue is
+    full, ``overflow`` decides: ``"block"`` pauses reading, ``"drop_oldest"``
+    discards the oldest queued message and ``"spill"`` appends messages to
+    this instance's ``<channel>:spill:<instance>`` stream until the workers
+    catch up (every subscribed process gets its own copy of a message, so
+    each spills to its own stream).
+    """
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        queue_size: int | None = None,
+        channel_workers: int | None = None,
+        overflow: str | None = None,
+    ):
         self._redis = redis_client
         self._pubsub = redis_client.pubsub()
-        self._callbacks: dict[str, list[Callable]] = {}
+        self._channels: dict[str, _Channel] = {}
         self._listener_task: asyncio.Task | None = None
         self._running = False
+        self._subscribed = asyncio.Event()
+        self.instance = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
         settings = get_construction_settings()
-        self._dedup_ttl = settings.dedup_ttl_seconds
+        self.queue_size = queue_size or settings.pubsub_queue_size
+        self.channel_workers = channel_workers or settings.pubsub_channel_workers
+        self.default_concurrency = settings.pubsub_subscriber_concurrency
+        self.overflow = overflow or settings.pubsub_overflow
+        if self.overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown pub/sub overflow policy '{self.overflow}'")
+        self._spill_maxlen = settings.event_stream_maxlen
+        self._dedup = AlertDeduplicator(
+            redis_client,
+            settings.dedup_ttl_seconds,
+            prefix="dedup:pubsub:",
+            max_entries=settings.dedup_local_max_entries,
+        )
 
     async def publish(self, channel: str, message_dict: dict) -> None:
         """Publish a message to a channel with deduplication."""
         payload = json.dumps(message_dict, default=_json_default)
         msg_hash = hashlib.sha256(payload.encode()).hexdigest()
+        # Dedup and publish in one atomic call
+        await self._dedup.publish_once(channel, msg_hash, payload)
 
-        # Check dedup
-        dedup_key = f"dedup:pubsub:{msg_hash}"
-        already_seen = await self._redis.get(dedup_key)
-        if already_seen:
-            return
-
-        await self._redis.set(dedup_key, "1", ex=self._dedup_ttl)
-        await self._redis.publish(channel, payload)
-
-    async def subscribe(self, channel: str, callback: Callable) -> None:
-        """Subscribe to a channel with a callback."""
-        if channel not in self._callbacks:
-            self._callbacks[channel] = []
+    async def subscribe(
+        self, channel: str, callback: Callable, concurrency: int | None = None
+    ) -> None:
+        """Subscribe to a channel with a callback running at most
+        ``concurrency`` (default ``PUBSUB_SUBSCRIBER_CONCURRENCY``) at a time."""
+        state = self._channels.get(channel)
+        if state is None:
+            state = self._channels[channel] = _Channel(
+                channel, self.queue_size, f"{channel}:spill:{self.instance}"
+            )
             await self._pubsub.subscribe(channel)
-        self._callbacks[channel].append(callback)
+            self._subscribed.set()
+            if self._running:
+                self._start_workers(state)
+        state.subscribers.append(_Subscriber(callback, concurrency or self.default_concurrency))
 
     async def start_listening(self) -> None:
-        """Start the background listener task."""
+        """Start the background listener and channel workers."""
         self._running = True
+        for state in self._channels.values():
+            self._start_workers(state)
         self._listener_task = asyncio.create_task(self._listen())
 
+    def channel_stats(self) -> dict[str, ChannelStats]:
+        """Delivery counts, queue depth and lag per channel."""
+        for state in self._channels.values():
+            state.stats.depth = state.queue.qsize() + state.spilled
+        return {name: replace(state.stats) for name, state in self._channels.items()}
+
     async def _listen(self) -> None:
-        """Listen for messages and dispatch to callbacks."""
+        """Read messages as they arrive and queue them on their channel."""
         while self._running:
             try:
+                await self._subscribed.wait()
                 message = await self._pubsub.get_message(
-                    ignore_subscribe_messages=True, timeout=1.0
+                    ignore_subscribe_messages=True, timeout=None
                 )
                 if message and message["type"] == "message":
                     channel = message["channel"]
                     if isinstance(channel, bytes):
                         channel = channel.decode()
-                    data = json.loads(message["data"])
-                    for cb in self._callbacks.get(channel, []):
-                        await cb(data)
+                    state = self._channels.get(channel)
+                    if state is not None:
+                        await self._enqueue(state, message["data"])
             except asyncio.CancelledError:
                 break
             except Exception:
+                # Connection lost; redis-py reconnects on the next read
+                logger.exception("Pub/sub read failed")
                 await asyncio.sleep(1)
 
+    async def _enqueue(self, state: _Channel, data: bytes | str) -> None:
+        state.stats.received += 1
+        item = (time.monotonic(), data)
+        if self.overflow == "spill" and (state.spilled or state.queue.full()):
+            await self._spill(state, item)
+            return
+        if self.overflow == "drop_oldest" and state.queue.full():
+            state.queue.get_nowait()
+            state.stats.dropped += 1
+        # Under "block" a full queue holds up the reader until a worker frees a slot
+        await state.queue.put(item)
+
+    async def _spill(self, state: _Channel, item: tuple[float, bytes | str]) -> None:
+        received_at, data = item
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(
+                state.spill_key,
+                {"data": data, "received_at": repr(received_at)},
+                maxlen=self._spill_maxlen,
+                approximate=True,
+            )
+            # A crashed process's stream is left behind; let it expire
+            pipe.expire(state.spill_key, _SPILL_TTL)
+            await pipe.execute()
+        state.spilled += 1
+        state.stats.spilled += 1
+
+    async def _refill(self, state: _Channel) -> None:
+        """Move spilled messages back into the emptied queue, oldest first."""
+        async with state.refill_lock:
+            if not state.spilled or not state.queue.empty():
+                return
+            entries = await self._redis.xrange(state.spill_key, "-", "+", count=state.queue.maxsize)
+            if entries:
+                await self._redis.xdel(state.spill_key, *(entry_id for entry_id, _ in entries))
+            for _, fields in entries:
+                state.queue.put_nowait(
+                    (float(_field(fields, "received_at")), _field(fields, "data"))
+                )
+            # An empty read means the rest was trimmed away
+            state.spilled = max(state.spilled - len(entries), 0) if entries else 0
+
+    def _start_workers(self, state: _Channel) -> None:
+        state.workers = [
+            asyncio.create_task(self._work(state)) for _ in range(self.channel_workers)
+        ]
+
+    async def _work(self, state: _Channel) -> None:
+        stats = state.stats
+        while True:
+            if state.spilled and state.queue.empty():
+                try:
+                    await self._refill(state)
+                except Exception:
+                    logger.exception("Refill from %s failed", state.spill_key)
+                    await asyncio.sleep(1)
+                    continue
+            received_at, raw = await state.queue.get()
+            stats.lag = time.monotonic() - received_at
+            stats.max_lag = max(stats.max_lag, stats.lag)
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                stats.failed += 1
+                logger.warning("Dropping malformed message on %s", state.name)
+                continue
+            if len(state.subscribers) == 1:
+                await self._deliver(state, state.subscribers[0], data)
+            else:
+                await asyncio.gather(*(self._deliver(state, s, data) for s in state.subscribers))
+            stats.delivered += 1
+
+    async def _deliver(self, state: _Channel, subscriber: _Subscriber, data: dict) -> None:
+        async with subscriber.limit:
+            try:
+                await subscriber.callback(data)
+            except Exception:
+                state.stats.failed += 1
+                logger.exception("Callback failed on %s", state.name)
+
     async def stop(self) -> None:
-        """Stop the listener and unsubscribe."""
+        """Stop the listener and workers, unsubscribe and drop spilled messages."""
         self._running = False
+        tasks = [task for state in self._channels.values() for task in state.workers]
         if self._listener_task and not self._listener_task.done():
-            self._listener_task.cancel()
-            try:
-                await self._listener_task
-            except asyncio.CancelledError:
-                pass
+            tasks.append(self._listener_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for state in self._channels.values():
+            state.workers = []
         await self._pubsub.unsubscribe()
+        if self.overflow == "spill" and self._channels:
+            await self._redis.delete(*(state.spill_key for state in self._channels.values()))
+            for state in self._channels.values():
+                state.spilled = 0
+
+
+_OVERFLOW_POLICIES = ("block", "drop_oldest", "spill")
+# Seconds a spill stream outlives its last spilled message
+_SPILL_TTL = 86400
+
+
+def _field(fields: dict, name: str) -> str:
+    value = fields.get(name.encode(), fields.get(name))
+    return value.decode() if isinstance(value, bytes) else value
 
 
 def _json_default(obj: object) -> str:
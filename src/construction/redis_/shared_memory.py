@@ -6,6 +6,7 @@ from datetime import datetime
 import redis.asyncio as redis
 
 from construction.config import get_construction_settings
+from construction.redis_.dedup import AlertDeduplicator
 
 
 class SharedMemory:
@@ -14,7 +15,11 @@ class SharedMemory:
     def __init__(self, redis_client: redis.Redis):
         self._redis = redis_client
         settings = get_construction_settings()
-        self._dedup_ttl = settings.dedup_ttl_seconds
+        self._dedup = AlertDeduplicator(
+            redis_client,
+            settings.dedup_ttl_seconds,
+            max_entries=settings.dedup_local_max_entries,
+        )
 
     # --- Agent status ---
 
@@ -162,14 +167,13 @@ class SharedMemory:
 
     # --- Deduplication ---
 
-    async def check_dedup(self, alert_hash: str) -> bool:
-        """Return True if alert_hash has already been seen."""
-        val = await self._redis.get(f"dedup:{alert_hash}")
-        return val is not None
+    async def claim_dedup(self, alert_hash: str) -> bool:
+        """Atomically mark alert_hash as seen; True if it was not seen within the TTL."""
+        return await self._dedup.claim(alert_hash)
 
-    async def mark_dedup(self, alert_hash: str) -> None:
-        """Mark an alert_hash as seen with TTL."""
-        await self._redis.set(f"dedup:{alert_hash}", "1", ex=self._dedup_ttl)
+    async def claim_dedup_many(self, alert_hashes: list[str]) -> list[bool]:
+        """``claim_dedup`` for a burst of hashes in one round trip."""
+        return await self._dedup.claim_many(alert_hashes)
 
 
 def _json_default(obj: object) -> str:
@@ -0,0 +1,211 @@
+"""Redis Streams transport for inter-agent communication.
+
+``AgentStreamBus`` has ``AgentPubSub``'s ``publish``/``subscribe`` API but
+appends each message to a stream named after the channel (``XADD MAXLEN
+~``) and reads through a consumer group (``XREADGROUP``). Unlike
+PUBLISH/SUBSCRIBE, entries published while a subscriber is slow or
+restarting wait in the stream, and every worker in a group shares a
+channel's entries, so orchestrator or websocket workers scale across
+processes; workers that must each see every entry use their own groups.
+
+An entry is acked once every callback for it succeeds. Entries left
+pending (a failed callback or a consumer that died) for ``claim_idle_ms``
+are claimed by whichever consumer checks next; an entry delivered
+``max_deliveries`` times is acked and copied to ``<channel>:dead``.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+from collections.abc import Callable
+
+import redis.asyncio as redis
+
+from construction.config import ConstructionSettings, get_construction_settings
+from construction.redis_.dedup import AlertDeduplicator
+from construction.redis_.pubsub import AgentPubSub, _json_default
+
+logger = logging.getLogger(__name__)
+
+
+class AgentStreamBus:
+    """Manages Redis Streams consumer groups for inter-agent communication."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        group: str | None = None,
+        consumer: str | None = None,
+        block_ms: int = 1000,
+        batch: int = 64,
+    ):
+        settings = get_construction_settings()
+        self._redis = redis_client
+        self.group = group or settings.event_stream_group
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self.maxlen = settings.event_stream_maxlen
+        self.claim_idle_ms = settings.event_stream_claim_idle_ms
+        self.max_deliveries = settings.event_stream_max_deliveries
+        self.block_ms = block_ms
+        self.batch = batch
+        self._callbacks: dict[str, list[Callable]] = {}
+        self._listener_task: asyncio.Task | None = None
+        self._running = False
+        self._next_reclaim = 0.0
+        self._dedup = AlertDeduplicator(
+            redis_client,
+            settings.dedup_ttl_seconds,
+            prefix="dedup:pubsub:",
+            max_entries=settings.dedup_local_max_entries,
+        )
+
+    async def publish(self, channel: str, message_dict: dict) -> None:
+        """Append a message to a channel's stream with deduplication."""
+        payload = json.dumps(message_dict, default=_json_default)
+        msg_hash = hashlib.sha256(payload.encode()).hexdigest()
+        await self._dedup.add_once(channel, msg_hash, payload, self.maxlen)
+
+    async def subscribe(self, channel: str, callback: Callable) -> None:
+        """Subscribe to a channel with a callback, creating the group if needed."""
+        if channel not in self._callbacks:
+            try:
+                await self._redis.xgroup_create(channel, self.group, id="$", mkstream=True)
+            except redis.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+            self._callbacks[channel] = []
+        self._callbacks[channel].append(callback)
+
+    async def start_listening(self) -> None:
+        """Start the background listener task."""
+        self._running = True
+        self._listener_task = asyncio.create_task(self._listen())
+
+    async def poll(self) -> int:
+        """Reclaim stale entries when due, then read and handle one batch of
+        new ones; returns the number of entries handled."""
+        if not self._callbacks:
+            return 0
+        handled = 0
+        if time.monotonic() >= self._next_reclaim:
+            self._next_reclaim = time.monotonic() + self.claim_idle_ms / 1000
+            handled += await self.reclaim()
+        replies = await self._redis.xreadgroup(
+            self.group,
+            self.consumer,
+            dict.fromkeys(self._callbacks, ">"),
+            count=self.batch,
+            block=self.block_ms,
+        )
+        for stream, entries in replies or ():
+            handled += await self._handle(_text(stream), entries)
+        return handled
+
+    async def reclaim(self) -> int:
+        """Claim entries pending longer than ``claim_idle_ms`` and handle them."""
+        handled = 0
+        for channel in self._callbacks:
+            pending = await self._redis.xpending_range(
+                channel, self.group, "-", "+", self.batch, idle=self.claim_idle_ms
+            )
+            if not pending:
+                continue
+            deliveries = {_text(p["message_id"]): p["times_delivered"] for p in pending}
+            entries = await self._redis.xclaim(
+                channel, self.group, self.consumer, self.claim_idle_ms, list(deliveries)
+            )
+            retry = []
+            for entry_id, fields in entries:
+                if deliveries.get(_text(entry_id), 0) >= self.max_deliveries:
+                    await self._dead_letter(channel, entry_id, fields)
+                else:
+                    retry.append((entry_id, fields))
+            handled += await self._handle(channel, retry)
+        return handled
+
+    async def _listen(self) -> None:
+        """Read entries and dispatch them to callbacks."""
+        while self._running:
+            try:
+                if self._callbacks:
+                    await self.poll()
+                else:
+                    await asyncio.sleep(self.block_ms / 1000)
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Stream read failed")
+                await asyncio.sleep(1)
+
+    async def _handle(self, channel: str, entries) -> int:
+        """Run the callbacks for each entry and ack the ones that succeed."""
+        acked = []
+        for entry_id, fields in entries:
+            payload = _field(fields, "data")
+            if payload is None:
+                # Trimmed away while pending
+                acked.append(entry_id)
+                continue
+            data = json.loads(payload)
+            try:
+                for cb in self._callbacks.get(channel, []):
+                    await cb(data)
+            except Exception:
+                logger.exception("Callback failed for %s entry %s", channel, _text(entry_id))
+                continue
+            acked.append(entry_id)
+        if acked:
+            await self._redis.xack(channel, self.group, *acked)
+        return len(entries)
+
+    async def _dead_letter(self, channel: str, entry_id, fields) -> None:
+        logger.error(
+            "Moving %s entry %s to %s:dead after %d deliveries",
+            channel,
+            _text(entry_id),
+            channel,
+            self.max_deliveries,
+        )
+        async with self._redis.pipeline(transaction=True) as pipe:
+            if fields:
+                pipe.xadd(f"{channel}:dead", fields, maxlen=self.maxlen, approximate=True)
+            pipe.xack(channel, self.group, entry_id)
+            await pipe.execute()
+
+    async def stop(self) -> None:
+        """Stop the listener; pending entries stay with the group."""
+        self._running = False
+        if self._listener_task and not self._listener_task.done():
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+
+
+def build_agent_bus(
+    redis_client: redis.Redis,
+    settings: ConstructionSettings | None = None,
+) -> AgentPubSub | AgentStreamBus:
+    """The transport named by ``EVENT_TRANSPORT``."""
+    settings = settings or get_construction_settings()
+    if settings.event_transport == "streams":
+        return AgentStreamBus(redis_client)
+    if settings.event_transport != "pubsub":
+        raise ValueError(f"Unknown event transport '{settings.event_transport}'")
+    return AgentPubSub(redis_client)
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _field(fields, name: str):
+    if not fields:
+        return None
+    value = fields.get(name.encode(), fields.get(name))
+    return _text(value)
@@ -0,0 +1,82 @@
+"""Cross-agent tool result cache backed by Redis."""
+
+import logging
+import time
+from functools import lru_cache
+
+import redis.asyncio as redis
+
+from ai_agent.tool_cache import CachePolicy, ToolResultCache
+from construction.config import get_construction_settings
+from construction.redis_.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Freshness per tool; tools without a policy are never cached
+DEFAULT_CACHE_POLICIES: dict[str, CachePolicy] = {
+    "weather_forecast": CachePolicy(ttl=900),
+    "osha_search": CachePolicy(ttl=3600),
+    "niosh_lookup": CachePolicy(ttl=86400),
+    "supply_chain_monitor": CachePolicy(ttl=300),
+    "risk_database": CachePolicy(ttl=60, actions=frozenset({"query"})),
+}
+
+
+class RedisToolCacheBackend:
+    """Shares cached tool results between workers through Redis."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis | None = None,
+        prefix: str = "toolcache:",
+        retry_after: float = 30.0,
+    ):
+        self._redis = redis_client
+        self.prefix = prefix
+        self.retry_after = retry_after
+        self._down_until = 0.0
+
+    async def get(self, key: str) -> str | None:
+        client = await self._client()
+        if client is None:
+            return None
+        val = await self._guard(client.get(self.prefix + key))
+        return val.decode() if isinstance(val, bytes) else val
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        client = await self._client()
+        if client is None:
+            return
+        await self._guard(
+            client.set(self.prefix + key, value, px=max(int(ttl * 1000), 1))
+        )
+
+    async def _client(self) -> redis.Redis | None:
+        """The Redis client, or None while backing off after a connection error."""
+        if time.monotonic() < self._down_until:
+            return None
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+    async def _guard(self, command):
+        try:
+            return await command
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._down_until = time.monotonic() + self.retry_after
+            raise
+
+
+@lru_cache
+def get_tool_cache() -> ToolResultCache:
+    """Process-wide tool result cache shared by every agent's registry."""
+    settings = get_construction_settings()
+    policies = dict(DEFAULT_CACHE_POLICIES)
+    for tool_name, ttl in settings.tool_cache_ttls.items():
+        base = policies.get(tool_name, CachePolicy(ttl=ttl))
+        policies[tool_name] = CachePolicy(ttl=ttl, actions=base.actions)
+    return ToolResultCache(
+        {name: policy for name, policy in policies.items() if policy.ttl > 0},
+        max_entries=settings.tool_cache_max_entries,
+        backend=RedisToolCacheBackend() if settings.tool_cache_redis else None,
+    )
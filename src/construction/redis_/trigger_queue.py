@@ -0,0 +1,118 @@
+"""Coalescing trigger priority queue shared between workers through Redis.
+
+Each coalescing key has a list of queued items (``<prefix>items:<key>``)
+and a member in the ``<prefix>queue`` sorted set scored
+``priority * _BAND + ready_at_ms``, so the set orders keys by priority and
+then by when their coalescing window closes. Pushing is one ``MULTI``:
+``RPUSH`` the item and ``ZADD LT`` the key, which adds a new key and only
+ever moves an existing one earlier (a higher priority or a closer window).
+Popping reads the head of the set, claims a ready key with ``ZREM`` (only
+one worker gets 1 back) and takes its items with ``LRANGE`` + ``DEL`` in
+one ``MULTI``.
+"""
+
+import json
+import time
+from collections.abc import Collection, Iterable, Mapping
+
+import redis.asyncio as redis
+
+from construction.agents.triggers import (
+    SAFETY_PRIORITY,
+    LocalTriggerQueue,
+    TriggerBatch,
+    TriggerExecutor,
+    trigger_item,
+    trigger_key,
+)
+from construction.config import ConstructionSettings
+from construction.schemas.orchestrator import CrossAgentTrigger
+
+# Score band per priority level, in milliseconds (well past any epoch time)
+_BAND = 10**13
+# Queue head entries read per pop
+_SCAN = 64
+
+
+class RedisTriggerQueue:
+    """Trigger queue in Redis, for executors in several processes."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        window: float = 30.0,
+        prefix: str = "triggers:",
+    ):
+        self._redis = redis_client
+        self.window = window
+        self.prefix = prefix
+        self._queue = f"{prefix}queue"
+
+    async def push(self, triggers: Iterable[CrossAgentTrigger]) -> None:
+        now = _now_ms()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for trigger in triggers:
+                self._add(pipe, trigger_key(trigger), trigger_item(trigger), now, self.window)
+            await pipe.execute()
+
+    async def requeue(self, batch: TriggerBatch) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            self._add(pipe, batch.key, batch.item(), _now_ms(), 0.0)
+            await pipe.execute()
+
+    async def pop(self, busy: Collection[str] = ()) -> TriggerBatch | None:
+        """The ready batch that runs next, skipping non-safety batches for ``busy`` agents."""
+        now = _now_ms()
+        head = await self._redis.zrangebyscore(
+            self._queue, 0, "+inf", start=0, num=_SCAN, withscores=True
+        )
+        for member, score in head:
+            key = member.decode() if isinstance(member, bytes) else member
+            priority, ready_at = divmod(int(score), _BAND)
+            if ready_at > now:
+                continue
+            if priority > SAFETY_PRIORITY and key.split("|", 1)[0] in busy:
+                continue
+            if not await self._redis.zrem(self._queue, key):
+                # Another worker claimed it
+                continue
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.lrange(self._items(key), 0, -1)
+                pipe.delete(self._items(key))
+                raw, _ = await pipe.execute()
+            if raw:
+                return TriggerBatch.merge(key, [json.loads(item) for item in raw])
+        return None
+
+    def _add(self, pipe, key: str, item: dict, now: int, window: float) -> None:
+        priority = item["priority"]
+        ready_at = now if priority <= SAFETY_PRIORITY else now + int(window * 1000)
+        pipe.rpush(self._items(key), json.dumps(item, default=str))
+        pipe.zadd(self._queue, {key: priority * _BAND + ready_at}, lt=True)
+
+    def _items(self, key: str) -> str:
+        return f"{self.prefix}items:{key}"
+
+
+def build_trigger_executor(
+    agents: Mapping,
+    settings: ConstructionSettings,
+    redis_client: redis.Redis | None = None,
+) -> TriggerExecutor:
+    """Executor over the Redis queue when a client is given and
+    ``TRIGGER_QUEUE_REDIS`` is on, else over an in-process queue."""
+    window = settings.trigger_coalesce_window
+    if redis_client is not None and settings.trigger_queue_redis:
+        queue = RedisTriggerQueue(redis_client, window)
+    else:
+        queue = LocalTriggerQueue(window)
+    return TriggerExecutor(
+        queue,
+        agents,
+        concurrency=settings.trigger_concurrency,
+        default_concurrency=settings.trigger_default_concurrency,
+    )
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
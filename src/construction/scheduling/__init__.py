@@ -0,0 +1 @@
+"""Schedule analysis: CPM, versions, Monte Carlo, what-if and resequencing."""
@@ -0,0 +1,77 @@
+"""Work calendars mapping working-day offsets to dates."""
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+from functools import cached_property
+
+import numpy as np
+
+
+class WorkCalendar:
+    """Working weekdays (Monday = 0) and non-working holidays.
+
+    Schedule arithmetic runs in working days from a project start; this
+    converts whole arrays of offsets to and from dates with NumPy's business
+    day routines.
+    """
+
+    def __init__(self, workdays: Iterable[int] = range(5), holidays: Iterable[date] = ()):
+        self.workdays = tuple(sorted(set(workdays)))
+        if not self.workdays or not set(self.workdays) <= set(range(7)):
+            raise ValueError("Work calendar needs at least one working weekday in 0-6")
+        self.holidays = tuple(sorted(set(holidays)))
+
+    def __repr__(self) -> str:
+        return f"WorkCalendar(workdays={self.workdays}, holidays={len(self.holidays)})"
+
+    def __getstate__(self) -> dict:
+        # NumPy business-day calendars do not pickle; rebuilt on first use
+        state = self.__dict__.copy()
+        state.pop("_busdaycal", None)
+        return state
+
+    @cached_property
+    def _busdaycal(self) -> np.busdaycalendar:
+        weekmask = [day in self.workdays for day in range(7)]
+        return np.busdaycalendar(weekmask=weekmask, holidays=list(self.holidays))
+
+    def is_workday(self, day: date) -> bool:
+        return bool(np.is_busday(np.datetime64(day, "D"), busdaycal=self._busdaycal))
+
+    def roll_forward(self, day: date) -> date:
+        """``day`` if it is a working day, else the next one."""
+        return self.add_workdays(day, 0)
+
+    def add_workdays(self, start: date, days: int) -> date:
+        """The working day ``days`` working days after ``start`` (rolled forward)."""
+        return self.offsets_to_dates(start, np.array([days]))[0]
+
+    def workdays_between(self, start: date, end: date) -> int:
+        """Working days in ``[start, end)``."""
+        return int(np.busday_count(start, end, busdaycal=self._busdaycal))
+
+    def duration(self, start: date, finish: date) -> int:
+        """Working days of an activity running from ``start`` to ``finish`` inclusive."""
+        return self.workdays_between(start, finish + timedelta(days=1))
+
+    def days_to_offsets(self, start: date, days: np.ndarray) -> np.ndarray:
+        """Working days from ``start`` to each ``datetime64[D]`` day."""
+        return np.busday_count(np.datetime64(start, "D"), days, busdaycal=self._busdaycal)
+
+    def offsets_to_dates(self, start: date, offsets: np.ndarray) -> list[date]:
+        """Dates of whole working-day ``offsets`` counted from ``start``."""
+        return self.offsets_to_days(start, offsets).tolist()
+
+    def offsets_to_days(self, start: date, offsets: np.ndarray) -> np.ndarray:
+        """``offsets_to_dates`` as a ``datetime64[D]`` array."""
+        return np.busday_offset(
+            np.datetime64(start, "D"),
+            np.asarray(offsets, dtype=np.int64),
+            roll="forward",
+            busdaycal=self._busdaycal,
+        )
+
+
+# Round-the-clock work (durations and lags in calendar days)
+SEVEN_DAY = WorkCalendar(range(7))
+STANDARD = WorkCalendar()
@@ -0,0 +1,468 @@
+"""Critical Path Method over activity networks with typed, lagged links.
+
+Every relationship type reduces to a difference constraint between the two
+activities' early starts, ``ES[succ] >= ES[pred] + w``, with
+
+====  =====================================
+FS    w = duration[pred] + lag
+SS    w = lag
+FF    w = duration[pred] + lag - duration[succ]
+SF    w = lag - duration[succ]
+====  =====================================
+
+so the forward pass is a longest-path pass over start times and the
+backward pass its mirror image. Nodes are renumbered in topological order
+and grouped into levels as in ``ScheduleNetwork``; each pass resolves one
+level with a gather and a ``reduceat`` over its edges, O(activities +
+relationships) in total. Times are working days from the project start on a
+single project ``WorkCalendar``; lags are in the same working days.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from functools import cached_property
+
+import numpy as np
+
+from construction.scheduling.calendars import STANDARD, WorkCalendar
+from construction.scheduling.network import _topological_levels
+
+RELATIONSHIP_TYPES = ("FS", "SS", "FF", "SF")
+_TYPE_CODES = {kind: code for code, kind in enumerate(RELATIONSHIP_TYPES)}
+# Total float (working days) within this of zero counts as critical
+CRITICAL_TOLERANCE = 1e-6
+# Total float at or below this is reported as "warning" rather than "healthy"
+NEAR_CRITICAL_DAYS = 5.0
+
+
+@dataclass(frozen=True)
+class Relationship:
+    """Link from a predecessor activity, e.g. ``Relationship("A1010", "SS", 2)``."""
+
+    predecessor: str
+    type: str = "FS"
+    lag: float = 0.0
+
+
+@dataclass(frozen=True)
+class CPMActivity:
+    """One activity with a duration in working days."""
+
+    id: str
+    name: str
+    duration: float
+    predecessors: tuple[Relationship, ...] = ()
+    external_id: str | None = None
+    tier_critical: bool = False
+    # Crew the activity occupies while it runs (headcount of one trade)
+    trade: str | None = None
+    crew_size: int = 0
+
+
+class CPMNetwork:
+    """Activity-on-node network stored as flat arrays, ready for CPM passes.
+
+    Relationships are kept sorted by successor (forward pass) and by
+    predecessor (backward pass and free float), each with per-level slices.
+    Links to unknown activities are ignored.
+    """
+
+    def __init__(
+        self,
+        activities: Iterable[CPMActivity],
+        calendar: WorkCalendar = STANDARD,
+        start: date | None = None,
+    ):
+        specs = list(activities)
+        index = {spec.id: i for i, spec in enumerate(specs)}
+        if len(index) != len(specs):
+            raise ValueError("Duplicate activity ids in schedule network")
+
+        src, dst, kind, lag = [], [], [], []
+        for i, spec in enumerate(specs):
+            for link in spec.predecessors:
+                j = index.get(link.predecessor)
+                if j is None:
+                    continue
+                code = _TYPE_CODES.get(link.type)
+                if code is None:
+                    raise ValueError(f"Unknown relationship type '{link.type}'")
+                src.append(j)
+                dst.append(i)
+                kind.append(code)
+                lag.append(link.lag)
+        src = np.array(src, dtype=np.int64)
+        dst = np.array(dst, dtype=np.int64)
+        order, level_of = _topological_levels(len(specs), src, dst)
+
+        position = np.empty(len(specs), dtype=np.int64)
+        position[order] = np.arange(len(specs))
+        self.ids = [specs[i].id for i in order]
+        self.names = [specs[i].name for i in order]
+        self.external_ids = [specs[i].external_id or specs[i].id for i in order]
+        self.index = {activity_id: k for k, activity_id in enumerate(self.ids)}
+        self.durations = np.array([specs[i].duration for i in order], dtype=np.float64)
+        if np.any(self.durations < 0):
+            raise ValueError("Activity durations must not be negative")
+        self.tier_critical = np.array([specs[i].tier_critical for i in order], dtype=bool)
+        self.trades = [specs[i].trade for i in order]
+        self.crew_sizes = np.array([specs[i].crew_size for i in order], dtype=np.int64)
+        self.calendar = calendar
+        self.start = calendar.roll_forward(start or date.today())
+
+        levels = level_of[order]
+        self.level_bounds = np.searchsorted(levels, np.arange(levels.max(initial=-1) + 2))
+        self.edge_src = position[src].astype(np.int32)
+        self.edge_dst = position[dst].astype(np.int32)
+        self.edge_type = np.array(kind, dtype=np.int8)
+        self.edge_lag = np.array(lag, dtype=np.float64)
+        # FS/FF links start from the predecessor's finish, FF/SF constrain the
+        # successor's finish
+        self._pred_end = np.isin(self.edge_type, (0, 2)).astype(np.float64)
+        self._succ_end = (self.edge_type >= 2).astype(np.float64)
+
+        self._in_order = np.argsort(self.edge_dst, kind="stable")
+        self._out_order = np.argsort(self.edge_src, kind="stable")
+        self.in_ptr = np.searchsorted(self.edge_dst[self._in_order], np.arange(len(self) + 1))
+        self.out_ptr = np.searchsorted(self.edge_src[self._out_order], np.arange(len(self) + 1))
+        self._in_groups = self._level_groups(self.edge_dst[self._in_order])
+        self._out_groups = self._level_groups(self.edge_src[self._out_order])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_levels(self) -> int:
+        return len(self.level_bounds) - 1
+
+    def predecessors(self, k: int) -> list[int]:
+        """Predecessor nodes of node ``k``."""
+        ptr, nodes = self._adjacency[0]
+        return nodes[ptr[k] : ptr[k + 1]]
+
+    def successors(self, k: int) -> list[int]:
+        """Successor nodes of node ``k``."""
+        ptr, nodes = self._adjacency[1]
+        return nodes[ptr[k] : ptr[k + 1]]
+
+    @cached_property
+    def _adjacency(self) -> tuple[tuple[list[int], list[int]], tuple[list[int], list[int]]]:
+        # Plain lists: slicing them per node is far cheaper than NumPy views
+        return (
+            (self.in_ptr.tolist(), self.edge_src[self._in_order].tolist()),
+            (self.out_ptr.tolist(), self.edge_dst[self._out_order].tolist()),
+        )
+
+    def _level_groups(self, keys: np.ndarray) -> list[tuple[int, int, np.ndarray, np.ndarray]]:
+        """Per level with edges: (edge lo, edge hi, owner nodes, reduceat offsets)."""
+        heads = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+        heads = heads[heads < len(keys)]
+        owners = keys[heads]
+        bounds = np.searchsorted(owners, self.level_bounds)
+        edge_bounds = np.append(heads, len(keys))[bounds]
+        groups = []
+        for a, b, lo, hi in zip(
+            bounds[:-1].tolist(),
+            bounds[1:].tolist(),
+            edge_bounds[:-1].tolist(),
+            edge_bounds[1:].tolist(),
+            strict=True,
+        ):
+            if a < b:
+                groups.append((lo, hi, owners[a:b], heads[a:b] - lo))
+        return groups
+
+    def finish_date(self, offset: float) -> date:
+        """Last working day touched by a finish ``offset`` working days after the start."""
+        days = max(int(np.ceil(offset - CRITICAL_TOLERANCE)) - 1, 0)
+        return self.calendar.add_workdays(self.start, days)
+
+    def edge_weights(self, durations: np.ndarray) -> np.ndarray:
+        """Minimum start-to-start distance ``w`` of every relationship."""
+        return (
+            self._pred_end * durations[self.edge_src]
+            + self.edge_lag
+            - self._succ_end * durations[self.edge_dst]
+        )
+
+    def compute(
+        self,
+        durations: np.ndarray | None = None,
+        release: np.ndarray | None = None,
+        weights: np.ndarray | None = None,
+    ) -> "CPMResult":
+        """Forward and backward pass.
+
+        ``durations`` defaults to the activities' own; ``release`` gives
+        per-activity earliest starts (working days, e.g. from a start
+        no earlier than date), zero by default. ``weights`` overrides the
+        link distances derived from the durations (e.g. for relaxed logic).
+        """
+        durations = self.durations if durations is None else durations
+        weights = self.edge_weights(durations) if weights is None else weights
+
+        # Forward pass: early starts, never before the release (project start)
+        early_start = np.zeros(len(self)) if release is None else release.astype(np.float64)
+        in_src = self.edge_src[self._in_order]
+        in_weights = weights[self._in_order]
+        for lo, hi, owners, offsets in self._in_groups:
+            reach = np.maximum.reduceat(early_start[in_src[lo:hi]] + in_weights[lo:hi], offsets)
+            early_start[owners] = np.maximum(reach, early_start[owners])
+        project_finish = float((early_start + durations).max(initial=0.0))
+
+        # Backward pass: late starts, nothing finishing after the project
+        late_start = project_finish - durations
+        out_dst = self.edge_dst[self._out_order]
+        out_weights = weights[self._out_order]
+        for lo, hi, owners, offsets in reversed(self._out_groups):
+            reach = np.minimum.reduceat(late_start[out_dst[lo:hi]] - out_weights[lo:hi], offsets)
+            late_start[owners] = np.minimum(late_start[owners], reach)
+        return self.result(durations, weights, early_start, late_start)
+
+    def result(
+        self,
+        durations: np.ndarray,
+        weights: np.ndarray,
+        early_start: np.ndarray,
+        late_start: np.ndarray,
+    ) -> "CPMResult":
+        """Assemble a ``CPMResult`` from solved start times."""
+        early_finish = early_start + durations
+        project_finish = float(early_finish.max(initial=0.0))
+        return CPMResult(
+            network=self,
+            durations=durations,
+            early_start=early_start,
+            early_finish=early_finish,
+            late_start=late_start,
+            late_finish=late_start + durations,
+            free_float=self._free_float(durations, weights, early_start, project_finish),
+            project_finish=project_finish,
+        )
+
+    def _free_float(
+        self,
+        durations: np.ndarray,
+        weights: np.ndarray,
+        early_start: np.ndarray,
+        project_finish: float,
+    ) -> np.ndarray:
+        # Slack of each link at early dates; activities without successors
+        # may slip to the project finish
+        free = project_finish - early_start - durations
+        if len(weights):
+            slack = early_start[self.edge_dst] - weights - early_start[self.edge_src]
+            slack = slack[self._out_order]
+            counts = np.diff(self.out_ptr)
+            has_succ = np.flatnonzero(counts)
+            free[has_succ] = np.minimum.reduceat(slack, self.out_ptr[has_succ])
+        return free
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping],
+        calendar: WorkCalendar | None = None,
+        start: date | None = None,
+    ) -> "CPMNetwork":
+        """Build a network from activity dicts or ``ScheduleActivity`` rows.
+
+        Each record needs an id (``external_id`` or ``id``), a name and
+        either a ``duration`` (or ``mode``) in working days or
+        ``start_date``/``end_date`` (inclusive). ``predecessors`` holds ids
+        or ``{"id", "type", "lag"}`` links; ``trade`` and ``crew_size`` give
+        the crew it occupies. The project starts at ``start``, else the
+        earliest ``start_date``, else today.
+        """
+        calendar = calendar or STANDARD
+        rows = [record if isinstance(record, Mapping) else vars(record) for record in records]
+        if start is None:
+            starts = [row["start_date"] for row in rows if row.get("start_date")]
+            start = min(map(_as_date, starts)) if starts else None
+        specs = []
+        for row in rows:
+            activity_id = str(row.get("external_id") or row["id"])
+            specs.append(
+                CPMActivity(
+                    id=activity_id,
+                    name=row.get("name") or activity_id,
+                    duration=_record_duration(row, calendar),
+                    predecessors=tuple(relationships(row.get("predecessors"))),
+                    external_id=str(row.get("external_id") or activity_id),
+                    tier_critical=bool(row.get("tier_critical")),
+                    trade=row.get("trade") or None,
+                    crew_size=int(row.get("crew_size") or 0),
+                )
+            )
+        return cls(specs, calendar=calendar, start=start)
+
+
+@dataclass
+class CPMResult:
+    """Early/late dates and floats of every activity, in working days."""
+
+    network: CPMNetwork
+    durations: np.ndarray
+    early_start: np.ndarray
+    early_finish: np.ndarray
+    late_start: np.ndarray
+    late_finish: np.ndarray
+    free_float: np.ndarray
+    project_finish: float
+
+    @property
+    def total_float(self) -> np.ndarray:
+        return self.late_start - self.early_start
+
+    @property
+    def critical(self) -> np.ndarray:
+        return self.total_float <= CRITICAL_TOLERANCE
+
+    def critical_path(self) -> np.ndarray:
+        """Critical nodes ordered by early start."""
+        nodes = np.flatnonzero(self.critical)
+        return nodes[np.argsort(self.early_start[nodes], kind="stable")]
+
+    def float_status(self, near_critical: float = NEAR_CRITICAL_DAYS) -> list[str]:
+        """Float status of every activity: critical, warning or healthy."""
+        total = self.total_float
+        level = (total <= near_critical).astype(np.int64) + (total <= CRITICAL_TOLERANCE)
+        return np.array(["healthy", "warning", "critical"])[level].tolist()
+
+    @property
+    def project_finish_date(self) -> date:
+        return self.network.finish_date(self.project_finish)
+
+    def records(self, nodes: Iterable[int] | None = None) -> list[dict]:
+        """Activity dicts with early and late dates (ISO strings) and floats."""
+        net = self.network
+        nodes = np.arange(len(net)) if nodes is None else np.asarray(list(nodes), dtype=np.int64)
+        early_start, early_finish = self._dates(self.early_start[nodes], nodes)
+        late_start, late_finish = self._dates(self.late_start[nodes], nodes)
+        columns = zip(
+            nodes.tolist(),
+            self.durations[nodes].tolist(),
+            early_start,
+            early_finish,
+            late_start,
+            late_finish,
+            np.round(self.total_float[nodes], 3).tolist(),
+            np.round(self.free_float[nodes], 3).tolist(),
+            self.critical[nodes].tolist(),
+            net.tier_critical[nodes].tolist(),
+            strict=True,
+        )
+        ids = net.ids
+        return [
+            {
+                "id": ids[k],
+                "external_id": net.external_ids[k],
+                "name": net.names[k],
+                "duration_days": duration,
+                "start_date": es,
+                "end_date": ef,
+                "late_start": ls,
+                "late_finish": lf,
+                "total_float": total,
+                "free_float": free,
+                "is_critical": critical,
+                "tier_critical": tier,
+                "predecessors": [ids[j] for j in net.predecessors(k)],
+                "successors": [ids[j] for j in net.successors(k)],
+            }
+            for k, duration, es, ef, ls, lf, total, free, critical, tier in columns
+        ]
+
+    def early_days(self) -> tuple[np.ndarray, np.ndarray]:
+        """Early start and finish day of every activity as ``datetime64[D]`` arrays."""
+        return self._days(self.early_start, np.arange(len(self.network)))
+
+    def _dates(self, starts: np.ndarray, nodes: np.ndarray) -> tuple[list[str], list[str]]:
+        first, last = self._days(starts, nodes)
+        return np.datetime_as_string(first).tolist(), np.datetime_as_string(last).tolist()
+
+    def _days(self, starts: np.ndarray, nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # An activity occupies whole working days: it starts on the day its
+        # offset falls in and finishes on the last day it touches
+        durations = self.durations[nodes]
+        first = np.floor(starts + CRITICAL_TOLERANCE)
+        last = np.ceil(starts + durations - CRITICAL_TOLERANCE) - 1
+        last = np.where(durations > 0, np.maximum(last, first), first)
+        calendar, start = self.network.calendar, self.network.start
+        return calendar.offsets_to_days(start, first), calendar.offsets_to_days(start, last)
+
+
+def relationships(predecessors) -> list[Relationship]:
+    """Normalize stored predecessor links to ``Relationship``s.
+
+    Accepts a list of ids or ``{"id", "type", "lag"}`` dicts, a single such
+    dict, or a mapping of predecessor id to a type or ``{"type", "lag"}``.
+    P6 type names (``PR_FS``) are accepted.
+    """
+    if not predecessors:
+        return []
+    if isinstance(predecessors, Mapping):
+        if "id" in predecessors:
+            predecessors = [predecessors]
+        else:
+            predecessors = [
+                {"id": key, **(value if isinstance(value, Mapping) else {"type": value})}
+                for key, value in predecessors.items()
+            ]
+    links = []
+    for pred in predecessors:
+        if not isinstance(pred, Mapping):
+            links.append(Relationship(str(pred)))
+            continue
+        kind = str(pred.get("type") or "FS").upper().removeprefix("PR_")
+        links.append(Relationship(str(pred["id"]), kind, float(pred.get("lag") or 0.0)))
+    return links
+
+
+def records_signature(
+    records: Iterable[Mapping], calendar: WorkCalendar | None = None
+) -> tuple[str, dict[str, float]]:
+    """Split records as ``CPMNetwork.from_records`` reads them into a hash
+    of everything but durations (ids, names, links, crews, project start)
+    and each activity's duration, so callers can tell a changed network
+    from changed durations."""
+    calendar = calendar or STANDARD
+    rows = [record if isinstance(record, Mapping) else vars(record) for record in records]
+    starts = [_as_date(row["start_date"]) for row in rows if row.get("start_date")]
+    shape = [min(starts).isoformat() if starts else None]
+    durations = {}
+    for row in rows:
+        activity_id = str(row.get("external_id") or row["id"])
+        durations[activity_id] = _record_duration(row, calendar)
+        shape.append(
+            [
+                activity_id,
+                row.get("name") or activity_id,
+                [
+                    [link.predecessor, link.type, link.lag]
+                    for link in relationships(row.get("predecessors"))
+                ],
+                bool(row.get("tier_critical")),
+                row.get("trade") or None,
+                int(row.get("crew_size") or 0),
+            ]
+        )
+    digest = hashlib.sha256(json.dumps(shape, separators=(",", ":")).encode()).hexdigest()
+    return digest, durations
+
+
+def _record_duration(row: Mapping, calendar: WorkCalendar) -> float:
+    for key in ("duration", "mode"):
+        if row.get(key) is not None:
+            return float(row[key])
+    start, end = row.get("start_date"), row.get("end_date")
+    if start and end:
+        return float(calendar.duration(_as_date(start), _as_date(end)))
+    return 0.0
+
+
+def _as_date(value) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
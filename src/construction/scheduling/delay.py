@@ -0,0 +1,448 @@
+"""Time impact and windows delay analysis by fragnet insertion.
+
+A ``DelayEvent`` is a fragnet: a few new activities (an RFI response, a
+redesign, a weather shutdown) owned by a responsible party and tied into the
+schedule by links to the activities they hold up. ``analyze_window``
+rebuilds a snapshot's network with every fragnet already in place but
+switched off (zero durations, links at ``-inf`` lag), then switches
+fragnets on and off through ``IncrementalCPM.update_many``, so each
+insertion re-propagates only the subgraph it reaches:
+
+- inserting the events one at a time in date order gives each event's time
+  impact on the project finish (the TIA);
+- inserting only one party's events gives the critical delay that party
+  causes on its own, and withdrawing only that party's events from the full
+  set the delay it alone is responsible for; the rest of its critical delay
+  is concurrent with other parties' delay.
+
+The snapshot's early starts are kept as start-no-earlier-than dates, so
+imposed dates and progress survive the rebuild. ``windows_analysis`` splits
+the events between consecutive schedule updates and analyzes each window
+against the update at its start. Windows are independent, so they run on a
+process pool; delays are in working days of the analysis calendar.
+"""
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date
+
+import numpy as np
+
+from construction.scheduling.calendars import STANDARD, WorkCalendar
+from construction.scheduling.cpm import CPMActivity, CPMNetwork, Relationship, relationships
+from construction.scheduling.incremental import IncrementalCPM
+from construction.scheduling.monte_carlo import _pool_context, resolve_workers
+from construction.scheduling.snapshot import ScheduleSnapshot
+
+# Lag that switches a fragnet link off
+_OFF = -math.inf
+# Below this many activities across all windows a process pool costs more
+# than it saves, so windows run in process
+_PARALLEL_MIN_ACTIVITIES = 50_000
+
+
+@dataclass(frozen=True)
+class Tie:
+    """Link from a fragnet activity to the schedule activity it holds up."""
+
+    predecessor: str
+    successor: str
+    type: str = "FS"
+    lag: float = 0.0
+
+
+@dataclass(frozen=True)
+class DelayEvent:
+    """A delay event as a fragnet owned by a responsible party.
+
+    Fragnet activity predecessors may name other activities of the same
+    fragnet or schedule activities; the fragnet starts no earlier than
+    ``start``.
+    """
+
+    id: str
+    party: str
+    activities: tuple[CPMActivity, ...]
+    ties: tuple[Tie, ...]
+    start: date | None = None
+    description: str = ""
+
+    @classmethod
+    def from_record(cls, record: Mapping) -> "DelayEvent":
+        """Event from a dict.
+
+        Either a full fragnet (``activities`` with id, name, duration and
+        predecessors, and ``ties`` with predecessor, successor, type and
+        lag) or the shorthand ``{"activity": "A1010", "days": 10}``: one
+        fragnet activity of ``days`` finishing before ``activity`` starts.
+        """
+        event_id = str(record["id"])
+        description = record.get("description", "")
+        if "activity" in record:
+            activities = (CPMActivity("delay", description or event_id, float(record["days"])),)
+            ties = (Tie("delay", str(record["activity"]), record.get("type", "FS")),)
+        else:
+            activities = tuple(
+                CPMActivity(
+                    str(row["id"]),
+                    row.get("name") or str(row["id"]),
+                    float(row["duration"]),
+                    tuple(relationships(row.get("predecessors"))),
+                )
+                for row in record["activities"]
+            )
+            ties = tuple(
+                Tie(
+                    str(tie["predecessor"]),
+                    str(tie["successor"]),
+                    tie.get("type", "FS"),
+                    float(tie.get("lag", 0.0)),
+                )
+                for tie in record["ties"]
+            )
+        start = record.get("start_date") or record.get("date")
+        return cls(
+            id=event_id,
+            party=record.get("party") or record.get("responsible_party") or "Unassigned",
+            activities=activities,
+            ties=ties,
+            start=date.fromisoformat(start) if isinstance(start, str) else start,
+            description=description,
+        )
+
+
+def check_events(snapshot: ScheduleSnapshot, events: Iterable[DelayEvent]) -> None:
+    """Raise ``ValueError`` naming every link from ``events`` to an activity
+    that is neither in ``snapshot`` nor in the event's own fragnet."""
+    schedule_ids = set(snapshot.ids.tolist())
+    problems = []
+    for event in events:
+        own = {activity.id for activity in event.activities}
+        for activity in event.activities:
+            problems += [
+                f"'{event.id}' activity '{activity.id}' follows unknown activity"
+                f" '{link.predecessor}'"
+                for link in activity.predecessors
+                if link.predecessor not in own and link.predecessor not in schedule_ids
+            ]
+        for tie in event.ties:
+            if tie.predecessor not in own:
+                problems.append(
+                    f"'{event.id}' ties from '{tie.predecessor}', which is not in its fragnet"
+                )
+            if tie.successor not in schedule_ids:
+                problems.append(f"'{event.id}' ties to unknown activity '{tie.successor}'")
+    if problems:
+        raise ValueError(
+            f"Delay events don't fit the {snapshot.label or snapshot.kind} schedule: "
+            + "; ".join(problems)
+        )
+
+
+@dataclass
+class EventImpact:
+    """Project finish movement when one event was inserted."""
+
+    event_id: str
+    party: str
+    start: date | None
+    impact_days: float
+    finish: date
+
+
+@dataclass
+class PartyDelay:
+    """One party's share of a window's delay.
+
+    ``critical_delay_days`` is the delay its events cause on their own,
+    ``sole_delay_days`` the delay that disappears without them and
+    ``concurrent_delay_days`` the part of its critical delay other parties'
+    events would have caused anyway.
+    """
+
+    party: str
+    events: int = 0
+    critical_delay_days: float = 0.0
+    sole_delay_days: float = 0.0
+    concurrent_delay_days: float = 0.0
+
+    def add(self, other: "PartyDelay") -> None:
+        self.events += other.events
+        self.critical_delay_days += other.critical_delay_days
+        self.sole_delay_days += other.sole_delay_days
+        self.concurrent_delay_days += other.concurrent_delay_days
+
+    def record(self) -> dict:
+        """The party's delay as JSON-ready data."""
+        return {
+            "events": self.events,
+            "critical_delay_days": _round(self.critical_delay_days),
+            "sole_delay_days": _round(self.sole_delay_days),
+            "concurrent_delay_days": _round(self.concurrent_delay_days),
+        }
+
+
+@dataclass
+class WindowResult:
+    """Delay analysis of the events between two schedule updates."""
+
+    start: date
+    end: date | None
+    label: str
+    baseline_finish: date
+    impacted_finish: date
+    delay_days: float
+    # Delay no single party's withdrawal removes
+    concurrent_days: float
+    events: list[EventImpact]
+    parties: dict[str, PartyDelay]
+    # Calendar days the project finish moved by the next update, if any
+    update_slip_days: int | None = None
+    affected_activities: list[str] = field(default_factory=list)
+
+    def record(self) -> dict:
+        """The window as JSON-ready data."""
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat() if self.end else None,
+            "label": self.label,
+            "baseline_finish": self.baseline_finish.isoformat(),
+            "impacted_finish": self.impacted_finish.isoformat(),
+            "delay_days": _round(self.delay_days),
+            "concurrent_days": _round(self.concurrent_days),
+            "update_slip_days": self.update_slip_days,
+            "affected_activities": self.affected_activities,
+            "events": [
+                {
+                    "event_id": impact.event_id,
+                    "party": impact.party,
+                    "start": impact.start.isoformat() if impact.start else None,
+                    "impact_days": _round(impact.impact_days),
+                    "finish": impact.finish.isoformat(),
+                }
+                for impact in self.events
+            ],
+            "parties": {name: delay.record() for name, delay in self.parties.items()},
+        }
+
+
+def party_totals(windows: Iterable[WindowResult]) -> dict[str, PartyDelay]:
+    """Each party's delay summed across windows."""
+    totals: dict[str, PartyDelay] = {}
+    for window in windows:
+        for name, delay in window.parties.items():
+            totals.setdefault(name, PartyDelay(name)).add(delay)
+    return totals
+
+
+class _Fragnets:
+    """A snapshot's network with every event's fragnet inserted, switched off."""
+
+    def __init__(
+        self,
+        snapshot: ScheduleSnapshot,
+        events: Sequence[DelayEvent],
+        calendar: WorkCalendar,
+    ):
+        activities = snapshot.activities()
+        index = {activity.id: i for i, activity in enumerate(activities)}
+        schedule_size = len(activities)
+        owners = []
+        for e, event in enumerate(events):
+            own = {activity.id for activity in event.activities}
+            for activity in event.activities:
+                links = tuple(
+                    replace(link, predecessor=_fragnet_id(event, link.predecessor))
+                    if link.predecessor in own
+                    else link
+                    for link in activity.predecessors
+                )
+                activities.append(
+                    replace(activity, id=_fragnet_id(event, activity.id), predecessors=links)
+                )
+                owners.append(e)
+            for tie in event.ties:
+                i = index[tie.successor]
+                link = Relationship(_fragnet_id(event, tie.predecessor), tie.type, tie.lag)
+                activities[i] = replace(
+                    activities[i], predecessors=(*activities[i].predecessors, link)
+                )
+
+        self.network = network = CPMNetwork(activities, calendar=calendar, start=snapshot.data_date)
+        self.events = list(events)
+        # Event of every node in network order, -1 for schedule activities
+        owner = np.full(len(network), -1, dtype=np.int64)
+        spec_nodes = np.array([network.index[a.id] for a in activities], dtype=np.int64)
+        owner[spec_nodes[schedule_size:]] = owners
+        edge_owner = np.maximum(owner[network.edge_src], owner[network.edge_dst])
+        nodes_by_event = _group(owner, len(events))
+        edges_by_event = _group(edge_owner, len(events))
+
+        ids = np.array([network.index[activity_id] for activity_id in snapshot.ids.tolist()])
+        release = np.zeros(len(network))
+        release[ids] = calendar.days_to_offsets(network.start, snapshot.start)
+        self.durations = network.durations.copy()
+        durations = self.durations.copy()
+        lags = network.edge_lag.copy()
+
+        self.on: list[tuple[dict, dict, dict]] = []
+        self.off: list[tuple[dict, dict, dict]] = []
+        for event, nodes, edges in zip(events, nodes_by_event, edges_by_event, strict=True):
+            offset = 0
+            if event.start is not None and event.start > network.start:
+                offset = calendar.workdays_between(network.start, event.start)
+            node_list, edge_list = nodes.tolist(), edges.tolist()
+            self.on.append(
+                (
+                    dict(zip(node_list, self.durations[nodes].tolist(), strict=True)),
+                    dict.fromkeys(node_list, float(offset)),
+                    dict(zip(edge_list, network.edge_lag[edges].tolist(), strict=True)),
+                )
+            )
+            self.off.append(
+                (
+                    dict.fromkeys(node_list, 0.0),
+                    dict.fromkeys(node_list, 0.0),
+                    dict.fromkeys(edge_list, _OFF),
+                )
+            )
+            durations[nodes] = 0.0
+            lags[edges] = _OFF
+        self.schedule = IncrementalCPM(network, release, durations, lags)
+
+    def switch(self, events: Iterable[int], on: bool) -> float:
+        """Insert (or withdraw) events in one pass; returns the new project finish."""
+        edits = self.on if on else self.off
+        durations, release, lags = {}, {}, {}
+        for e in events:
+            durations.update(edits[e][0])
+            release.update(edits[e][1])
+            lags.update(edits[e][2])
+        return self.schedule.update_many(durations, release, lags).project_finish
+
+
+def analyze_window(
+    snapshot: ScheduleSnapshot,
+    events: Sequence[DelayEvent],
+    calendar: WorkCalendar = STANDARD,
+    end: date | None = None,
+) -> WindowResult:
+    """Time impact of ``events`` on ``snapshot``, attributed per party."""
+    check_events(snapshot, events)
+    events = sorted(events, key=lambda event: (event.start or date.min, event.id))
+    fragnets = _Fragnets(snapshot, events, calendar)
+    network = fragnets.network
+    baseline = fragnets.schedule.project_finish
+
+    # Sequential insertion in date order
+    impacts = []
+    finish = baseline
+    for e, event in enumerate(events):
+        previous, finish = finish, fragnets.switch([e], on=True)
+        impacts.append(
+            EventImpact(
+                event.id, event.party, event.start, finish - previous, network.finish_date(finish)
+            )
+        )
+    impacted = finish
+    total = impacted - baseline
+
+    by_party: dict[str, list[int]] = {}
+    for e, event in enumerate(events):
+        by_party.setdefault(event.party, []).append(e)
+    parties = {}
+    for party, owned in by_party.items():
+        without = fragnets.switch(owned, on=False)
+        fragnets.switch(owned, on=True)
+        parties[party] = PartyDelay(party, len(owned), sole_delay_days=impacted - without)
+    fragnets.switch(range(len(events)), on=False)
+    for party, owned in by_party.items():
+        alone = fragnets.switch(owned, on=True) - baseline
+        fragnets.switch(owned, on=False)
+        delay = parties[party]
+        delay.critical_delay_days = alone
+        delay.concurrent_delay_days = max(alone - delay.sole_delay_days, 0.0)
+    sole = sum(delay.sole_delay_days for delay in parties.values())
+
+    return WindowResult(
+        start=snapshot.data_date,
+        end=end,
+        label=snapshot.label or snapshot.kind,
+        baseline_finish=network.finish_date(baseline),
+        impacted_finish=network.finish_date(impacted),
+        delay_days=total,
+        concurrent_days=max(total - sole, 0.0),
+        events=impacts,
+        parties=parties,
+        affected_activities=sorted({tie.successor for event in events for tie in event.ties}),
+    )
+
+
+def time_impact_analysis(
+    snapshot: ScheduleSnapshot,
+    events: Sequence[DelayEvent],
+    calendar: WorkCalendar = STANDARD,
+) -> WindowResult:
+    """TIA: every event inserted into one schedule update."""
+    return analyze_window(snapshot, events, calendar)
+
+
+def windows_analysis(
+    snapshots: Sequence[ScheduleSnapshot],
+    events: Sequence[DelayEvent],
+    calendar: WorkCalendar = STANDARD,
+    workers: int | None = 1,
+) -> list[WindowResult]:
+    """Analyze each window between consecutive updates against its opening update.
+
+    An event falls in the window its start date does; undated events and
+    events before the first update go to the first window. With
+    ``workers`` > 1 (0 or None: one per CPU) windows run on a process pool.
+    """
+    snapshots = sorted(snapshots, key=lambda snapshot: snapshot.data_date)
+    if not snapshots:
+        raise ValueError("Windows analysis needs at least one schedule snapshot")
+    starts = [snapshot.data_date for snapshot in snapshots]
+    grouped: list[list[DelayEvent]] = [[] for _ in snapshots]
+    for event in events:
+        w = 0
+        if event.start is not None:
+            w = max(int(np.searchsorted(starts, event.start, side="right")) - 1, 0)
+        grouped[w].append(event)
+    for snapshot, window_events in zip(snapshots, grouped, strict=True):
+        check_events(snapshot, window_events)
+    ends = [*starts[1:], None]
+    tasks = list(zip(snapshots, grouped, [calendar] * len(snapshots), ends, strict=True))
+
+    workers = min(resolve_workers(workers), len(tasks))
+    if sum(len(snapshot) for snapshot in snapshots) < _PARALLEL_MIN_ACTIVITIES:
+        workers = 1
+    if workers <= 1:
+        windows = [analyze_window(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+            windows = list(pool.map(_analyze_task, tasks))
+    for window, following in zip(windows, snapshots[1:], strict=False):
+        window.update_slip_days = (following.project_finish - window.baseline_finish).days
+    return windows
+
+
+def _analyze_task(task: tuple) -> WindowResult:
+    return analyze_window(*task)
+
+
+def _fragnet_id(event: DelayEvent, activity_id: str) -> str:
+    return f"{event.id}/{activity_id}"
+
+
+def _group(owner: np.ndarray, n: int) -> list[np.ndarray]:
+    """Indexes of ``owner`` per owner value 0..n-1 (ignoring -1)."""
+    order = np.argsort(owner, kind="stable")
+    bounds = np.searchsorted(owner[order], np.arange(n + 1))
+    return [order[bounds[i] : bounds[i + 1]] for i in range(n)]
+
+
+def _round(days: float) -> float:
+    return round(days, 3) + 0.0
@@ -0,0 +1,294 @@
+"""Incremental CPM: re-propagate dates through the subgraph an edit touches.
+
+``IncrementalCPM`` keeps the solved early starts and, instead of late starts,
+each activity's *tail*: the longest distance from its start to the project
+finish (``late_start = project_finish - tail``). Tails do not depend on the
+project finish, so an edit that moves the finish does not invalidate every
+late date, only the subgraph whose longest paths actually changed.
+
+An edit to one activity's duration or earliest start seeds a forward
+worklist (the activity and its successors, in topological order) and a
+backward one (the activity and its predecessors, in reverse order); a lag
+edit seeds the link's two ends. A lag of ``-inf`` switches a link off, so
+fragnets can be inserted into and withdrawn from a network in place. Each
+node popped is recomputed from its own links, and only a node whose value
+moved enqueues its neighbours, so propagation stops where float absorbs
+the change. Hot state lives in plain lists, which are much cheaper than
+NumPy arrays to read one element at a time; NumPy mirrors of the touched
+entries keep whole-network queries vectorized.
+"""
+
+import heapq
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from construction.scheduling.cpm import CRITICAL_TOLERANCE, CPMNetwork, CPMResult
+
+# Changes smaller than this (working days) are rounding, not movement
+_EPSILON = 1e-9
+
+
+@dataclass
+class CPMUpdate:
+    """What one edit changed."""
+
+    activity_id: str
+    project_finish: float
+    finish_delta: float
+    # Activities whose early start or distance to the finish moved, in
+    # network order (a finish change shifts every late date on top of this)
+    changed: list[str]
+    became_critical: list[str]
+    no_longer_critical: list[str]
+
+
+class IncrementalCPM:
+    """A solved CPM network that absorbs single-activity edits in place."""
+
+    def __init__(
+        self,
+        network: CPMNetwork,
+        release: np.ndarray | None = None,
+        durations: np.ndarray | None = None,
+        lags: np.ndarray | None = None,
+    ):
+        self.network = network
+        self._lock = threading.Lock()
+        durations = network.durations.copy() if durations is None else durations.astype(np.float64)
+        release = np.zeros(len(network)) if release is None else release.astype(np.float64)
+        lags = network.edge_lag if lags is None else lags.astype(np.float64)
+        weights = network.edge_weights(durations) - network.edge_lag + lags
+        solved = network.compute(durations, release, weights)
+        tail = solved.project_finish - solved.late_start
+
+        self.project_finish = solved.project_finish
+        self._durations = durations
+        self._release = release
+        self._weights = weights
+        self._early_start = solved.early_start
+        self._tail = tail
+        self._critical = solved.critical.copy()
+
+        # Per-element state as lists for the worklists
+        self._dur = durations.tolist()
+        self._rel = release.tolist()
+        self._w = weights.tolist()
+        self._es = solved.early_start.tolist()
+        self._tl = tail.tolist()
+        self._src = network.edge_src.tolist()
+        self._dst = network.edge_dst.tolist()
+        self._lag = lags.tolist()
+        self._pred_end = network._pred_end.tolist()
+        self._succ_end = network._succ_end.tolist()
+        self._in_ptr = network.in_ptr.tolist()
+        self._in_edges = network._in_order.tolist()
+        self._out_ptr = network.out_ptr.tolist()
+        self._out_edges = network._out_order.tolist()
+
+    def update(
+        self,
+        activity_id: str,
+        duration: float | None = None,
+        release: float | None = None,
+    ) -> CPMUpdate:
+        """Change one activity's duration and/or earliest start (working days)."""
+        k = self.network.index.get(activity_id)
+        if k is None:
+            raise KeyError(f"Unknown activity '{activity_id}'")
+        if duration is not None and duration < 0:
+            raise ValueError("Activity durations must not be negative")
+        with self._lock:
+            return self._apply(
+                activity_id,
+                {} if duration is None else {k: duration},
+                {} if release is None else {k: release},
+                {},
+            )
+
+    def update_many(
+        self,
+        durations: Mapping[int, float] | None = None,
+        release: Mapping[int, float] | None = None,
+        lags: Mapping[int, float] | None = None,
+    ) -> CPMUpdate:
+        """Apply several edits, keyed by node and relationship index, in one pass.
+
+        ``lags`` are indexes into the network's edge arrays; ``-inf``
+        switches a link off and a finite lag switches it back on.
+        """
+        durations = dict(durations or {})
+        if any(d < 0 for d in durations.values()):
+            raise ValueError("Activity durations must not be negative")
+        with self._lock:
+            return self._apply("", durations, dict(release or {}), dict(lags or {}))
+
+    def _apply(
+        self,
+        label: str,
+        durations: dict[int, float],
+        release: dict[int, float],
+        lags: dict[int, float],
+    ) -> CPMUpdate:
+        edges = set(lags)
+        for e, lag in lags.items():
+            self._lag[e] = float(lag)
+        for k, duration in durations.items():
+            self._dur[k] = float(duration)
+            edges.update(self._in_edges[self._in_ptr[k] : self._in_ptr[k + 1]])
+            edges.update(self._out_edges[self._out_ptr[k] : self._out_ptr[k + 1]])
+        for e in edges:
+            self._w[e] = (
+                self._pred_end[e] * self._dur[self._src[e]]
+                + self._lag[e]
+                - self._succ_end[e] * self._dur[self._dst[e]]
+            )
+        for k, start in release.items():
+            self._rel[k] = max(float(start), 0.0)
+
+        nodes = sorted(durations.keys() | release.keys())
+        edges = sorted(edges)
+        forward = self._propagate_forward(nodes + [self._dst[e] for e in edges])
+        backward = self._propagate_backward(nodes + [self._src[e] for e in edges])
+
+        # Sync the touched entries into the NumPy mirrors
+        self._durations[nodes] = [self._dur[v] for v in nodes]
+        self._release[nodes] = [self._rel[v] for v in nodes]
+        self._weights[edges] = [self._w[e] for e in edges]
+        self._early_start[forward] = [self._es[v] for v in forward]
+        self._tail[backward] = [self._tl[v] for v in backward]
+
+        previous_finish = self.project_finish
+        self.project_finish = float((self._early_start + self._durations).max(initial=0.0))
+        if abs(self.project_finish - previous_finish) > _EPSILON:
+            # Every total float shifts with the finish
+            candidates = np.arange(len(self.network))
+        else:
+            candidates = np.union1d(forward, backward).astype(np.int64)
+        critical = self._total_float(candidates) <= CRITICAL_TOLERANCE
+        flipped = candidates[critical != self._critical[candidates]]
+        self._critical[candidates] = critical
+
+        ids = self.network.ids
+        return CPMUpdate(
+            activity_id=label,
+            project_finish=self.project_finish,
+            finish_delta=self.project_finish - previous_finish,
+            changed=[ids[v] for v in sorted(set(forward) | set(backward))],
+            became_critical=[ids[v] for v in flipped if self._critical[v]],
+            no_longer_critical=[ids[v] for v in flipped if not self._critical[v]],
+        )
+
+    def _propagate_forward(self, seeds: list[int]) -> list[int]:
+        """Recompute early starts downstream of ``seeds``; returns moved nodes."""
+        es, w, src = self._es, self._w, self._src
+        heap = sorted(set(seeds))
+        queued = set(heap)
+        moved = []
+        while heap:
+            v = heapq.heappop(heap)
+            queued.discard(v)
+            start = self._rel[v]
+            for e in self._in_edges[self._in_ptr[v] : self._in_ptr[v + 1]]:
+                reach = es[src[e]] + w[e]
+                if reach > start:
+                    start = reach
+            if abs(start - es[v]) <= _EPSILON:
+                continue
+            es[v] = start
+            moved.append(v)
+            for e in self._out_edges[self._out_ptr[v] : self._out_ptr[v + 1]]:
+                succ = self._dst[e]
+                if succ not in queued:
+                    queued.add(succ)
+                    heapq.heappush(heap, succ)
+        return moved
+
+    def _propagate_backward(self, seeds: list[int]) -> list[int]:
+        """Recompute tails upstream of ``seeds``; returns moved nodes."""
+        tl, w, dst = self._tl, self._w, self._dst
+        # Max-heap on node order via negated keys
+        heap = [-v for v in sorted(set(seeds), reverse=True)]
+        queued = set(seeds)
+        moved = []
+        while heap:
+            v = -heapq.heappop(heap)
+            queued.discard(v)
+            tail = self._dur[v]
+            for e in self._out_edges[self._out_ptr[v] : self._out_ptr[v + 1]]:
+                reach = tl[dst[e]] + w[e]
+                if reach > tail:
+                    tail = reach
+            if abs(tail - tl[v]) <= _EPSILON:
+                continue
+            tl[v] = tail
+            moved.append(v)
+            for e in self._in_edges[self._in_ptr[v] : self._in_ptr[v + 1]]:
+                pred = self._src[e]
+                if pred not in queued:
+                    queued.add(pred)
+                    heapq.heappush(heap, -pred)
+        return moved
+
+    def _total_float(self, nodes: np.ndarray) -> np.ndarray:
+        return self.project_finish - self._tail[nodes] - self._early_start[nodes]
+
+    def result(self) -> CPMResult:
+        """Current dates and floats as a full ``CPMResult``."""
+        with self._lock:
+            return self.network.result(
+                self._durations.copy(),
+                self._weights.copy(),
+                self._early_start.copy(),
+                self.project_finish - self._tail,
+            )
+
+    @property
+    def release(self) -> np.ndarray:
+        """Current earliest starts (working days) set by edits."""
+        return self._release.copy()
+
+    def early_start_date(self, activity_id: str) -> date:
+        """Current early start date of one activity."""
+        offset = np.floor(self._es[self.network.index[activity_id]] + CRITICAL_TOLERANCE)
+        return self.network.calendar.add_workdays(self.network.start, int(offset))
+
+
+class ScheduleStore:
+    """Small in-process LRU of solved schedules keyed by project.
+
+    Each schedule can carry the ``source`` it was built from (e.g. a
+    ``records_signature``), so callers can tell whether new input changes it.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[IncrementalCPM, object]] = OrderedDict()
+
+    def get(self, project_id: str) -> IncrementalCPM | None:
+        entry = self.entry(project_id)
+        return None if entry is None else entry[0]
+
+    def entry(self, project_id: str) -> tuple[IncrementalCPM, object] | None:
+        """The project's schedule and its source, or None."""
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is not None:
+                self._entries.move_to_end(project_id)
+            return entry
+
+    def put(self, project_id: str, schedule: IncrementalCPM, source: object = None) -> None:
+        with self._lock:
+            self._entries[project_id] = (schedule, source)
+            self._entries.move_to_end(project_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,450 @@
+"""Vectorized Monte Carlo simulation over a schedule network."""
+
+import hashlib
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from statistics import NormalDist
+
+import numpy as np
+
+from construction.scheduling.network import ScheduleNetwork, latest_start, longest_path
+from construction.scheduling.sketch import TDigest
+
+# Cap on (activities x iterations) cells held per chunk, ~16 MB of float32
+_CHUNK_CELLS = 4_000_000
+# Per-iteration arithmetic runs in float32 to halve memory traffic; total
+# float within this many days (~15 minutes) of zero counts as critical
+_SAMPLE_DTYPE = np.float32
+_CRITICAL_TOLERANCE = 0.01
+
+# "lhs": Latin hypercube (one random point per stratum, strata shuffled
+# independently per activity); "stratified": the same design using stratum
+# midpoints, which removes within-stratum noise entirely
+SAMPLING_METHODS = ("random", "lhs", "stratified")
+# Independent stratified batches needed before trusting their spread
+_MIN_REPLICATES = 5
+# Below this many (activities x iterations) cells a process pool costs more
+# than it saves, so parallel runs fall back to in-process batches
+_PARALLEL_MIN_CELLS = 2_000_000
+
+
+@dataclass
+class SimulationResult:
+    """Project finish distribution and per-activity statistics from one run.
+
+    The finish distribution is always available as a mergeable quantile
+    sketch; raw per-iteration samples only when the run kept them.
+    """
+
+    network: ScheduleNetwork
+    iterations: int
+    finish_digest: TDigest
+    mean_finish: float
+    criticality: np.ndarray
+    mean_overrun: np.ndarray
+    mean_total_float: np.ndarray
+    # (activities, bins) counts of sampled duration minus mode, binned
+    # evenly over each activity's [min - mode, max - mode]
+    overrun_counts: np.ndarray | None = None
+    finish_days: np.ndarray | None = None
+    # Root entropy of the run; passing it back as ``seed`` reproduces it exactly
+    seed: int | None = None
+    # None for fixed-size runs; otherwise whether the tolerance was reached
+    converged: bool | None = None
+    # 95% CI half-width (days) of each requested percentile, keyed by level
+    percentile_error: dict[float, float] = field(default_factory=dict)
+
+    def percentiles(self, levels: Sequence[float]) -> np.ndarray:
+        """Project finish (days) at each confidence level in [0, 1]."""
+        if self.finish_days is not None:
+            return np.percentile(self.finish_days, [lvl * 100 for lvl in levels])
+        return self.finish_digest.quantile(levels)
+
+    def finish_cdf(self, days: float) -> float:
+        """Share of iterations finishing within ``days``."""
+        if self.finish_days is not None:
+            return float(np.mean(self.finish_days <= days))
+        return float(self.finish_digest.cdf(days))
+
+    def finish_histogram(self, bins: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """(counts, edges) of project finish over the sampled range."""
+        if self.finish_days is not None:
+            return np.histogram(self.finish_days, bins=bins)
+        edges = np.linspace(self.finish_digest.min, self.finish_digest.max, bins + 1)
+        cumulative = np.rint(self.finish_digest.cdf(edges) * self.iterations).astype(np.int64)
+        cumulative[0], cumulative[-1] = 0, self.iterations
+        return np.diff(cumulative), edges
+
+    def overrun_histogram(self, activity_id: str) -> tuple[np.ndarray, np.ndarray]:
+        """(counts, edges) of one activity's sampled duration minus its mode."""
+        if self.overrun_counts is None:
+            raise ValueError("Run was made without per-activity histograms")
+        k = self.network.index[activity_id]
+        low = self.network.min_days[k] - self.network.mode_days[k]
+        high = self.network.max_days[k] - self.network.mode_days[k]
+        edges = np.linspace(low, high, self.overrun_counts.shape[1] + 1)
+        return self.overrun_counts[k], edges
+
+    def criticality_index(self, min_index: float = 0.0) -> dict[str, float]:
+        """Share of iterations each activity was critical, keyed by name."""
+        return {
+            name: round(float(ci), 4)
+            for name, ci in zip(self.network.names, self.criticality, strict=True)
+            if ci > min_index
+        }
+
+
+def triangular_ppf(
+    u: np.ndarray, low: np.ndarray, mode: np.ndarray, high: np.ndarray
+) -> np.ndarray:
+    """Inverse CDF of the triangular distribution.
+
+    ``u`` is (activities, iterations); the parameters are per activity.
+    Sampling by inverse transform (rather than ``rng.triangular``) lets the
+    same uniforms drive stratified designs and common random numbers.
+    """
+    low, mode, high = (np.asarray(a, dtype=u.dtype)[:, np.newaxis] for a in (low, mode, high))
+    span = high - low
+    split = np.divide(mode - low, span, out=np.zeros_like(span), where=span > 0)
+    left = low + np.sqrt(u * (span * (mode - low)))
+    right = high - np.sqrt((1 - u) * (span * (high - mode)))
+    return np.where(u < split, left, right)
+
+
+def percentile_half_widths(
+    samples: np.ndarray | TDigest, levels: Sequence[float], confidence: float = 0.95
+) -> np.ndarray:
+    """Distribution-free CI half-widths for the given quantile levels.
+
+    Uses the binomial order-statistic interval, which holds for any finish
+    distribution of independent samples. ``samples`` may be a sketch, in
+    which case the order statistics are read from it.
+    """
+    n = int(samples.count) if isinstance(samples, TDigest) else len(samples)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    levels = np.asarray(levels, dtype=np.float64)
+    spread = z * np.sqrt(n * levels * (1 - levels))
+    lower = np.clip(np.floor(n * levels - spread).astype(np.int64), 0, n - 1)
+    upper = np.clip(np.ceil(n * levels + spread).astype(np.int64), 0, n - 1)
+    if isinstance(samples, TDigest):
+        return (samples.quantile((upper + 0.5) / n) - samples.quantile((lower + 0.5) / n)) / 2
+    ordered = np.partition(samples, np.unique(np.concatenate([lower, upper])))
+    return (ordered[upper] - ordered[lower]) / 2
+
+
+def draw_uniforms(
+    rng: np.random.Generator, n_activities: int, n_iterations: int, sampling: str = "random"
+) -> np.ndarray:
+    """(activities, iterations) uniforms for one batch under ``sampling``."""
+    shape = (n_activities, n_iterations)
+    if sampling == "random":
+        return rng.random(shape, dtype=_SAMPLE_DTYPE)
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method '{sampling}'")
+    strata = rng.permuted(
+        np.tile(np.arange(n_iterations, dtype=_SAMPLE_DTYPE), (n_activities, 1)), axis=1
+    )
+    if sampling == "lhs":
+        strata += rng.random(shape, dtype=_SAMPLE_DTYPE)
+    else:
+        strata += 0.5
+    strata /= n_iterations
+    return strata
+
+
+class _Accumulator:
+    """Running per-activity sums, histograms and a finish sketch.
+
+    Nothing here grows with the iteration count unless ``keep_samples`` is
+    set, so peak memory is the current chunk plus O(activities x bins).
+    Accumulators merge, which is how batches from pool workers combine.
+    """
+
+    def __init__(self, n: int, histogram_bins: int = 0, keep_samples: bool = False):
+        self.count = 0
+        self.finish_digest = TDigest()
+        self.finish_sum = 0.0
+        self.samples: list[np.ndarray] | None = [] if keep_samples else None
+        self.critical_count = np.zeros(n)
+        self.overrun_sum = np.zeros(n)
+        self.float_sum = np.zeros(n)
+        self.overrun_counts = (
+            np.zeros((n, histogram_bins), dtype=np.int64) if histogram_bins else None
+        )
+        # Per-batch percentiles of full stratified batches (error replicates)
+        self.batch_quantiles: list[np.ndarray] = []
+
+    def add_chunk(self, network: ScheduleNetwork, uniforms: np.ndarray) -> np.ndarray:
+        """Simulate one chunk and fold it in; returns its project finishes."""
+        durations = triangular_ppf(uniforms, network.min_days, network.mode_days, network.max_days)
+        early_finish = longest_path(network, durations)
+        project_finish = early_finish.max(axis=0, initial=0.0)
+        # Total float = late start - early start = LS - (EF - D)
+        total_float = latest_start(network, durations, project_finish)
+        total_float -= early_finish
+        total_float += durations
+        del early_finish
+        finish = project_finish.astype(np.float64)
+        m = durations.shape[1]
+        self.count += m
+        self.finish_digest.update(finish)
+        self.finish_sum += float(finish.sum())
+        if self.samples is not None:
+            self.samples.append(finish)
+        self.critical_count += (total_float <= _CRITICAL_TOLERANCE).sum(axis=1)
+        self.overrun_sum += durations.sum(axis=1, dtype=np.float64) - network.mode_days * m
+        self.float_sum += total_float.sum(axis=1, dtype=np.float64)
+        if self.overrun_counts is not None:
+            self._bin_durations(network, durations)
+        return finish
+
+    def _bin_durations(self, network: ScheduleNetwork, durations: np.ndarray) -> None:
+        n, bins = self.overrun_counts.shape
+        span = network.max_days - network.min_days
+        scale = np.divide(bins, span, out=np.zeros_like(span), where=span > 0)
+        low = network.min_days.astype(durations.dtype)[:, np.newaxis]
+        # Reuse the duration buffer: position within [min, max] -> flat bin id
+        durations -= low
+        durations *= scale.astype(durations.dtype)[:, np.newaxis]
+        idx = durations.astype(np.int64)
+        np.clip(idx, 0, bins - 1, out=idx)
+        idx += (np.arange(n) * bins)[:, np.newaxis]
+        self.overrun_counts += np.bincount(idx.ravel(), minlength=n * bins).reshape(n, bins)
+
+    def merge(self, other: "_Accumulator") -> None:
+        """Fold in a later batch; merging in batch order keeps results reproducible."""
+        self.count += other.count
+        self.finish_digest.merge(other.finish_digest)
+        self.finish_sum += other.finish_sum
+        if self.samples is not None:
+            self.samples.extend(other.samples)
+        self.critical_count += other.critical_count
+        self.overrun_sum += other.overrun_sum
+        self.float_sum += other.float_sum
+        if self.overrun_counts is not None:
+            self.overrun_counts += other.overrun_counts
+        self.batch_quantiles.extend(other.batch_quantiles)
+
+    def finish_days(self) -> np.ndarray | None:
+        if self.samples is None:
+            return None
+        if len(self.samples) > 1:
+            self.samples = [np.concatenate(self.samples)]
+        return self.samples[0]
+
+    def result(
+        self,
+        network: ScheduleNetwork,
+        seed: int,
+        converged: bool | None,
+        errors: dict[float, float],
+    ) -> SimulationResult:
+        return SimulationResult(
+            network=network,
+            iterations=self.count,
+            finish_digest=self.finish_digest,
+            mean_finish=self.finish_sum / self.count,
+            criticality=self.critical_count / self.count,
+            mean_overrun=self.overrun_sum / self.count,
+            mean_total_float=self.float_sum / self.count,
+            overrun_counts=self.overrun_counts,
+            finish_days=self.finish_days(),
+            seed=seed,
+            converged=converged,
+            percentile_error=errors,
+        )
+
+
+@dataclass(frozen=True)
+class _BatchPlan:
+    """Everything a worker needs to run one batch besides the network."""
+
+    size: int
+    seed: np.random.SeedSequence
+    sampling: str
+    chunk_size: int
+    # Percentile levels to record for error replicates, empty to skip
+    levels: tuple[float, ...]
+    histogram_bins: int
+    keep_samples: bool
+
+
+def _run_batch(network: ScheduleNetwork, plan: _BatchPlan) -> _Accumulator:
+    rng = np.random.default_rng(plan.seed)
+    acc = _Accumulator(len(network), plan.histogram_bins, plan.keep_samples)
+    finishes = []
+    # Each chunk is its own Latin hypercube so memory stays bounded
+    for lo in range(0, plan.size, plan.chunk_size):
+        m = min(plan.chunk_size, plan.size - lo)
+        finish = acc.add_chunk(network, draw_uniforms(rng, len(network), m, plan.sampling))
+        if plan.levels:
+            finishes.append(finish)
+    if plan.levels:
+        acc.batch_quantiles.append(
+            np.percentile(np.concatenate(finishes), np.multiply(plan.levels, 100))
+        )
+    return acc
+
+
+# Network shipped once to each pool worker instead of with every batch
+_worker_network: ScheduleNetwork | None = None
+
+
+def _init_worker(network: ScheduleNetwork) -> None:
+    global _worker_network
+    _worker_network = network
+
+
+def _run_worker_batch(plan: _BatchPlan) -> _Accumulator:
+    return _run_batch(_worker_network, plan)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    # forkserver avoids forking a multi-threaded parent (API server, Celery)
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _run_batches(
+    network: ScheduleNetwork, plans: list[_BatchPlan], workers: int
+) -> Iterator[_Accumulator]:
+    """Yield batch results in plan order, computing up to ``2 x workers`` ahead.
+
+    Closing the generator early (convergence reached) cancels batches that
+    have not started.
+    """
+    if workers <= 1:
+        for plan in plans:
+            yield _run_batch(network, plan)
+        return
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_pool_context(),
+        initializer=_init_worker,
+        initargs=(network,),
+    )
+    try:
+        queued = iter(plans)
+        pending = deque(pool.submit(_run_worker_batch, p) for p in islice(queued, 2 * workers))
+        while pending:
+            acc = pending.popleft().result()
+            nxt = next(queued, None)
+            if nxt is not None:
+                pending.append(pool.submit(_run_worker_batch, nxt))
+            yield acc
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def project_seed(project_id: str) -> int:
+    """Stable default seed per project, so repeated runs are comparable and cacheable."""
+    digest = hashlib.blake2b(project_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Pool size for ``workers``: 0 or None means one per CPU."""
+    return workers if workers else os.cpu_count() or 1
+
+
+def _estimate_errors(acc: _Accumulator, levels: list[float]) -> np.ndarray:
+    """CI half-widths: batch replicates for stratified designs, else order statistics.
+
+    Order-statistic intervals ignore the variance reduction of Latin
+    hypercube batches, so once there are enough independent batches the
+    spread of per-batch percentiles is used instead.
+    """
+    k = len(acc.batch_quantiles)
+    if k >= _MIN_REPLICATES:
+        z = NormalDist().inv_cdf(0.975)
+        return z * np.std(acc.batch_quantiles, axis=0, ddof=1) / np.sqrt(k)
+    samples = acc.finish_days()
+    return percentile_half_widths(acc.finish_digest if samples is None else samples, levels)
+
+
+def simulate(
+    network: ScheduleNetwork,
+    iterations: int,
+    seed: int | None = None,
+    chunk_size: int | None = None,
+    sampling: str = "random",
+    tolerance: float | None = None,
+    confidence_levels: Sequence[float] = (0.5, 0.8, 0.95),
+    batch_size: int = 1000,
+    workers: int | None = 1,
+    histogram_bins: int = 20,
+    keep_samples: bool = False,
+) -> SimulationResult:
+    """Sample activity durations and run forward/backward passes per iteration.
+
+    Iterations run in batches of ``batch_size``, each drawing from its own
+    ``SeedSequence.spawn`` child of ``seed``, and batches are processed in
+    chunks so peak memory stays bounded by ``chunk_size x activities``.
+    With ``workers`` > 1 (0 or None: one per CPU) batches run on a process
+    pool and are merged in batch order, so the same ``seed`` gives
+    bit-for-bit identical results for any worker count. Small runs stay
+    in-process since the pool would only add overhead.
+
+    With ``tolerance`` (days) set, ``iterations`` becomes a cap: batches are
+    merged until the 95% interval of every requested percentile is
+    narrower than ``tolerance`` on each side.
+
+    Results stream into a finish-date ``TDigest``, running per-activity
+    means and ``histogram_bins``-bin per-activity overrun histograms; the
+    full sample matrix never exists. Set ``keep_samples`` to also return
+    every project finish (one float per iteration) for exact percentiles.
+    """
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1")
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method '{sampling}'")
+    root = np.random.SeedSequence(seed)
+    n = len(network)
+    batch_size = max(1, min(batch_size, iterations))
+    chunk_size = chunk_size or max(1, min(batch_size, _CHUNK_CELLS // max(n, 1)))
+    levels = list(confidence_levels)
+
+    sizes = [batch_size] * (iterations // batch_size)
+    if iterations % batch_size:
+        sizes.append(iterations % batch_size)
+    plans = [
+        _BatchPlan(
+            size=size,
+            seed=child,
+            sampling=sampling,
+            chunk_size=chunk_size,
+            levels=tuple(levels) if sampling != "random" and size == batch_size else (),
+            histogram_bins=histogram_bins,
+            keep_samples=keep_samples,
+        )
+        for size, child in zip(sizes, root.spawn(len(sizes)), strict=True)
+    ]
+    workers = resolve_workers(workers)
+    if n * iterations < _PARALLEL_MIN_CELLS:
+        workers = 1
+
+    acc = _Accumulator(n, histogram_bins, keep_samples)
+    converged = None if tolerance is None else False
+    batches = _run_batches(network, plans, min(workers, len(plans)))
+    try:
+        for part in batches:
+            acc.merge(part)
+            if tolerance is not None and acc.count >= 2 * batch_size:
+                errors = _estimate_errors(acc, levels)
+                if float(errors.max()) <= tolerance:
+                    converged = True
+                    break
+    finally:
+        batches.close()
+    errors = _estimate_errors(acc, levels)
+    return acc.result(
+        network,
+        root.entropy,
+        converged,
+        {lvl: float(e) for lvl, e in zip(levels, errors, strict=True)},
+    )
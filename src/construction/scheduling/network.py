@@ -0,0 +1,269 @@
+"""Array-backed activity network built from schedule predecessor links."""
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+# Default three-point spread around a baseline duration (optimistic, pessimistic)
+DEFAULT_SPREAD = (0.85, 1.35)
+
+
+@dataclass(frozen=True)
+class ActivitySpec:
+    """One activity with a triangular (min, mode, max) duration in days."""
+
+    id: str
+    name: str
+    min_days: float
+    mode_days: float
+    max_days: float
+    predecessors: tuple[str, ...] = ()
+
+
+class ScheduleNetwork:
+    """Activity-on-node DAG stored as flat NumPy arrays.
+
+    Activities are renumbered in topological order and grouped into levels
+    (every predecessor sits on an earlier level), so a longest-path pass can
+    process one whole level at a time across many iterations. Edges are
+    kept twice in CSR-like form: sorted by target for the forward pass and
+    by source for the backward pass.
+    """
+
+    def __init__(self, activities: Iterable[ActivitySpec]):
+        specs = list(activities)
+        index = {spec.id: i for i, spec in enumerate(specs)}
+        if len(index) != len(specs):
+            raise ValueError("Duplicate activity ids in schedule network")
+
+        src, dst = [], []
+        for i, spec in enumerate(specs):
+            for pred in spec.predecessors:
+                if pred in index:
+                    src.append(index[pred])
+                    dst.append(i)
+        src = np.array(src, dtype=np.int64)
+        dst = np.array(dst, dtype=np.int64)
+        order, level_of = _topological_levels(len(specs), src, dst)
+
+        # Renumber nodes so each level is a contiguous slice
+        position = np.empty(len(specs), dtype=np.int64)
+        position[order] = np.arange(len(specs))
+        self.ids = [specs[i].id for i in order]
+        self.names = [specs[i].name for i in order]
+        self.index = {activity_id: k for k, activity_id in enumerate(self.ids)}
+        self.min_days = np.array([specs[i].min_days for i in order], dtype=np.float64)
+        self.mode_days = np.array([specs[i].mode_days for i in order], dtype=np.float64)
+        self.max_days = np.array([specs[i].max_days for i in order], dtype=np.float64)
+        if np.any(self.min_days > self.mode_days) or np.any(self.mode_days > self.max_days):
+            raise ValueError("Activity durations must satisfy min <= mode <= max")
+
+        levels = level_of[order]
+        self.level_bounds = np.searchsorted(levels, np.arange(levels.max(initial=-1) + 2))
+        self.edge_src = position[src]
+        self.edge_dst = position[dst]
+        self.has_successor = np.zeros(len(specs), dtype=bool)
+        self.has_successor[self.edge_src] = True
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_levels(self) -> int:
+        return len(self.level_bounds) - 1
+
+    def level(self, k: int) -> slice:
+        """Node slice of topological level ``k``."""
+        return slice(int(self.level_bounds[k]), int(self.level_bounds[k + 1]))
+
+    @cached_property
+    def incoming(self) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Per level: (nodes with predecessors, predecessor per edge, reduceat offsets)."""
+        return self._group_edges(self.edge_dst, self.edge_src)
+
+    @cached_property
+    def outgoing(self) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Per level: (nodes with successors, successor per edge, reduceat offsets)."""
+        return self._group_edges(self.edge_src, self.edge_dst)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Content hash of the graph and durations, independent of input order."""
+        preds: dict[str, list[str]] = {activity_id: [] for activity_id in self.ids}
+        for src, dst in zip(self.edge_src, self.edge_dst, strict=True):
+            preds[self.ids[dst]].append(self.ids[src])
+        rows = sorted(
+            (
+                self.ids[k],
+                self.min_days[k],
+                self.mode_days[k],
+                self.max_days[k],
+                sorted(preds[self.ids[k]]),
+            )
+            for k in range(len(self))
+        )
+        payload = json.dumps(rows, separators=(",", ":"), default=float)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def downstream(self, nodes: Iterable[int]) -> np.ndarray:
+        """Sorted node indices reachable from ``nodes``, including themselves.
+
+        Node order is topological, so the result is too.
+        """
+        reached = np.zeros(len(self), dtype=bool)
+        frontier = np.unique(np.asarray(list(nodes), dtype=np.int64))
+        succ_ptr, succ = self._successor_csr
+        while len(frontier):
+            reached[frontier] = True
+            targets = succ[_ranges(succ_ptr[frontier], succ_ptr[frontier + 1])]
+            frontier = np.unique(targets[~reached[targets]])
+        return np.flatnonzero(reached)
+
+    @cached_property
+    def _successor_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(self.edge_src, kind="stable")
+        ptr = np.searchsorted(self.edge_src[order], np.arange(len(self) + 1))
+        return ptr, self.edge_dst[order]
+
+    def _group_edges(self, key: np.ndarray, other: np.ndarray) -> list[tuple]:
+        order = np.argsort(key, kind="stable")
+        key, other = key[order], other[order]
+        groups = []
+        for k in range(self.n_levels):
+            nodes = self.level(k)
+            lo, hi = np.searchsorted(key, [nodes.start, nodes.stop])
+            owners, offsets = np.unique(key[lo:hi], return_index=True)
+            groups.append((owners, other[lo:hi], offsets))
+        return groups
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping],
+        overrides: Mapping[str, Mapping] | None = None,
+        spread: tuple[float, float] = DEFAULT_SPREAD,
+    ) -> "ScheduleNetwork":
+        """Build a network from activity dicts or ``ScheduleActivity`` rows.
+
+        Each record needs an id (``external_id`` or ``id``), a name,
+        ``predecessors`` (list of ids) and either explicit ``min``/``mode``/
+        ``max`` days or ``start_date``/``end_date`` whose span becomes the
+        mode with ``spread`` applied. ``overrides`` maps an id or name to
+        replacement ``{min, mode, max}`` values.
+        """
+        overrides = overrides or {}
+        specs = []
+        for record in records:
+            row = record if isinstance(record, Mapping) else vars(record)
+            activity_id = str(row.get("external_id") or row["id"])
+            name = row.get("name") or activity_id
+            if "mode" in row:
+                mode = float(row["mode"])
+                low = float(row.get("min", mode))
+                high = float(row.get("max", mode))
+            else:
+                start, end = row.get("start_date"), row.get("end_date")
+                mode = float((end - start).days) if start and end else 0.0
+                low, high = mode * spread[0], mode * spread[1]
+            ov = overrides.get(activity_id) or overrides.get(name) or {}
+            specs.append(
+                ActivitySpec(
+                    id=activity_id,
+                    name=name,
+                    min_days=float(ov.get("min", low)),
+                    mode_days=float(ov.get("mode", mode)),
+                    max_days=float(ov.get("max", high)),
+                    predecessors=tuple(_predecessor_ids(row.get("predecessors"))),
+                )
+            )
+        return cls(specs)
+
+    def deterministic_finish(self, durations: np.ndarray | None = None) -> float:
+        """Project finish (days) for one set of durations, mode by default."""
+        durations = self.mode_days if durations is None else durations
+        return float(longest_path(self, durations[:, np.newaxis]).max(initial=0.0))
+
+
+def _predecessor_ids(predecessors) -> list[str]:
+    """Normalize stored predecessor links to a list of activity ids."""
+    if not predecessors:
+        return []
+    if isinstance(predecessors, Mapping):
+        # A single link dict, or a mapping keyed by predecessor id
+        predecessors = [predecessors] if "id" in predecessors else list(predecessors)
+    ids = []
+    for pred in predecessors:
+        ids.append(str(pred["id"]) if isinstance(pred, Mapping) else str(pred))
+    return ids
+
+
+def _topological_levels(n: int, src: np.ndarray, dst: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Kahn's algorithm by level; returns (node order, level of each node)."""
+    indegree = np.bincount(dst, minlength=n)
+    by_src = np.argsort(src, kind="stable")
+    succ_ptr = np.searchsorted(src[by_src], np.arange(n + 1))
+    succ = dst[by_src]
+    level_of = np.zeros(n, dtype=np.int64)
+    frontier = np.flatnonzero(indegree == 0)
+    order = []
+    level = 0
+    while len(frontier):
+        order.append(frontier)
+        level_of[frontier] = level
+        starts, stops = succ_ptr[frontier], succ_ptr[frontier + 1]
+        targets, counts = np.unique(succ[_ranges(starts, stops)], return_counts=True)
+        indegree[targets] -= counts
+        frontier = targets[indegree[targets] == 0]
+        level += 1
+    order = np.concatenate(order) if order else np.zeros(0, dtype=np.int64)
+    if len(order) != n:
+        raise ValueError("Schedule network contains a dependency cycle")
+    return order, level_of
+
+
+def _ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Concatenated ``arange(start, stop)`` for each pair, without a Python loop."""
+    lengths = stops - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+def longest_path(network: ScheduleNetwork, durations: np.ndarray) -> np.ndarray:
+    """Early finish of every activity for each column of ``durations``.
+
+    ``durations`` is (activities, iterations) in network order, so each
+    activity's samples are contiguous and gathering predecessors copies
+    whole rows. Each level is resolved with one gather and a
+    ``maximum.reduceat`` over its incoming edges: O((activities + edges)
+    x iterations) in total.
+    """
+    finish = np.empty_like(durations)
+    for k in range(network.n_levels):
+        nodes = network.level(k)
+        finish[nodes] = durations[nodes]
+        targets, sources, offsets = network.incoming[k]
+        if len(targets):
+            finish[targets] += np.maximum.reduceat(finish[sources], offsets, axis=0)
+    return finish
+
+
+def latest_start(
+    network: ScheduleNetwork, durations: np.ndarray, project_finish: np.ndarray
+) -> np.ndarray:
+    """Late start of every activity given each iteration's project finish."""
+    start = np.empty_like(durations)
+    for k in reversed(range(network.n_levels)):
+        nodes = network.level(k)
+        np.subtract(project_finish, durations[nodes], out=start[nodes])
+        origins, targets, offsets = network.outgoing[k]
+        if len(origins):
+            late_finish = np.minimum.reduceat(start[targets], offsets, axis=0)
+            start[origins] = late_finish - durations[origins]
+    return start
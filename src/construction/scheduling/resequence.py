@@ -0,0 +1,449 @@
+"""Resequencing search: crew-feasible sequences that finish the job earlier.
+
+Schedules are rebuilt with a serial schedule-generation scheme (SGS):
+activities are placed in priority order (least late start first, from a
+CPM pass) once all their predecessors are placed, each at the earliest
+whole working day that satisfies its links and keeps every crew it uses
+within capacity for its whole duration. Tier-critical activities
+(redundant cooling and power paths, anything commissioned in sequence for
+Tier certification) also share a single-slot resource, so no two of them
+ever run at the same time, and links into them are never relaxed.
+
+The search resequences by fast-tracking finish-to-start links on the
+driving chain of the current schedule: a relaxed link becomes
+start-to-start, letting the successor start once the predecessor is
+``overlap`` done. Hill climbing accepts the first relaxation that shortens
+the schedule and restarts from each possible first move in turn until the
+time budget runs out. Sequences found are pruned of changes that no longer
+save time and ranked by days saved against the current sequence under the
+same crews.
+"""
+
+import heapq
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from construction.scheduling.cpm import _TYPE_CODES, CRITICAL_TOLERANCE, CPMNetwork
+
+# Share of a predecessor's duration a fast-tracked successor may overlap
+DEFAULT_OVERLAP = 0.5
+# Wall-clock budget for the local search, in seconds
+DEFAULT_TIME_BUDGET = 1.0
+# Initial length (working days) of the crew usage profile; it grows on demand
+_HORIZON = 1024
+
+
+def crew_capacities(assignments: Iterable) -> dict[str, int]:
+    """Total headcount per trade from ``CrewAssignment`` rows or dicts."""
+    capacities: dict[str, int] = {}
+    for assignment in assignments:
+        row = assignment if isinstance(assignment, Mapping) else vars(assignment)
+        trade = row.get("trade")
+        if trade:
+            capacities[trade] = capacities.get(trade, 0) + int(row.get("headcount") or 0)
+    return capacities
+
+
+@dataclass(frozen=True)
+class SequenceChange:
+    """A finish-to-start link fast-tracked to start-to-start."""
+
+    predecessor: str
+    successor: str
+    lag: float
+    # The successor may start this many working days after the predecessor
+    overlap_lag: float
+
+
+@dataclass
+class SequenceAlternative:
+    """One resequenced schedule (whole working days from the project start)."""
+
+    changes: tuple[SequenceChange, ...]
+    finish: int
+    days_saved: int
+    start: np.ndarray
+
+
+@dataclass
+class ResequencingResult:
+    """The current sequence under crew limits and ranked alternatives to it."""
+
+    network: CPMNetwork
+    baseline_finish: int
+    baseline_start: np.ndarray
+    alternatives: list[SequenceAlternative]
+    evaluations: int
+    # False when the time budget ran out before the search did
+    exhausted: bool
+
+    def records(self, max_listed: int = 50) -> list[dict]:
+        """Alternatives as dicts with ISO finish dates, best first."""
+        net = self.network
+        rows = []
+        for rank, alternative in enumerate(self.alternatives, 1):
+            moved = np.flatnonzero(alternative.start != self.baseline_start)
+            rows.append(
+                {
+                    "rank": rank,
+                    "days_saved": alternative.days_saved,
+                    "finish_days": alternative.finish,
+                    "project_finish": net.finish_date(alternative.finish).isoformat(),
+                    "changes": [
+                        {
+                            "predecessor": change.predecessor,
+                            "successor": change.successor,
+                            "type": "FS",
+                            "lag": change.lag,
+                            "new_type": "SS",
+                            "new_lag": change.overlap_lag,
+                        }
+                        for change in alternative.changes
+                    ],
+                    "moved_count": len(moved),
+                    "moved_activities": [net.ids[k] for k in moved[:max_listed]],
+                    "tier_critical_moved": [
+                        net.ids[k] for k in moved[net.tier_critical[moved]][:max_listed]
+                    ],
+                }
+            )
+        return rows
+
+
+class _CrewProfile:
+    """Crew usage per working day, one row per resource."""
+
+    def __init__(self, capacity: list[int]):
+        self.capacity = capacity
+        self.usage = np.zeros((len(capacity), _HORIZON), dtype=np.int64)
+        self.busy_until = [0] * len(capacity)
+
+    def earliest(self, uses: tuple[tuple[int, int], ...], t: int, duration: int) -> int:
+        """First day from ``t`` with room for ``uses`` over ``duration`` days."""
+        hi = max(self.busy_until[r] for r, _ in uses)
+        if hi <= t or all(
+            self.usage[r, t : t + duration].max() <= self.capacity[r] - demand for r, demand in uses
+        ):
+            return t
+        r, demand = uses[0]
+        ok = self.usage[r, t:hi] <= self.capacity[r] - demand
+        for r, demand in uses[1:]:
+            ok &= self.usage[r, t:hi] <= self.capacity[r] - demand
+        blocked = np.nonzero(~ok)[0]
+        # Runs of free days between blocked ones; the last is unbounded
+        gap_start = np.concatenate(([0], blocked + 1))
+        gap_end = np.append(blocked, np.iinfo(np.int64).max)
+        fits = np.flatnonzero(gap_end - gap_start >= duration)
+        return t + int(gap_start[fits[0]])
+
+    def load(
+        self, resource: np.ndarray, demand: np.ndarray, start: np.ndarray, duration: np.ndarray
+    ) -> None:
+        """Book many activities at once (into an empty profile)."""
+        end = start + duration
+        horizon = max(_HORIZON, int(end.max(initial=0)) + 1)
+        delta = np.zeros((len(self.capacity), horizon + 1), dtype=np.int64)
+        np.add.at(delta, (resource, start), demand)
+        np.add.at(delta, (resource, end), -demand)
+        self.usage = np.cumsum(delta[:, :horizon], axis=1)
+        busy_until = np.zeros(len(self.capacity), dtype=np.int64)
+        np.maximum.at(busy_until, resource, end)
+        self.busy_until = busy_until.tolist()
+
+    def book(self, uses: tuple[tuple[int, int], ...], t: int, duration: int) -> None:
+        end = t + duration
+        if end > self.usage.shape[1]:
+            grown = np.zeros((len(self.capacity), max(end, 2 * self.usage.shape[1])), np.int64)
+            grown[:, : self.usage.shape[1]] = self.usage
+            self.usage = grown
+        for r, demand in uses:
+            self.usage[r, t:end] += demand
+            self.busy_until[r] = max(self.busy_until[r], end)
+
+
+class Resequencer:
+    """Serial SGS plus local search over fast-tracked links.
+
+    ``capacities`` maps trade to available headcount (see
+    ``crew_capacities``); activities of other trades are not crew-limited,
+    and a crew larger than its trade is capped at the trade. ``durations``
+    and ``release`` (earliest starts) default to the network's own and are
+    rounded up to whole working days, as are lags.
+    """
+
+    def __init__(
+        self,
+        network: CPMNetwork,
+        capacities: Mapping[str, int] | None = None,
+        durations: np.ndarray | None = None,
+        release: np.ndarray | None = None,
+        overlap: float = DEFAULT_OVERLAP,
+    ):
+        if not 0 < overlap <= 1:
+            raise ValueError("overlap must be in (0, 1]")
+        self.network = network
+        n = len(network)
+        durations = network.durations if durations is None else durations
+        self._durations = np.ceil(durations - CRITICAL_TOLERANCE).clip(0)
+        release = np.zeros(n) if release is None else release
+        self._release = np.ceil(release - CRITICAL_TOLERANCE).clip(0)
+
+        src, dst = network.edge_src, network.edge_dst
+        lag = np.ceil(network.edge_lag - CRITICAL_TOLERANCE)
+        d = self._durations
+        self._base = network._pred_end * d[src] + lag - network._succ_end * d[dst]
+        relaxed = np.ceil(d[src] * (1 - overlap) - CRITICAL_TOLERANCE) + lag
+        # Only FS links into activities that are not tier-critical, and
+        # only where overlapping actually moves the successor
+        self._candidate = (
+            (network.edge_type == _TYPE_CODES["FS"])
+            & ~network.tier_critical[dst]
+            & (relaxed < self._base)
+        )
+        self._relaxed = np.where(self._candidate, relaxed, self._base)
+
+        # Resources: one per constrained trade plus the tier-critical slot
+        capacities = capacities or {}
+        trades = sorted({t for t in network.trades if t in capacities and capacities[t] > 0})
+        row_of = {trade: r for r, trade in enumerate(trades)}
+        self._capacity = [int(capacities[t]) for t in trades] + [1]
+        tier_slot = len(trades)
+        uses = []
+        for k, (trade, crew) in enumerate(
+            zip(network.trades, network.crew_sizes.tolist(), strict=True)
+        ):
+            use = []
+            if trade in row_of and crew > 0:
+                use.append((row_of[trade], min(crew, capacities[trade])))
+            if network.tier_critical[k]:
+                use.append((tier_slot, 1))
+            uses.append(tuple(use))
+        self._uses = uses
+
+        self._dur = self._durations.astype(np.int64).tolist()
+        self._rel = self._release.astype(np.int64).tolist()
+        self._src = src.tolist()
+        self._dst = dst.tolist()
+        self._in_ptr = network.in_ptr.tolist()
+        self._in_edges = network._in_order.tolist()
+
+        # Flattened (activity, resource, demand) bookings for profile rebuilds
+        bookings = [(k, r, q) for k, use in enumerate(uses) if self._dur[k] for r, q in use]
+        self._booked = np.array(bookings, dtype=np.int64).reshape(-1, 3).T
+
+        # The activity list: eligibility depends only on the links, not their
+        # distances, so one list of least-late-start-first serves every
+        # sequence and schedules differing in one link share a prefix
+        late_start = network.compute(self._durations, self._release, self._base).late_start
+        self._order = self._activity_list(late_start.tolist())
+        self._position = np.empty(n, dtype=np.int64)
+        self._position[self._order] = np.arange(n)
+        self._evaluated: dict[frozenset[int], tuple[int, np.ndarray]] = {}
+
+    def _activity_list(self, priority: list[float]) -> list[int]:
+        net = self.network
+        out_ptr, out_edges, dst = net.out_ptr.tolist(), net._out_order.tolist(), self._dst
+        waiting = np.diff(net.in_ptr).tolist()
+        eligible = [(priority[k], k) for k, count in enumerate(waiting) if not count]
+        heapq.heapify(eligible)
+        order = []
+        while eligible:
+            _, v = heapq.heappop(eligible)
+            order.append(v)
+            for e in out_edges[out_ptr[v] : out_ptr[v + 1]]:
+                w = dst[e]
+                waiting[w] -= 1
+                if not waiting[w]:
+                    heapq.heappush(eligible, (priority[w], w))
+        return order
+
+    def schedule(self, relaxed: Iterable[int] = ()) -> tuple[int, np.ndarray]:
+        """(finish, starts) of the SGS schedule with links ``relaxed``."""
+        return self._evaluate(frozenset(relaxed), frozenset())
+
+    def _evaluate(self, state: frozenset[int], parent: frozenset[int]) -> tuple[int, np.ndarray]:
+        """Schedule ``state``, reusing the prefix it shares with ``parent``."""
+        found = self._evaluated.get(state)
+        if found is not None:
+            return found
+        known = self._evaluated.get(parent)
+        if known is None or not state ^ parent:
+            prefix, first = None, 0
+        else:
+            prefix = known[1]
+            first = int(self._position[[self._dst[e] for e in state ^ parent]].min())
+        start = self._sgs(self._weights(state).astype(np.int64).tolist(), prefix, first)
+        finish = int((start + self._durations).max(initial=0))
+        found = self._evaluated[state] = (finish, start)
+        return found
+
+    def _weights(self, state: frozenset[int]) -> np.ndarray:
+        weights = self._base.copy()
+        edges = list(state)
+        weights[edges] = self._relaxed[edges]
+        return weights
+
+    def _sgs(self, weights: list[int], prefix: np.ndarray | None, first: int) -> np.ndarray:
+        """Serial SGS over the activity list from position ``first``.
+
+        Activities before ``first`` keep their starts in ``prefix``.
+        """
+        dur, src = self._dur, self._src
+        in_ptr, in_edges = self._in_ptr, self._in_edges
+        profile = _CrewProfile(self._capacity)
+        if prefix is None:
+            start = [0] * len(dur)
+        else:
+            start = prefix.tolist()
+            placed = self._position[self._booked[0]] < first
+            node, resource, demand = self._booked[:, placed]
+            profile.load(resource, demand, prefix[node], self._durations[node].astype(np.int64))
+        for v in self._order[first:]:
+            t = self._rel[v]
+            for e in in_edges[in_ptr[v] : in_ptr[v + 1]]:
+                reach = start[src[e]] + weights[e]
+                if reach > t:
+                    t = reach
+            uses = self._uses[v]
+            if uses and dur[v]:
+                t = profile.earliest(uses, t, dur[v])
+                profile.book(uses, t, dur[v])
+            start[v] = t
+        return np.array(start, dtype=np.int64)
+
+    def _driving_links(self, state: frozenset[int]) -> list[int]:
+        """Relaxable links on the chains that drive the finish, best first."""
+        _, start = self.schedule(state)
+        weights = self._weights(state).astype(np.int64).tolist()
+        finish = start + self._durations.astype(np.int64)
+        starts = start.tolist()
+        # Which activities free each resource on each day
+        frees = defaultdict(list)
+        for k, (uses, end) in enumerate(zip(self._uses, finish.tolist(), strict=True)):
+            for r, _ in uses:
+                frees[r, end].append(k)
+
+        stack = np.flatnonzero(finish == finish.max(initial=0)).tolist()
+        seen = set(stack)
+        links = set()
+        while stack:
+            v = stack.pop()
+            drivers = []
+            for e in self._in_edges[self._in_ptr[v] : self._in_ptr[v + 1]]:
+                u = self._src[e]
+                if starts[u] + weights[e] == starts[v]:
+                    drivers.append(u)
+                    if self._candidate[e] and e not in state:
+                        links.add(e)
+            if not drivers and starts[v] > self._rel[v]:
+                # Held back by a crew: follow whoever released it
+                drivers = [u for r, _ in self._uses[v] for u in frees.get((r, starts[v]), ())]
+            for u in drivers:
+                if u not in seen:
+                    seen.add(u)
+                    stack.append(u)
+        gain = self._base - self._relaxed
+        return sorted(links, key=lambda e: (-gain[e], e))
+
+    def search(
+        self, time_budget: float = DEFAULT_TIME_BUDGET, max_alternatives: int = 5
+    ) -> ResequencingResult:
+        """Ranked alternatives found within ``time_budget`` seconds."""
+        deadline = time.perf_counter() + time_budget
+        baseline_finish, baseline_start = self.schedule()
+        found: dict[frozenset[int], int] = {}
+        tried: set[int] = set()
+        exhausted = True
+        for first in self._driving_links(frozenset()):
+            if time.perf_counter() > deadline:
+                exhausted = False
+                break
+            if first in tried:
+                continue
+            state = frozenset([first])
+            finish = self._evaluate(state, frozenset())[0]
+            if finish >= baseline_finish:
+                continue
+            found[state] = finish
+            state, finish, complete = self._climb(state, finish, found, deadline)
+            pruned, pruned_finish = self._prune(state, finish, deadline)
+            if pruned != state:
+                # No later finish with fewer changes supersedes the climb's end
+                del found[state]
+            found[pruned] = pruned_finish
+            state = pruned
+            tried |= state
+            exhausted &= complete
+
+        ranked = sorted(found.items(), key=lambda item: (item[1], len(item[0]), sorted(item[0])))
+        alternatives = [
+            SequenceAlternative(
+                changes=self._changes(state),
+                finish=finish,
+                days_saved=baseline_finish - finish,
+                start=self.schedule(state)[1],
+            )
+            for state, finish in ranked[:max_alternatives]
+        ]
+        return ResequencingResult(
+            network=self.network,
+            baseline_finish=baseline_finish,
+            baseline_start=baseline_start,
+            alternatives=alternatives,
+            evaluations=len(self._evaluated),
+            exhausted=exhausted,
+        )
+
+    def _climb(
+        self,
+        state: frozenset[int],
+        finish: int,
+        found: dict[frozenset[int], int],
+        deadline: float,
+    ) -> tuple[frozenset[int], int, bool]:
+        """First-improvement hill climbing; the flag is False on timeout."""
+        while True:
+            for e in self._driving_links(state):
+                if time.perf_counter() > deadline:
+                    return state, finish, False
+                candidate = state | {e}
+                candidate_finish = self._evaluate(candidate, state)[0]
+                if candidate_finish < finish:
+                    state, finish = candidate, candidate_finish
+                    found[state] = finish
+                    break
+            else:
+                return state, finish, True
+
+    def _prune(
+        self, state: frozenset[int], finish: int, deadline: float
+    ) -> tuple[frozenset[int], int]:
+        """Drop changes the finish no longer depends on.
+
+        Returns the pruned state and its finish, which is earlier than
+        ``finish`` when a dropped change was costing time under the crews.
+        """
+        for e in sorted(state):
+            if time.perf_counter() > deadline or len(state) == 1:
+                break
+            smaller = state - {e}
+            smaller_finish = self._evaluate(smaller, state)[0]
+            if smaller_finish <= finish:
+                state, finish = smaller, smaller_finish
+        return state, finish
+
+    def _changes(self, state: frozenset[int]) -> tuple[SequenceChange, ...]:
+        net = self.network
+        return tuple(
+            SequenceChange(
+                predecessor=net.ids[self._src[e]],
+                successor=net.ids[self._dst[e]],
+                lag=float(net.edge_lag[e]),
+                overlap_lag=float(self._relaxed[e]),
+            )
+            for e in sorted(state, key=lambda e: (self._dst[e], self._src[e]))
+        )
@@ -0,0 +1,289 @@
+"""Fingerprinted, cached Monte Carlo runs shared by the API and agents.
+
+A run is identified by a fingerprint of everything that determines its
+output: the schedule graph and durations, overrides, iterations, seed,
+sampling, tolerance, reported levels and start date (results are
+bit-for-bit reproducible for a seed, whatever the worker count). Lookups go
+through an in-process LRU, Redis and then stored ``ScheduleSimulation``
+rows; only a miss runs the simulation, and concurrent requests for the
+same fingerprint share one run.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+from collections.abc import Mapping, Sequence
+from datetime import date
+from functools import lru_cache
+from typing import Protocol
+
+from ai_agent.tool_cache import CachePolicy, ToolResultCache
+from ai_agent.tools import ToolResult
+from construction.config import get_construction_settings
+from construction.db.engine import get_session_factory
+from construction.db.models import ScheduleSimulation
+from construction.db.repositories import ScheduleRepository
+from construction.redis_.tool_cache import RedisToolCacheBackend
+from construction.scheduling.monte_carlo import project_seed
+from construction.scheduling.network import ScheduleNetwork
+from construction.tools.monte_carlo import MonteCarloSimulationTool
+from construction.tools.schedule import project_activity_records
+
+logger = logging.getLogger(__name__)
+
+# Cache namespace for simulation results (keys are ``<name>:<hash>``)
+SIMULATION_CACHE_NAME = "schedule_simulation"
+
+
+def simulation_fingerprint(
+    network: ScheduleNetwork,
+    overrides: Mapping[str, Mapping] | None,
+    iterations: int,
+    seed: int,
+    start_date: date,
+    sampling: str = "random",
+    tolerance: float | None = None,
+    confidence_levels: Sequence[float] = (0.5, 0.8, 0.95),
+) -> str:
+    """Hash identifying a simulation run's inputs."""
+    payload = json.dumps(
+        {
+            "graph": network.fingerprint,
+            "overrides": overrides or {},
+            "iterations": iterations,
+            "seed": seed,
+            "sampling": sampling,
+            "tolerance": tolerance,
+            "levels": list(confidence_levels),
+            "start": start_date.isoformat(),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SimulationStore(Protocol):
+    """Durable tier: project schedules in, simulation results out."""
+
+    async def load_activities(self, project_id: str) -> list[dict] | None: ...
+
+    async def get(self, fingerprint: str) -> dict | None: ...
+
+    async def put(self, fingerprint: str, project_id: str, result: dict) -> None: ...
+
+
+class DatabaseSimulationStore:
+    """Reads schedules and stores results as ``ScheduleSimulation`` rows.
+
+    Only projects whose id is a database UUID are looked up; failures are
+    logged and the database is skipped for ``retry_after`` seconds.
+    """
+
+    def __init__(self, session_factory=None, retry_after: float = 30.0):
+        self._session_factory = session_factory
+        self.retry_after = retry_after
+        self._down_until = 0.0
+
+    async def load_activities(self, project_id: str) -> list[dict] | None:
+        project_uuid = _as_uuid(project_id)
+        if project_uuid is None or not self._available():
+            return None
+        try:
+            async with self._sessions()() as session:
+                rows = await ScheduleRepository(session).list_activities(project_uuid)
+        except Exception as exc:
+            self._fail("load schedule", exc)
+            return None
+        return [
+            {
+                "id": row.external_id,
+                "name": row.name,
+                "start_date": row.start_date,
+                "end_date": row.end_date,
+                "predecessors": row.predecessors,
+                "tier_critical": row.tier_critical,
+            }
+            for row in rows
+        ] or None
+
+    async def get(self, fingerprint: str) -> dict | None:
+        if not self._available():
+            return None
+        try:
+            async with self._sessions()() as session:
+                row = await ScheduleRepository(session).get_simulation_by_fingerprint(fingerprint)
+        except Exception as exc:
+            self._fail("read", exc)
+            return None
+        return row.result if row is not None else None
+
+    async def put(self, fingerprint: str, project_id: str, result: dict) -> None:
+        project_uuid = _as_uuid(project_id)
+        if project_uuid is None or not self._available():
+            return
+        try:
+            async with self._sessions()() as session:
+                await ScheduleRepository(session).create(
+                    ScheduleSimulation,
+                    project_id=project_uuid,
+                    iterations=result["iterations"],
+                    p50_completion=_as_date(result.get("p50_completion")),
+                    p80_completion=_as_date(result.get("p80_completion")),
+                    p95_completion=_as_date(result.get("p95_completion")),
+                    float_consumed=result.get("float_consumed"),
+                    run_params=result.get("run_params"),
+                    fingerprint=fingerprint,
+                    result=result,
+                )
+                await session.commit()
+        except Exception as exc:
+            self._fail("write", exc)
+
+    def _sessions(self):
+        if self._session_factory is None:
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _fail(self, operation: str, exc: Exception) -> None:
+        logger.warning("Simulation store %s failed: %s", operation, exc)
+        self._down_until = time.monotonic() + self.retry_after
+
+
+class SimulationService:
+    """Runs Monte Carlo simulations at most once per fingerprint."""
+
+    def __init__(
+        self,
+        cache: ToolResultCache,
+        store: SimulationStore | None = None,
+        tool: MonteCarloSimulationTool | None = None,
+    ):
+        self.cache = cache
+        self.store = store
+        self.tool = tool or MonteCarloSimulationTool()
+
+    async def simulate(
+        self,
+        project_id: str,
+        iterations: int = 10000,
+        overrides: Mapping[str, Mapping] | None = None,
+        seed: int | None = None,
+        sampling: str = "random",
+        tolerance: float | None = None,
+        confidence_levels: Sequence[float] = (0.5, 0.8, 0.95),
+        activities: list[dict] | None = None,
+    ) -> ToolResult:
+        """Simulation result for these inputs, from cache when possible.
+
+        The schedule comes from ``activities``, else the project's stored
+        activities, else its live CPM schedule. Without a ``seed`` the
+        project's stable default seed is used, so repeated requests match.
+        """
+        if activities is None:
+            activities = await self.load_activities(project_id)
+        activities = activities or project_activity_records(project_id)
+        # Schedules without a start date begin today, so their fingerprint changes daily
+        start_date = _schedule_start(activities) or date.today()
+        seed = project_seed(project_id) if seed is None else seed
+        try:
+            network = ScheduleNetwork.from_records(activities)
+        except (KeyError, ValueError) as exc:
+            return ToolResult.error(f"Error: {exc}")
+        fingerprint = simulation_fingerprint(
+            network,
+            overrides,
+            iterations,
+            seed,
+            start_date,
+            sampling,
+            tolerance,
+            confidence_levels,
+        )
+        params = {
+            "project_id": project_id,
+            "iterations": iterations,
+            "activities": activities,
+            "activity_durations": dict(overrides or {}),
+            "seed": seed,
+            "sampling": sampling,
+            "tolerance_days": tolerance,
+            "confidence_levels": list(confidence_levels),
+            "start_date": start_date.isoformat(),
+        }
+        result = await self.cache.get_or_run(
+            SIMULATION_CACHE_NAME,
+            {"fingerprint": fingerprint},
+            lambda: self._run(fingerprint, params),
+        )
+        if result.is_error:
+            return result
+        # Projects with the same inputs share a run; the id is per request
+        return ToolResult({**result.data, "project_id": project_id})
+
+    async def load_activities(self, project_id: str) -> list[dict] | None:
+        """The project's stored schedule, or None when there is none."""
+        if self.store is None:
+            return None
+        return await self.store.load_activities(project_id)
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/coalesced counters for simulation lookups."""
+        return self.cache.stats().get(
+            SIMULATION_CACHE_NAME, {"hits": 0, "misses": 0, "coalesced": 0}
+        )
+
+    async def _run(self, fingerprint: str, params: dict) -> ToolResult:
+        if self.store is not None:
+            stored = await self.store.get(fingerprint)
+            if stored is not None:
+                return ToolResult(stored)
+        result = await asyncio.to_thread(
+            self.tool.execute_structured, **{k: v for k, v in params.items() if v is not None}
+        )
+        if result.is_error:
+            return result
+        run_params = {k: v for k, v in params.items() if k not in ("project_id", "activities")}
+        data = {k: v for k, v in result.data.items() if k != "project_id"}
+        data.update(fingerprint=fingerprint, run_params=run_params)
+        if self.store is not None:
+            await self.store.put(fingerprint, params["project_id"], data)
+        return ToolResult(data)
+
+
+@lru_cache
+def get_simulation_service() -> SimulationService:
+    """Process-wide simulation service for the API and agents."""
+    settings = get_construction_settings()
+    backend = RedisToolCacheBackend(prefix="simulation:") if settings.tool_cache_redis else None
+    return SimulationService(
+        ToolResultCache(
+            {SIMULATION_CACHE_NAME: CachePolicy(ttl=settings.simulation_cache_ttl)},
+            max_entries=settings.simulation_cache_max_entries,
+            backend=backend,
+        ),
+        store=DatabaseSimulationStore() if settings.simulation_store_db else None,
+    )
+
+
+def _schedule_start(activities: list[dict]) -> date | None:
+    starts = [a["start_date"] for a in activities if isinstance(a, Mapping) and a.get("start_date")]
+    return min(starts) if starts else None
+
+
+def _as_uuid(value: str) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _as_date(value: str | None) -> date | None:
+    return date.fromisoformat(value) if value else None
@@ -0,0 +1,487 @@
+"""Immutable columnar schedule snapshots and a vectorized diff between two.
+
+A ``ScheduleSnapshot`` freezes a solved schedule as read-only arrays sorted
+by activity id: early start/finish days, durations, total and free float,
+criticality, and the relationships as index pairs with type and lag. Two
+snapshots are joined with ``searchsorted`` on the sorted ids, and links by
+encoding each (predecessor, successor) pair as one integer in the current
+snapshot's index space, so ``diff_snapshots`` is a handful of array passes
+whatever the schedule size (~50 ms for 50k activities, see
+``benchmarks/snapshot_diff.py``).
+
+Snapshots serialize to a compressed ``.npz`` payload (``to_bytes``) for
+storage as ``ScheduleVersion`` rows; ``SnapshotStore`` keeps recent ones
+per project in process.
+"""
+
+import io
+import json
+import uuid
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from functools import cached_property
+
+import numpy as np
+
+from construction.scheduling.cpm import RELATIONSHIP_TYPES, CPMActivity, CPMResult, Relationship
+
+BASELINE = "baseline"
+UPDATE = "update"
+# Snapshot references besides ids (see ``select_snapshot``)
+LATEST = "latest"
+PREVIOUS = "previous"
+# Float and lag differences below this (working days) are not changes
+_TOLERANCE = 1e-6
+_ARRAYS = (
+    "ids",
+    "names",
+    "start",
+    "finish",
+    "duration",
+    "total_float",
+    "free_float",
+    "critical",
+    "tier_critical",
+    "edge_pred",
+    "edge_succ",
+    "edge_type",
+    "edge_lag",
+)
+
+
+@dataclass(frozen=True, eq=False)
+class ScheduleSnapshot:
+    """A solved schedule frozen as arrays sorted by activity id."""
+
+    ids: np.ndarray
+    names: np.ndarray
+    start: np.ndarray
+    finish: np.ndarray
+    duration: np.ndarray
+    total_float: np.ndarray
+    free_float: np.ndarray
+    critical: np.ndarray
+    tier_critical: np.ndarray
+    # Relationships as indexes into ``ids``; type indexes RELATIONSHIP_TYPES
+    edge_pred: np.ndarray
+    edge_succ: np.ndarray
+    edge_type: np.ndarray
+    edge_lag: np.ndarray
+    data_date: date
+    project_finish: date
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    label: str = ""
+    kind: str = UPDATE
+    taken_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def __post_init__(self):
+        for name in _ARRAYS:
+            getattr(self, name).flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_result(
+        cls,
+        result: CPMResult,
+        label: str = "",
+        kind: str = UPDATE,
+    ) -> "ScheduleSnapshot":
+        """Snapshot of a CPM result at its early dates."""
+        net = result.network
+        ids = np.array(net.ids, dtype=str)
+        order = np.argsort(ids, kind="stable")
+        rank = np.empty(len(order), dtype=np.int32)
+        rank[order] = np.arange(len(order), dtype=np.int32)
+        start, finish = result.early_days()
+        return cls(
+            ids=ids[order],
+            names=np.array(net.names, dtype=str)[order],
+            start=start[order],
+            finish=finish[order],
+            duration=result.durations[order].astype(np.float64),
+            total_float=result.total_float[order],
+            free_float=result.free_float[order],
+            critical=result.critical[order],
+            tier_critical=net.tier_critical[order],
+            edge_pred=rank[net.edge_src],
+            edge_succ=rank[net.edge_dst],
+            edge_type=net.edge_type.copy(),
+            edge_lag=net.edge_lag.copy(),
+            data_date=net.start,
+            project_finish=result.project_finish_date,
+            label=label,
+            kind=kind,
+        )
+
+    def activities(self) -> list[CPMActivity]:
+        """The snapshot's activities and links, to rebuild its network."""
+        links = [[] for _ in range(len(self))]
+        for p, s, kind, lag in zip(
+            self.edge_pred.tolist(),
+            self.edge_succ.tolist(),
+            self.edge_type.tolist(),
+            self.edge_lag.tolist(),
+            strict=True,
+        ):
+            links[s].append(Relationship(str(self.ids[p]), RELATIONSHIP_TYPES[kind], lag))
+        return [
+            CPMActivity(activity_id, name, duration, tuple(preds), tier_critical=tier)
+            for activity_id, name, duration, preds, tier in zip(
+                self.ids.tolist(),
+                self.names.tolist(),
+                self.duration.tolist(),
+                links,
+                self.tier_critical.tolist(),
+                strict=True,
+            )
+        ]
+
+    def info(self) -> dict:
+        """Metadata of the snapshot (JSON-ready)."""
+        return {
+            "id": self.id,
+            "label": self.label,
+            "kind": self.kind,
+            "taken_at": self.taken_at.isoformat(),
+            "data_date": self.data_date.isoformat(),
+            "project_finish": self.project_finish.isoformat(),
+            "activities": len(self),
+            "relationships": len(self.edge_pred),
+        }
+
+    def to_bytes(self) -> bytes:
+        """Compressed ``.npz`` payload of the arrays and metadata."""
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            meta=np.array(json.dumps(self.info())),
+            **{name: getattr(self, name) for name in _ARRAYS},
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "ScheduleSnapshot":
+        with np.load(io.BytesIO(payload), allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            arrays = {name: data[name] for name in _ARRAYS}
+        return cls(
+            **arrays,
+            data_date=date.fromisoformat(meta["data_date"]),
+            project_finish=date.fromisoformat(meta["project_finish"]),
+            id=meta["id"],
+            label=meta["label"],
+            kind=meta["kind"],
+            taken_at=datetime.fromisoformat(meta["taken_at"]),
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class ScheduleDiff:
+    """Activity and logic changes from ``base`` to ``current``.
+
+    ``base_common``/``current_common`` pair up the activities in both
+    snapshots; day deltas are calendar days, float deltas working days.
+    Links are index pairs into their own snapshot's ``ids``.
+    """
+
+    base: ScheduleSnapshot
+    current: ScheduleSnapshot
+    base_common: np.ndarray
+    current_common: np.ndarray
+    added: np.ndarray
+    removed: np.ndarray
+    start_delta: np.ndarray
+    finish_delta: np.ndarray
+    duration_delta: np.ndarray
+    float_delta: np.ndarray
+    renamed: np.ndarray
+    added_links: np.ndarray
+    removed_links: np.ndarray
+    # (base edge, current edge) pairs whose type or lag changed
+    changed_links: np.ndarray
+
+    @cached_property
+    def changed(self) -> np.ndarray:
+        """Mask over the common activities with any date, duration, float or name change."""
+        return (
+            (self.start_delta != 0)
+            | (self.finish_delta != 0)
+            | (np.abs(self.duration_delta) > _TOLERANCE)
+            | (np.abs(self.float_delta) > _TOLERANCE)
+            | self.renamed
+        )
+
+    @property
+    def float_erosion(self) -> np.ndarray:
+        """Float consumed by each common activity (negative when float was gained)."""
+        return 0.0 - self.float_delta
+
+    @cached_property
+    def became_critical(self) -> np.ndarray:
+        return self.current.critical[self.current_common] & ~self.base.critical[self.base_common]
+
+    @cached_property
+    def no_longer_critical(self) -> np.ndarray:
+        return self.base.critical[self.base_common] & ~self.current.critical[self.current_common]
+
+    @property
+    def finish_delta_days(self) -> int:
+        """Calendar days the project finish moved (positive = later)."""
+        return (self.current.project_finish - self.base.project_finish).days
+
+    def counts(self) -> dict[str, int]:
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed": int(self.changed.sum()),
+            "unchanged": int((~self.changed).sum()),
+            "links_added": len(self.added_links),
+            "links_removed": len(self.removed_links),
+            "links_changed": len(self.changed_links),
+            "became_critical": int(self.became_critical.sum()),
+            "no_longer_critical": int(self.no_longer_critical.sum()),
+        }
+
+    def summary(self, max_listed: int = 50) -> dict:
+        """Counts plus the most-eroded activities and the logic changes (JSON-ready)."""
+        base_ids = self.base.ids
+        common_ids = self.current.ids[self.current_common]
+        return {
+            "base": self.base.info(),
+            "current": self.current.info(),
+            "project_finish_delta_days": self.finish_delta_days,
+            "counts": self.counts(),
+            "added": self.current.ids[self.added[:max_listed]].tolist(),
+            "removed": base_ids[self.removed[:max_listed]].tolist(),
+            "became_critical": common_ids[self.became_critical][:max_listed].tolist(),
+            "no_longer_critical": common_ids[self.no_longer_critical][:max_listed].tolist(),
+            "changed_activities": self.records(max_listed),
+            "logic_changes": self.logic_changes(max_listed),
+        }
+
+    def records(self, max_listed: int | None = None) -> list[dict]:
+        """Changed activities, most float eroded first."""
+        changed = np.flatnonzero(self.changed)
+        changed = changed[np.argsort(-self.float_erosion[changed], kind="stable")]
+        changed = changed[:max_listed]
+        base, current = self.base, self.current
+        b, c = self.base_common[changed], self.current_common[changed]
+        columns = zip(
+            current.ids[c].tolist(),
+            current.names[c].tolist(),
+            np.datetime_as_string(base.start[b]).tolist(),
+            np.datetime_as_string(current.start[c]).tolist(),
+            np.datetime_as_string(base.finish[b]).tolist(),
+            np.datetime_as_string(current.finish[c]).tolist(),
+            self.start_delta[changed].tolist(),
+            self.finish_delta[changed].tolist(),
+            np.round(self.duration_delta[changed], 3).tolist(),
+            np.round(base.total_float[b], 3).tolist(),
+            np.round(current.total_float[c], 3).tolist(),
+            np.round(self.float_erosion[changed], 3).tolist(),
+            current.critical[c].tolist(),
+            strict=True,
+        )
+        return [
+            {
+                "id": activity_id,
+                "name": name,
+                "start_was": start_was,
+                "start": start,
+                "finish_was": finish_was,
+                "finish": finish,
+                "start_delta_days": start_delta,
+                "finish_delta_days": finish_delta,
+                "duration_delta_days": duration_delta,
+                "total_float_was": float_was,
+                "total_float": float_now,
+                "float_erosion_days": erosion,
+                "is_critical": critical,
+            }
+            for (
+                activity_id,
+                name,
+                start_was,
+                start,
+                finish_was,
+                finish,
+                start_delta,
+                finish_delta,
+                duration_delta,
+                float_was,
+                float_now,
+                erosion,
+                critical,
+            ) in columns
+        ]
+
+    def logic_changes(self, max_listed: int | None = None) -> list[dict]:
+        """Added, removed and modified relationships."""
+        base, current = self.base, self.current
+        rows = []
+        for e in self.added_links[:max_listed].tolist():
+            rows.append({"change": "added", **_link(current, e)})
+        for e in self.removed_links[:max_listed].tolist():
+            rows.append({"change": "removed", **_link(base, e)})
+        for b, c in self.changed_links[:max_listed].tolist():
+            was = _link(base, b)
+            rows.append(
+                {
+                    "change": "modified",
+                    **_link(current, c),
+                    "type_was": was["type"],
+                    "lag_was": was["lag"],
+                }
+            )
+        return rows
+
+    def to_delta(self, max_listed: int = 50) -> dict:
+        """The comparison as a ``ScheduleDelta`` payload."""
+        erosion = self.float_erosion
+        eroded = np.flatnonzero(erosion > _TOLERANCE)
+        eroded = eroded[np.argsort(-erosion[eroded], kind="stable")][:max_listed]
+        ids = self.current.ids[self.current_common]
+        affected = np.flatnonzero(self.changed)
+        counts = self.counts()
+        return {
+            "baseline_end": self.base.project_finish,
+            "projected_end": self.current.project_finish,
+            "delta_days": self.finish_delta_days,
+            "float_consumed": dict(
+                zip(ids[eroded].tolist(), np.round(erosion[eroded], 3).tolist(), strict=True)
+            ),
+            "affected_activities": ids[affected[:max_listed]].tolist(),
+            "description": (
+                f"{self.base.label or self.base.kind} -> {self.current.label or self.current.kind}:"
+                f" finish {self.finish_delta_days:+d} days; {counts['changed']} changed,"
+                f" {counts['added']} added, {counts['removed']} removed activities;"
+                f" {counts['links_added'] + counts['links_removed'] + counts['links_changed']}"
+                " logic changes"
+            ),
+        }
+
+
+def diff_snapshots(base: ScheduleSnapshot, current: ScheduleSnapshot) -> ScheduleDiff:
+    """Compare two snapshots of the same project."""
+    n_base, n_current = len(base), len(current)
+    # Activities: join the sorted ids
+    position = np.searchsorted(current.ids, base.ids)
+    found = np.zeros(n_base, dtype=bool)
+    if n_current:
+        inside = position < n_current
+        found[inside] = current.ids[position[inside]] == base.ids[inside]
+    base_common = np.flatnonzero(found)
+    current_common = position[found]
+    in_base = np.zeros(n_current, dtype=bool)
+    in_base[current_common] = True
+
+    start_delta = (current.start[current_common] - base.start[base_common]).astype(np.int64)
+    finish_delta = (current.finish[current_common] - base.finish[base_common]).astype(np.int64)
+
+    # Links: key both sides by (predecessor, successor) in the current index space
+    to_current = np.full(n_base, -1, dtype=np.int64)
+    to_current[base_common] = current_common
+    base_pred, base_succ = to_current[base.edge_pred], to_current[base.edge_succ]
+    mappable = np.flatnonzero((base_pred >= 0) & (base_succ >= 0))
+    base_keys = base_pred[mappable] * n_current + base_succ[mappable]
+    current_keys = current.edge_pred.astype(np.int64) * n_current + current.edge_succ
+    current_order = np.argsort(current_keys, kind="stable")
+    sorted_keys = current_keys[current_order]
+    slot = np.searchsorted(sorted_keys, base_keys)
+    matched = np.zeros(len(base_keys), dtype=bool)
+    inside = slot < len(sorted_keys)
+    matched[inside] = sorted_keys[slot[inside]] == base_keys[inside]
+    base_matched = mappable[matched]
+    current_matched = current_order[slot[matched]]
+
+    removed_links = np.ones(len(base.edge_pred), dtype=bool)
+    removed_links[base_matched] = False
+    added_links = np.ones(len(current.edge_pred), dtype=bool)
+    added_links[current_matched] = False
+    modified = (base.edge_type[base_matched] != current.edge_type[current_matched]) | (
+        np.abs(base.edge_lag[base_matched] - current.edge_lag[current_matched]) > _TOLERANCE
+    )
+
+    return ScheduleDiff(
+        base=base,
+        current=current,
+        base_common=base_common,
+        current_common=current_common,
+        added=np.flatnonzero(~in_base),
+        removed=np.flatnonzero(~found),
+        start_delta=start_delta,
+        finish_delta=finish_delta,
+        duration_delta=current.duration[current_common] - base.duration[base_common],
+        float_delta=current.total_float[current_common] - base.total_float[base_common],
+        renamed=current.names[current_common] != base.names[base_common],
+        added_links=np.flatnonzero(added_links),
+        removed_links=np.flatnonzero(removed_links),
+        changed_links=np.column_stack([base_matched[modified], current_matched[modified]]),
+    )
+
+
+class SnapshotStore:
+    """Recent snapshots per project, oldest first, in process.
+
+    Each project keeps up to ``max_per_project`` snapshots; the oldest
+    update goes first, so the latest baseline survives.
+    """
+
+    def __init__(self, max_per_project: int = 32, max_projects: int = 64):
+        self.max_per_project = max_per_project
+        self.max_projects = max_projects
+        self._projects: OrderedDict[str, list[ScheduleSnapshot]] = OrderedDict()
+
+    def add(self, project_id: str, snapshot: ScheduleSnapshot) -> None:
+        snapshots = self._projects.setdefault(project_id, [])
+        self._projects.move_to_end(project_id)
+        if any(existing.id == snapshot.id for existing in snapshots):
+            return
+        snapshots.append(snapshot)
+        snapshots.sort(key=lambda s: s.taken_at)
+        while len(snapshots) > self.max_per_project:
+            baseline = select_snapshot(snapshots, BASELINE)
+            snapshots.remove(next(s for s in snapshots if s is not baseline))
+        while len(self._projects) > self.max_projects:
+            self._projects.popitem(last=False)
+
+    def get(self, project_id: str, ref: str) -> ScheduleSnapshot | None:
+        """Snapshot by id, or ``"baseline"`` / ``"latest"`` / ``"previous"``."""
+        return select_snapshot(self._projects.get(project_id) or [], ref)
+
+    def snapshots(self, project_id: str) -> list[ScheduleSnapshot]:
+        return list(self._projects.get(project_id) or [])
+
+    def clear(self) -> None:
+        self._projects.clear()
+
+
+def select_snapshot(snapshots: Sequence, ref: str):
+    """Pick from snapshots (or stored versions) ordered oldest first.
+
+    ``ref`` is an id, ``"baseline"`` (the latest taken as one, else the
+    first), ``"latest"`` or ``"previous"`` (the one before the latest).
+    """
+    if not snapshots:
+        return None
+    if ref == BASELINE:
+        baselines = [s for s in snapshots if s.kind == BASELINE]
+        return baselines[-1] if baselines else snapshots[0]
+    if ref == LATEST:
+        return snapshots[-1]
+    if ref == PREVIOUS:
+        return snapshots[-2] if len(snapshots) > 1 else None
+    return next((s for s in snapshots if str(s.id) == ref), None)
+
+
+def _link(snapshot: ScheduleSnapshot, e: int) -> dict:
+    return {
+        "predecessor": str(snapshot.ids[snapshot.edge_pred[e]]),
+        "successor": str(snapshot.ids[snapshot.edge_succ[e]]),
+        "type": RELATIONSHIP_TYPES[snapshot.edge_type[e]],
+        "lag": round(float(snapshot.edge_lag[e]), 3),
+    }
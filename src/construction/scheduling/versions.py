@@ -0,0 +1,199 @@
+"""Schedule versions: snapshots taken, kept and compared per project.
+
+``ScheduleVersionService`` snapshots a project's live schedule into the
+in-process ``SnapshotStore`` shared with ``ScheduleCompareTool`` and, for
+database projects, stores it as a ``ScheduleVersion`` row; snapshots not in
+memory are loaded back on demand. Failures are logged and the database is
+skipped for ``retry_after`` seconds, as for simulation results.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from functools import lru_cache
+
+from construction.config import get_construction_settings
+from construction.db.engine import get_session_factory
+from construction.db.models import ScheduleVersion
+from construction.db.repositories import ScheduleRepository
+from construction.scheduling.snapshot import (
+    BASELINE,
+    UPDATE,
+    ScheduleDiff,
+    ScheduleSnapshot,
+    SnapshotStore,
+    diff_snapshots,
+    select_snapshot,
+)
+from construction.tools.schedule import CURRENT, current_snapshot, schedule_snapshots
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleVersionService:
+    """Takes, lists and compares schedule snapshots of a project."""
+
+    def __init__(
+        self,
+        snapshots: SnapshotStore,
+        persist: bool = True,
+        session_factory=None,
+        retry_after: float = 30.0,
+    ):
+        self.snapshots = snapshots
+        self.persist = persist
+        self._session_factory = session_factory
+        self.retry_after = retry_after
+        self._down_until = 0.0
+
+    async def take(
+        self,
+        project_id: str,
+        activities: list[dict] | None = None,
+        label: str = "",
+        kind: str | None = None,
+    ) -> ScheduleSnapshot:
+        """Snapshot the live schedule; the first one is the baseline by default."""
+        if kind is None:
+            kind = BASELINE if not await self.history(project_id) else UPDATE
+        snapshot = await asyncio.to_thread(current_snapshot, project_id, activities, label, kind)
+        self.snapshots.add(project_id, snapshot)
+        await self._save(project_id, snapshot)
+        return snapshot
+
+    async def history(self, project_id: str) -> list[dict]:
+        """Snapshot metadata, oldest first, from memory and the database."""
+        infos = {s.id: s.info() for s in self.snapshots.snapshots(project_id)}
+        for row in await self._versions(project_id):
+            infos.setdefault(str(row.id), _info(row))
+        return sorted(infos.values(), key=lambda info: info["taken_at"])
+
+    async def get(self, project_id: str, ref: str) -> ScheduleSnapshot | None:
+        """Snapshot by id or ``"baseline"``/``"latest"``/``"previous"``."""
+        rows = await self._versions(project_id)
+        if not rows:
+            return self.snapshots.get(project_id, ref)
+        # Stored versions and unsaved in-memory snapshots, oldest first
+        stored = {str(row.id) for row in rows}
+        candidates = sorted(
+            [*rows, *(s for s in self.snapshots.snapshots(project_id) if s.id not in stored)],
+            key=lambda item: item.taken_at,
+        )
+        chosen = select_snapshot(candidates, ref)
+        if chosen is None or isinstance(chosen, ScheduleSnapshot):
+            return chosen
+        snapshot = self.snapshots.get(project_id, str(chosen.id))
+        if snapshot is None:
+            snapshot = await self._load(chosen.id)
+            if snapshot is not None:
+                self.snapshots.add(project_id, snapshot)
+        return snapshot
+
+    async def compare(
+        self,
+        project_id: str,
+        base: str = BASELINE,
+        current: str = CURRENT,
+        activities: list[dict] | None = None,
+    ) -> ScheduleDiff:
+        """Diff two snapshots; ``"current"`` is the live schedule.
+
+        Raises ``LookupError`` when either snapshot does not exist.
+        """
+        resolved = []
+        for ref in (base, current):
+            if ref == CURRENT:
+                snapshot = await asyncio.to_thread(
+                    current_snapshot, project_id, activities, CURRENT
+                )
+            else:
+                snapshot = await self.get(project_id, ref)
+            if snapshot is None:
+                raise LookupError(f"No snapshot '{ref}' for project '{project_id}'")
+            resolved.append(snapshot)
+        return await asyncio.to_thread(diff_snapshots, *resolved)
+
+    async def _versions(self, project_id: str) -> list[ScheduleVersion]:
+        project_uuid = _as_uuid(project_id)
+        if project_uuid is None or not self._available():
+            return []
+        try:
+            async with self._sessions()() as session:
+                return await ScheduleRepository(session).list_versions(project_uuid)
+        except Exception as exc:
+            self._fail("list", exc)
+            return []
+
+    async def _load(self, version_id: uuid.UUID) -> ScheduleSnapshot | None:
+        try:
+            async with self._sessions()() as session:
+                row = await ScheduleRepository(session).get_by_id(ScheduleVersion, version_id)
+                payload = None if row is None else row.payload
+        except Exception as exc:
+            self._fail("read", exc)
+            return None
+        return None if payload is None else ScheduleSnapshot.from_bytes(payload)
+
+    async def _save(self, project_id: str, snapshot: ScheduleSnapshot) -> None:
+        project_uuid = _as_uuid(project_id)
+        if project_uuid is None or not self._available():
+            return
+        payload = await asyncio.to_thread(snapshot.to_bytes)
+        try:
+            async with self._sessions()() as session:
+                await ScheduleRepository(session).create(
+                    ScheduleVersion,
+                    id=uuid.UUID(snapshot.id),
+                    project_id=project_uuid,
+                    label=snapshot.label,
+                    kind=snapshot.kind,
+                    taken_at=snapshot.taken_at,
+                    data_date=snapshot.data_date,
+                    project_finish=snapshot.project_finish,
+                    activity_count=len(snapshot),
+                    relationship_count=len(snapshot.edge_pred),
+                    payload=payload,
+                )
+                await session.commit()
+        except Exception as exc:
+            self._fail("write", exc)
+
+    def _sessions(self):
+        if self._session_factory is None:
+            self._session_factory = get_session_factory()
+        return self._session_factory
+
+    def _available(self) -> bool:
+        return self.persist and time.monotonic() >= self._down_until
+
+    def _fail(self, operation: str, exc: Exception) -> None:
+        logger.warning("Schedule version %s failed: %s", operation, exc)
+        self._down_until = time.monotonic() + self.retry_after
+
+
+@lru_cache
+def get_version_service() -> ScheduleVersionService:
+    """Process-wide version service, sharing the schedule tools' snapshots."""
+    settings = get_construction_settings()
+    return ScheduleVersionService(schedule_snapshots(), persist=settings.schedule_versions_db)
+
+
+def _info(row: ScheduleVersion) -> dict:
+    return {
+        "id": str(row.id),
+        "label": row.label,
+        "kind": row.kind,
+        "taken_at": row.taken_at.isoformat(),
+        "data_date": row.data_date.isoformat(),
+        "project_finish": row.project_finish.isoformat(),
+        "activities": row.activity_count,
+        "relationships": row.relationship_count,
+    }
+
+
+def _as_uuid(value: str) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
@@ -0,0 +1,223 @@
+"""Incremental what-if simulation with common random numbers.
+
+A ``ScenarioBaseline`` fixes one random stream per activity, derived from
+the run seed and the activity id, and keeps the baseline early finish of
+every activity in every iteration. A what-if that changes a few activity
+distributions re-samples only those activities from their own streams and
+re-runs the forward pass over their downstream subgraph; everything
+upstream or unrelated is read from the baseline. Because both runs see the
+same random numbers, unchanged paths contribute exactly zero difference and
+the deltas carry no sampling noise of their own.
+
+Baselines hold two (activities x iterations) float32 matrices (sampled
+durations and early finishes), so they are meant for what-if sized runs
+(a few thousand iterations) and are cached per schedule version
+in-process. Streams are keyed by activity id, so a rebuilt baseline
+(another worker, a later version sharing activities) sees the same numbers.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from construction.scheduling.monte_carlo import _SAMPLE_DTYPE, triangular_ppf
+from construction.scheduling.network import ScheduleNetwork, _ranges, longest_path
+
+WHAT_IF_SAMPLING = ("random", "lhs")
+
+
+@dataclass
+class WhatIfResult:
+    """Paired baseline and scenario project finishes from shared samples."""
+
+    baseline_days: np.ndarray
+    finish_days: np.ndarray
+    # Overridden activity ids and how many activities were recomputed
+    affected: list[str]
+    recomputed: int
+
+    @property
+    def delta_days(self) -> np.ndarray:
+        """Per-iteration finish change (scenario - baseline)."""
+        return self.finish_days - self.baseline_days
+
+    @property
+    def mean_delta(self) -> float:
+        return float(self.delta_days.mean())
+
+    def percentiles(self, levels: Sequence[float]) -> tuple[np.ndarray, np.ndarray]:
+        """(baseline, scenario) finish at each confidence level in [0, 1]."""
+        q = [lvl * 100 for lvl in levels]
+        return np.percentile(self.baseline_days, q), np.percentile(self.finish_days, q)
+
+    def probability_later(self, margin: float = 0.0) -> float:
+        """Share of iterations where the scenario finishes more than ``margin`` later."""
+        return float(np.mean(self.delta_days > margin))
+
+
+def activity_uniforms(
+    entropy: int, activity_id: str, iterations: int, sampling: str = "random"
+) -> np.ndarray:
+    """One activity's uniforms, reproducible from the run seed and its id alone."""
+    key = int.from_bytes(hashlib.blake2b(activity_id.encode(), digest_size=8).digest(), "little")
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(key,)))
+    if sampling == "random":
+        return rng.random(iterations, dtype=_SAMPLE_DTYPE)
+    if sampling not in WHAT_IF_SAMPLING:
+        raise ValueError(f"Unknown sampling method '{sampling}'")
+    # Latin hypercube per activity: each stratum once, in random order
+    strata = rng.permutation(iterations).astype(_SAMPLE_DTYPE)
+    strata += rng.random(iterations, dtype=_SAMPLE_DTYPE)
+    strata /= iterations
+    return strata
+
+
+def resolve_overrides(
+    network: ScheduleNetwork, overrides: Mapping[str, Mapping]
+) -> tuple[dict[int, tuple[float, float, float]], list[str]]:
+    """Map overrides keyed by id or name to node -> (min, mode, max).
+
+    Each override may replace ``min``/``mode``/``max`` and add
+    ``delay_days`` to all three. Returns the resolved overrides and the
+    keys that matched no activity.
+    """
+    by_name = {name: k for k, name in enumerate(network.names)}
+    resolved, unmatched = {}, []
+    for key, ov in overrides.items():
+        k = network.index.get(key, by_name.get(key))
+        if k is None:
+            unmatched.append(key)
+            continue
+        shift = float(ov.get("delay_days", 0.0))
+        low = float(ov.get("min", network.min_days[k])) + shift
+        mode = float(ov.get("mode", network.mode_days[k])) + shift
+        high = float(ov.get("max", network.max_days[k])) + shift
+        if not low <= mode <= high:
+            raise ValueError(f"Override for '{key}' must satisfy min <= mode <= max")
+        resolved[k] = (low, mode, high)
+    return resolved, unmatched
+
+
+class ScenarioBaseline:
+    """Baseline forward pass of one schedule version under fixed streams."""
+
+    def __init__(
+        self,
+        network: ScheduleNetwork,
+        iterations: int = 5000,
+        seed: int | None = None,
+        sampling: str = "lhs",
+    ):
+        if iterations < 1:
+            raise ValueError("iterations must be at least 1")
+        self.network = network
+        self.iterations = iterations
+        self.sampling = sampling
+        self.seed = np.random.SeedSequence(seed).entropy
+        self.durations = self._sample(np.arange(len(network)))
+        self.early_finish = longest_path(network, self.durations)
+        self.sinks = np.flatnonzero(~network.has_successor)
+        self.finish_days = self.early_finish[self.sinks].max(axis=0, initial=0.0)
+
+    def _sample(
+        self, nodes: np.ndarray, params: Mapping[int, tuple[float, float, float]] | None = None
+    ) -> np.ndarray:
+        """Durations for ``nodes`` drawn from their own streams."""
+        net = self.network
+        uniforms = np.empty((len(nodes), self.iterations), dtype=_SAMPLE_DTYPE)
+        for row, k in enumerate(nodes):
+            uniforms[row] = activity_uniforms(self.seed, net.ids[k], self.iterations, self.sampling)
+        if params:
+            low, mode, high = np.array([params[k] for k in nodes]).T
+        else:
+            low, mode, high = net.min_days[nodes], net.mode_days[nodes], net.max_days[nodes]
+        return triangular_ppf(uniforms, low, mode, high)
+
+    def what_if(self, overrides: Mapping[str, Mapping]) -> WhatIfResult:
+        """Re-simulate with some activity distributions changed.
+
+        Only overridden activities are re-sampled, and only their
+        downstream subgraph is recomputed.
+        """
+        net = self.network
+        params, unmatched = resolve_overrides(net, overrides)
+        if unmatched:
+            raise KeyError(f"Unknown activities: {', '.join(sorted(unmatched))}")
+        nodes = net.downstream(params)
+        changed_nodes = np.array(sorted(params), dtype=np.int64)
+
+        # Rows of the recomputed subgraph, -1 for nodes read from the baseline
+        pos = np.full(len(net), -1, dtype=np.int64)
+        pos[nodes] = np.arange(len(nodes))
+        # Baseline samples for the subgraph; only the overridden rows are redrawn
+        finish = self.durations[nodes]
+        finish[pos[changed_nodes]] = self._sample(changed_nodes, params)
+        node_levels = np.searchsorted(net.level_bounds, nodes, side="right") - 1
+        for k in np.unique(node_levels):
+            owners, sources, offsets = net.incoming[k]
+            keep = pos[owners] >= 0
+            if not keep.any():
+                continue
+            # Incoming edges of the recomputed owners only
+            ends = np.append(offsets[1:], len(sources))
+            starts = offsets[keep]
+            sub = sources[_ranges(starts, ends[keep])]
+            sub_offsets = np.concatenate([[0], np.cumsum(ends[keep] - starts)[:-1]])
+            pred_finish = self.early_finish[sub]
+            changed = pos[sub] >= 0
+            pred_finish[changed] = finish[pos[sub[changed]]]
+            finish[pos[owners[keep]]] += np.maximum.reduceat(pred_finish, sub_offsets, axis=0)
+
+        touched = pos[self.sinks] >= 0
+        project = self.early_finish[self.sinks[~touched]].max(axis=0, initial=0.0)
+        if touched.any():
+            project = np.maximum(project, finish[pos[self.sinks[touched]]].max(axis=0))
+        return WhatIfResult(
+            baseline_days=self.finish_days,
+            finish_days=project,
+            affected=[net.ids[k] for k in sorted(params)],
+            recomputed=len(nodes),
+        )
+
+
+class BaselineStore:
+    """Small in-process LRU of baselines keyed by schedule version."""
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, ScenarioBaseline] = OrderedDict()
+
+    def get(
+        self,
+        network: ScheduleNetwork,
+        iterations: int = 5000,
+        seed: int | None = None,
+        sampling: str = "lhs",
+    ) -> ScenarioBaseline:
+        """Cached baseline for this graph, building it on a miss.
+
+        ``seed`` is required for reuse: an unseeded baseline is never cached.
+        """
+        if seed is None:
+            return ScenarioBaseline(network, iterations, seed, sampling)
+        key = (network.fingerprint, iterations, seed, sampling)
+        with self._lock:
+            baseline = self._entries.get(key)
+            if baseline is not None:
+                self._entries.move_to_end(key)
+                return baseline
+        baseline = ScenarioBaseline(network, iterations, seed, sampling)
+        with self._lock:
+            self._entries[key] = baseline
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return baseline
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,4 +1,4 @@
-"""Pydantic models for schedule management and Monte Carlo simulation."""
+"""Pydantic models for schedule management, versions and Monte Carlo simulation."""
 
 from datetime import date, datetime
 
@@ -13,7 +13,11 @@ class Activity(BaseModel):
     name: str
     start_date: date | None = None
     end_date: date | None = None
+    late_start: date | None = None
+    late_finish: date | None = None
+    duration_days: float = 0.0
     total_float: float = 0.0
+    free_float: float = 0.0
     is_critical: bool = False
     tier_critical: bool = False
     predecessors: list[str] = []
@@ -25,6 +29,8 @@ class CriticalPath(BaseModel):
 
     activities: list[Activity] = []
     total_duration_days: int = 0
+    project_start: date | None = None
+    project_finish: date | None = None
     float_summary: dict[str, float] = {}
 
 
@@ -39,6 +45,43 @@ class ScheduleDelta(BaseModel):
     description: str = ""
 
 
+class ScheduleSnapshotRequest(BaseModel):
+    """Request to snapshot a project's current schedule."""
+
+    project_id: str
+    label: str = ""
+    kind: str | None = None  # baseline/update; first snapshot is the baseline
+
+
+class ScheduleSnapshotInfo(BaseModel):
+    """Metadata of a stored schedule snapshot."""
+
+    id: str
+    label: str = ""
+    kind: str
+    taken_at: datetime
+    data_date: date
+    project_finish: date
+    activities: int = 0
+    relationships: int = 0
+
+
+class ScheduleComparison(BaseModel):
+    """Differences between two schedule snapshots."""
+
+    base: ScheduleSnapshotInfo
+    current: ScheduleSnapshotInfo
+    project_finish_delta_days: int = 0
+    counts: dict[str, int] = {}
+    added: list[str] = []
+    removed: list[str] = []
+    became_critical: list[str] = []
+    no_longer_critical: list[str] = []
+    changed_activities: list[dict] = []
+    logic_changes: list[dict] = []
+    delta: ScheduleDelta
+
+
 class FloatReport(BaseModel):
     """Float status for a single activity."""
 
@@ -56,6 +99,9 @@ class MonteCarloRequest(BaseModel):
     iterations: int = 10000
     activity_overrides: dict | None = None
     scenario: str | None = None
+    seed: int | None = None
+    sampling: str = "random"
+    tolerance_days: float | None = None
 
 
 class MonteCarloResult(BaseModel):
@@ -68,4 +114,6 @@ class MonteCarloResult(BaseModel):
     confidence: float = Field(ge=0, le=1)
     float_consumed: dict[str, float] = {}
     histogram: list[dict] = []
+    seed: int | None = None
+    fingerprint: str | None = None
     run_at: datetime
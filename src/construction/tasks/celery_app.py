@@ -1,8 +1,17 @@
 """Celery application for scheduled agent tasks."""
 
+import asyncio
+
+from anthropic import Anthropic, AsyncAnthropic
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
+from ai_agent.agent import shutdown_tool_executors
+from ai_agent.clients import aclose_shared_clients, get_shared_client
+from ai_agent.tools import shutdown_tool_bridge
+from construction.agents.base import build_agent_settings
 from construction.config import get_construction_settings
+from construction.integrations.clients import aclose_integration_clients
 
 settings = get_construction_settings()
 
@@ -23,5 +32,45 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
 )
 
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop reused by every task in this worker process.
+
+    Pooled async HTTP connections are bound to their loop, so tasks share
+    one loop instead of creating and closing a new one per run.
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop
+
+
+async def _warm_shared_clients() -> None:
+    agent_settings = build_agent_settings(get_construction_settings())
+    get_shared_client(Anthropic, agent_settings)
+    get_shared_client(AsyncAnthropic, agent_settings)
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Create the worker loop and shared Anthropic clients once per process."""
+    get_worker_loop().run_until_complete(_warm_shared_clients())
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Close pooled connections, the worker and bridge loops and the tool thread pools."""
+    global _worker_loop
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        _worker_loop.run_until_complete(aclose_shared_clients())
+        _worker_loop.run_until_complete(aclose_integration_clients())
+        _worker_loop.close()
+    _worker_loop = None
+    shutdown_tool_bridge(aclose_integration_clients)
+    shutdown_tool_executors()
+
+
 # Import tasks so they're registered
 celery_app.autodiscover_tasks(["construction.tasks"])
@@ -1,23 +1,18 @@
 """Scheduled Celery tasks for all construction agents."""
 
-import asyncio
 import logging
 
 from celery.schedules import crontab
 
 from construction.config import get_construction_settings
-from construction.tasks.celery_app import celery_app
+from construction.tasks.celery_app import celery_app, get_worker_loop
 
 logger = logging.getLogger(__name__)
 
 
 def _run_async(coro):
     """Helper to run async code in Celery synchronous tasks."""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return get_worker_loop().run_until_complete(coro)
 
 
 @celery_app.task(name="agents.risk_forecaster")
@@ -200,6 +195,30 @@ def generate_daily_brief(project_id: str = "default"):
     }
 
 
+@celery_app.task(name="schedules.sync")
+def sync_schedule(project_id: str = "", source: str = "", source_project_id: str = ""):
+    """Import the project schedule from P6 or MS Project -- nightly."""
+    settings = get_construction_settings()
+    project_id = project_id or settings.schedule_sync_project_id
+    source = source or settings.schedule_sync_source
+    source_project_id = source_project_id or settings.schedule_sync_source_project_id
+    if not project_id or not source_project_id:
+        logger.info("Schedule sync not configured, skipping")
+        return {"status": "skipped"}
+    logger.info("Syncing %s schedule for project %s", source, project_id)
+    from construction.integrations.schedule_import import run_schedule_sync
+
+    report = _run_async(run_schedule_sync(project_id, source, source_project_id))
+    return {
+        "status": "completed",
+        "source": report.source,
+        "rows_seen": report.rows_seen,
+        "rows_written": report.rows_written,
+        "rows_deleted": report.rows_deleted,
+        "elapsed_s": report.elapsed_s,
+    }
+
+
 # Celery Beat schedule
 celery_app.conf.beat_schedule = {
     "risk-forecaster-hourly": {
@@ -246,4 +265,8 @@ celery_app.conf.beat_schedule = {
         "task": "orchestrator.daily_brief",
         "schedule": crontab(hour=6, minute=0),
     },
+    "schedule-sync-nightly": {
+        "task": "schedules.sync",
+        "schedule": crontab(hour=2, minute=0),
+    },
 }
@@ -1,12 +1,11 @@
 """BIM model query and compliance checking tool."""
 
-import json
 from datetime import UTC, datetime
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class BIMQueryTool(Tool):
+class BIMQueryTool(StructuredTool):
     """Query BIM model elements and check compliance."""
 
     name = "bim_query"
@@ -46,7 +45,7 @@ class BIMQueryTool(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         element_id = kwargs.get("element_id")
@@ -64,17 +63,17 @@ class BIMQueryTool(Tool):
             elif action == "get_deviations":
                 return self._get_deviations(project_id)
             else:
-                return f"Error: Unknown action '{action}'"
+                return ToolResult.error(f"Error: Unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
     def _query_element(
         self, project_id: str, element_id: str | None
-    ) -> str:
+    ) -> ToolResult:
         if not element_id:
             return (
-                "Error: element_id is required"
-                " for query_element"
+                ToolResult.error("Error: element_id is required"
+                " for query_element")
             )
         element = {
             "element_id": element_id,
@@ -91,14 +90,13 @@ class BIMQueryTool(Tool):
             "spec_reference": "ASHRAE 90.1-2019",
             "installation_status": "installed",
         }
-        return json.dumps(
-            {"project_id": project_id, "element": element},
-            indent=2,
+        return ToolResult(
+            {"project_id": project_id, "element": element}
         )
 
     def _check_compliance(
         self, project_id: str, check_type: str | None
-    ) -> str:
+    ) -> ToolResult:
         now = datetime.now(UTC).isoformat()
         checks = []
         if check_type in (None, "fire_separation"):
@@ -155,12 +153,11 @@ class BIMQueryTool(Tool):
                 ),
                 "created_at": now,
             })
-        return json.dumps(
-            {"project_id": project_id, "checks": checks},
-            indent=2,
+        return ToolResult(
+            {"project_id": project_id, "checks": checks}
         )
 
-    def _get_deviations(self, project_id: str) -> str:
+    def _get_deviations(self, project_id: str) -> ToolResult:
         deviations = [
             {
                 "element_id": "WALL-FS-301",
@@ -179,10 +176,9 @@ class BIMQueryTool(Tool):
                 "visual_url": None,
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "deviations": deviations,
-            },
-            indent=2,
+            }
         )
@@ -1,12 +1,24 @@
 """Claims query tool for events, delay analysis, and notices."""
 
-import json
 from datetime import date, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
+from construction.config import get_construction_settings
+from construction.scheduling.delay import (
+    DelayEvent,
+    WindowResult,
+    party_totals,
+    time_impact_analysis,
+    windows_analysis,
+)
+from construction.scheduling.snapshot import BASELINE
+from construction.tools.schedule import (
+    current_snapshot,
+    schedule_snapshots,
+)
 
 
-class ClaimsQuery(Tool):
+class ClaimsQuery(StructuredTool):
     """Query claims and dispute data."""
 
     name = "claims_query"
@@ -37,18 +49,50 @@ class ClaimsQuery(Tool):
                     "type": "string",
                     "description": "Specific event ID to query.",
                 },
+                "events": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "Delay events for delay_analysis"
+                        " (required): each an id, party, optional"
+                        " date and either a fragnet (activities and"
+                        " ties to schedule activities) or an"
+                        " activity and days."
+                    ),
+                },
+                "analysis_type": {
+                    "type": "string",
+                    "enum": ["tia", "windows"],
+                    "description": (
+                        "Run only a time impact analysis or only"
+                        " a windows analysis (default both)."
+                    ),
+                },
+                "activities": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "Schedule to analyze when no snapshots are"
+                        " stored for the project."
+                    ),
+                },
             },
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
             if action == "events":
                 return self._events(project_id)
             elif action == "delay_analysis":
-                return self._delay_analysis(project_id)
+                return self._delay_analysis(
+                    project_id,
+                    kwargs.get("events"),
+                    kwargs.get("analysis_type"),
+                    kwargs.get("activities"),
+                )
             elif action == "notices":
                 return self._notices(project_id)
             elif action == "causation_chain":
@@ -56,11 +100,11 @@ class ClaimsQuery(Tool):
                     project_id, kwargs.get("event_id")
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _events(self, project_id: str) -> str:
+    def _events(self, project_id: str) -> ToolResult:
         today = date.today()
         events = [
             {
@@ -141,60 +185,65 @@ class ClaimsQuery(Tool):
                 "responsible_party": "Force Majeure",
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "claim_events": events,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _delay_analysis(self, project_id: str) -> str:
-        analyses = [
-            {
-                "analysis_type": "TIA",
-                "affected_activities": [
-                    "Interior Finishes — Lobby",
-                    "Millwork Install",
-                    "Final Paint — Lobby",
-                ],
-                "critical_delay_days": 14.0,
-                "concurrent_delay_days": 3.0,
-                "responsible_party": "Owner",
-                "narrative": (
-                    "Time Impact Analysis shows owner-directed"
-                    " lobby redesign added 14 calendar days to"
-                    " the critical path. 3 days concurrent with"
-                    " GC material procurement delay."
-                ),
-            },
-            {
-                "analysis_type": "windows",
-                "affected_activities": [
-                    "Foundation — Zone C",
-                    "SOG — Zone C",
-                ],
-                "critical_delay_days": 8.0,
-                "concurrent_delay_days": 0.0,
-                "responsible_party": None,
-                "narrative": (
-                    "Windows analysis for differing site condition."
-                    " Rock removal added 8 working days. No"
-                    " concurrent delays identified."
-                ),
-            },
+    def _delay_analysis(
+        self,
+        project_id: str,
+        events: list[dict] | None,
+        analysis_type: str | None,
+        activities: list[dict] | None,
+    ) -> ToolResult:
+        """TIA and windows analysis of fragnets on the stored updates."""
+        if not events:
+            return ToolResult.error(
+                "Error: delay_analysis needs events (fragnets or"
+                " activity/days delays tied to schedule activities)"
+            )
+        delay_events = [
+            DelayEvent.from_record(record) for record in events
         ]
-        return json.dumps(
+        stored = schedule_snapshots().snapshots(project_id)
+        if not stored:
+            stored = [current_snapshot(project_id, activities)]
+        analyses = []
+        windows = []
+        if analysis_type in (None, "tia"):
+            tia_snapshot = next(
+                (s for s in stored if s.kind == BASELINE), stored[0]
+            )
+            tia = time_impact_analysis(tia_snapshot, delay_events)
+            analyses.append(_analysis("TIA", tia))
+        if analysis_type in (None, "windows"):
+            windows = windows_analysis(
+                stored,
+                delay_events,
+                workers=(
+                    get_construction_settings().delay_analysis_workers
+                ),
+            )
+            for window in windows:
+                analyses.append(_analysis("windows", window))
+        totals = party_totals(windows) if windows else tia.parties
+        return ToolResult(
             {
                 "project_id": project_id,
                 "delay_analyses": analyses,
-                "note": "Mock data",
-            },
-            indent=2,
+                "party_totals": {
+                    name: delay.record()
+                    for name, delay in totals.items()
+                },
+                "units": "working days",
+            }
         )
 
-    def _notices(self, project_id: str) -> str:
+    def _notices(self, project_id: str) -> ToolResult:
         today = date.today()
         notices = [
             {
@@ -233,18 +282,17 @@ class ClaimsQuery(Tool):
                 "status": "pending",
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "notices": notices,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _causation_chain(
         self, project_id: str, event_id: str | None
-    ) -> str:
+    ) -> ToolResult:
         chain = {
             "events": [
                 "Owner RFI #42 — lobby redesign request",
@@ -275,12 +323,53 @@ class ClaimsQuery(Tool):
                 "No pre-purchased millwork materials",
             ],
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "event_id": event_id or "CLM-001",
                 "causation_chain": chain,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
+
+
+def _analysis(analysis_type: str, window: WindowResult) -> dict:
+    """A window as a delay analysis result with a short narrative."""
+    parties = sorted(
+        window.parties.values(),
+        key=lambda delay: -delay.sole_delay_days,
+    )
+    responsible = (
+        parties[0].party
+        if parties and parties[0].sole_delay_days > 0
+        else None
+    )
+    shares = "; ".join(
+        f"{delay.party} {delay.critical_delay_days:g} critical"
+        f" ({delay.sole_delay_days:g} sole,"
+        f" {delay.concurrent_delay_days:g} concurrent)"
+        for delay in parties
+    )
+    label = (
+        "Time Impact Analysis"
+        if analysis_type == "TIA"
+        else f"Windows analysis from {window.start.isoformat()}"
+    )
+    narrative = (
+        f"{label}: {len(window.events)} events moved the project"
+        f" finish from {window.baseline_finish.isoformat()} to"
+        f" {window.impacted_finish.isoformat()}"
+        f" ({window.delay_days:g} working days)."
+    )
+    if shares:
+        narrative += f" {shares}."
+    record = window.record()
+    return {
+        "analysis_type": analysis_type,
+        "affected_activities": window.affected_activities,
+        "critical_delay_days": record["delay_days"],
+        "concurrent_delay_days": record["concurrent_days"],
+        "responsible_party": responsible,
+        "narrative": narrative,
+        "window": record,
+    }
@@ -1,12 +1,11 @@
 """Commissioning query tool for IST, punch lists, and turnover."""
 
-import json
 from datetime import UTC, date, datetime, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class CommissioningQuery(Tool):
+class CommissioningQuery(StructuredTool):
     """Query commissioning data including IST, punch lists, and turnover."""
 
     name = "commissioning_query"
@@ -46,7 +45,7 @@ class CommissioningQuery(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -61,11 +60,11 @@ class CommissioningQuery(Tool):
                     project_id, kwargs.get("data", {})
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _ist_sequence(self, project_id: str) -> str:
+    def _ist_sequence(self, project_id: str) -> ToolResult:
         today = date.today()
         tests = [
             {
@@ -117,16 +116,15 @@ class CommissioningQuery(Tool):
                 "notes": "Day 2 of 3-day test sequence",
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "ist_sequence": tests,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _punch_list(self, project_id: str) -> str:
+    def _punch_list(self, project_id: str) -> ToolResult:
         now = datetime.now(UTC)
         items = [
             {
@@ -169,17 +167,16 @@ class CommissioningQuery(Tool):
             },
         ]
         summary = {"A": 1, "B": 1, "C": 1, "D": 0}
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "punch_items": items,
                 "summary": summary,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _turnover_status(self, project_id: str) -> str:
+    def _turnover_status(self, project_id: str) -> ToolResult:
         packages = [
             {
                 "id": "TOP-001",
@@ -231,30 +228,28 @@ class CommissioningQuery(Tool):
                 "status": "incomplete",
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "turnover_packages": packages,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _schedule_witness(
         self, project_id: str, data: dict
-    ) -> str:
+    ) -> ToolResult:
         test_id = data.get("test_id", "IST-002")
         witness_date = data.get(
             "date",
             (date.today() + timedelta(days=5)).isoformat(),
         )
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "test_id": test_id,
                 "witness_date": witness_date,
                 "status": "scheduled",
                 "note": "Mock data — witness scheduled",
-            },
-            indent=2,
+            }
         )
@@ -1,13 +1,12 @@
 """Communication drafting tool for reports, RFIs, and notices."""
 
-import json
 import uuid
 from datetime import UTC, datetime
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class DraftCommunication(Tool):
+class DraftCommunication(StructuredTool):
     """Draft owner reports, RFI responses, and sub notices."""
 
     name = "draft_communication"
@@ -56,7 +55,7 @@ class DraftCommunication(Tool):
             "required": ["action", "project_id", "context"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         context = kwargs.get("context", {})
@@ -79,18 +78,18 @@ class DraftCommunication(Tool):
                     project_id, context
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error drafting communication: {exc}"
+            return ToolResult.error(f"Error drafting communication: {exc}")
 
     def _owner_report(
         self,
         project_id: str,
         context: dict,
         tone: str,
-    ) -> str:
+    ) -> ToolResult:
         period = context.get("period", "2025-Q3")
-        return json.dumps(
+        return ToolResult(
             {
                 "id": str(uuid.uuid4())[:8],
                 "report_type": "owner_report",
@@ -126,13 +125,12 @@ class DraftCommunication(Tool):
                 "status": "draft",
                 "generated_at": datetime.now(UTC).isoformat(),
                 "note": "Mock draft — AI will generate from live data",
-            },
-            indent=2,
+            }
         )
 
     def _rfi_response(
         self, project_id: str, context: dict
-    ) -> str:
+    ) -> ToolResult:
         rfi_number = context.get(
             "rfi_number", "RFI-2025-042"
         )
@@ -140,7 +138,7 @@ class DraftCommunication(Tool):
             "question",
             "Clarify routing for conduit run C-14 at Level 3",
         )
-        return json.dumps(
+        return ToolResult(
             {
                 "id": str(uuid.uuid4())[:8],
                 "rfi_number": rfi_number,
@@ -168,18 +166,17 @@ class DraftCommunication(Tool):
                 "status": "draft",
                 "generated_at": datetime.now(UTC).isoformat(),
                 "note": "Mock draft",
-            },
-            indent=2,
+            }
         )
 
     def _sub_notice(
         self, project_id: str, context: dict
-    ) -> str:
+    ) -> ToolResult:
         notice_type = context.get("notice_type", "delay")
         recipient = context.get(
             "recipient", "Pacific Steel Corp"
         )
-        return json.dumps(
+        return ToolResult(
             {
                 "id": str(uuid.uuid4())[:8],
                 "notice_type": notice_type,
@@ -213,15 +210,14 @@ class DraftCommunication(Tool):
                 "status": "draft",
                 "generated_at": datetime.now(UTC).isoformat(),
                 "note": "Mock draft",
-            },
-            indent=2,
+            }
         )
 
     def _owner_update(
         self, project_id: str, context: dict
-    ) -> str:
+    ) -> ToolResult:
         period = context.get("period", "Week of 2025-06-30")
-        return json.dumps(
+        return ToolResult(
             {
                 "id": str(uuid.uuid4())[:8],
                 "period": period,
@@ -255,6 +251,5 @@ class DraftCommunication(Tool):
                 ],
                 "generated_at": datetime.now(UTC).isoformat(),
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
@@ -1,12 +1,11 @@
 """Compliance ticket CRUD tool."""
 
-import json
 from datetime import UTC, datetime
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class ComplianceDatabaseTool(Tool):
+class ComplianceDatabaseTool(StructuredTool):
     """Query, create, or update compliance checks and deviation tickets."""
 
     name = "compliance_database"
@@ -59,7 +58,7 @@ class ComplianceDatabaseTool(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
 
@@ -81,13 +80,13 @@ class ComplianceDatabaseTool(Tool):
             elif action == "get_summary":
                 return self._get_summary(project_id)
             else:
-                return f"Error: Unknown action '{action}'"
+                return ToolResult.error(f"Error: Unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
     def _query(
         self, project_id: str, filters: dict | None
-    ) -> str:
+    ) -> ToolResult:
         now = datetime.now(UTC).isoformat()
         checks = [
             {
@@ -144,21 +143,19 @@ class ComplianceDatabaseTool(Tool):
                     c for c in checks
                     if c["check_type"] == check_type
                 ]
-        return json.dumps(
-            {"project_id": project_id, "checks": checks},
-            indent=2,
+        return ToolResult(
+            {"project_id": project_id, "checks": checks}
         )
 
-    def _create(self, project_id: str, data: dict) -> str:
+    def _create(self, project_id: str, data: dict) -> ToolResult:
         check_id = f"CHK-{datetime.now(UTC).strftime('%H%M%S')}"
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "check_id": check_id,
                 "status": "created",
                 "data": data,
-            },
-            indent=2,
+            }
         )
 
     def _update(
@@ -166,21 +163,20 @@ class ComplianceDatabaseTool(Tool):
         project_id: str,
         check_id: str | None,
         data: dict,
-    ) -> str:
+    ) -> ToolResult:
         if not check_id:
-            return "Error: check_id is required for update"
-        return json.dumps(
+            return ToolResult.error("Error: check_id is required for update")
+        return ToolResult(
             {
                 "project_id": project_id,
                 "check_id": check_id,
                 "status": "updated",
                 "updated_fields": list(data.keys()),
-            },
-            indent=2,
+            }
         )
 
-    def _get_summary(self, project_id: str) -> str:
-        return json.dumps(
+    def _get_summary(self, project_id: str) -> ToolResult:
+        return ToolResult(
             {
                 "project_id": project_id,
                 "total_checks": 15,
@@ -195,6 +191,5 @@ class ComplianceDatabaseTool(Tool):
                     "bim_vs_field": 3,
                     "code_compliance": 2,
                 },
-            },
-            indent=2,
+            }
         )
@@ -1,12 +1,11 @@
 """Document search and ingestion tool using pgvector semantic search."""
 
-import json
 import uuid
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class DocumentSearch(Tool):
+class DocumentSearch(StructuredTool):
     """Semantic search across construction documents."""
 
     name = "document_search"
@@ -67,7 +66,7 @@ class DocumentSearch(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         try:
             if action == "search":
@@ -77,11 +76,11 @@ class DocumentSearch(Tool):
             elif action == "detect_contradictions":
                 return self._mock_detect_contradictions(**kwargs)
             else:
-                return f"Error: Unknown action '{action}'"
+                return ToolResult.error(f"Error: Unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _mock_search(self, **kwargs) -> str:
+    def _mock_search(self, **kwargs) -> ToolResult:
         query = kwargs.get("query", "")
         project_id = kwargs["project_id"]
         doc_type = kwargs.get("doc_type")
@@ -164,9 +163,9 @@ class DocumentSearch(Tool):
                 " pgvector semantic search"
             ),
         }
-        return json.dumps(response, indent=2)
+        return ToolResult(response)
 
-    def _mock_ingest(self, **kwargs) -> str:
+    def _mock_ingest(self, **kwargs) -> ToolResult:
         title = kwargs.get("title", "Untitled")
         content = kwargs.get("content", "")
 
@@ -180,9 +179,9 @@ class DocumentSearch(Tool):
                 " embed, and store in pgvector"
             ),
         }
-        return json.dumps(response, indent=2)
+        return ToolResult(response)
 
-    def _mock_detect_contradictions(self, **kwargs) -> str:
+    def _mock_detect_contradictions(self, **kwargs) -> ToolResult:
         query = kwargs.get("query", "")
         project_id = kwargs["project_id"]
 
@@ -271,4 +270,4 @@ class DocumentSearch(Tool):
                 " embeddings to detect semantic conflicts"
             ),
         }
-        return json.dumps(response, indent=2)
+        return ToolResult(response)
@@ -1,12 +1,11 @@
 """Environmental query tool for permits, LEED, carbon, and SWPPP."""
 
-import json
 from datetime import date, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class EnvironmentalQuery(Tool):
+class EnvironmentalQuery(StructuredTool):
     """Query environmental compliance and sustainability data."""
 
     name = "environmental_query"
@@ -44,7 +43,7 @@ class EnvironmentalQuery(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -59,13 +58,13 @@ class EnvironmentalQuery(Tool):
             elif action == "swppp_check":
                 return self._swppp_check(project_id)
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
     def _permits(
         self, project_id: str, permit_type: str | None
-    ) -> str:
+    ) -> ToolResult:
         today = date.today()
         permits = [
             {
@@ -133,16 +132,15 @@ class EnvironmentalQuery(Tool):
                 p for p in permits
                 if p["permit_type"] == permit_type
             ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "permits": permits,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _leed_credits(self, project_id: str) -> str:
+    def _leed_credits(self, project_id: str) -> ToolResult:
         credits = [
             {
                 "credit_id": "EAc1",
@@ -189,18 +187,17 @@ class EnvironmentalQuery(Tool):
         ]
         total = sum(c["points"] for c in credits)
         max_total = sum(c["max_points"] for c in credits)
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "leed_credits": credits,
                 "total_points": total,
                 "max_points": max_total,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _carbon(self, project_id: str) -> str:
+    def _carbon(self, project_id: str) -> ToolResult:
         metrics = [
             {
                 "period": "2025-Q1",
@@ -231,16 +228,15 @@ class EnvironmentalQuery(Tool):
                 "variance_pct": -8.0,
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "carbon_metrics": metrics,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _swppp_check(self, project_id: str) -> str:
+    def _swppp_check(self, project_id: str) -> ToolResult:
         today = date.today()
         checks = [
             {
@@ -274,11 +270,10 @@ class EnvironmentalQuery(Tool):
                 "compliant": False,
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "swppp_checks": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
@@ -1,12 +1,14 @@
 """EPA compliance tool for CWA, CAA, RCRA, SWPPP, and NEPA."""
 
-import json
 from datetime import date, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
+from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.epa_api import EPAClient
 
 
-class EpaComplianceTool(Tool):
+class EpaComplianceTool(AsyncTool):
     """Check EPA compliance for construction projects."""
 
     name = "epa_compliance"
@@ -47,7 +49,7 @@ class EpaComplianceTool(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -56,9 +58,13 @@ class EpaComplianceTool(Tool):
                     project_id, kwargs.get("permit_id")
                 )
             elif action == "air_quality_check":
-                return self._air_quality_check(
-                    project_id, kwargs.get("location")
-                )
+                location = kwargs.get("location")
+                api_key = get_construction_settings().epa_echo_api_key
+                if api_key and location and location.isdigit():
+                    return await self._air_quality_live(
+                        project_id, location, api_key
+                    )
+                return self._air_quality_check(project_id, location)
             elif action == "rcra_check":
                 return self._rcra_check(project_id)
             elif action == "stormwater_check":
@@ -66,13 +72,26 @@ class EpaComplianceTool(Tool):
             elif action == "nepa_status":
                 return self._nepa_status(project_id)
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
+
+    async def _air_quality_live(
+        self, project_id: str, zip_code: str, api_key: str
+    ) -> ToolResult:
+        client = get_integration_client(EPAClient, api_key=api_key)
+        air_quality = await client.get_air_quality(zip_code)
+        return ToolResult(
+            {
+                "project_id": project_id,
+                "location": zip_code,
+                "air_quality": air_quality,
+            }
+        )
 
     def _npdes_check(
         self, project_id: str, permit_id: str | None
-    ) -> str:
+    ) -> ToolResult:
         today = date.today()
         permits = [
             {
@@ -122,7 +141,7 @@ class EpaComplianceTool(Tool):
         exceedances = [
             s for s in sampling if not s["compliant"]
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "permits": permits,
@@ -135,13 +154,12 @@ class EpaComplianceTool(Tool):
                     today - timedelta(days=3)
                 ).isoformat(),
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _air_quality_check(
         self, project_id: str, location: str | None
-    ) -> str:
+    ) -> ToolResult:
         readings = [
             {
                 "parameter": "PM2.5",
@@ -194,7 +212,7 @@ class EpaComplianceTool(Tool):
             "Wind screens at material stockpiles",
             "Track-out controls at site exits",
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "location": location or "Austin, TX 78701",
@@ -212,11 +230,10 @@ class EpaComplianceTool(Tool):
                     else []
                 ),
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _rcra_check(self, project_id: str) -> str:
+    def _rcra_check(self, project_id: str) -> ToolResult:
         today = date.today()
         waste_streams = [
             {
@@ -278,7 +295,7 @@ class EpaComplianceTool(Tool):
                 "closed_properly": True,
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "generator_status": "SQG",
@@ -288,11 +305,10 @@ class EpaComplianceTool(Tool):
                 "container_inspections": container_inspections,
                 "violations": [],
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _stormwater_check(self, project_id: str) -> str:
+    def _stormwater_check(self, project_id: str) -> ToolResult:
         today = date.today()
         inspection_results = [
             {
@@ -361,7 +377,7 @@ class EpaComplianceTool(Tool):
                 "issues_found": False,
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "cgp_permit": "TXR150000",
@@ -372,13 +388,12 @@ class EpaComplianceTool(Tool):
                 "turbidity_monitoring": turbidity,
                 "rain_events_response": rain_events,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _nepa_status(self, project_id: str) -> str:
+    def _nepa_status(self, project_id: str) -> ToolResult:
         today = date.today()
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "review_type": "Environmental Assessment",
@@ -427,6 +442,5 @@ class EpaComplianceTool(Tool):
                 },
                 "categorical_exclusion": False,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
@@ -1,12 +1,11 @@
 """Financial query tool for budget, EVM, and cash flow."""
 
-import json
 from datetime import date
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class FinancialQuery(Tool):
+class FinancialQuery(StructuredTool):
     """Query project financial data including budget, EVM, and cash flow."""
 
     name = "financial_query"
@@ -49,7 +48,7 @@ class FinancialQuery(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -64,12 +63,12 @@ class FinancialQuery(Tool):
             elif action == "change_orders":
                 return self._change_orders(project_id)
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error in financial query: {exc}"
+            return ToolResult.error(f"Error in financial query: {exc}")
 
-    def _budget_status(self, project_id: str) -> str:
-        return json.dumps(
+    def _budget_status(self, project_id: str) -> ToolResult:
+        return ToolResult(
             {
                 "project_id": project_id,
                 "total_budget": 45_000_000.00,
@@ -79,13 +78,12 @@ class FinancialQuery(Tool):
                 "contingency_remaining": 2_250_000.00,
                 "variance_pct": 2.67,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _earned_value(self, project_id: str) -> str:
+    def _earned_value(self, project_id: str) -> ToolResult:
         today = date.today()
-        return json.dumps(
+        return ToolResult(
             {
                 "snapshot_date": today.isoformat(),
                 "bcws": 20_000_000.00,
@@ -98,13 +96,12 @@ class FinancialQuery(Tool):
                 "vac": -593_718.34,
                 "tcpi": 1.010,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _cash_flow(
         self, project_id: str, period: str | None
-    ) -> str:
+    ) -> ToolResult:
         periods = [
             {
                 "period": "2025-Q1",
@@ -132,12 +129,11 @@ class FinancialQuery(Tool):
             periods = [
                 p for p in periods if p["period"] == period
             ]
-        return json.dumps(
-            {"cash_flow": periods, "note": "Mock data"},
-            indent=2,
+        return ToolResult(
+            {"cash_flow": periods, "note": "Mock data"}
         )
 
-    def _change_orders(self, project_id: str) -> str:
+    def _change_orders(self, project_id: str) -> ToolResult:
         today = date.today()
         orders = [
             {
@@ -177,7 +173,6 @@ class FinancialQuery(Tool):
                 "approved_date": None,
             },
         ]
-        return json.dumps(
-            {"change_orders": orders, "note": "Mock data"},
-            indent=2,
+        return ToolResult(
+            {"change_orders": orders, "note": "Mock data"}
         )
@@ -1,11 +1,10 @@
 """Hazard analysis tool for JHA, risk assessment, and controls."""
 
-import json
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class HazardAnalysis(Tool):
+class HazardAnalysis(StructuredTool):
     """Generate job hazard analyses and risk assessments."""
 
     name = "hazard_analysis"
@@ -41,7 +40,7 @@ class HazardAnalysis(Tool):
             "required": ["action"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         activity = kwargs.get(
             "activity", "steel_erection"
@@ -56,11 +55,11 @@ class HazardAnalysis(Tool):
             elif action == "hierarchy_of_controls":
                 return self._hierarchy_of_controls(activity)
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _generate_jha(self, activity: str) -> str:
+    def _generate_jha(self, activity: str) -> ToolResult:
         jhas = {
             "steel_erection": [
                 {
@@ -151,18 +150,17 @@ class HazardAnalysis(Tool):
         data = jhas.get(
             activity.lower(), jhas["steel_erection"]
         )
-        return json.dumps(
+        return ToolResult(
             {
                 "activity": activity,
                 "jha_entries": data,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _risk_assessment(
         self, activity: str, location: str | None
-    ) -> str:
+    ) -> ToolResult:
         assessment = {
             "activity": activity,
             "location": location or "General site",
@@ -210,17 +208,16 @@ class HazardAnalysis(Tool):
             "overall_risk_level": "high",
             "stop_work_threshold": 20,
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "risk_assessment": assessment,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _hierarchy_of_controls(
         self, activity: str
-    ) -> str:
+    ) -> ToolResult:
         controls = {
             "activity": activity,
             "hierarchy": [
@@ -292,10 +289,9 @@ class HazardAnalysis(Tool):
                 },
             ],
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "hierarchy_of_controls": controls,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
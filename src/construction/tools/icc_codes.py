@@ -1,11 +1,13 @@
 """ICC building codes compliance tool."""
 
-import json
 
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
+from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.icc_api import ICCClient
 
 
-class IccCodesTool(Tool):
+class IccCodesTool(AsyncTool):
     """Check ICC building codes including IBC, IFC, IMC, IPC, IECC."""
 
     name = "icc_codes"
@@ -49,14 +51,18 @@ class IccCodesTool(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
             if action == "ibc_check":
-                return self._ibc_check(
-                    project_id, kwargs.get("occupancy_type")
-                )
+                occupancy_type = kwargs.get("occupancy_type")
+                api_key = get_construction_settings().icc_api_key
+                if api_key and occupancy_type:
+                    return await self._ibc_live(
+                        project_id, occupancy_type, api_key
+                    )
+                return self._ibc_check(project_id, occupancy_type)
             elif action == "ifc_check":
                 return self._ifc_check(project_id)
             elif action == "imc_check":
@@ -66,13 +72,28 @@ class IccCodesTool(Tool):
             elif action == "iecc_check":
                 return self._iecc_check(project_id)
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
+
+    async def _ibc_live(
+        self, project_id: str, occupancy_type: str, api_key: str
+    ) -> ToolResult:
+        client = get_integration_client(ICCClient, api_key=api_key)
+        requirements = await client.get_occupancy_requirements(
+            occupancy_type
+        )
+        return ToolResult(
+            {
+                "project_id": project_id,
+                "occupancy_type": occupancy_type,
+                "occupancy_requirements": requirements,
+            }
+        )
 
     def _ibc_check(
         self, project_id: str, occupancy_type: str | None
-    ) -> str:
+    ) -> ToolResult:
         classifications = [
             {
                 "zone": "Server Hall A",
@@ -147,7 +168,7 @@ class IccCodesTool(Tool):
             "code_section": "IBC Chapter 6",
             "compliant": True,
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "occupancy_classification": classifications,
@@ -166,11 +187,10 @@ class IccCodesTool(Tool):
                     "IBC Chapter 16",
                 ],
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _ifc_check(self, project_id: str) -> str:
+    def _ifc_check(self, project_id: str) -> ToolResult:
         checks = {
             "fire_access": {
                 "status": "compliant",
@@ -213,16 +233,15 @@ class IccCodesTool(Tool):
                 "code_section": "IFC Chapter 33",
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "ifc_compliance": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _imc_check(self, project_id: str) -> str:
+    def _imc_check(self, project_id: str) -> ToolResult:
         checks = {
             "ventilation_rates": {
                 "status": "compliant",
@@ -263,16 +282,15 @@ class IccCodesTool(Tool):
                 "code_section": "IMC Chapter 5",
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "imc_compliance": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _ipc_check(self, project_id: str) -> str:
+    def _ipc_check(self, project_id: str) -> ToolResult:
         checks = {
             "fixture_compliance": {
                 "status": "compliant",
@@ -316,16 +334,15 @@ class IccCodesTool(Tool):
                 "code_section": "IPC Chapter 6",
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "ipc_compliance": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _iecc_check(self, project_id: str) -> str:
+    def _iecc_check(self, project_id: str) -> ToolResult:
         checks = {
             "envelope_compliance": {
                 "status": "compliant",
@@ -377,11 +394,10 @@ class IccCodesTool(Tool):
                 "code_section": "IECC C408",
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "iecc_compliance": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
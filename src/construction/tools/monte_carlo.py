@@ -1,26 +1,17 @@
-"""Monte Carlo schedule simulation tool using NumPy."""
+"""Monte Carlo schedule simulation tools using NumPy."""
 
-import json
+import time
 from datetime import UTC, date, datetime, timedelta
 
-import numpy as np
+from ai_agent.tools import StructuredTool, ToolResult
+from construction.config import get_construction_settings
+from construction.scheduling.monte_carlo import SAMPLING_METHODS, project_seed, simulate
+from construction.scheduling.network import ScheduleNetwork
+from construction.scheduling.what_if import WHAT_IF_SAMPLING, BaselineStore
+from construction.tools.schedule import project_activity_records
 
-from ai_agent.tools import Tool
 
-# Default baseline activities with triangular distribution params
-# Each: (name, min_days, mode_days, max_days, is_critical)
-_DEFAULT_ACTIVITIES = [
-    ("Foundation Pour", 10, 14, 21, True),
-    ("Steel Erection", 25, 30, 40, True),
-    ("MEP Rough-In", 20, 30, 45, True),
-    ("Cooling Loop Install", 25, 30, 38, True),
-    ("Exterior Envelope", 15, 20, 30, False),
-    ("Interior Finishes", 20, 25, 35, False),
-    ("Commissioning", 10, 14, 21, True),
-]
-
-
-class MonteCarloSimulationTool(Tool):
+class MonteCarloSimulationTool(StructuredTool):
     """Run Monte Carlo simulation on project schedule."""
 
     name = "monte_carlo_simulation"
@@ -40,10 +31,50 @@ class MonteCarloSimulationTool(Tool):
                 "iterations": {
                     "type": "integer",
                     "description": (
-                        "Number of simulation iterations."
+                        "Number of simulation iterations (the cap"
+                        " when tolerance_days is set)."
                     ),
                     "default": 10000,
                 },
+                "sampling": {
+                    "type": "string",
+                    "enum": list(SAMPLING_METHODS),
+                    "description": (
+                        "Duration sampling design: independent random"
+                        " draws, Latin hypercube, or stratum midpoints."
+                    ),
+                    "default": "random",
+                },
+                "tolerance_days": {
+                    "type": "number",
+                    "description": (
+                        "Stop early once every reported percentile's"
+                        " 95% interval is within this many days."
+                    ),
+                },
+                "seed": {
+                    "type": "integer",
+                    "description": (
+                        "Random seed; the same seed and inputs reproduce"
+                        " a run exactly. Each result reports its seed."
+                    ),
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": (
+                        "ISO date the schedule starts from; completion"
+                        " dates are offsets from it. Defaults to today."
+                    ),
+                },
+                "activities": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "Schedule network as [{id, name, min, mode,"
+                        " max, predecessors}]. Defaults to the"
+                        " project's CPM schedule."
+                    ),
+                },
                 "activity_durations": {
                     "type": "object",
                     "description": (
@@ -64,75 +95,59 @@ class MonteCarloSimulationTool(Tool):
             "required": ["project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         project_id = kwargs["project_id"]
         iterations = kwargs.get("iterations", 10000)
+        activities = kwargs.get("activities") or project_activity_records(project_id)
         overrides = kwargs.get("activity_durations") or {}
         confidence_levels = kwargs.get(
             "confidence_levels", [0.5, 0.8, 0.95]
         )
+        sampling = kwargs.get("sampling", "random")
+        tolerance = kwargs.get("tolerance_days")
+        seed = kwargs.get("seed")
+        start_date = kwargs.get("start_date")
 
         try:
             return self._run_simulation(
                 project_id,
                 iterations,
+                activities,
                 overrides,
                 confidence_levels,
+                sampling,
+                tolerance,
+                seed,
+                date.fromisoformat(start_date) if start_date else None,
             )
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
     def _run_simulation(
         self,
         project_id: str,
         iterations: int,
+        activities: list[dict],
         overrides: dict,
         confidence_levels: list[float],
-    ) -> str:
-        rng = np.random.default_rng()
-        today = date.today()
-
-        # Build activity list with distribution params
-        activities = []
-        for name, min_d, mode_d, max_d, critical in _DEFAULT_ACTIVITIES:
-            if name in overrides:
-                ov = overrides[name]
-                min_d = ov.get("min", min_d)
-                mode_d = ov.get("mode", mode_d)
-                max_d = ov.get("max", max_d)
-            activities.append((name, min_d, mode_d, max_d, critical))
-
-        # Simulate: critical path is sum of critical activities
-        critical_activities = [
-            a for a in activities if a[4]
-        ]
-        all_activities = activities
-
-        # Sample durations for each critical activity
-        critical_durations = np.zeros(iterations)
-        float_consumed_samples: dict[str, np.ndarray] = {}
-
-        for name, min_d, mode_d, max_d, _ in critical_activities:
-            samples = rng.triangular(
-                min_d, mode_d, max_d, size=iterations
-            )
-            critical_durations += samples
-            # Float consumed = actual - mode (baseline)
-            float_consumed_samples[name] = samples - mode_d
-
-        # Non-critical float consumption
-        for name, min_d, mode_d, max_d, is_crit in all_activities:
-            if not is_crit:
-                samples = rng.triangular(
-                    min_d, mode_d, max_d, size=iterations
-                )
-                float_consumed_samples[name] = samples - mode_d
-
-        # Calculate percentiles
-        percentile_values = np.percentile(
-            critical_durations,
-            [lvl * 100 for lvl in confidence_levels],
+        sampling: str = "random",
+        tolerance: float | None = None,
+        seed: int | None = None,
+        start_date: date | None = None,
+    ) -> ToolResult:
+        start = start_date or date.today()
+        network = ScheduleNetwork.from_records(activities, overrides)
+        sim = simulate(
+            network,
+            iterations,
+            sampling=sampling,
+            tolerance=tolerance,
+            confidence_levels=confidence_levels,
+            seed=seed,
+            workers=get_construction_settings().monte_carlo_workers,
         )
+        # Calculate percentiles
+        percentile_values = sim.percentiles(confidence_levels)
 
         completion_dates = {}
         for lvl, val in zip(
@@ -140,19 +155,19 @@ class MonteCarloSimulationTool(Tool):
         ):
             key = f"p{int(lvl * 100)}"
             completion_dates[key] = (
-                today + timedelta(days=int(val))
+                start + timedelta(days=int(val))
             ).isoformat()
 
-        # Average float consumed per activity
+        # Average float consumed (sampled - baseline duration) per activity
         float_consumed = {
-            name: round(float(np.mean(samples)), 2)
-            for name, samples in float_consumed_samples.items()
+            name: round(float(overrun), 2)
+            for name, overrun in zip(
+                network.names, sim.mean_overrun, strict=True
+            )
         }
 
         # Build histogram (10 bins)
-        hist_counts, hist_edges = np.histogram(
-            critical_durations, bins=10
-        )
+        hist_counts, hist_edges = sim.finish_histogram(bins=10)
         histogram = []
         for i, count in enumerate(hist_counts):
             histogram.append({
@@ -161,17 +176,22 @@ class MonteCarloSimulationTool(Tool):
                 "count": int(count),
             })
 
-        # Confidence: fraction within baseline total
-        baseline_total = sum(
-            a[2] for a in critical_activities
-        )
-        confidence = float(
-            np.mean(critical_durations <= baseline_total)
-        )
+        # Confidence: fraction finishing within the deterministic
+        # (all-mode) critical path length
+        baseline_total = network.deterministic_finish()
+        confidence = sim.finish_cdf(baseline_total)
 
         result = {
             "project_id": project_id,
-            "iterations": iterations,
+            "iterations": sim.iterations,
+            "max_iterations": iterations,
+            "sampling": sampling,
+            "seed": sim.seed,
+            "converged": sim.converged,
+            "percentile_error_days": {
+                f"p{int(lvl * 100)}": round(err, 3)
+                for lvl, err in sim.percentile_error.items()
+            },
             "p50_completion": completion_dates.get(
                 "p50", completion_dates.get(
                     next(iter(completion_dates.keys()))
@@ -184,8 +204,126 @@ class MonteCarloSimulationTool(Tool):
                 "p95", ""
             ),
             "confidence": round(confidence, 4),
+            "baseline_duration_days": round(baseline_total, 1),
             "float_consumed": float_consumed,
+            "criticality_index": sim.criticality_index(),
             "histogram": histogram,
             "run_at": datetime.now(UTC).isoformat(),
         }
-        return json.dumps(result, indent=2)
+        return ToolResult(result)
+
+
+# Baselines per schedule version, shared by every what-if tool instance
+_BASELINES = BaselineStore()
+
+
+class ScheduleWhatIfTool(StructuredTool):
+    """Compare a changed schedule against its baseline with shared samples."""
+
+    name = "schedule_what_if"
+    description = (
+        "Estimate how changed activity durations or delays"
+        " move P50/P80/P95 completion, against the baseline"
+        " schedule using common random numbers."
+    )
+
+    def get_input_schema(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "The project identifier.",
+                },
+                "activity_durations": {
+                    "type": "object",
+                    "description": (
+                        "Changes as {id or name: {min, mode, max,"
+                        " delay_days}}; delay_days shifts all three."
+                    ),
+                },
+                "activities": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "Baseline network as [{id, name, min, mode,"
+                        " max, predecessors}]. Defaults to the"
+                        " project's CPM schedule."
+                    ),
+                },
+                "iterations": {
+                    "type": "integer",
+                    "description": "Iterations in the shared baseline.",
+                    "default": 5000,
+                },
+                "sampling": {
+                    "type": "string",
+                    "enum": list(WHAT_IF_SAMPLING),
+                    "default": "lhs",
+                },
+                "seed": {
+                    "type": "integer",
+                    "description": (
+                        "Random seed; defaults to one derived from"
+                        " project_id so repeated what-ifs share a"
+                        " baseline."
+                    ),
+                },
+                "confidence_levels": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "default": [0.5, 0.8, 0.95],
+                },
+            },
+            "required": ["project_id", "activity_durations"],
+        }
+
+    def execute_structured(self, **kwargs) -> ToolResult:
+        project_id = kwargs["project_id"]
+        overrides = kwargs.get("activity_durations") or {}
+        activities = kwargs.get("activities") or project_activity_records(project_id)
+        iterations = kwargs.get("iterations", 5000)
+        sampling = kwargs.get("sampling", "lhs")
+        seed = kwargs.get("seed")
+        if seed is None:
+            seed = project_seed(project_id)
+        confidence_levels = kwargs.get(
+            "confidence_levels", [0.5, 0.8, 0.95]
+        )
+
+        try:
+            started = time.perf_counter()
+            network = ScheduleNetwork.from_records(activities)
+            baseline = _BASELINES.get(network, iterations, seed, sampling)
+            built = time.perf_counter()
+            result = baseline.what_if(overrides)
+            elapsed_ms = (time.perf_counter() - built) * 1000
+        except Exception as exc:
+            return ToolResult.error(f"Error: {exc}")
+
+        base_pct, scenario_pct = result.percentiles(confidence_levels)
+        percentiles = {}
+        for lvl, base, scenario in zip(
+            confidence_levels, base_pct, scenario_pct, strict=True
+        ):
+            percentiles[f"p{int(lvl * 100)}"] = {
+                "baseline_days": round(float(base), 2),
+                "scenario_days": round(float(scenario), 2),
+                "delta_days": round(float(scenario - base), 2),
+            }
+
+        return ToolResult({
+            "project_id": project_id,
+            "iterations": baseline.iterations,
+            "sampling": sampling,
+            "seed": seed,
+            "schedule_fingerprint": network.fingerprint[:16],
+            "affected_activities": result.affected,
+            "recomputed_activities": result.recomputed,
+            "total_activities": len(network),
+            "percentiles": percentiles,
+            "mean_delta_days": round(result.mean_delta, 2),
+            "probability_later": round(result.probability_later(), 4),
+            "baseline_build_ms": round((built - started) * 1000, 1),
+            "what_if_ms": round(elapsed_ms, 2),
+        })
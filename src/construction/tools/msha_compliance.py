@@ -1,11 +1,13 @@
 """MSHA compliance tool for contractor checks and violations."""
 
-import json
 
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
+from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.msha_api import MSHAClient
 
 
-class MshaComplianceTool(Tool):
+class MshaComplianceTool(AsyncTool):
     """Check MSHA compliance for mining-adjacent construction."""
 
     name = "msha_compliance"
@@ -43,7 +45,7 @@ class MshaComplianceTool(Tool):
             "required": ["action"],
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         try:
             if action == "contractor_check":
@@ -51,19 +53,26 @@ class MshaComplianceTool(Tool):
                     kwargs.get("contractor", "Unknown")
                 )
             elif action == "violation_search":
-                return self._violation_search(
-                    kwargs.get("mine_id")
-                )
+                mine_id = kwargs.get("mine_id")
+                settings = get_construction_settings()
+                if settings.regulatory_live_lookups and mine_id:
+                    return await self._violation_search_live(mine_id)
+                return self._violation_search(mine_id)
             elif action == "jurisdiction_check":
                 return self._jurisdiction_check(
                     kwargs.get("location", "Unknown")
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
+
+    async def _violation_search_live(self, mine_id: str) -> ToolResult:
+        client = get_integration_client(MSHAClient)
+        violations = await client.search_violations(mine_id=mine_id)
+        return ToolResult({"mine_id": mine_id, "violations": violations})
 
-    def _contractor_check(self, contractor: str) -> str:
+    def _contractor_check(self, contractor: str) -> ToolResult:
         profile = {
             "contractor": contractor,
             "msha_id": "MSHA-4501234",
@@ -84,17 +93,16 @@ class MshaComplianceTool(Tool):
             "fatalities_5y": 0,
             "risk_level": "medium",
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "contractor_profile": profile,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _violation_search(
         self, mine_id: str | None
-    ) -> str:
+    ) -> ToolResult:
         violations = [
             {
                 "violation_id": "V-2025-0123",
@@ -119,16 +127,15 @@ class MshaComplianceTool(Tool):
                 "abated": True,
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "mine_id": mine_id or "M-0012345",
                 "violations": violations,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _jurisdiction_check(self, location: str) -> str:
+    def _jurisdiction_check(self, location: str) -> ToolResult:
         result = {
             "location": location,
             "msha_jurisdiction": False,
@@ -148,10 +155,9 @@ class MshaComplianceTool(Tool):
                 " MSHA jurisdiction."
             ),
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "jurisdiction": result,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
@@ -1,11 +1,13 @@
 """NFPA/NEC compliance tool for fire protection and electrical code."""
 
-import json
 
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
+from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.nfpa_api import NFPAClient
 
 
-class NfpaComplianceTool(Tool):
+class NfpaComplianceTool(AsyncTool):
     """Check NFPA and NEC compliance for construction projects."""
 
     name = "nfpa_compliance"
@@ -46,16 +48,20 @@ class NfpaComplianceTool(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
             if action == "fire_protection_check":
                 return self._fire_protection_check(project_id)
             elif action == "nec_article_check":
-                return self._nec_article_check(
-                    project_id, kwargs.get("article_number")
-                )
+                article_number = kwargs.get("article_number")
+                api_key = get_construction_settings().nfpa_api_key
+                if api_key and article_number:
+                    return await self._nec_article_live(
+                        project_id, article_number, api_key
+                    )
+                return self._nec_article_check(project_id, article_number)
             elif action == "life_safety_check":
                 return self._life_safety_check(project_id)
             elif action == "sprinkler_alarm_check":
@@ -65,11 +71,24 @@ class NfpaComplianceTool(Tool):
                     project_id, kwargs.get("location")
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
+
+    async def _nec_article_live(
+        self, project_id: str, article_number: str, api_key: str
+    ) -> ToolResult:
+        client = get_integration_client(NFPAClient, api_key=api_key)
+        article = await client.get_nec_article(article_number)
+        return ToolResult(
+            {
+                "project_id": project_id,
+                "nec_article": article,
+                "article_checked": article_number,
+            }
+        )
 
-    def _fire_protection_check(self, project_id: str) -> str:
+    def _fire_protection_check(self, project_id: str) -> ToolResult:
         checks = {
             "fire_barriers": {
                 "status": "warning",
@@ -103,18 +122,17 @@ class NfpaComplianceTool(Tool):
                 ],
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "fire_protection": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _nec_article_check(
         self, project_id: str, article_number: str | None
-    ) -> str:
+    ) -> ToolResult:
         article = article_number or "210"
         checks = {
             "conductor_sizing": {
@@ -156,17 +174,16 @@ class NfpaComplianceTool(Tool):
                 "nec_articles": ["700", "701"],
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "nec_compliance": checks,
                 "article_checked": article,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _life_safety_check(self, project_id: str) -> str:
+    def _life_safety_check(self, project_id: str) -> ToolResult:
         checks = {
             "occupant_load": {
                 "floor": "Level 2",
@@ -212,16 +229,15 @@ class NfpaComplianceTool(Tool):
                 "standard": "NFPA 101 Section 7.9",
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "life_safety": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _sprinkler_alarm_check(self, project_id: str) -> str:
+    def _sprinkler_alarm_check(self, project_id: str) -> ToolResult:
         checks = {
             "sprinkler_coverage": {
                 "status": "warning",
@@ -264,18 +280,17 @@ class NfpaComplianceTool(Tool):
                 ],
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "sprinkler_alarm": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _egress_check(
         self, project_id: str, location: str | None
-    ) -> str:
+    ) -> ToolResult:
         loc = location or "Level 2 — Main Corridor"
         checks = {
             "corridor_width": {
@@ -311,11 +326,10 @@ class NfpaComplianceTool(Tool):
                 "standard": "NFPA 101 Section 7.7",
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "egress_compliance": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
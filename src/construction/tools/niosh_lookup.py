@@ -1,11 +1,13 @@
 """NIOSH lookup tool for RELs, FACE reports, and health hazards."""
 
-import json
 
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
+from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.niosh_api import NIOSHClient
 
 
-class NioshLookup(Tool):
+class NioshLookup(AsyncTool):
     """Look up NIOSH recommended exposure limits and reports."""
 
     name = "niosh_lookup"
@@ -48,13 +50,14 @@ class NioshLookup(Tool):
             "required": ["action"],
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         try:
             if action == "rel_lookup":
-                return self._rel_lookup(
-                    kwargs.get("substance", "silica")
-                )
+                substance = kwargs.get("substance", "silica")
+                if get_construction_settings().regulatory_live_lookups:
+                    return await self._rel_lookup_live(substance)
+                return self._rel_lookup(substance)
             elif action == "face_report":
                 return self._face_report(
                     kwargs.get("industry", "construction")
@@ -64,11 +67,16 @@ class NioshLookup(Tool):
                     kwargs.get("hazard_type", "noise")
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
+
+    async def _rel_lookup_live(self, substance: str) -> ToolResult:
+        client = get_integration_client(NIOSHClient)
+        rel = await client.get_rel(substance)
+        return ToolResult({"rel_data": rel})
 
-    def _rel_lookup(self, substance: str) -> str:
+    def _rel_lookup(self, substance: str) -> ToolResult:
         rels = {
             "silica": {
                 "substance": "Crystalline Silica (quartz)",
@@ -129,12 +137,11 @@ class NioshLookup(Tool):
             },
         }
         data = rels.get(substance.lower(), rels["silica"])
-        return json.dumps(
-            {"rel_data": data, "note": "Mock data"},
-            indent=2,
+        return ToolResult(
+            {"rel_data": data, "note": "Mock data"}
         )
 
-    def _face_report(self, industry: str) -> str:
+    def _face_report(self, industry: str) -> ToolResult:
         reports = [
             {
                 "report_id": "FACE-2024-01",
@@ -177,16 +184,15 @@ class NioshLookup(Tool):
                 ],
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "industry": industry,
                 "face_reports": reports,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _health_hazard(self, hazard_type: str) -> str:
+    def _health_hazard(self, hazard_type: str) -> ToolResult:
         hazards = {
             "noise": {
                 "hazard": "Occupational Noise Exposure",
@@ -244,7 +250,6 @@ class NioshLookup(Tool):
         data = hazards.get(
             hazard_type.lower(), hazards["noise"]
         )
-        return json.dumps(
-            {"health_hazard": data, "note": "Mock data"},
-            indent=2,
+        return ToolResult(
+            {"health_hazard": data, "note": "Mock data"}
         )
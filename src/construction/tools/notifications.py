@@ -1,12 +1,11 @@
 """Notification tool for SMS and email alerts."""
 
-import json
 from datetime import UTC, datetime
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class SendNotification(Tool):
+class SendNotification(StructuredTool):
     """Send SMS or email notifications for critical alerts."""
 
     name = "send_notification"
@@ -48,7 +47,7 @@ class SendNotification(Tool):
             "required": ["method", "recipient", "message"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         method = kwargs["method"]
         try:
             if method == "sms":
@@ -56,11 +55,11 @@ class SendNotification(Tool):
             elif method == "email":
                 return self._send_email(**kwargs)
             else:
-                return f"Error: Unknown method '{method}'"
+                return ToolResult.error(f"Error: Unknown method '{method}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _send_sms(self, **kwargs) -> str:
+    def _send_sms(self, **kwargs) -> ToolResult:
         recipient = kwargs["recipient"]
         message = kwargs["message"]
         priority = kwargs.get("priority", "normal")
@@ -81,9 +80,9 @@ class SendNotification(Tool):
                 "Mock — production would use Twilio client"
             ),
         }
-        return json.dumps(response, indent=2)
+        return ToolResult(response)
 
-    def _send_email(self, **kwargs) -> str:
+    def _send_email(self, **kwargs) -> ToolResult:
         recipient = kwargs["recipient"]
         message = kwargs["message"]
         priority = kwargs.get("priority", "normal")
@@ -99,4 +98,4 @@ class SendNotification(Tool):
                 "Mock — production would use SMTP/SES"
             ),
         }
-        return json.dumps(response, indent=2)
+        return ToolResult(response)
@@ -1,12 +1,14 @@
 """OSHA inspection and citation search tool."""
 
-import json
 from datetime import UTC, datetime
 
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
+from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.osha_api import OSHAClient
 
 
-class OshaSearch(Tool):
+class OshaSearch(AsyncTool):
     """Search OSHA inspection and citation data."""
 
     name = "osha_search"
@@ -43,13 +45,37 @@ class OshaSearch(Tool):
             },
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         try:
+            if get_construction_settings().regulatory_live_lookups:
+                return await self._live_search(**kwargs)
             return self._mock_search(**kwargs)
         except Exception as exc:
-            return f"Error searching OSHA data: {exc}"
+            return ToolResult.error(f"Error searching OSHA data: {exc}")
 
-    def _mock_search(self, **kwargs) -> str:
+    async def _live_search(self, **kwargs) -> ToolResult:
+        client = get_integration_client(OSHAClient)
+        inspections = await client.search_inspections(
+            establishment=kwargs.get("establishment"),
+            state=kwargs.get("state"),
+            sic=kwargs.get("sic_code"),
+        )
+        return ToolResult(
+            {
+                "inspections": inspections,
+                "total_results": len(inspections),
+                "query": {
+                    "establishment": kwargs.get("establishment", ""),
+                    "state": kwargs.get("state", ""),
+                    "sic_code": kwargs.get("sic_code"),
+                    "date_from": kwargs.get("date_from"),
+                    "date_to": kwargs.get("date_to"),
+                },
+                "retrieved_at": datetime.now(UTC).isoformat(),
+            }
+        )
+
+    def _mock_search(self, **kwargs) -> ToolResult:
         establishment = kwargs.get("establishment", "")
         state = kwargs.get("state", "")
 
@@ -127,4 +153,4 @@ class OshaSearch(Tool):
             "retrieved_at": datetime.now(UTC).isoformat(),
             "note": "Mock data — production would call OSHA enforcement API",
         }
-        return json.dumps(result, indent=2)
+        return ToolResult(result)
@@ -1,12 +1,11 @@
 """OSHA compliance tool for 300 log, Focus Four, and standards."""
 
-import json
 from datetime import date, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class OshaComplianceTool(Tool):
+class OshaComplianceTool(StructuredTool):
     """Check OSHA compliance including 300 log and Focus Four."""
 
     name = "osha_compliance"
@@ -43,7 +42,7 @@ class OshaComplianceTool(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -60,11 +59,11 @@ class OshaComplianceTool(Tool):
             elif action == "excavation_check":
                 return self._excavation_check(project_id)
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _osha_300_log(self, project_id: str) -> str:
+    def _osha_300_log(self, project_id: str) -> ToolResult:
         today = date.today()
         records = [
             {
@@ -117,17 +116,16 @@ class OshaComplianceTool(Tool):
             "total_fatalities": 0,
             "total_hours_worked": 185000,
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "osha_300_log": records,
                 "summary": summary,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _focus_four_check(self, project_id: str) -> str:
+    def _focus_four_check(self, project_id: str) -> ToolResult:
         checks = {
             "falls": {
                 "status": "warning",
@@ -167,18 +165,17 @@ class OshaComplianceTool(Tool):
                 ],
             },
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "focus_four": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _silica_check(
         self, project_id: str, location: str | None
-    ) -> str:
+    ) -> ToolResult:
         monitoring = [
             {
                 "id": "SIL-001",
@@ -211,17 +208,16 @@ class OshaComplianceTool(Tool):
                 ],
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "silica_monitoring": monitoring,
                 "standard": "29 CFR 1926.1153",
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _electrical_check(self, project_id: str) -> str:
+    def _electrical_check(self, project_id: str) -> ToolResult:
         checks = {
             "gfci_status": {
                 "total_outlets": 48,
@@ -247,16 +243,15 @@ class OshaComplianceTool(Tool):
             },
             "standard": "29 CFR 1926.405",
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "electrical_compliance": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _excavation_check(self, project_id: str) -> str:
+    def _excavation_check(self, project_id: str) -> ToolResult:
         checks = {
             "active_excavations": [
                 {
@@ -285,11 +280,10 @@ class OshaComplianceTool(Tool):
             ],
             "standard": "29 CFR 1926.652",
         }
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "excavation_compliance": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
@@ -1,12 +1,11 @@
 """Risk database CRUD tool for the risk register."""
 
-import json
 from datetime import UTC, datetime
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class RiskDatabase(Tool):
+class RiskDatabase(StructuredTool):
     """Query, create, or update risk events in the risk register."""
 
     name = "risk_database"
@@ -49,7 +48,7 @@ class RiskDatabase(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -64,13 +63,13 @@ class RiskDatabase(Tool):
                     kwargs.get("data"),
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error in risk database: {exc}"
+            return ToolResult.error(f"Error in risk database: {exc}")
 
     def _query(
         self, project_id: str, filters: dict | None
-    ) -> str:
+    ) -> ToolResult:
         category = (filters or {}).get("category")
         status = (filters or {}).get("status", "active")
 
@@ -127,13 +126,13 @@ class RiskDatabase(Tool):
         if status:
             risks = [r for r in risks if r["status"] == status]
 
-        return json.dumps(
-            {"risks": risks, "total": len(risks)}, indent=2
+        return ToolResult(
+            {"risks": risks, "total": len(risks)}
         )
 
-    def _create(self, project_id: str, data: dict | None) -> str:
+    def _create(self, project_id: str, data: dict | None) -> ToolResult:
         if not data:
-            return "Error: data is required for create action"
+            return ToolResult.error("Error: data is required for create action")
         now = datetime.now(UTC).isoformat()
         risk = {
             "id": f"RISK-{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}",
@@ -141,8 +140,8 @@ class RiskDatabase(Tool):
             "created_at": now,
             **data,
         }
-        return json.dumps(
-            {"created": risk, "status": "success"}, indent=2
+        return ToolResult(
+            {"created": risk, "status": "success"}
         )
 
     def _update(
@@ -150,11 +149,11 @@ class RiskDatabase(Tool):
         project_id: str,
         risk_id: str | None,
         data: dict | None,
-    ) -> str:
+    ) -> ToolResult:
         if not risk_id:
-            return "Error: risk_id is required for update action"
+            return ToolResult.error("Error: risk_id is required for update action")
         if not data:
-            return "Error: data is required for update action"
+            return ToolResult.error("Error: data is required for update action")
         now = datetime.now(UTC).isoformat()
         updated = {
             "id": risk_id,
@@ -162,6 +161,6 @@ class RiskDatabase(Tool):
             "updated_at": now,
             **data,
         }
-        return json.dumps(
-            {"updated": updated, "status": "success"}, indent=2
+        return ToolResult(
+            {"updated": updated, "status": "success"}
         )
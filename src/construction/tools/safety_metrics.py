@@ -1,11 +1,10 @@
 """Safety metrics tool for TRIR, DART, and EMR calculations."""
 
-import json
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class SafetyMetrics(Tool):
+class SafetyMetrics(StructuredTool):
     """Calculate construction safety metrics."""
 
     name = "safety_metrics"
@@ -49,7 +48,7 @@ class SafetyMetrics(Tool):
             "required": ["action"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         try:
             if action == "calculate_trir":
@@ -67,20 +66,20 @@ class SafetyMetrics(Tool):
                     kwargs.get("project_id", "default")
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
     def _calculate_trir(
         self, recordable_cases: int, hours_worked: float
-    ) -> str:
+    ) -> ToolResult:
         if hours_worked <= 0:
-            return json.dumps(
+            return ToolResult(
                 {"error": "Hours worked must be positive"}
             )
         trir = (recordable_cases * 200000) / hours_worked
         benchmark = 2.5
-        return json.dumps(
+        return ToolResult(
             {
                 "metric": "TRIR",
                 "formula": (
@@ -97,20 +96,19 @@ class SafetyMetrics(Tool):
                     else "above_benchmark"
                 ),
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _calculate_dart(
         self, dart_cases: int, hours_worked: float
-    ) -> str:
+    ) -> ToolResult:
         if hours_worked <= 0:
-            return json.dumps(
+            return ToolResult(
                 {"error": "Hours worked must be positive"}
             )
         dart = (dart_cases * 200000) / hours_worked
         benchmark = 1.5
-        return json.dumps(
+        return ToolResult(
             {
                 "metric": "DART",
                 "formula": (
@@ -126,12 +124,11 @@ class SafetyMetrics(Tool):
                     else "above_benchmark"
                 ),
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _calculate_emr(self, project_id: str) -> str:
-        return json.dumps(
+    def _calculate_emr(self, project_id: str) -> ToolResult:
+        return ToolResult(
             {
                 "metric": "EMR",
                 "project_id": project_id,
@@ -148,6 +145,5 @@ class SafetyMetrics(Tool):
                     "ballast_value": 28000.00,
                 },
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
@@ -1,12 +1,210 @@
 """Schedule query tool for P6/MS Project integration."""
 
-import json
-from datetime import date, timedelta
+import time
+from datetime import date
+from math import ceil
 
-from ai_agent.tools import Tool
+import numpy as np
 
+from ai_agent.tools import StructuredTool, ToolResult
+from construction.scheduling.cpm import CPMNetwork, records_signature
+from construction.scheduling.incremental import IncrementalCPM, ScheduleStore
+from construction.scheduling.network import DEFAULT_SPREAD
+from construction.scheduling.resequence import (
+    DEFAULT_OVERLAP,
+    DEFAULT_TIME_BUDGET,
+    Resequencer,
+    crew_capacities,
+)
+from construction.scheduling.snapshot import (
+    BASELINE,
+    UPDATE,
+    ScheduleSnapshot,
+    SnapshotStore,
+    diff_snapshots,
+)
 
-class ScheduleQueryTool(Tool):
+# Solved schedules per project, shared by every tool instance so status
+# updates re-propagate incrementally instead of recomputing the network
+_SCHEDULES = ScheduleStore()
+# Recent snapshots per project, shared the same way; "current" in a
+# comparison is always the live schedule above
+_SNAPSHOTS = SnapshotStore()
+CURRENT = "current"
+# Longest activity list returned for one update
+_MAX_LISTED = 50
+
+# Demo schedule used when no activities are supplied: durations in working
+# days from today; Elevator Install starts 5 days into MEP rough-in and
+# carries 3 days of float. Each activity runs with one crew of its trade.
+_DEFAULT_SCHEDULE = [
+    ("ACT-001", "Foundation Pour - Zone A", 10, True, [], "concrete", 12),
+    ("ACT-002", "Steel Erection - Zone A", 22, True, ["ACT-001"], "ironwork", 14),
+    ("ACT-003", "MEP Rough-In - Zone A", 22, False, ["ACT-002"], "mechanical", 10),
+    (
+        "ACT-004",
+        "Redundant Cooling Loop Install",
+        22,
+        True,
+        ["ACT-003", "ACT-006"],
+        "mechanical",
+        12,
+    ),
+    ("ACT-005", "Landscaping - Phase 1", 15, False, ["ACT-002"], "sitework", 6),
+    (
+        "ACT-006",
+        "Elevator Install",
+        14,
+        False,
+        [{"id": "ACT-003", "type": "SS", "lag": 5}],
+        "elevator",
+        4,
+    ),
+]
+# Demo crews (total headcount per trade) used when none are supplied
+_DEFAULT_CREWS = [
+    {"trade": "concrete", "headcount": 16},
+    {"trade": "ironwork", "headcount": 14},
+    {"trade": "mechanical", "headcount": 18},
+    {"trade": "electrical", "headcount": 24},
+    {"trade": "sitework", "headcount": 8},
+]
+
+
+def default_schedule_records() -> list[dict]:
+    """The demo schedule as activity records, used when none are given."""
+    return [
+        {
+            "id": activity_id,
+            "name": name,
+            "duration": duration,
+            "tier_critical": tier_critical,
+            "predecessors": predecessors,
+            "trade": trade,
+            "crew_size": crew_size,
+        }
+        for (
+            activity_id,
+            name,
+            duration,
+            tier_critical,
+            predecessors,
+            trade,
+            crew_size,
+        ) in _DEFAULT_SCHEDULE
+    ]
+
+
+def default_crews() -> list[dict]:
+    """The demo crew assignments, used when none are given."""
+    return [dict(crew) for crew in _DEFAULT_CREWS]
+
+
+def project_schedule(
+    project_id: str, activities: list[dict] | None
+) -> IncrementalCPM:
+    """The project's solved schedule, kept in step with supplied activities.
+
+    The network is rebuilt only when the activities' ids, names, links,
+    crews or project start change. Otherwise rows whose duration changed
+    since the last call are applied incrementally, and edits made through
+    ``update_activity`` to the other rows are kept.
+    """
+    entry = _SCHEDULES.entry(project_id)
+    if not activities:
+        if entry is None:
+            schedule = IncrementalCPM(
+                CPMNetwork.from_records(default_schedule_records())
+            )
+            _SCHEDULES.put(project_id, schedule)
+            return schedule
+        return entry[0]
+    signature, durations = records_signature(activities)
+    if entry is None or entry[1] is None or entry[1][0] != signature:
+        schedule = IncrementalCPM(CPMNetwork.from_records(activities))
+        _SCHEDULES.put(project_id, schedule, (signature, durations))
+        return schedule
+    schedule, (_, previous) = entry
+    changed = {
+        schedule.network.index[activity_id]: duration
+        for activity_id, duration in durations.items()
+        if previous[activity_id] != duration
+    }
+    if changed:
+        schedule.update_many(changed)
+        _SCHEDULES.put(project_id, schedule, (signature, durations))
+    return schedule
+
+
+def project_activity_records(project_id: str) -> list[dict]:
+    """The project's live schedule as Monte Carlo network records: each
+    activity's CPM duration is the most likely value, with the default
+    spread around it."""
+    low, high = DEFAULT_SPREAD
+    return [
+        {
+            "id": record["id"],
+            "name": record["name"],
+            "min": record["duration_days"] * low,
+            "mode": record["duration_days"],
+            "max": record["duration_days"] * high,
+            "predecessors": record["predecessors"],
+        }
+        for record in project_schedule(project_id, None).result().records()
+    ]
+
+
+def schedule_snapshots() -> SnapshotStore:
+    """The in-process snapshot store shared by tools and services."""
+    return _SNAPSHOTS
+
+
+def current_snapshot(
+    project_id: str,
+    activities: list[dict] | None,
+    label: str = "",
+    kind: str = UPDATE,
+) -> ScheduleSnapshot:
+    """Snapshot of the project's live schedule (not stored)."""
+    return ScheduleSnapshot.from_result(
+        project_schedule(project_id, activities).result(),
+        label=label,
+        kind=kind,
+    )
+
+
+def _schedule_edit(
+    schedule: IncrementalCPM, activity_id: str, data: dict
+) -> tuple[float | None, float | None]:
+    """(duration, earliest start) in working days from an update payload.
+
+    ``duration``/``duration_days`` set the duration directly; a
+    ``start_date`` becomes a start-no-earlier-than date and an
+    ``end_date`` sets the duration from the (new or current) start.
+    """
+    network = schedule.network
+    calendar = network.calendar
+    duration = data.get("duration", data.get("duration_days"))
+    release = None
+    start = data.get("start_date")
+    if start:
+        start = _as_date(start)
+        release = calendar.workdays_between(network.start, start)
+    if data.get("end_date"):
+        start = start or schedule.early_start_date(activity_id)
+        finish = _as_date(data["end_date"])
+        duration = max(calendar.duration(start, finish), 0)
+    return (
+        None if duration is None else float(duration),
+        None if release is None else float(release),
+    )
+
+
+def _as_date(value) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+class ScheduleQueryTool(StructuredTool):
     """Query and update project schedule activities."""
 
     name = "schedule_query"
@@ -41,132 +239,96 @@ class ScheduleQueryTool(Tool):
                     "type": "object",
                     "description": "Data payload for updates.",
                 },
+                "activities": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "Schedule activities (id, name, duration"
+                        " or start/end dates, predecessors with"
+                        " optional FS/SS/FF/SF type and lag)."
+                        " Defaults to the project schedule."
+                    ),
+                },
             },
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         activity_id = kwargs.get("activity_id")
+        activities = kwargs.get("activities")
 
         try:
             if action == "get_critical_path":
-                return self._get_critical_path(project_id)
+                return self._get_critical_path(
+                    project_id, activities
+                )
             elif action == "get_activity":
-                return self._get_activity(project_id, activity_id)
+                return self._get_activity(
+                    project_id, activity_id, activities
+                )
             elif action == "update_activity":
                 data = kwargs.get("data", {})
                 return self._update_activity(
-                    project_id, activity_id, data
+                    project_id, activity_id, data, activities
                 )
             elif action == "get_float_report":
-                return self._get_float_report(project_id)
+                return self._get_float_report(
+                    project_id, activities
+                )
             else:
-                return f"Error: Unknown action '{action}'"
+                return ToolResult.error(f"Error: Unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _get_critical_path(self, project_id: str) -> str:
-        today = date.today()
-        activities = [
-            {
-                "id": "ACT-001",
-                "external_id": "P6-A1010",
-                "name": "Foundation Pour - Zone A",
-                "start_date": today.isoformat(),
-                "end_date": (today + timedelta(days=14)).isoformat(),
-                "total_float": 0.0,
-                "is_critical": True,
-                "tier_critical": True,
-                "predecessors": [],
-                "successors": ["ACT-002"],
-            },
-            {
-                "id": "ACT-002",
-                "external_id": "P6-A1020",
-                "name": "Steel Erection - Zone A",
-                "start_date": (
-                    today + timedelta(days=15)
-                ).isoformat(),
-                "end_date": (
-                    today + timedelta(days=45)
-                ).isoformat(),
-                "total_float": 0.0,
-                "is_critical": True,
-                "tier_critical": True,
-                "predecessors": ["ACT-001"],
-                "successors": ["ACT-003"],
-            },
-            {
-                "id": "ACT-003",
-                "external_id": "P6-A1030",
-                "name": "MEP Rough-In - Zone A",
-                "start_date": (
-                    today + timedelta(days=46)
-                ).isoformat(),
-                "end_date": (
-                    today + timedelta(days=76)
-                ).isoformat(),
-                "total_float": 0.0,
-                "is_critical": True,
-                "tier_critical": False,
-                "predecessors": ["ACT-002"],
-                "successors": ["ACT-004"],
-            },
-            {
-                "id": "ACT-004",
-                "external_id": "P6-A1040",
-                "name": "Redundant Cooling Loop Install",
-                "start_date": (
-                    today + timedelta(days=77)
-                ).isoformat(),
-                "end_date": (
-                    today + timedelta(days=107)
-                ).isoformat(),
-                "total_float": 0.0,
-                "is_critical": True,
-                "tier_critical": True,
-                "predecessors": ["ACT-003"],
-                "successors": [],
-            },
-        ]
+    def _schedule(
+        self, project_id: str, activities: list[dict] | None
+    ) -> IncrementalCPM:
+        return project_schedule(project_id, activities)
+
+    def _get_critical_path(
+        self, project_id: str, activities: list[dict] | None
+    ) -> ToolResult:
+        cpm = self._schedule(project_id, activities).result()
+        path = cpm.records(cpm.critical_path())
         result = {
             "project_id": project_id,
             "critical_path": {
-                "activities": activities,
-                "total_duration_days": 107,
+                "activities": path,
+                "total_duration_days": ceil(cpm.project_finish),
+                "project_start": (
+                    cpm.network.start.isoformat()
+                ),
+                "project_finish": (
+                    cpm.project_finish_date.isoformat()
+                ),
                 "float_summary": {
-                    "ACT-001": 0.0,
-                    "ACT-002": 0.0,
-                    "ACT-003": 0.0,
-                    "ACT-004": 0.0,
+                    a["id"]: a["total_float"] for a in path
                 },
             },
         }
-        return json.dumps(result, indent=2)
+        return ToolResult(result)
 
     def _get_activity(
-        self, project_id: str, activity_id: str | None
-    ) -> str:
+        self,
+        project_id: str,
+        activity_id: str | None,
+        activities: list[dict] | None,
+    ) -> ToolResult:
         if not activity_id:
-            return "Error: activity_id is required for get_activity"
-        today = date.today()
-        activity = {
-            "id": activity_id,
-            "external_id": f"P6-{activity_id}",
-            "name": f"Activity {activity_id}",
-            "start_date": today.isoformat(),
-            "end_date": (today + timedelta(days=14)).isoformat(),
-            "total_float": 3.0,
-            "is_critical": False,
-            "tier_critical": False,
-            "predecessors": [],
-            "successors": [],
-        }
-        return json.dumps(
-            {"project_id": project_id, "activity": activity},
-            indent=2,
+            return ToolResult.error("Error: activity_id is required for get_activity")
+        cpm = self._schedule(project_id, activities).result()
+        node = cpm.network.index.get(activity_id)
+        if node is None:
+            return ToolResult.error(
+                f"Error: Activity '{activity_id}' not found"
+            )
+        return ToolResult(
+            {
+                "project_id": project_id,
+                "activity": cpm.records([node])[0],
+            }
         )
 
     def _update_activity(
@@ -174,44 +336,346 @@ class ScheduleQueryTool(Tool):
         project_id: str,
         activity_id: str | None,
         data: dict,
-    ) -> str:
+        activities: list[dict] | None,
+    ) -> ToolResult:
         if not activity_id:
-            return "Error: activity_id is required for update_activity"
-        return json.dumps(
+            return ToolResult.error("Error: activity_id is required for update_activity")
+        schedule = self._schedule(project_id, activities)
+        if activity_id not in schedule.network.index:
+            return ToolResult.error(
+                f"Error: Activity '{activity_id}' not found"
+            )
+        duration, release = _schedule_edit(
+            schedule, activity_id, data
+        )
+        started = time.perf_counter()
+        update = schedule.update(
+            activity_id, duration=duration, release=release
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return ToolResult(
             {
                 "project_id": project_id,
                 "activity_id": activity_id,
                 "status": "updated",
                 "updated_fields": list(data.keys()),
-            },
-            indent=2,
+                "project_finish": schedule.network.finish_date(
+                    update.project_finish
+                ).isoformat(),
+                "finish_delta_days": round(
+                    update.finish_delta, 3
+                ),
+                "changed_count": len(update.changed),
+                "changed_activities": (
+                    update.changed[:_MAX_LISTED]
+                ),
+                "became_critical": (
+                    update.became_critical[:_MAX_LISTED]
+                ),
+                "no_longer_critical": (
+                    update.no_longer_critical[:_MAX_LISTED]
+                ),
+                "elapsed_ms": round(elapsed_ms, 3),
+            }
         )
 
-    def _get_float_report(self, project_id: str) -> str:
+    def _get_float_report(
+        self, project_id: str, activities: list[dict] | None
+    ) -> ToolResult:
+        cpm = self._schedule(project_id, activities).result()
+        # Least float first
+        order = np.lexsort(
+            (cpm.early_start, cpm.total_float)
+        )
+        total = np.round(cpm.total_float, 3).tolist()
+        free = np.round(cpm.free_float, 3).tolist()
+        status = cpm.float_status()
+        names = cpm.network.names
         report = [
             {
-                "activity_id": "ACT-001",
-                "activity_name": "Foundation Pour - Zone A",
-                "total_float": 0.0,
-                "free_float": 0.0,
-                "status": "critical",
+                "activity_id": cpm.network.ids[k],
+                "activity_name": names[k],
+                "total_float": total[k],
+                "free_float": free[k],
+                "status": status[k],
+            }
+            for k in order.tolist()
+        ]
+        return ToolResult(
+            {"project_id": project_id, "float_report": report}
+        )
+
+
+class ScheduleResequenceTool(StructuredTool):
+    """Search crew-feasible resequencing alternatives."""
+
+    name = "schedule_resequence"
+    description = (
+        "Search alternative activity sequences that finish"
+        " earlier within crew capacities, never"
+        " parallelizing tier-critical activities."
+    )
+
+    def get_input_schema(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "The project identifier.",
+                },
+                "activities": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "Schedule activities as for"
+                        " schedule_query, with optional trade"
+                        " and crew_size. Defaults to the"
+                        " project schedule."
+                    ),
+                },
+                "crews": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "Crew assignments (trade, headcount);"
+                        " headcount is summed per trade."
+                    ),
+                },
+                "overlap": {
+                    "type": "number",
+                    "description": (
+                        "Share of a predecessor a fast-tracked"
+                        " successor may overlap (default"
+                        f" {DEFAULT_OVERLAP})."
+                    ),
+                },
+                "time_budget_ms": {
+                    "type": "integer",
+                    "description": "Search time budget in milliseconds.",
+                },
+                "max_alternatives": {
+                    "type": "integer",
+                    "description": "Alternatives to return (default 5).",
+                },
             },
+            "required": ["project_id"],
+        }
+
+    def execute_structured(self, **kwargs) -> ToolResult:
+        project_id = kwargs["project_id"]
+        crews = kwargs.get("crews") or default_crews()
+        time_budget_ms = kwargs.get(
+            "time_budget_ms", DEFAULT_TIME_BUDGET * 1000
+        )
+        try:
+            schedule = project_schedule(
+                project_id, kwargs.get("activities")
+            )
+            capacities = crew_capacities(crews)
+            started = time.perf_counter()
+            resequencer = Resequencer(
+                schedule.network,
+                capacities,
+                durations=schedule.result().durations,
+                release=schedule.release,
+                overlap=kwargs.get("overlap", DEFAULT_OVERLAP),
+            )
+            result = resequencer.search(
+                time_budget=time_budget_ms / 1000,
+                max_alternatives=kwargs.get(
+                    "max_alternatives", 5
+                ),
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        except Exception as exc:
+            return ToolResult.error(f"Error: {exc}")
+        network = schedule.network
+        return ToolResult(
             {
-                "activity_id": "ACT-005",
-                "activity_name": "Landscaping - Phase 1",
-                "total_float": 15.0,
-                "free_float": 10.0,
-                "status": "healthy",
+                "project_id": project_id,
+                "crews": capacities,
+                "cpm_duration_days": ceil(
+                    schedule.project_finish
+                ),
+                "baseline_duration_days": (
+                    result.baseline_finish
+                ),
+                "baseline_finish": network.finish_date(
+                    result.baseline_finish
+                ).isoformat(),
+                "alternatives": result.records(_MAX_LISTED),
+                "tier_critical_protected": int(
+                    network.tier_critical.sum()
+                ),
+                "evaluations": result.evaluations,
+                "search_complete": result.exhausted,
+                "elapsed_ms": round(elapsed_ms, 3),
+            }
+        )
+
+
+class ScheduleCompareTool(StructuredTool):
+    """Snapshot schedules and compare two versions."""
+
+    name = "schedule_compare"
+    description = (
+        "Snapshot the project schedule and compare two"
+        " versions: added, removed and changed activities,"
+        " logic changes, float erosion and finish movement."
+    )
+
+    def get_input_schema(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": ["snapshot", "list", "compare"],
+                    "description": "The snapshot action to perform.",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "The project identifier.",
+                },
+                "label": {
+                    "type": "string",
+                    "description": "Snapshot label, e.g. 'Update 7'.",
+                },
+                "kind": {
+                    "type": "string",
+                    "enum": [BASELINE, UPDATE],
+                    "description": (
+                        "Snapshot kind (default baseline for"
+                        " the first snapshot, else update)."
+                    ),
+                },
+                "base": {
+                    "type": "string",
+                    "description": (
+                        "Snapshot id, 'baseline', 'latest' or"
+                        " 'previous' (default baseline)."
+                    ),
+                },
+                "current": {
+                    "type": "string",
+                    "description": (
+                        "Snapshot to compare against base, or"
+                        " 'current' for the live schedule"
+                        " (default)."
+                    ),
+                },
+                "activities": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "Schedule activities as for"
+                        " schedule_query. Defaults to the"
+                        " project schedule."
+                    ),
+                },
+                "max_listed": {
+                    "type": "integer",
+                    "description": (
+                        "Longest activity and logic list"
+                        f" returned (default {_MAX_LISTED})."
+                    ),
+                },
             },
+            "required": ["action", "project_id"],
+        }
+
+    def execute_structured(self, **kwargs) -> ToolResult:
+        action = kwargs["action"]
+        project_id = kwargs["project_id"]
+        activities = kwargs.get("activities")
+        try:
+            if action == "snapshot":
+                return self._snapshot(
+                    project_id,
+                    activities,
+                    kwargs.get("label", ""),
+                    kwargs.get("kind"),
+                )
+            elif action == "list":
+                return ToolResult(
+                    {
+                        "project_id": project_id,
+                        "snapshots": [
+                            snapshot.info()
+                            for snapshot in _SNAPSHOTS.snapshots(
+                                project_id
+                            )
+                        ],
+                    }
+                )
+            elif action == "compare":
+                return self._compare(
+                    project_id,
+                    activities,
+                    kwargs.get("base") or BASELINE,
+                    kwargs.get("current") or CURRENT,
+                    kwargs.get("max_listed", _MAX_LISTED),
+                )
+            else:
+                return ToolResult.error(f"Error: Unknown action '{action}'")
+        except Exception as exc:
+            return ToolResult.error(f"Error: {exc}")
+
+    def _snapshot(
+        self,
+        project_id: str,
+        activities: list[dict] | None,
+        label: str,
+        kind: str | None,
+    ) -> ToolResult:
+        if kind is None:
+            kind = (
+                UPDATE if _SNAPSHOTS.snapshots(project_id) else BASELINE
+            )
+        snapshot = current_snapshot(
+            project_id, activities, label=label, kind=kind
+        )
+        _SNAPSHOTS.add(project_id, snapshot)
+        return ToolResult(
+            {"project_id": project_id, "snapshot": snapshot.info()}
+        )
+
+    def _compare(
+        self,
+        project_id: str,
+        activities: list[dict] | None,
+        base_ref: str,
+        current_ref: str,
+        max_listed: int,
+    ) -> ToolResult:
+        snapshots = {}
+        for ref in (base_ref, current_ref):
+            if ref == CURRENT:
+                snapshots[ref] = current_snapshot(
+                    project_id, activities, label=CURRENT
+                )
+            else:
+                snapshots[ref] = _SNAPSHOTS.get(project_id, ref)
+            if snapshots[ref] is None:
+                return ToolResult.error(
+                    f"Error: No snapshot '{ref}' for project"
+                    f" '{project_id}'"
+                )
+        started = time.perf_counter()
+        diff = diff_snapshots(
+            snapshots[base_ref], snapshots[current_ref]
+        )
+        summary = diff.summary(max_listed)
+        delta = diff.to_delta(max_listed)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for key in ("baseline_end", "projected_end"):
+            delta[key] = delta[key].isoformat()
+        return ToolResult(
             {
-                "activity_id": "ACT-006",
-                "activity_name": "Elevator Install",
-                "total_float": 3.0,
-                "free_float": 1.0,
-                "status": "warning",
-            },
-        ]
-        return json.dumps(
-            {"project_id": project_id, "float_report": report},
-            indent=2,
+                "project_id": project_id,
+                **summary,
+                "delta": delta,
+                "elapsed_ms": round(elapsed_ms, 3),
+            }
         )
@@ -1,12 +1,11 @@
 """Site logistics query tool for crane, staging, and headcount."""
 
-import json
 from datetime import date, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class SiteLogisticsQuery(Tool):
+class SiteLogisticsQuery(StructuredTool):
     """Query site logistics data."""
 
     name = "site_logistics_query"
@@ -45,7 +44,7 @@ class SiteLogisticsQuery(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -60,11 +59,11 @@ class SiteLogisticsQuery(Tool):
             elif action == "permits":
                 return self._permits(project_id)
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _crane_schedule(self, project_id: str) -> str:
+    def _crane_schedule(self, project_id: str) -> ToolResult:
         today = date.today()
         entries = [
             {
@@ -122,16 +121,15 @@ class SiteLogisticsQuery(Tool):
                 "status": "scheduled",
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "crane_schedule": entries,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _staging(self, project_id: str) -> str:
+    def _staging(self, project_id: str) -> ToolResult:
         zones = [
             {
                 "zone_id": "STG-A",
@@ -172,18 +170,17 @@ class SiteLogisticsQuery(Tool):
                 "trade": "electrical",
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "staging_zones": zones,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _headcount(
         self, project_id: str, trade: str | None
-    ) -> str:
+    ) -> ToolResult:
         today = date.today()
         counts = [
             {
@@ -223,16 +220,15 @@ class SiteLogisticsQuery(Tool):
             counts = [
                 c for c in counts if c["trade"] == trade
             ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "headcount": counts,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _permits(self, project_id: str) -> str:
+    def _permits(self, project_id: str) -> ToolResult:
         today = date.today()
         permits = [
             {
@@ -280,11 +276,10 @@ class SiteLogisticsQuery(Tool):
                 ],
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "site_permits": permits,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
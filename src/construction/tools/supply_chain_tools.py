@@ -1,12 +1,15 @@
 """Supply chain monitoring tool."""
 
-import json
+import asyncio
 from datetime import UTC, date, datetime, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
+from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.terminal49 import Terminal49Client
 
 
-class SupplyChainMonitor(Tool):
+class SupplyChainMonitor(AsyncTool):
     """Monitor vendor status, shipments, and alternative sources."""
 
     name = "supply_chain_monitor"
@@ -48,7 +51,7 @@ class SupplyChainMonitor(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -57,21 +60,45 @@ class SupplyChainMonitor(Tool):
                     project_id, kwargs.get("vendor_id")
                 )
             elif action == "track_shipment":
-                return self._track_shipment(
-                    project_id, kwargs.get("shipment_id")
-                )
+                shipment_id = kwargs.get("shipment_id")
+                api_key = get_construction_settings().terminal49_api_key
+                if api_key and shipment_id:
+                    return await self._track_shipment_live(
+                        shipment_id, api_key
+                    )
+                return self._track_shipment(project_id, shipment_id)
             elif action == "find_alternatives":
                 return self._find_alternatives(
                     project_id, kwargs.get("material")
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error in supply chain monitor: {exc}"
+            return ToolResult.error(f"Error in supply chain monitor: {exc}")
+
+    async def _track_shipment_live(
+        self, shipment_id: str, api_key: str
+    ) -> ToolResult:
+        client = get_integration_client(Terminal49Client, api_key)
+        shipment, milestones = await asyncio.gather(
+            client.get_shipment(shipment_id),
+            client.get_milestones(shipment_id),
+        )
+        return ToolResult(
+            {
+                "shipments": [
+                    {
+                        "id": shipment_id,
+                        "details": shipment,
+                        "milestones": milestones,
+                    }
+                ]
+            }
+        )
 
     def _vendor_status(
         self, project_id: str, vendor_id: str | None
-    ) -> str:
+    ) -> ToolResult:
         now = datetime.now(UTC).isoformat()
         vendors = [
             {
@@ -113,11 +140,11 @@ class SupplyChainMonitor(Tool):
         ]
         if vendor_id:
             vendors = [v for v in vendors if v["id"] == vendor_id]
-        return json.dumps({"vendors": vendors}, indent=2)
+        return ToolResult({"vendors": vendors})
 
     def _track_shipment(
         self, project_id: str, shipment_id: str | None
-    ) -> str:
+    ) -> ToolResult:
         today = date.today()
         shipments = [
             {
@@ -170,13 +197,13 @@ class SupplyChainMonitor(Tool):
             shipments = [
                 s for s in shipments if s["id"] == shipment_id
             ]
-        return json.dumps({"shipments": shipments}, indent=2)
+        return ToolResult({"shipments": shipments})
 
     def _find_alternatives(
         self, project_id: str, material: str | None
-    ) -> str:
+    ) -> ToolResult:
         if not material:
-            return "Error: material is required for find_alternatives"
+            return ToolResult.error("Error: material is required for find_alternatives")
 
         alternatives = [
             {
@@ -213,11 +240,10 @@ class SupplyChainMonitor(Tool):
                 "confidence": 0.60,
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "material": material,
                 "alternatives": alternatives,
                 "note": "Mock data — production integrates real vendor DB",
-            },
-            indent=2,
+            }
         )
@@ -1,11 +1,13 @@
 """Uptime Institute Tier certification compliance tool."""
 
-import json
 
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
+from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.uptime_institute import UptimeInstituteClient
 
 
-class TierCertification(Tool):
+class TierCertification(AsyncTool):
     """Check Uptime Institute Tier certification compliance."""
 
     name = "tier_certification"
@@ -52,7 +54,7 @@ class TierCertification(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         tier_level = kwargs.get("tier_level", "III")
@@ -67,13 +69,25 @@ class TierCertification(Tool):
             elif action == "fault_tolerance":
                 return self._fault_tolerance(project_id, system)
             elif action == "certification_status":
+                api_key = get_construction_settings().uptime_api_key
+                if api_key:
+                    return await self._certification_status_live(
+                        project_id, api_key
+                    )
                 return self._certification_status(project_id)
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
-    def _tier_requirements(self, tier_level: str) -> str:
+    async def _certification_status_live(
+        self, project_id: str, api_key: str
+    ) -> ToolResult:
+        client = get_integration_client(UptimeInstituteClient, api_key=api_key)
+        status = await client.get_certification_status(project_id)
+        return ToolResult({"project_id": project_id, **status})
+
+    def _tier_requirements(self, tier_level: str) -> ToolResult:
         tiers = {
             "I": {
                 "name": "Tier I — Basic Site Infrastructure",
@@ -177,13 +191,12 @@ class TierCertification(Tool):
             },
         }
         data = tiers.get(tier_level, tiers["III"])
-        return json.dumps(
+        return ToolResult(
             {
                 "tier_level": tier_level,
                 "requirements": data,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _redundancy_check(
@@ -191,7 +204,7 @@ class TierCertification(Tool):
         project_id: str,
         tier_level: str,
         system: str | None,
-    ) -> str:
+    ) -> ToolResult:
         systems = {
             "power": {
                 "system": "power",
@@ -328,22 +341,21 @@ class TierCertification(Tool):
                         overall = "warning"
             if overall == "non_compliant":
                 break
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "tier_level": tier_level,
                 "overall_status": overall,
                 "systems": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _concurrent_maintainability(
         self,
         project_id: str,
         system: str | None,
-    ) -> str:
+    ) -> ToolResult:
         systems = {
             "power": {
                 "system": "power",
@@ -421,21 +433,20 @@ class TierCertification(Tool):
         else:
             checks = systems
         all_maintainable = all(s.get("concurrently_maintainable", False) for s in checks.values())
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "tier_iii_concurrent_maintainability": (all_maintainable),
                 "systems": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _fault_tolerance(
         self,
         project_id: str,
         system: str | None,
-    ) -> str:
+    ) -> ToolResult:
         systems = {
             "power": {
                 "system": "power",
@@ -504,18 +515,17 @@ class TierCertification(Tool):
         else:
             checks = systems
         all_tolerant = all(s.get("fault_tolerant", False) for s in checks.values())
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "tier_iv_fault_tolerant": all_tolerant,
                 "systems": checks,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _certification_status(self, project_id: str) -> str:
-        return json.dumps(
+    def _certification_status(self, project_id: str) -> ToolResult:
+        return ToolResult(
             {
                 "project_id": project_id,
                 "target_tier": "III",
@@ -543,6 +553,5 @@ class TierCertification(Tool):
                     "findings": [],
                 },
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
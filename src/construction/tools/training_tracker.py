@@ -1,12 +1,11 @@
 """Training tracker tool for certifications and compliance."""
 
-import json
 from datetime import date, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class TrainingTracker(Tool):
+class TrainingTracker(StructuredTool):
     """Track worker training certifications and gaps."""
 
     name = "training_tracker"
@@ -47,7 +46,7 @@ class TrainingTracker(Tool):
             "required": ["action"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         try:
             if action == "check_certifications":
@@ -64,13 +63,13 @@ class TrainingTracker(Tool):
                     kwargs.get("project_id", "default")
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error: {exc}"
+            return ToolResult.error(f"Error: {exc}")
 
     def _check_certifications(
         self, worker_id: str | None
-    ) -> str:
+    ) -> ToolResult:
         today = date.today()
         records = [
             {
@@ -127,17 +126,16 @@ class TrainingTracker(Tool):
                 r for r in records
                 if r["worker_id"] == worker_id
             ]
-        return json.dumps(
+        return ToolResult(
             {
                 "certifications": records,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
     def _expiring_soon(
         self, project_id: str, days_ahead: int
-    ) -> str:
+    ) -> ToolResult:
         today = date.today()
         expiring = [
             {
@@ -184,17 +182,16 @@ class TrainingTracker(Tool):
             e for e in expiring
             if e["days_until_expiry"] <= days_ahead
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "days_ahead": days_ahead,
                 "expiring_certifications": expiring,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
 
-    def _training_gaps(self, project_id: str) -> str:
+    def _training_gaps(self, project_id: str) -> ToolResult:
         gaps = [
             {
                 "gap_type": "competent_person_shortage",
@@ -242,11 +239,10 @@ class TrainingTracker(Tool):
                 ),
             },
         ]
-        return json.dumps(
+        return ToolResult(
             {
                 "project_id": project_id,
                 "training_gaps": gaps,
                 "note": "Mock data",
-            },
-            indent=2,
+            }
         )
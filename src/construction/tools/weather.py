@@ -1,15 +1,14 @@
 """Weather forecast tool using OpenWeatherMap API."""
 
-import json
 from datetime import UTC, datetime, timedelta
 
-import httpx
-
-from ai_agent.tools import Tool
+from ai_agent.tools import AsyncTool, ToolResult
 from construction.config import get_construction_settings
+from construction.integrations.clients import get_integration_client
+from construction.integrations.openweathermap import OpenWeatherMapClient
 
 
-class WeatherForecast(Tool):
+class WeatherForecast(AsyncTool):
     """Get weather forecast for a construction site location."""
 
     name = "weather_forecast"
@@ -40,7 +39,7 @@ class WeatherForecast(Tool):
             "required": ["latitude", "longitude"],
         }
 
-    def execute(self, **kwargs) -> str:
+    async def aexecute(self, **kwargs) -> ToolResult:
         latitude = kwargs["latitude"]
         longitude = kwargs["longitude"]
         days = min(kwargs.get("days", 14), 14)
@@ -48,28 +47,23 @@ class WeatherForecast(Tool):
         settings = get_construction_settings()
 
         if settings.openweathermap_api_key:
-            return self._fetch_live(
+            return await self._fetch_live(
                 latitude, longitude, days, settings.openweathermap_api_key
             )
         return self._mock_forecast(latitude, longitude, days)
 
-    def _fetch_live(
+    async def _fetch_live(
         self,
         lat: float,
         lon: float,
         days: int,
         api_key: str,
-    ) -> str:
+    ) -> ToolResult:
         try:
-            url = (
-                "https://api.openweathermap.org/data/3.0/onecall"
-                f"?lat={lat}&lon={lon}"
-                f"&exclude=minutely,hourly"
-                f"&units=imperial&appid={api_key}"
+            client = get_integration_client(
+                OpenWeatherMapClient, api_key, max_retries=1, timeout=10
             )
-            resp = httpx.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
+            data = await client.get_daily_forecast(lat, lon)
 
             daily = data.get("daily", [])[:days]
             alerts = data.get("alerts", [])
@@ -99,16 +93,16 @@ class WeatherForecast(Tool):
                     "description": alert.get("description", ""),
                 })
 
-            return json.dumps(result, indent=2)
+            return ToolResult(result)
         except Exception as exc:
-            return f"Error fetching weather: {exc}"
+            return ToolResult.error(f"Error fetching weather: {exc}")
 
     def _mock_forecast(
         self,
         lat: float,
         lon: float,
         days: int,
-    ) -> str:
+    ) -> ToolResult:
         now = datetime.now(UTC)
         forecast = []
         for i in range(days):
@@ -143,4 +137,4 @@ class WeatherForecast(Tool):
             "alerts": alerts,
             "note": "Mock data — no API key configured",
         }
-        return json.dumps(result, indent=2)
+        return ToolResult(result)
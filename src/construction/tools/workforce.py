@@ -1,12 +1,11 @@
 """Workforce query tool for crew status, productivity, and certs."""
 
-import json
 from datetime import date, timedelta
 
-from ai_agent.tools import Tool
+from ai_agent.tools import StructuredTool, ToolResult
 
 
-class WorkforceQuery(Tool):
+class WorkforceQuery(StructuredTool):
     """Query workforce data including crew status and productivity."""
 
     name = "workforce_query"
@@ -48,7 +47,7 @@ class WorkforceQuery(Tool):
             "required": ["action", "project_id"],
         }
 
-    def execute(self, **kwargs) -> str:
+    def execute_structured(self, **kwargs) -> ToolResult:
         action = kwargs["action"]
         project_id = kwargs["project_id"]
         try:
@@ -69,13 +68,13 @@ class WorkforceQuery(Tool):
                     project_id, kwargs.get("trade")
                 )
             else:
-                return f"Error: unknown action '{action}'"
+                return ToolResult.error(f"Error: unknown action '{action}'")
         except Exception as exc:
-            return f"Error in workforce query: {exc}"
+            return ToolResult.error(f"Error in workforce query: {exc}")
 
     def _crew_status(
         self, project_id: str, trade: str | None
-    ) -> str:
+    ) -> ToolResult:
         crews = [
             {
                 "trade": "electrical",
@@ -116,13 +115,13 @@ class WorkforceQuery(Tool):
         ]
         if trade:
             crews = [c for c in crews if c["trade"] == trade]
-        return json.dumps(
-            {"crews": crews, "note": "Mock data"}, indent=2
+        return ToolResult(
+            {"crews": crews, "note": "Mock data"}
         )
 
     def _productivity(
         self, project_id: str, trade: str | None
-    ) -> str:
+    ) -> ToolResult:
         metrics = [
             {
                 "trade": "electrical",
@@ -161,14 +160,13 @@ class WorkforceQuery(Tool):
             metrics = [
                 m for m in metrics if m["trade"] == trade
             ]
-        return json.dumps(
-            {"productivity": metrics, "note": "Mock data"},
-            indent=2,
+        return ToolResult(
+            {"productivity": metrics, "note": "Mock data"}
         )
 
     def _certifications(
         self, project_id: str, worker_id: str | None
-    ) -> str:
+    ) -> ToolResult:
         today = date.today()
         certs = [
             {
@@ -216,14 +214,13 @@ class WorkforceQuery(Tool):
             certs = [
                 c for c in certs if c["worker_id"] == worker_id
             ]
-        return json.dumps(
-            {"certifications": certs, "note": "Mock data"},
-            indent=2,
+        return ToolResult(
+            {"certifications": certs, "note": "Mock data"}
         )
 
     def _labor_forecast(
         self, project_id: str, trade: str | None
-    ) -> str:
+    ) -> ToolResult:
         forecasts = [
             {
                 "trade": "electrical",
@@ -262,7 +259,6 @@ class WorkforceQuery(Tool):
             forecasts = [
                 f for f in forecasts if f["trade"] == trade
             ]
-        return json.dumps(
-            {"labor_forecast": forecasts, "note": "Mock data"},
-            indent=2,
+        return ToolResult(
+            {"labor_forecast": forecasts, "note": "Mock data"}
         )
@@ -41,7 +41,7 @@ def mock_shared_memory():
     mem.get_budget_status.return_value = {}
     mem.get_safety_readiness.return_value = 85.0
     mem.get_trir_current.return_value = 1.2
-    mem.check_dedup.return_value = False
+    mem.claim_dedup.return_value = True
     return mem
 
 
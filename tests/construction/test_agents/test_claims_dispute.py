@@ -1,7 +1,7 @@
 """Tests for the Claims & Dispute agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.claims_dispute import (
     ClaimsDisputeAgent,
@@ -50,7 +50,7 @@ def test_system_prompt_set(mock_agent_cls):
 
 @patch("construction.agents.base.Agent")
 def test_tools_registered(mock_agent_cls):
-    """Agent registers claims query tool."""
+    """Agent registers the claims query and schedule compare tools."""
     agent = ClaimsDisputeAgent(
         settings=_make_settings()
     )
@@ -58,7 +58,8 @@ def test_tools_registered(mock_agent_cls):
         t.name for t in agent._tools._tools.values()
     ]
     assert "claims_query" in tool_names
-    assert len(tool_names) == 1
+    assert "schedule_compare" in tool_names
+    assert len(tool_names) == 2
 
 
 @patch("construction.agents.base.Agent")
@@ -73,13 +74,13 @@ async def test_run_returns_agent_event(mock_agent_cls):
     agent = ClaimsDisputeAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(
         context={"project_id": "PRJ-001"}
     )
 
-    agent.chat.assert_called_once()
+    agent.achat.assert_awaited_once()
     assert event.source_agent == "claims_dispute"
     assert event.event_type == "claims_status"
     assert event.severity == "info"
@@ -101,7 +102,7 @@ async def test_run_urgent_notice_critical(mock_agent_cls):
     agent = ClaimsDisputeAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -116,7 +117,7 @@ async def test_run_handles_non_json(mock_agent_cls):
     agent = ClaimsDisputeAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="No pending claims activity."
     )
 
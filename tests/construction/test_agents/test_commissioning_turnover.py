@@ -1,7 +1,7 @@
 """Tests for the Commissioning & Turnover agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.commissioning_turnover import (
     CommissioningTurnoverAgent,
@@ -77,13 +77,13 @@ async def test_run_returns_agent_event(mock_agent_cls):
     agent = CommissioningTurnoverAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(
         context={"project_id": "PRJ-001"}
     )
 
-    agent.chat.assert_called_once()
+    agent.achat.assert_awaited_once()
     assert event.source_agent == "commissioning_turnover"
     assert event.event_type == "commissioning_status"
     assert event.severity == "info"
@@ -103,7 +103,7 @@ async def test_run_blocked_tests_warning(mock_agent_cls):
     agent = CommissioningTurnoverAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -118,7 +118,7 @@ async def test_run_handles_non_json(mock_agent_cls):
     agent = CommissioningTurnoverAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="All systems ready for commissioning."
     )
 
@@ -1,10 +1,13 @@
 """Tests for the CriticalPathOptimizer agent."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from construction.agents.critical_path import CriticalPathOptimizer
+from construction.tools import schedule
+from construction.tools.schedule import ScheduleQueryTool, ScheduleResequenceTool
 
 
 def _make_settings():
@@ -40,7 +43,10 @@ def test_tools_registered(mock_agent_cls):
     agent = CriticalPathOptimizer(settings=_make_settings())
     assert agent._tools.get("schedule_query") is not None
     assert agent._tools.get("monte_carlo_simulation") is not None
-    assert len(agent._tools) == 2
+    assert agent._tools.get("schedule_what_if") is not None
+    assert agent._tools.get("schedule_resequence") is not None
+    assert agent._tools.get("schedule_compare") is not None
+    assert len(agent._tools) == 5
 
 
 @pytest.mark.asyncio
@@ -134,3 +140,78 @@ async def test_run_creates_approval_for_delay(mock_agent_cls):
     assert approval["agent_name"] == "critical_path"
     assert approval["action_type"] == "schedule_resequence"
     assert approval["status"] == "pending"
+    # Fast-tracking MEP rough-in behind steel erection saves 11 days
+    best = data["resequencing_options"][0]
+    assert best["potential_savings_days"] == 11
+    assert best["activity_ids"] == ["ACT-003"]
+    assert approval["impact"]["schedule_delta_days"] == -11
+
+
+@pytest.mark.asyncio
+@patch("construction.agents.base.Agent")
+async def test_run_what_if_for_affected_activities(mock_agent_cls):
+    agent = CriticalPathOptimizer(settings=_make_settings())
+    agent.pubsub = None
+    agent.shared_memory = None
+
+    event = await agent.run(context={
+        "project_id": "PROJ-001",
+        "delay_days": 5,
+        "affected_activities": ["ACT-002"],
+    })
+
+    what_if = event.data["what_if"]
+    assert what_if["percentiles"]["p80"]["delta_days"] > 0
+    assert 0 < what_if["probability_later"] <= 1
+    # Run on the project's schedule, whose ids schedule_query reports
+    assert any(
+        "What-if" in line and "of 6 activities" in line
+        for line in event.transparency_log
+    )
+
+
+@pytest.mark.asyncio
+@patch("construction.agents.base.Agent")
+async def test_run_reports_changes_since_last_snapshot(mock_agent_cls):
+    agent = CriticalPathOptimizer(settings=_make_settings())
+    agent.pubsub = None
+    agent.shared_memory = None
+    schedule._SCHEDULES.clear()
+    schedule._SNAPSHOTS.clear()
+
+    first = await agent.run(context={"project_id": "PROJ-SNAP"})
+    assert "schedule_changes" not in first.data
+    assert len(schedule._SNAPSHOTS.snapshots("PROJ-SNAP")) == 1
+
+    ScheduleQueryTool().execute_structured(
+        action="update_activity",
+        project_id="PROJ-SNAP",
+        activity_id="ACT-003",
+        data={"duration": 25},
+    )
+    second = await agent.run(context={"project_id": "PROJ-SNAP"})
+
+    changes = second.data["schedule_changes"]
+    assert changes["compared_to"]["kind"] == "baseline"
+    assert changes["project_finish_delta_days"] > 0
+    assert changes["counts"]["changed"] >= 1
+    assert len(schedule._SNAPSHOTS.snapshots("PROJ-SNAP")) == 2
+
+
+@pytest.mark.asyncio
+@patch("construction.agents.base.Agent")
+async def test_run_keeps_schedule_tools_off_the_event_loop(mock_agent_cls):
+    agent = CriticalPathOptimizer(settings=_make_settings())
+    agent.pubsub = None
+    agent.shared_memory = None
+    threads = []
+    search = ScheduleResequenceTool.execute_structured
+
+    def record_thread(self, **kwargs):
+        threads.append(threading.current_thread())
+        return search(self, **kwargs)
+
+    with patch.object(ScheduleResequenceTool, "execute_structured", record_thread):
+        await agent.run(context={"project_id": "PROJ-001", "delay_days": 3})
+
+    assert threads and threading.main_thread() not in threads
@@ -1,7 +1,7 @@
 """Tests for the Environmental & Sustainability agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.environmental_sustainability import (
     EnvironmentalSustainabilityAgent,
@@ -76,13 +76,13 @@ async def test_run_returns_agent_event(mock_agent_cls):
     agent = EnvironmentalSustainabilityAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(
         context={"project_id": "PRJ-001"}
     )
 
-    agent.chat.assert_called_once()
+    agent.achat.assert_awaited_once()
     assert event.source_agent == "environmental_sustainability"
     assert event.event_type == "environmental_status"
     assert event.severity == "info"
@@ -100,7 +100,7 @@ async def test_run_permit_violation_critical(mock_agent_cls):
     agent = EnvironmentalSustainabilityAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -115,7 +115,7 @@ async def test_run_handles_non_json(mock_agent_cls):
     agent = EnvironmentalSustainabilityAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="All permits current."
     )
 
@@ -1,7 +1,7 @@
 """Tests for the Financial Intelligence agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.financial_intelligence import (
     FinancialIntelligenceAgent,
@@ -81,14 +81,14 @@ async def test_run_returns_agent_event(mock_agent_cls):
     agent = FinancialIntelligenceAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(
         context={"project_id": "PRJ-001"}
     )
 
-    agent.chat.assert_called_once()
-    call_arg = agent.chat.call_args[0][0]
+    agent.achat.assert_awaited_once()
+    call_arg = agent.achat.call_args[0][0]
     assert "PRJ-001" in call_arg
 
     assert event.source_agent == "financial_intelligence"
@@ -114,7 +114,7 @@ async def test_run_critical_alert(mock_agent_cls):
     agent = FinancialIntelligenceAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -129,7 +129,7 @@ async def test_run_handles_non_json_response(mock_agent_cls):
     agent = FinancialIntelligenceAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="Project is on budget. No concerns."
     )
 
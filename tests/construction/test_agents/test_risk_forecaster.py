@@ -1,7 +1,7 @@
 """Tests for the Risk Forecaster agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.risk_forecaster import RiskForecasterAgent
 
@@ -74,12 +74,12 @@ async def test_run_returns_agent_event(mock_agent_cls):
     })
 
     agent = RiskForecasterAgent(settings=_make_settings())
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(context={"project_id": "PRJ-001"})
 
-    agent.chat.assert_called_once()
-    call_arg = agent.chat.call_args[0][0]
+    agent.achat.assert_awaited_once()
+    call_arg = agent.achat.call_args[0][0]
     assert "PRJ-001" in call_arg
 
     assert event.source_agent == "risk_forecaster"
@@ -108,7 +108,7 @@ async def test_run_critical_safety_risk(mock_agent_cls):
     })
 
     agent = RiskForecasterAgent(settings=_make_settings())
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -121,7 +121,7 @@ async def test_run_critical_safety_risk(mock_agent_cls):
 async def test_run_handles_non_json_response(mock_agent_cls):
     """run() handles non-JSON responses gracefully."""
     agent = RiskForecasterAgent(settings=_make_settings())
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="No significant risks identified at this time."
     )
 
@@ -1,7 +1,7 @@
 """Tests for the Safety Compliance agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.safety_compliance import (
     SafetyComplianceAgent,
@@ -83,13 +83,13 @@ async def test_run_returns_agent_event(mock_agent_cls):
     agent = SafetyComplianceAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(
         context={"project_id": "PRJ-001"}
     )
 
-    agent.chat.assert_called_once()
+    agent.achat.assert_awaited_once()
     assert event.source_agent == "safety_compliance"
     assert event.event_type == "safety_status"
     assert event.severity == "info"
@@ -111,7 +111,7 @@ async def test_run_stop_work_critical(mock_agent_cls):
     agent = SafetyComplianceAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -136,7 +136,7 @@ async def test_run_exposure_warning(mock_agent_cls):
     agent = SafetyComplianceAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -159,7 +159,7 @@ async def test_run_training_expired_warning(mock_agent_cls):
     agent = SafetyComplianceAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -172,7 +172,7 @@ async def test_run_handles_non_json(mock_agent_cls):
     agent = SafetyComplianceAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="Site is safe, no issues found."
     )
 
@@ -1,7 +1,7 @@
 """Tests for the Site Logistics agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.site_logistics import (
     SiteLogisticsAgent,
@@ -74,13 +74,13 @@ async def test_run_returns_agent_event(mock_agent_cls):
     agent = SiteLogisticsAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(
         context={"project_id": "PRJ-001"}
     )
 
-    agent.chat.assert_called_once()
+    agent.achat.assert_awaited_once()
     assert event.source_agent == "site_logistics"
     assert event.event_type == "site_logistics_status"
     assert event.severity == "info"
@@ -98,7 +98,7 @@ async def test_run_crane_conflict_warning(mock_agent_cls):
     agent = SiteLogisticsAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -113,7 +113,7 @@ async def test_run_handles_non_json(mock_agent_cls):
     agent = SiteLogisticsAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="Site operations running smoothly."
     )
 
@@ -1,7 +1,7 @@
 """Tests for the Stakeholder Communication agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.stakeholder_communication import (
     StakeholderCommunicationAgent,
@@ -74,7 +74,7 @@ async def test_run_returns_agent_event(mock_agent_cls):
     agent = StakeholderCommunicationAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(
         context={
@@ -83,8 +83,8 @@ async def test_run_returns_agent_event(mock_agent_cls):
         }
     )
 
-    agent.chat.assert_called_once()
-    call_arg = agent.chat.call_args[0][0]
+    agent.achat.assert_awaited_once()
+    call_arg = agent.achat.call_args[0][0]
     assert "PRJ-001" in call_arg
     assert "owner_update" in call_arg
 
@@ -104,11 +104,11 @@ async def test_run_default_action(mock_agent_cls):
     agent = StakeholderCommunicationAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     await agent.run()
 
-    call_arg = agent.chat.call_args[0][0]
+    call_arg = agent.achat.call_args[0][0]
     assert "owner_update" in call_arg
 
 
@@ -118,7 +118,7 @@ async def test_run_handles_non_json_response(mock_agent_cls):
     agent = StakeholderCommunicationAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="Draft report attached for review."
     )
 
@@ -137,7 +137,7 @@ async def test_run_no_cross_agent(mock_agent_cls):
     agent = StakeholderCommunicationAgent(
         settings=_make_settings()
     )
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -1,7 +1,7 @@
 """Tests for the Workforce & Labor agent."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.agents.workforce_labor import (
     WorkforceLaborAgent,
@@ -77,14 +77,14 @@ async def test_run_returns_agent_event(mock_agent_cls):
     })
 
     agent = WorkforceLaborAgent(settings=_make_settings())
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run(
         context={"project_id": "PRJ-001"}
     )
 
-    agent.chat.assert_called_once()
-    call_arg = agent.chat.call_args[0][0]
+    agent.achat.assert_awaited_once()
+    call_arg = agent.achat.call_args[0][0]
     assert "PRJ-001" in call_arg
 
     assert event.source_agent == "workforce_labor"
@@ -110,7 +110,7 @@ async def test_run_critical_labor_gap(mock_agent_cls):
     })
 
     agent = WorkforceLaborAgent(settings=_make_settings())
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -133,7 +133,7 @@ async def test_run_critical_expired_cert(mock_agent_cls):
     })
 
     agent = WorkforceLaborAgent(settings=_make_settings())
-    agent.chat = MagicMock(return_value=mock_response)
+    agent.achat = AsyncMock(return_value=mock_response)
 
     event = await agent.run()
 
@@ -145,7 +145,7 @@ async def test_run_critical_expired_cert(mock_agent_cls):
 async def test_run_handles_non_json_response(mock_agent_cls):
     """run() handles non-JSON responses gracefully."""
     agent = WorkforceLaborAgent(settings=_make_settings())
-    agent.chat = MagicMock(
+    agent.achat = AsyncMock(
         return_value="All crews performing well. No issues."
     )
 
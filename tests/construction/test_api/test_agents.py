@@ -53,3 +53,16 @@ async def test_get_agent_history():
         assert isinstance(data, list)
         assert len(data) >= 1
         assert data[0]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_get_tool_cache_stats():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        response = await client.get(
+            "/api/agents/tool-cache"
+        )
+        assert response.status_code == 200
+        assert isinstance(response.json(), dict)
@@ -3,7 +3,18 @@
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from ai_agent.tool_cache import CachePolicy, ToolResultCache
 from construction.api.app import app
+from construction.scheduling.service import (
+    SIMULATION_CACHE_NAME,
+    SimulationService,
+    get_simulation_service,
+)
+from construction.scheduling.snapshot import SnapshotStore
+from construction.scheduling.versions import (
+    ScheduleVersionService,
+    get_version_service,
+)
 
 
 @pytest.mark.asyncio
@@ -18,8 +29,10 @@ async def test_critical_path():
         assert response.status_code == 200
         data = response.json()
         assert "activities" in data
-        assert data["total_duration_days"] == 120
+        assert data["total_duration_days"] == 76
         assert len(data["activities"]) >= 1
+        assert all(a["is_critical"] for a in data["activities"])
+        assert data["project_finish"] >= data["project_start"]
 
 
 @pytest.mark.asyncio
@@ -58,3 +71,63 @@ async def test_float_report():
         assert len(data) >= 1
         assert "activity_id" in data[0]
         assert "status" in data[0]
+
+
+@pytest.mark.asyncio
+async def test_simulate_reuses_identical_runs():
+    service = SimulationService(
+        ToolResultCache({SIMULATION_CACHE_NAME: CachePolicy(ttl=60)})
+    )
+    app.dependency_overrides[get_simulation_service] = lambda: service
+    transport = ASGITransport(app=app)
+    try:
+        async with AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            body = {"project_id": "test-project", "iterations": 500}
+            first = await client.post("/api/schedule/simulate", json=body)
+            second = await client.post("/api/schedule/simulate", json=body)
+            stats = await client.get("/api/schedule/simulate/stats")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.json()["fingerprint"] == second.json()["fingerprint"]
+    assert first.json()["p80_completion"] == second.json()["p80_completion"]
+    assert stats.json() == {"hits": 1, "misses": 1, "coalesced": 0}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_and_compare():
+    versions = ScheduleVersionService(SnapshotStore(), persist=False)
+    app.dependency_overrides[get_version_service] = lambda: versions
+    transport = ASGITransport(app=app)
+    try:
+        async with AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            missing = await client.get(
+                "/api/schedule/compare",
+                params={"project_id": "snap-project"},
+            )
+            taken = await client.post(
+                "/api/schedule/snapshots",
+                json={"project_id": "snap-project", "label": "Baseline"},
+            )
+            listed = await client.get(
+                "/api/schedule/snapshots",
+                params={"project_id": "snap-project"},
+            )
+            compared = await client.get(
+                "/api/schedule/compare",
+                params={"project_id": "snap-project"},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert missing.status_code == 404
+    assert taken.json()["kind"] == "baseline"
+    assert [s["id"] for s in listed.json()] == [taken.json()["id"]]
+    data = compared.json()
+    assert data["base"]["id"] == taken.json()["id"]
+    assert data["counts"]["changed"] == 0
+    assert data["delta"]["delta_days"] == 0
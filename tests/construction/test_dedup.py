@@ -0,0 +1,110 @@
+"""Tests for atomic alert deduplication."""
+
+import asyncio
+
+from construction.redis_.dedup import AlertDeduplicator
+from construction.redis_.pubsub import AgentPubSub
+
+
+class FakeRedis:
+    """The commands the deduplicator uses, counting round trips."""
+
+    def __init__(self):
+        self.keys: dict[str, int] = {}
+        self.published: list[tuple[str, str]] = []
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self):
+        return None
+
+    async def set(self, name, value, nx=False, ex=None):
+        # Yield like a network call, so concurrent claims interleave
+        await asyncio.sleep(0)
+        if nx and name in self.keys:
+            return None
+        self.keys[name] = ex * 1000
+        return True
+
+    async def pttl(self, name):
+        return self.keys.get(name, -2)
+
+    def register_script(self, script):
+        async def run(keys, args):
+            self.round_trips += 1
+            ttl, channel, payload = args
+            if await self.set(keys[0], "1", nx=True, ex=ttl):
+                self.published.append((channel, payload))
+                return 1
+            return 0
+
+        return run
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._calls.append((name, args, kwargs))
+
+    async def execute(self):
+        self._redis.round_trips += 1
+        return [await getattr(self._redis, n)(*a, **k) for n, a, k in self._calls]
+
+
+async def test_concurrent_claims_have_one_winner():
+    redis = FakeRedis()
+    workers = [AlertDeduplicator(redis, ttl=60) for _ in range(5)]
+
+    results = await asyncio.gather(*(worker.claim("abc") for worker in workers))
+
+    assert sorted(results) == [False, False, False, False, True]
+    assert redis.keys == {"dedup:abc": 60_000}
+
+
+async def test_front_cache_skips_round_trips():
+    redis = FakeRedis()
+    dedup = AlertDeduplicator(redis, ttl=60, max_entries=2)
+
+    assert await dedup.claim("a") is True
+    assert await dedup.claim("a") is False
+    assert redis.round_trips == 1
+    # Evicted from the front cache, but Redis still has it
+    await dedup.claim("b")
+    await dedup.claim("c")
+    assert await dedup.claim("a") is False
+    assert redis.round_trips == 4
+
+
+async def test_claim_many_is_one_round_trip():
+    redis = FakeRedis()
+    dedup = AlertDeduplicator(redis, ttl=60)
+    await AlertDeduplicator(redis, ttl=60).claim("seen")
+
+    claimed = await dedup.claim_many(["x", "seen", "y", "x"])
+
+    assert claimed == [True, False, True, False]
+    assert redis.round_trips == 2
+
+
+async def test_publish_once_dedups_and_publishes_atomically():
+    redis = FakeRedis()
+    pubsub = AgentPubSub(redis)
+
+    for _ in range(3):
+        await pubsub.publish("channel:escalation", {"event": "stop_work"})
+    await AgentPubSub(redis).publish("channel:escalation", {"event": "stop_work"})
+
+    assert redis.published == [("channel:escalation", '{"event": "stop_work"}')]
+    # The first publisher's repeats never left the process
+    assert redis.round_trips == 2
@@ -1,6 +1,6 @@
 """E2E test: OSHA inspection readiness check."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -21,13 +21,13 @@ async def test_osha_readiness_check(
         "construction.agents.base.Agent"
     ) as mock_agent_cls:
         mock_agent_inst = MagicMock()
-        mock_agent_inst.chat.return_value = (
+        mock_agent_inst.achat = AsyncMock(return_value=(
             '{"safety_metrics": {"trir": 1.2},'
             ' "focus_four_status": {},'
             ' "stop_work_recommendations": [],'
             ' "training_alerts": {"expired": []},'
             ' "exposure_monitoring": {"exceedances": []}}'
-        )
+        ))
         mock_agent_cls.return_value = mock_agent_inst
 
         agent = SafetyComplianceAgent(
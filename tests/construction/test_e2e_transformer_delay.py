@@ -127,7 +127,7 @@ async def test_dedup_prevents_duplicate_alerts(
     mock_pubsub,
 ):
     """Test that duplicate alerts within 4h TTL are suppressed."""
-    mock_shared_memory.check_dedup.return_value = True
+    mock_shared_memory.claim_dedup.return_value = False
 
     event = AgentEvent(
         event_id="evt-dup-001",
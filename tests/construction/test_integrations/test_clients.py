@@ -0,0 +1,64 @@
+"""Tests for the per-loop integration client registry."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from ai_agent.tools import shutdown_tool_bridge
+from construction.integrations.clients import (
+    aclose_integration_clients,
+    get_integration_client,
+)
+from construction.integrations.openweathermap import OpenWeatherMapClient
+from construction.integrations.osha_api import OSHAClient
+from construction.tools.weather import WeatherForecast
+
+
+async def test_client_shared_within_loop_per_arguments():
+    first = get_integration_client(OpenWeatherMapClient, "key-a", timeout=10)
+
+    assert get_integration_client(OpenWeatherMapClient, "key-a", timeout=10) is first
+    assert get_integration_client(OpenWeatherMapClient, "key-b", timeout=10) is not first
+    assert get_integration_client(OSHAClient) is not first
+    await aclose_integration_clients()
+
+
+async def test_each_loop_gets_its_own_client():
+    here = get_integration_client(OSHAClient)
+
+    async def other_loop():
+        client = get_integration_client(OSHAClient)
+        await aclose_integration_clients()
+        return client
+
+    elsewhere = await asyncio.to_thread(asyncio.run, other_loop())
+
+    assert elsewhere is not here
+    assert get_integration_client(OSHAClient) is here
+    await aclose_integration_clients()
+
+
+async def test_aclose_closes_and_forgets_the_loop_clients():
+    client = get_integration_client(OSHAClient)
+    await client._get_client()
+
+    await aclose_integration_clients()
+
+    assert client._client.is_closed
+    assert get_integration_client(OSHAClient) is not client
+    await aclose_integration_clients()
+
+
+@patch("construction.tools.weather.get_construction_settings")
+@patch.object(OpenWeatherMapClient, "get_daily_forecast", autospec=True)
+def test_sync_tool_calls_reuse_one_client(mock_forecast, mock_settings):
+    """Sync calls run on the bridge loop, so they share its client."""
+    mock_settings.return_value = MagicMock(openweathermap_api_key="test-key-123")
+    mock_forecast.return_value = {"daily": [], "alerts": []}
+
+    tool = WeatherForecast()
+    tool.execute(latitude=29.76, longitude=-95.37)
+    tool.execute(latitude=29.76, longitude=-95.37)
+
+    first, second = (call.args[0] for call in mock_forecast.await_args_list)
+    assert first is second
+    shutdown_tool_bridge(aclose_integration_clients)
@@ -0,0 +1,261 @@
+"""Tests for the streaming XER and MSPDI schedule readers."""
+
+import uuid
+from datetime import date
+
+import pytest
+
+from construction.integrations.schedule_files import (
+    MSPDIScheduleSource,
+    XERScheduleSource,
+    schedule_file_source,
+)
+from construction.integrations.schedule_import import ScheduleImporter
+from construction.scheduling.cpm import CPMNetwork
+
+# Monday-Friday 08:00-16:00 (day_hr_cnt 8), 2026-12-25 (serial 46381) off
+_CLNDR_8 = (
+    "(0||CalendarData()((0||DaysOfWeek()((0||1()())"
+    + "".join(f"(0||{d}()((0||0(s|08:00|f|16:00)())))" for d in range(2, 7))
+    + "(0||7()()))(0||VIEW(ShowTotal|Y)())(0||Exceptions()((0||0(d|46381)()))))"
+)
+# Monday-Thursday 10-hour days
+_CLNDR_10 = (
+    "(0||CalendarData()((0||DaysOfWeek()((0||1()())"
+    + "".join(f"(0||{d}()((0||0(s|07:00|f|17:00)())))" for d in range(2, 6))
+    + "(0||6()())(0||7()())))(0||Exceptions()()))"
+)
+
+
+def _xer(*tables):
+    lines = ["ERMHDR\t19.12\t2026-03-01\tProject\tadmin"]
+    for name, fields, rows in tables:
+        lines.append(f"%T\t{name}")
+        lines.append("%F\t" + "\t".join(fields))
+        lines.extend("%R\t" + "\t".join(row) for row in rows)
+    lines.append("%E")
+    return "\r\n".join(lines) + "\r\n"
+
+
+XER = _xer(
+    (
+        "CALENDAR",
+        ["clndr_id", "clndr_name", "day_hr_cnt", "clndr_data"],
+        [["1", "Standard", "8", _CLNDR_8], ["2", "4x10", "10", _CLNDR_10]],
+    ),
+    (
+        "TASK",
+        [
+            "task_id",
+            "proj_id",
+            "clndr_id",
+            "task_code",
+            "task_name",
+            "total_float_hr_cnt",
+            "early_start_date",
+            "early_end_date",
+        ],
+        [
+            ["100", "7", "1", "A1000", "Excavate", "0", "2026-03-02 08:00", "2026-03-06 16:00"],
+            ["101", "7", "2", "A1010", "Footings", "40", "2026-03-09 07:00", "2026-03-12 17:00"],
+            ["102", "7", "1", "A1020", "Backfill", "", "2026-03-16 08:00", "2026-03-17 16:00"],
+            ["900", "8", "1", "B1000", "Other project", "0", "", ""],
+        ],
+    ),
+    (
+        "TASKPRED",
+        ["task_pred_id", "task_id", "pred_task_id", "pred_type", "lag_hr_cnt"],
+        [
+            ["1", "101", "100", "PR_FS", "16"],
+            ["2", "102", "101", "PR_SS", "20"],
+            ["3", "102", "900", "PR_FS", "0"],
+        ],
+    ),
+)
+
+MSPDI = """<?xml version="1.0" encoding="UTF-8"?>
+<Project xmlns="http://schemas.microsoft.com/project">
+  <Name>Data Hall 2</Name>
+  <CalendarUID>1</CalendarUID>
+  <MinutesPerDay>600</MinutesPerDay>
+  <Calendars>
+    <Calendar>
+      <UID>1</UID><Name>Standard</Name><IsBaseCalendar>1</IsBaseCalendar>
+      <WeekDays>
+        <WeekDay><DayType>1</DayType><DayWorking>0</DayWorking></WeekDay>
+        <WeekDay><DayType>2</DayType><DayWorking>1</DayWorking></WeekDay>
+        <WeekDay><DayType>3</DayType><DayWorking>1</DayWorking></WeekDay>
+        <WeekDay><DayType>4</DayType><DayWorking>1</DayWorking></WeekDay>
+        <WeekDay><DayType>5</DayType><DayWorking>1</DayWorking></WeekDay>
+        <WeekDay><DayType>6</DayType><DayWorking>1</DayWorking></WeekDay>
+        <WeekDay><DayType>7</DayType><DayWorking>0</DayWorking></WeekDay>
+      </WeekDays>
+      <Exceptions>
+        <Exception>
+          <TimePeriod><FromDate>2026-12-24T00:00:00</FromDate>
+          <ToDate>2026-12-25T23:59:00</ToDate></TimePeriod>
+          <DayWorking>0</DayWorking>
+        </Exception>
+      </Exceptions>
+    </Calendar>
+    <Calendar>
+      <UID>2</UID><Name>Six day</Name><BaseCalendarUID>1</BaseCalendarUID>
+      <WeekDays>
+        <WeekDay><DayType>7</DayType><DayWorking>1</DayWorking></WeekDay>
+      </WeekDays>
+    </Calendar>
+  </Calendars>
+  <Tasks>
+    <Task><UID>0</UID><ID>0</ID><Name>Data Hall 2</Name><Summary>1</Summary></Task>
+    <Task>
+      <UID>1</UID><ID>1</ID><Name>Set switchgear</Name>
+      <Start>2026-03-02T08:00:00</Start><Finish>2026-03-06T18:00:00</Finish>
+      <Duration>PT50H0M0S</Duration><TotalSlack>0</TotalSlack><Critical>1</Critical>
+    </Task>
+    <Task>
+      <UID>2</UID><ID>2</ID><Name>Terminate feeders</Name>
+      <Duration>PT20H0M0S</Duration><TotalSlack>12000</TotalSlack><Critical>0</Critical>
+      <CalendarUID>2</CalendarUID>
+      <PredecessorLink>
+        <PredecessorUID>1</PredecessorUID><Type>3</Type>
+        <LinkLag>12000</LinkLag><LagFormat>7</LagFormat>
+      </PredecessorLink>
+      <PredecessorLink>
+        <PredecessorUID>3</PredecessorUID><Type>1</Type>
+        <LinkLag>500</LinkLag><LagFormat>19</LagFormat>
+      </PredecessorLink>
+    </Task>
+    <Task>
+      <UID>3</UID><ID>3</ID><Name>Pull cable</Name>
+      <Duration>PT40H0M0S</Duration><TotalSlack>0</TotalSlack>
+      <PredecessorLink>
+        <PredecessorUID>1</PredecessorUID><Type>1</Type>
+        <LinkLag>14400</LinkLag><LagFormat>8</LagFormat>
+      </PredecessorLink>
+    </Task>
+  </Tasks>
+</Project>
+"""
+
+
+async def _read(source, cursor=None):
+    return [page async for page in source.pages(cursor)]
+
+
+@pytest.fixture
+def xer_file(tmp_path):
+    path = tmp_path / "data_hall.xer"
+    path.write_text(XER, encoding="cp1252", newline="")
+    return path
+
+
+@pytest.fixture
+def mspdi_file(tmp_path):
+    path = tmp_path / "data_hall.xml"
+    path.write_text(MSPDI, encoding="utf-8")
+    return path
+
+
+async def test_xer_maps_tasks_links_and_calendars(xer_file):
+    source = XERScheduleSource(xer_file, project="7")
+
+    ((records, cursor),) = await _read(source)
+
+    assert cursor == "3"
+    excavate, footings, backfill = records
+    assert excavate["external_id"] == "A1000" and excavate["is_critical"]
+    assert excavate["start_date"] == date(2026, 3, 2)
+    # Float on the task's 10-hour calendar, lags on the predecessor's
+    assert footings["total_float"] == 4.0 and not footings["is_critical"]
+    assert footings["predecessors"] == [{"id": "A1000", "type": "FS", "lag": 2.0}]
+    assert backfill["predecessors"] == [{"id": "A1010", "type": "SS", "lag": 2.0}]
+    assert not backfill["is_critical"]
+
+    standard, four_tens = source.calendars["1"], source.calendars["2"]
+    assert standard.calendar.workdays == (0, 1, 2, 3, 4)
+    assert standard.calendar.holidays == (date(2026, 12, 25),)
+    assert (four_tens.calendar.workdays, four_tens.hours_per_day) == ((0, 1, 2, 3), 10.0)
+
+
+async def test_xer_pages_resume_from_cursor(xer_file):
+    source = XERScheduleSource(xer_file, page_size=2)
+
+    pages = await _read(source)
+    resumed = await _read(source, cursor="2")
+
+    assert [cursor for _, cursor in pages] == ["2", "4"]
+    assert [r["external_id"] for r in resumed[0][0]] == ["A1020", "B1000"]
+    # Without a project filter the cross-project link is kept
+    assert {"id": "B1000", "type": "FS", "lag": 0.0} in resumed[0][0][0]["predecessors"]
+
+
+async def test_mspdi_maps_tasks_links_and_calendars(mspdi_file):
+    source = MSPDIScheduleSource(mspdi_file)
+
+    ((records, cursor),) = await _read(source)
+
+    assert cursor == "4"
+    # The summary task is skipped; UID 2 waits for UID 3's duration
+    assert [r["external_id"] for r in records] == ["1", "3", "2"]
+    switchgear, cable, feeders = records
+    assert switchgear["is_critical"] and switchgear["end_date"] == date(2026, 3, 6)
+    # 1440 elapsed minutes on a five-day week
+    assert cable["predecessors"] == [{"id": "1", "type": "FS", "lag": pytest.approx(5 / 7)}]
+    assert cable["is_critical"]
+    assert feeders["total_float"] == 2.0 and not feeders["is_critical"]
+    # 1200 working minutes at 600 per day; 50% of a 4-day predecessor
+    assert feeders["predecessors"] == [
+        {"id": "1", "type": "SS", "lag": 2.0},
+        {"id": "3", "type": "FS", "lag": 2.0},
+    ]
+
+    standard, six_day = source.calendars["1"], source.calendars["2"]
+    assert standard.calendar.workdays == (0, 1, 2, 3, 4)
+    assert standard.calendar.holidays == (date(2026, 12, 24), date(2026, 12, 25))
+    assert six_day.calendar.workdays == (0, 1, 2, 3, 4, 5)
+    assert six_day.calendar.holidays == standard.calendar.holidays
+
+
+async def test_mspdi_cursor_stops_before_held_back_tasks(mspdi_file):
+    source = MSPDIScheduleSource(mspdi_file, page_size=1)
+
+    pages = await _read(source)
+
+    # UID 2 (position 3) is held back, so the cursor stays at 2 until it is out
+    assert [([r["external_id"] for r in page], cursor) for page, cursor in pages] == [
+        (["1"], "2"),
+        (["3"], "2"),
+        (["2"], "4"),
+    ]
+    resumed = await _read(source, cursor="2")
+    assert [r["external_id"] for page, _ in resumed for r in page] == ["3", "2"]
+
+
+async def test_file_import_feeds_the_importer_and_cpm(xer_file):
+    class Sink:
+        def __init__(self):
+            self.rows = {}
+
+        async def load_checkpoint(self, project_id, source):
+            return None
+
+        async def activity_hashes(self, project_id):
+            return {}
+
+        async def write_batch(self, project_id, source, rows, checkpoint, keep=None):
+            self.rows.update((row["external_id"], row) for row in rows)
+            return len(rows), 0
+
+    sink = Sink()
+    source = schedule_file_source(xer_file, project="7")
+
+    report = await ScheduleImporter(sink).run(uuid.uuid4(), source)
+
+    assert report.rows_written == 3
+    network = CPMNetwork.from_records(sink.rows.values(), calendar=source.calendars["1"].calendar)
+    assert network.compute().project_finish > 0
+
+
+def test_unsupported_file(tmp_path):
+    with pytest.raises(ValueError):
+        schedule_file_source(tmp_path / "schedule.mpp")
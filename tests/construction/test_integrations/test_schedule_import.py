@@ -0,0 +1,329 @@
+"""Tests for the streaming schedule import."""
+
+import json
+import uuid
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from construction.db.repositories import ScheduleRepository
+from construction.integrations.ms_project import MSProjectClient
+from construction.integrations.primavera import PrimaveraClient
+from construction.integrations.schedule_import import (
+    COMPLETE,
+    RUNNING,
+    ImportCheckpoint,
+    MSProjectScheduleSource,
+    PrimaveraScheduleSource,
+    ScheduleImporter,
+    activity_row,
+)
+
+PROJECT = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+def _paged_http(client, pages):
+    """Serve ``pages`` in order; records the params of every request."""
+    responses = []
+    for page in pages:
+        response = MagicMock(spec=httpx.Response)
+        response.status_code = 200
+        response.json.return_value = page
+        response.raise_for_status = MagicMock()
+        responses.append(response)
+    mock_hc = AsyncMock(spec=httpx.AsyncClient)
+    mock_hc.is_closed = False
+    mock_hc.request = AsyncMock(side_effect=responses)
+    client._client = mock_hc
+    return mock_hc
+
+
+class MemorySink:
+    def __init__(self, fail_after=None):
+        self.rows = {}
+        self.checkpoints = {}
+        self.batches = []
+        self.fail_after = fail_after
+
+    async def load_checkpoint(self, project_id, source):
+        checkpoint = self.checkpoints.get((project_id, source))
+        return None if checkpoint is None else ImportCheckpoint(**vars(checkpoint))
+
+    async def activity_hashes(self, project_id):
+        return {external_id: row["source_hash"] for external_id, row in self.rows.items()}
+
+    async def write_batch(self, project_id, source, rows, checkpoint, keep=None):
+        if self.fail_after is not None and len(self.batches) >= self.fail_after:
+            raise ConnectionError("lost connection")
+        self.batches.append([row["external_id"] for row in rows])
+        for row in rows:
+            self.rows[row["external_id"]] = row
+        stale = []
+        if keep is not None:
+            stale = [
+                external_id
+                for external_id, row in self.rows.items()
+                if row["source_hash"] is not None and external_id not in keep
+            ]
+            for external_id in stale:
+                del self.rows[external_id]
+        saved = ImportCheckpoint(**vars(checkpoint))
+        saved.rows_written += len(rows)
+        self.checkpoints[(project_id, source)] = saved
+        return len(rows), len(stale)
+
+
+class ListSource:
+    name = "test"
+
+    def __init__(self, records, page_size=2):
+        self.records = records
+        self.page_size = page_size
+        self.cursors = []
+
+    async def pages(self, cursor):
+        self.cursors.append(cursor)
+        offset = int(cursor or 0)
+        while offset < len(self.records):
+            page = self.records[offset : offset + self.page_size]
+            offset += len(page)
+            yield page, str(offset)
+
+
+def _records(n, name="Activity"):
+    return [
+        {
+            "external_id": f"A{i}",
+            "name": f"{name} {i}",
+            "start_date": date(2026, 3, 2),
+            "total_float": float(i % 3),
+            "predecessors": [{"id": f"A{i - 1}", "type": "FS", "lag": 0.0}] if i else [],
+        }
+        for i in range(n)
+    ]
+
+
+async def test_primavera_pages_by_object_id():
+    client = PrimaveraClient("https://p6.example.com/api", "key", rate_limit_per_second=0)
+    mock_hc = _paged_http(
+        client, [[{"ObjectId": 1}, {"ObjectId": 2}], [{"ObjectId": 3}, {"ObjectId": 4}], []]
+    )
+
+    pages = [page async for page in client.iter_activities("proj1", page_size=2)]
+
+    assert [[a["ObjectId"] for a in page] for page in pages] == [[1, 2], [3, 4]]
+    params = [call.kwargs["params"] for call in mock_hc.request.call_args_list]
+    assert "Filter" not in params[0]
+    assert params[1]["Filter"] == "ObjectId gt 2" and params[2]["Filter"] == "ObjectId gt 4"
+    assert params[0]["OrderBy"] == "ObjectId" and params[0]["PageSize"] == 2
+
+
+async def test_ms_project_pages_with_skip():
+    client = MSProjectClient("https://msp.example.com/api", "key", rate_limit_per_second=0)
+    mock_hc = _paged_http(client, [{"value": [{"Id": 1}, {"Id": 2}]}, [{"Id": 3}]])
+
+    pages = [page async for page in client.iter_tasks("proj1", page_size=2)]
+
+    assert pages == [[{"Id": 1}, {"Id": 2}], [{"Id": 3}]]
+    params = [call.kwargs["params"] for call in mock_hc.request.call_args_list]
+    assert params == [{"$top": 2, "$skip": 0}, {"$top": 2, "$skip": 2}]
+
+
+async def test_primavera_source_maps_activities_and_links():
+    client = PrimaveraClient("https://p6.example.com/api", "key", rate_limit_per_second=0)
+    _paged_http(
+        client,
+        [
+            [
+                {
+                    "PredecessorActivityObjectId": 10,
+                    "PredecessorActivityId": "A1000",
+                    "SuccessorActivityObjectId": 11,
+                    "Type": "Start to Start",
+                    "Lag": 16.0,
+                }
+            ],
+            [
+                {
+                    "ObjectId": 10,
+                    "Id": "A1000",
+                    "Name": "Pour slab",
+                    "StartDate": "2026-03-02T08:00:00",
+                    "FinishDate": "2026-03-06T17:00:00",
+                    "TotalFloat": 0.0,
+                },
+                {"ObjectId": 11, "Id": "A1010", "Name": "Strip forms", "TotalFloat": 40.0},
+            ],
+        ],
+    )
+    source = PrimaveraScheduleSource(client, "proj1", page_size=10)
+
+    pages = [page async for page in source.pages(None)]
+
+    ((records, cursor),) = pages
+    assert cursor == "11"
+    slab, forms = records
+    assert slab["external_id"] == "A1000" and slab["is_critical"]
+    assert slab["start_date"] == date(2026, 3, 2) and slab["end_date"] == date(2026, 3, 6)
+    assert forms["total_float"] == 5.0 and not forms["is_critical"]
+    assert forms["predecessors"] == [{"id": "A1000", "type": "SS", "lag": 2.0}]
+
+
+def test_ms_project_source_parses_predecessor_text():
+    source = MSProjectScheduleSource(MagicMock(), "proj1")
+
+    record = source._record(
+        {"Id": 7, "Name": "Rough-in", "Predecessors": "3FS+2d,5, 6SS-16h", "TotalSlack": 0}
+    )
+
+    assert record["is_critical"]
+    assert record["predecessors"] == [
+        {"id": "3", "type": "FS", "lag": 2.0},
+        {"id": "5", "type": "FS", "lag": 0.0},
+        {"id": "6", "type": "SS", "lag": -2.0},
+    ]
+
+
+def test_activity_row_hash_tracks_imported_fields():
+    record = _records(2)[1]
+
+    assert activity_row(record)["source_hash"] == activity_row(dict(record))["source_hash"]
+    assert (
+        activity_row({**record, "total_float": 9.0})["source_hash"]
+        != activity_row(record)["source_hash"]
+    )
+
+
+async def test_import_writes_in_batches_and_skips_unchanged_rows():
+    sink = MemorySink()
+    importer = ScheduleImporter(sink, batch_size=4)
+
+    first = await importer.run(PROJECT, ListSource(_records(10)))
+
+    assert (first.rows_seen, first.rows_changed, first.rows_written) == (10, 10, 10)
+    assert [len(batch) for batch in sink.batches] == [4, 4, 2]
+    assert sink.checkpoints[(PROJECT, "test")].status == COMPLETE
+
+    sink.batches.clear()
+    again = await importer.run(PROJECT, ListSource(_records(10)))
+
+    assert (again.rows_seen, again.rows_written) == (10, 0)
+    assert sink.batches == [[]]
+
+    records = _records(10)
+    records[6]["name"] = "Renamed"
+    changed = await importer.run(PROJECT, ListSource(records))
+
+    assert changed.rows_written == 1
+    assert sink.batches[-1] == ["A6"]
+    assert sink.rows["A6"]["name"] == "Renamed"
+
+
+async def test_import_dedupes_a_batch_by_external_id():
+    records = _records(3)
+    records.append({**records[1], "name": "Second copy"})
+    sink = MemorySink()
+
+    report = await ScheduleImporter(sink).run(PROJECT, ListSource(records))
+
+    assert report.rows_written == 3
+    assert sink.rows["A1"]["name"] == "Second copy"
+
+
+async def test_interrupted_import_resumes_from_checkpoint():
+    sink = MemorySink(fail_after=1)
+    importer = ScheduleImporter(sink, batch_size=4)
+
+    with pytest.raises(ConnectionError):
+        await importer.run(PROJECT, ListSource(_records(10)))
+    checkpoint = sink.checkpoints[(PROJECT, "test")]
+    assert (checkpoint.status, checkpoint.cursor, checkpoint.rows_written) == (RUNNING, "4", 4)
+
+    sink.fail_after = None
+    source = ListSource(_records(10))
+    report = await importer.run(PROJECT, source)
+
+    assert source.cursors == ["4"]
+    assert report.resumed_from == "4"
+    assert (report.rows_seen, report.rows_written) == (10, 10)
+    assert sorted(sink.rows) == sorted(f"A{i}" for i in range(10))
+    assert sink.checkpoints[(PROJECT, "test")].status == COMPLETE
+
+
+async def test_full_sync_deletes_activities_the_source_dropped():
+    sink = MemorySink()
+    importer = ScheduleImporter(sink, batch_size=4)
+    await importer.run(PROJECT, ListSource(_records(10)))
+    sink.rows["MANUAL"] = {"external_id": "MANUAL", "source_hash": None}
+
+    records = [record for record in _records(10) if record["external_id"] not in ("A3", "A8")]
+    report = await importer.run(PROJECT, ListSource(records))
+
+    assert (report.rows_seen, report.rows_written, report.rows_deleted) == (8, 0, 2)
+    assert sorted(sink.rows) == sorted(["MANUAL"] + [r["external_id"] for r in records])
+
+
+async def test_resumed_sync_deletes_nothing():
+    sink = MemorySink(fail_after=1)
+    importer = ScheduleImporter(sink, batch_size=4)
+    with pytest.raises(ConnectionError):
+        await importer.run(PROJECT, ListSource(_records(10)))
+
+    sink.fail_after = None
+    report = await importer.run(PROJECT, ListSource(_records(10)))
+
+    assert report.resumed_from == "4"
+    assert report.rows_deleted == 0
+    assert sorted(sink.rows) == sorted(f"A{i}" for i in range(10))
+
+
+async def test_bulk_upsert_copies_rows_and_saves_checkpoint():
+    driver = MagicMock()
+    driver.transaction.return_value.__aenter__ = AsyncMock()
+    driver.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+    driver.copy_records_to_table = AsyncMock()
+    driver.execute = AsyncMock(side_effect=["CREATE TABLE", "INSERT 0 2", "INSERT 0 1"])
+    raw = MagicMock(driver_connection=driver)
+    connection = MagicMock(get_raw_connection=AsyncMock(return_value=raw))
+    session = MagicMock(connection=AsyncMock(return_value=connection))
+    rows = [activity_row(record) for record in _records(2)]
+
+    written, deleted = await ScheduleRepository(session).bulk_upsert_activities(
+        PROJECT, rows, source="test", cursor="2", status=RUNNING, rows_seen=2, rows_written=5
+    )
+
+    assert (written, deleted) == (2, 0)
+    copied = driver.copy_records_to_table.call_args.kwargs["records"]
+    assert [record[2] for record in copied] == ["A0", "A1"]
+    assert json.loads(copied[1][8]) == [{"id": "A0", "type": "FS", "lag": 0.0}]
+    checkpoint = driver.execute.call_args_list[-1].args
+    assert checkpoint[2:] == (PROJECT, "test", "2", RUNNING, 2, 7)
+
+
+async def test_bulk_upsert_deletes_unlisted_activities_before_the_checkpoint():
+    driver = MagicMock()
+    driver.transaction.return_value.__aenter__ = AsyncMock()
+    driver.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+    driver.execute = AsyncMock(side_effect=["UPDATE 0", "UPDATE 1", "DELETE 3", "INSERT 0 1"])
+    raw = MagicMock(driver_connection=driver)
+    connection = MagicMock(get_raw_connection=AsyncMock(return_value=raw))
+    session = MagicMock(connection=AsyncMock(return_value=connection))
+
+    written, deleted = await ScheduleRepository(session).bulk_upsert_activities(
+        PROJECT,
+        [],
+        source="test",
+        cursor=None,
+        status=COMPLETE,
+        rows_seen=4,
+        rows_written=4,
+        keep_ids=["A0", "A1"],
+    )
+
+    assert (written, deleted) == (0, 3)
+    calls = driver.execute.call_args_list
+    assert [call.args[0].split()[0] for call in calls] == ["UPDATE", "UPDATE", "DELETE", "INSERT"]
+    assert all(call.args[1:] == (PROJECT, ["A0", "A1"]) for call in calls[:3])
+    assert driver.transaction.call_count == 1
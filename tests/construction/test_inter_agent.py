@@ -22,7 +22,7 @@ def mock_settings():
 @pytest.fixture
 def mock_shared_memory():
     mem = AsyncMock()
-    mem.check_dedup.return_value = False
+    mem.claim_dedup.return_value = True
     return mem
 
 
@@ -7,6 +7,13 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from construction.agents.orchestrator import Orchestrator
+from construction.agents.rules import (
+    DEFAULT_RULES,
+    Rule,
+    RuleTable,
+    load_rules,
+)
+from construction.config import ConstructionSettings
 from construction.schemas.common import AgentEvent
 
 
@@ -22,7 +29,7 @@ def mock_settings():
 @pytest.fixture
 def mock_shared_memory():
     mem = AsyncMock()
-    mem.check_dedup.return_value = False
+    mem.claim_dedup.return_value = True
     mem.get_active_risks.return_value = [
         ("risk-1", 9.5),
         ("risk-2", 8.2),
@@ -164,6 +171,101 @@ async def test_unrecognized_event_returns_no_triggers(
     assert triggers == []
 
 
+# --- Rule table tests ---
+
+
+def test_default_rules_compile_to_one_entry_per_key():
+    table = RuleTable(DEFAULT_RULES, ConstructionSettings())
+
+    assert len(table) == len(DEFAULT_RULES) == 18
+    assert ("financial", "budget_variance") in table
+    assert ("financial", "progress") not in table
+
+
+def test_rule_predicates_and_escalation():
+    rule = Rule.from_record({
+        "source": "financial",
+        "event_type": "budget_variance",
+        "targets": [
+            {"agent": "critical_path", "action": "reoptimize"}
+        ],
+        "when": ["variance_pct >= 5", "approved == false"],
+        "escalate": True,
+        "escalate_when": ["overrun > escalation_impact_threshold"],
+    })
+    table = RuleTable([rule], ConstructionSettings())
+
+    def dispatch(data):
+        return table.dispatch(
+            _make_event("financial", "budget_variance", data)
+        )
+
+    triggers, escalate = dispatch(
+        {"variance_pct": 5, "approved": False, "overrun": 1}
+    )
+    assert [t.priority for t in triggers] == [5]
+    assert triggers[0].data["variance_pct"] == 5
+    assert not escalate
+    assert dispatch(
+        {"variance_pct": 5, "approved": False, "overrun": 3e5}
+    )[1]
+    assert dispatch({"variance_pct": 4}) == ([], False)
+    assert dispatch({"variance_pct": 9, "approved": True})[0] == []
+    # Missing fields compare as 0
+    assert len(dispatch({"variance_pct": 9})[0]) == 1
+
+
+def test_invalid_rules():
+    settings = ConstructionSettings()
+    for predicate in ["variance_pct >> 10", "variance_pct > no_such_setting"]:
+        rule = Rule("financial", "budget_variance", when=(predicate,))
+        with pytest.raises(ValueError):
+            RuleTable([rule], settings)
+
+
+@pytest.mark.asyncio
+async def test_configured_rules_replace_defaults(
+    mock_shared_memory, mock_pubsub
+):
+    settings = ConstructionSettings(
+        pm_phone_number="+15559999999",
+        orchestrator_rules=[
+            {
+                "source": "financial",
+                "event_type": "budget_variance",
+                "when": ["variance_pct > 5"],
+                "targets": [
+                    {
+                        "agent": "claims_dispute",
+                        "action": "cost_review",
+                        "priority": 2,
+                    }
+                ],
+            },
+            {"source": "compliance", "event_type": "critical_deviation"},
+        ],
+    )
+    orch = Orchestrator(
+        settings=settings,
+        shared_memory=mock_shared_memory,
+        pubsub=mock_pubsub,
+        agents={},
+    )
+
+    triggers = await orch.handle_event(
+        _make_event("financial", "budget_variance", {"variance_pct": 7})
+    )
+    disabled = await orch.handle_event(
+        _make_event("compliance", "critical_deviation")
+    )
+
+    assert [(t.target_agent, t.priority) for t in triggers] == [
+        ("claims_dispute", 2)
+    ]
+    assert disabled == []
+    assert len(load_rules(settings)) == len(DEFAULT_RULES)
+
+
 # --- Daily brief tests ---
 
 
@@ -250,12 +352,12 @@ async def test_dedup_first_alert_not_duplicate(orchestrator):
     )
     is_dup = await orchestrator.check_dedup(event)
     assert is_dup is False
-    orchestrator.shared_memory.mark_dedup.assert_called_once()
+    orchestrator.shared_memory.claim_dedup.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_dedup_second_alert_is_duplicate(orchestrator):
-    orchestrator.shared_memory.check_dedup.return_value = True
+    orchestrator.shared_memory.claim_dedup.return_value = False
 
     event = _make_event(
         "risk_forecaster",
@@ -281,6 +383,25 @@ async def test_dedup_without_shared_memory(
     assert is_dup is False
 
 
+@pytest.mark.asyncio
+async def test_dedup_many_claims_burst_at_once(orchestrator):
+    orchestrator.shared_memory.claim_dedup_many.return_value = [
+        True,
+        False,
+    ]
+    events = [
+        _make_event("financial", "budget_variance", {"n": 1}),
+        _make_event("financial", "budget_variance", {"n": 1}),
+    ]
+
+    assert await orchestrator.check_dedup_many(events) == [
+        False,
+        True,
+    ]
+    hashes = orchestrator.shared_memory.claim_dedup_many.call_args[0][0]
+    assert hashes[0] == hashes[1]
+
+
 # --- Approval processing tests ---
 
 
@@ -0,0 +1,217 @@
+"""Tests for pub/sub delivery through per-channel queues and workers."""
+
+import asyncio
+import json
+
+import pytest
+
+from construction.redis_.pubsub import AgentPubSub
+
+
+class FakePubSub:
+    def __init__(self):
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.channels: set[str] = set()
+
+    async def subscribe(self, channel):
+        self.channels.add(channel)
+
+    async def unsubscribe(self):
+        self.channels.clear()
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        assert timeout is None  # blocking read
+        return await self.inbox.get()
+
+
+class FakeRedis:
+    """Delivers published messages to one subscriber and keeps spill streams."""
+
+    def __init__(self, streams: dict | None = None):
+        self.subscription = FakePubSub()
+        # Shared between fakes standing in for several processes
+        self.streams: dict[str, list[tuple[bytes, dict]]] = {} if streams is None else streams
+        self.expiring: set[str] = set()
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self):
+        return self.subscription
+
+    def send(self, channel, message):
+        self.subscription.inbox.put_nowait(
+            {"type": "message", "channel": channel.encode(), "data": json.dumps(message).encode()}
+        )
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        entry = {key.encode(): str(value).encode() for key, value in fields.items()}
+        entry[b"data"] = fields["data"]
+        entries = self.streams.setdefault(name, [])
+        last = int(entries[-1][0].split(b"-")[0]) if entries else 0
+        entries.append((f"{last + 1}-0".encode(), entry))
+
+    async def expire(self, name, seconds):
+        self.expiring.add(name)
+
+    async def xrange(self, name, min, max, count=None):
+        return self.streams.get(name, [])[:count]
+
+    async def xdel(self, name, *ids):
+        self.streams[name] = [e for e in self.streams[name] if e[0] not in ids]
+
+    async def delete(self, *names):
+        for name in names:
+            self.streams.pop(name, None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self._redis, n)(*a, **k) for n, a, k in self._calls]
+
+
+async def _settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+async def test_slow_callback_only_holds_up_its_own_channel():
+    fake = FakeRedis()
+    bus = AgentPubSub(fake, channel_workers=3)
+    gate = asyncio.Event()
+    slow_running = []
+    fast = []
+
+    async def slow(data):
+        slow_running.append(data["n"])
+        await gate.wait()
+
+    async def record(data):
+        fast.append(data["n"])
+
+    await bus.subscribe("channel:agent_events", slow, concurrency=2)
+    await bus.subscribe("channel:dashboard_updates", record)
+    await bus.start_listening()
+    for n in range(3):
+        fake.send("channel:agent_events", {"n": n})
+        fake.send("channel:dashboard_updates", {"n": n})
+    await _settle()
+
+    # Capped at two concurrent runs; the other channel is unaffected
+    assert slow_running == [0, 1]
+    assert fast == [0, 1, 2]
+    stats = bus.channel_stats()["channel:agent_events"]
+    assert (stats.received, stats.delivered) == (3, 0)
+    gate.set()
+    await _settle()
+    assert slow_running == [0, 1, 2]
+    assert bus.channel_stats()["channel:agent_events"].delivered == 3
+    await bus.stop()
+
+
+async def test_failing_callback_does_not_stall_delivery():
+    fake = FakeRedis()
+    bus = AgentPubSub(fake, channel_workers=1)
+    received = []
+
+    async def flaky(data):
+        if data["n"] == 0:
+            raise RuntimeError("boom")
+        received.append(data["n"])
+
+    await bus.subscribe("channel:escalation", flaky)
+    await bus.start_listening()
+    fake.send("channel:escalation", {"n": 0})
+    fake.send("channel:escalation", {"n": 1})
+    await _settle()
+
+    assert received == [1]
+    assert bus.channel_stats()["channel:escalation"].failed == 1
+    await bus.stop()
+
+
+@pytest.mark.parametrize(
+    ("overflow", "expected"),
+    [("block", [0, 1, 2, 3, 4]), ("drop_oldest", [0, 3, 4]), ("spill", [0, 1, 2, 3, 4])],
+)
+async def test_overflow_policies(overflow, expected):
+    fake = FakeRedis()
+    bus = AgentPubSub(fake, queue_size=2, channel_workers=1, overflow=overflow)
+    gate = asyncio.Event()
+    received = []
+
+    async def callback(data):
+        received.append(data["n"])
+        await gate.wait()
+
+    await bus.subscribe("channel:site_logistics", callback)
+    await bus.start_listening()
+    fake.send("channel:site_logistics", {"n": 0})
+    await _settle()
+    for n in range(1, 5):
+        fake.send("channel:site_logistics", {"n": n})
+    await _settle()
+
+    stats = bus.channel_stats()["channel:site_logistics"]
+    if overflow == "block":
+        # The reader waits on the full queue, leaving the rest unread
+        assert (stats.received, stats.depth) == (4, 2)
+    elif overflow == "drop_oldest":
+        assert (stats.received, stats.dropped, stats.depth) == (5, 2, 2)
+    else:
+        assert (stats.received, stats.spilled, stats.depth) == (5, 2, 4)
+        spill_key = f"channel:site_logistics:spill:{bus.instance}"
+        assert len(fake.streams[spill_key]) == 2 and spill_key in fake.expiring
+    gate.set()
+    await _settle()
+    assert received == expected
+    assert bus.channel_stats()["channel:site_logistics"].depth == 0
+    assert bus.channel_stats()["channel:site_logistics"].max_lag > 0
+    await bus.stop()
+
+
+async def test_processes_spill_to_their_own_streams():
+    streams: dict = {}
+    fakes = [FakeRedis(streams), FakeRedis(streams)]
+    buses = [AgentPubSub(fake, queue_size=1, overflow="spill") for fake in fakes]
+    gate = asyncio.Event()
+    received: list[list[int]] = [[], []]
+
+    for bus, into in zip(buses, received, strict=True):
+
+        async def callback(data, into=into):
+            into.append(data["n"])
+            await gate.wait()
+
+        await bus.subscribe("channel:agent_events", callback)
+        await bus.start_listening()
+    # Pub/sub fans every message out to both processes
+    for n in range(4):
+        for fake in fakes:
+            fake.send("channel:agent_events", {"n": n})
+        await _settle()
+    gate.set()
+    await _settle()
+
+    assert received == [[0, 1, 2, 3], [0, 1, 2, 3]]
+    for bus in buses:
+        await bus.stop()
+    assert streams == {}
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(ValueError, match="overflow policy"):
+        AgentPubSub(FakeRedis(), overflow="discard")
@@ -0,0 +1 @@
+"""Tests for schedule network analysis."""
@@ -0,0 +1,228 @@
+"""Tests for the Critical Path Method engine and work calendars."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from construction.scheduling.calendars import SEVEN_DAY, WorkCalendar
+from construction.scheduling.cpm import (
+    CPMActivity,
+    CPMNetwork,
+    Relationship,
+    relationships,
+)
+
+MONDAY = date(2026, 3, 2)
+
+
+def _network(*activities, calendar=SEVEN_DAY):
+    return CPMNetwork(activities, calendar=calendar, start=MONDAY)
+
+
+def _by_id(result, attr):
+    values = getattr(result, attr)
+    return {activity_id: float(values[k]) for k, activity_id in enumerate(result.network.ids)}
+
+
+def test_finish_to_start_chain():
+    result = _network(
+        CPMActivity("A", "Excavate", 5),
+        CPMActivity("B", "Footings", 3, (Relationship("A"),)),
+        CPMActivity("C", "Backfill", 2, (Relationship("A"),)),
+        CPMActivity("D", "Slab", 4, (Relationship("B"), Relationship("C"))),
+    ).compute()
+
+    assert result.project_finish == 12
+    assert _by_id(result, "early_start") == {"A": 0, "B": 5, "C": 5, "D": 8}
+    assert _by_id(result, "total_float") == {"A": 0, "B": 0, "C": 1, "D": 0}
+    assert _by_id(result, "free_float")["C"] == 1
+    assert [result.network.ids[k] for k in result.critical_path()] == ["A", "B", "D"]
+
+
+@pytest.mark.parametrize(
+    ("kind", "lag", "early_start"),
+    [
+        ("FS", 2, 12),  # starts 2 days after A finishes
+        ("SS", 3, 3),  # starts 3 days after A starts
+        ("FF", 1, 7),  # finishes 1 day after A finishes
+        ("SF", 6, 2),  # finishes 6 days after A starts
+    ],
+)
+def test_relationship_types_with_lag(kind, lag, early_start):
+    result = _network(
+        CPMActivity("A", "Steel", 10),
+        CPMActivity("B", "Decking", 4, (Relationship("A", kind, lag),)),
+    ).compute()
+
+    assert result.early_start[result.network.index["B"]] == early_start
+
+
+def test_negative_early_start_clamps_to_project_start():
+    result = _network(
+        CPMActivity("A", "Survey", 2),
+        CPMActivity("B", "Layout", 6, (Relationship("A", "FF"),)),
+    ).compute()
+
+    assert result.early_start[result.network.index["B"]] == 0
+
+
+def test_backward_pass_and_free_float_with_mixed_links():
+    result = _network(
+        CPMActivity("A", "A", 10),
+        CPMActivity("B", "B", 5, (Relationship("A"),)),
+        CPMActivity("C", "C", 3, (Relationship("A", "SS", 2),)),
+        CPMActivity("D", "D", 4, (Relationship("B"), Relationship("C", "FF", 1))),
+        CPMActivity("E", "E", 2, (Relationship("C", "SF", 10),)),
+    ).compute()
+
+    assert _by_id(result, "late_start") == {"A": 0, "B": 10, "C": 9, "D": 15, "E": 17}
+    assert _by_id(result, "total_float") == {"A": 0, "B": 0, "C": 7, "D": 0, "E": 7}
+    # C's SF link to E is tight at early dates, so it has no free float
+    assert _by_id(result, "free_float") == {"A": 0, "B": 0, "C": 0, "D": 0, "E": 7}
+    assert result.float_status() == [
+        "critical" if tf == 0 else "healthy" for tf in result.total_float
+    ]
+
+
+def _reference_cpm(activities):
+    """Straightforward per-activity CPM used to cross-check the array passes."""
+    dur = {a.id: a.duration for a in activities}
+    es = {}
+    for a in activities:  # listed in topological order
+        es[a.id] = 0.0
+        for link in a.predecessors:
+            p = link.predecessor
+            start, finish = es[p], es[p] + dur[p]
+            es[a.id] = max(
+                es[a.id],
+                {
+                    "FS": finish + link.lag,
+                    "SS": start + link.lag,
+                    "FF": finish + link.lag - dur[a.id],
+                    "SF": start + link.lag - dur[a.id],
+                }[link.type],
+            )
+    finish = max(es[a] + dur[a] for a in es)
+    lf = {a: finish for a in es}
+    for a in reversed(activities):
+        for link in a.predecessors:
+            p = link.predecessor
+            ls_a, lf_a = lf[a.id] - dur[a.id], lf[a.id]
+            lf[p] = min(
+                lf[p],
+                {
+                    "FS": ls_a - link.lag,
+                    "SS": ls_a - link.lag + dur[p],
+                    "FF": lf_a - link.lag,
+                    "SF": lf_a - link.lag + dur[p],
+                }[link.type],
+            )
+    return es, {a: lf[a] - dur[a] for a in es}
+
+
+def test_matches_reference_on_random_network():
+    rng = np.random.default_rng(3)
+    activities = []
+    for i in range(400):
+        links = sorted(set(rng.integers(max(0, i - 30), i, size=3))) if i else []
+        preds = tuple(
+            Relationship(
+                f"A{j}", str(rng.choice(["FS", "SS", "FF", "SF"])), float(rng.integers(-2, 5))
+            )
+            for j in links
+        )
+        activities.append(CPMActivity(f"A{i}", f"A{i}", float(rng.integers(0, 20)), preds))
+
+    result = _network(*activities).compute()
+    es, ls = _reference_cpm(activities)
+
+    assert _by_id(result, "early_start") == pytest.approx(es)
+    assert _by_id(result, "late_start") == pytest.approx(ls)
+    assert result.total_float.min() >= -1e-9
+
+
+def test_dates_follow_the_work_calendar():
+    calendar = WorkCalendar(holidays=[date(2026, 3, 9)])
+    result = _network(
+        CPMActivity("A", "Pour", 5),
+        CPMActivity("B", "Cure", 3, (Relationship("A"),)),
+        CPMActivity("M", "Inspection", 0, (Relationship("B"),)),
+        calendar=calendar,
+    ).compute()
+
+    rows = {row["id"]: row for row in result.records()}
+    assert (rows["A"]["start_date"], rows["A"]["end_date"]) == ("2026-03-02", "2026-03-06")
+    # Weekend and the Monday holiday are skipped
+    assert (rows["B"]["start_date"], rows["B"]["end_date"]) == ("2026-03-10", "2026-03-12")
+    assert rows["M"]["start_date"] == rows["M"]["end_date"] == "2026-03-13"
+    assert result.project_finish_date == date(2026, 3, 12)
+    assert rows["B"]["predecessors"] == ["A"] and rows["B"]["successors"] == ["M"]
+
+
+def test_calendar_helpers():
+    calendar = WorkCalendar(holidays=[date(2026, 3, 4)])
+
+    assert calendar.roll_forward(date(2026, 3, 7)) == date(2026, 3, 9)
+    assert calendar.add_workdays(MONDAY, 3) == date(2026, 3, 6)
+    assert calendar.duration(MONDAY, date(2026, 3, 6)) == 4
+    assert not calendar.is_workday(date(2026, 3, 4))
+    with pytest.raises(ValueError):
+        WorkCalendar(workdays=[])
+
+
+def test_from_records_derives_durations_and_links():
+    network = CPMNetwork.from_records(
+        [
+            {
+                "external_id": "A1010",
+                "name": "Pour",
+                "start_date": date(2026, 3, 2),
+                "end_date": "2026-03-13",
+                "tier_critical": True,
+            },
+            {
+                "id": "A1020",
+                "name": "Cure",
+                "duration": 3,
+                "predecessors": {"A1010": {"type": "PR_SS", "lag": 2}},
+            },
+            {"id": "A1030", "name": "Strip", "mode": 1, "predecessors": ["A1020", "missing"]},
+        ]
+    )
+    result = network.compute()
+
+    assert network.start == MONDAY
+    assert network.durations[network.index["A1010"]] == 10
+    assert network.tier_critical[network.index["A1010"]]
+    assert result.early_start[network.index["A1020"]] == 2
+    assert result.project_finish == 10
+
+
+def test_relationships_formats():
+    assert relationships(None) == []
+    assert relationships(["A", {"id": "B", "type": "ff", "lag": 2}]) == [
+        Relationship("A"),
+        Relationship("B", "FF", 2.0),
+    ]
+    assert relationships({"id": "A", "type": "SS"}) == [Relationship("A", "SS")]
+    assert relationships({"A": "SF"}) == [Relationship("A", "SF")]
+
+
+def test_invalid_networks():
+    with pytest.raises(ValueError, match="cycle"):
+        _network(
+            CPMActivity("A", "A", 1, (Relationship("B"),)),
+            CPMActivity("B", "B", 1, (Relationship("A", "SS"),)),
+        )
+    with pytest.raises(ValueError, match="relationship type"):
+        _network(CPMActivity("A", "A", 1), CPMActivity("B", "B", 1, (Relationship("A", "XX"),)))
+    with pytest.raises(ValueError, match="Duplicate"):
+        _network(CPMActivity("A", "A", 1), CPMActivity("A", "A", 2))
+
+
+def test_empty_network():
+    result = _network().compute()
+
+    assert result.project_finish == 0
+    assert result.records() == []
@@ -0,0 +1,109 @@
+"""Tests for time impact and windows delay analysis."""
+
+from datetime import date
+
+import pytest
+
+from construction.scheduling import delay
+from construction.scheduling.calendars import SEVEN_DAY
+from construction.scheduling.cpm import CPMActivity, CPMNetwork, Relationship
+from construction.scheduling.delay import (
+    DelayEvent,
+    party_totals,
+    time_impact_analysis,
+    windows_analysis,
+)
+from construction.scheduling.snapshot import ScheduleSnapshot
+
+
+def _snapshot(start=date(2026, 3, 2), label=""):
+    # A -> B -> C
+    network = CPMNetwork(
+        [
+            CPMActivity("A", "Excavate", 10),
+            CPMActivity("B", "Footings", 5, (Relationship("A"),)),
+            CPMActivity("C", "Slab", 4, (Relationship("B"),)),
+        ],
+        calendar=SEVEN_DAY,
+        start=start,
+    )
+    return ScheduleSnapshot.from_result(network.compute(), label=label)
+
+
+# A 6-day owner redesign after A holds B; a contractor's 4-day resubmittal
+# from day 10 holds B too, inside the owner's delay
+REDESIGN = {
+    "id": "O1",
+    "party": "Owner",
+    "activities": [{"id": "R", "name": "Redesign", "duration": 6, "predecessors": ["A"]}],
+    "ties": [{"predecessor": "R", "successor": "B"}],
+}
+RESUBMIT = {"id": "C1", "party": "Contractor", "activity": "B", "days": 4, "date": "2026-03-12"}
+
+
+def test_tia_attributes_sole_and_concurrent_delay():
+    events = [DelayEvent.from_record(r) for r in (RESUBMIT, REDESIGN)]
+
+    window = time_impact_analysis(_snapshot(), events, SEVEN_DAY)
+
+    assert window.delay_days == 6
+    assert window.baseline_finish == date(2026, 3, 20)
+    assert window.impacted_finish == date(2026, 3, 26)
+    # Undated events are inserted first
+    assert [(e.event_id, e.impact_days) for e in window.events] == [("O1", 6), ("C1", 0)]
+    owner, contractor = window.parties["Owner"], window.parties["Contractor"]
+    assert owner.critical_delay_days == 6 and contractor.critical_delay_days == 4
+    assert owner.sole_delay_days == 2 and contractor.sole_delay_days == 0
+    assert owner.concurrent_delay_days == contractor.concurrent_delay_days == 4
+    assert window.concurrent_days == 4
+    assert window.affected_activities == ["B"]
+    assert window.record()["parties"]["Owner"]["sole_delay_days"] == 2.0
+
+
+def test_event_records():
+    redesign = DelayEvent.from_record(REDESIGN)
+    resubmit = DelayEvent.from_record(RESUBMIT)
+
+    assert [a.id for a in redesign.activities] == ["R"]
+    assert redesign.activities[0].predecessors == (Relationship("A"),)
+    assert redesign.start is None
+    assert resubmit.start == date(2026, 3, 12)
+    assert resubmit.activities[0].duration == 4
+    assert resubmit.ties[0].successor == "B"
+    assert DelayEvent.from_record({"id": "X", "activity": "B", "days": 1}).party == "Unassigned"
+
+
+def test_unknown_tie():
+    event = DelayEvent.from_record({"id": "X", "activity": "missing", "days": 3})
+
+    with pytest.raises(ValueError, match="missing"):
+        time_impact_analysis(_snapshot(), [event], SEVEN_DAY)
+
+
+def test_windows_split_events_by_update():
+    updates = [_snapshot(label="Update 1"), _snapshot(date(2026, 3, 16), label="Update 2")]
+    late = {**RESUBMIT, "id": "C2", "date": "2026-03-20", "activity": "C"}
+    events = [DelayEvent.from_record(r) for r in (REDESIGN, RESUBMIT, late)]
+
+    first, second = windows_analysis(updates, events, SEVEN_DAY)
+
+    assert (first.label, first.end, second.end) == ("Update 1", date(2026, 3, 16), None)
+    assert [e.event_id for e in first.events] == ["O1", "C1"]
+    assert [e.event_id for e in second.events] == ["C2"]
+    assert first.update_slip_days == 14 and second.update_slip_days is None
+    # C starts on 2026-03-31 in Update 2, well after C2's fragnet finishes
+    assert second.delay_days == 0
+    totals = party_totals([first, second])
+    assert totals["Contractor"].events == 2
+    assert totals["Owner"].critical_delay_days == 6
+
+
+def test_windows_on_a_process_pool(monkeypatch):
+    monkeypatch.setattr(delay, "_PARALLEL_MIN_ACTIVITIES", 0)
+    updates = [_snapshot(), _snapshot(date(2026, 3, 16))]
+    events = [DelayEvent.from_record(r) for r in (REDESIGN, RESUBMIT)]
+
+    pooled = windows_analysis(updates, events, SEVEN_DAY, workers=2)
+
+    serial = windows_analysis(updates, events, SEVEN_DAY)
+    assert [w.record() for w in pooled] == [w.record() for w in serial]
@@ -0,0 +1,158 @@
+"""Tests for incremental CPM updates."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from construction.scheduling.calendars import SEVEN_DAY
+from construction.scheduling.cpm import CPMActivity, CPMNetwork, Relationship
+from construction.scheduling.incremental import IncrementalCPM, ScheduleStore
+
+
+def _network():
+    # A -> B -> D, A -> C -(FF 1)-> D, C -(SF 10)-> E
+    return CPMNetwork(
+        [
+            CPMActivity("A", "A", 10),
+            CPMActivity("B", "B", 5, (Relationship("A"),)),
+            CPMActivity("C", "C", 3, (Relationship("A", "SS", 2),)),
+            CPMActivity("D", "D", 4, (Relationship("B"), Relationship("C", "FF", 1))),
+            CPMActivity("E", "E", 2, (Relationship("C", "SF", 10),)),
+        ],
+        calendar=SEVEN_DAY,
+        start=date(2026, 3, 2),
+    )
+
+
+def _assert_matches_full(schedule, durations, release):
+    full = schedule.network.compute(durations, release)
+    current = schedule.result()
+    np.testing.assert_allclose(current.early_start, full.early_start)
+    np.testing.assert_allclose(current.late_start, full.late_start)
+    np.testing.assert_allclose(current.free_float, full.free_float)
+    np.testing.assert_array_equal(current.critical, full.critical)
+    assert current.project_finish == pytest.approx(full.project_finish)
+
+
+def test_update_within_float_stops_early():
+    schedule = IncrementalCPM(_network())
+
+    update = schedule.update("E", duration=4)
+
+    assert update.finish_delta == 0
+    # E moves earlier under its SF link; C's tail and everything else hold
+    assert update.changed == ["E"]
+    assert update.became_critical == update.no_longer_critical == []
+
+
+def test_update_reports_criticality_changes():
+    schedule = IncrementalCPM(_network())
+
+    update = schedule.update("C", duration=20)
+
+    assert update.project_finish == 23
+    assert update.finish_delta == 4
+    assert update.became_critical == ["C"]
+    assert update.no_longer_critical == ["B"]
+    durations = schedule.network.durations.copy()
+    durations[schedule.network.index["C"]] = 20
+    _assert_matches_full(schedule, durations, None)
+
+
+def test_release_delays_the_activity_and_its_successors():
+    schedule = IncrementalCPM(_network())
+    k = schedule.network.index["B"]
+
+    update = schedule.update("B", release=14)
+
+    assert update.finish_delta == 4
+    assert schedule.result().early_start[k] == 14
+    release = np.zeros(len(schedule.network))
+    release[k] = 14
+    _assert_matches_full(schedule, schedule.network.durations, release)
+
+
+def test_random_edits_match_full_recompute():
+    rng = np.random.default_rng(11)
+    activities = []
+    for i in range(300):
+        links = sorted(set(rng.integers(max(0, i - 20), i, size=3))) if i else []
+        preds = tuple(
+            Relationship(f"A{j}", str(rng.choice(["FS", "SS", "FF", "SF"])), float(rng.integers(3)))
+            for j in links
+        )
+        activities.append(CPMActivity(f"A{i}", f"A{i}", float(rng.integers(1, 15)), preds))
+    network = CPMNetwork(activities, calendar=SEVEN_DAY)
+    schedule = IncrementalCPM(network)
+    durations = network.durations.copy()
+    release = np.zeros(len(network))
+    critical = schedule.result().critical
+
+    for step in range(60):
+        k = int(rng.integers(len(network)))
+        duration = float(rng.integers(0, 25))
+        start = float(rng.integers(0, 60)) if step % 4 == 0 else None
+        update = schedule.update(network.ids[k], duration=duration, release=start)
+        durations[k] = duration
+        if start is not None:
+            release[k] = start
+
+        _assert_matches_full(schedule, durations, release)
+        now = schedule.result().critical
+        flipped = {network.ids[v] for v in np.flatnonzero(now != critical)}
+        assert flipped == set(update.became_critical) | set(update.no_longer_critical)
+        critical = now
+
+
+def test_update_many_switches_links_by_lag():
+    network = _network()
+    # Edge C -(FF 1)-> D off, then back on with a longer lag
+    edge = next(
+        e
+        for e in range(len(network.edge_lag))
+        if network.ids[network.edge_src[e]] == "C" and network.ids[network.edge_dst[e]] == "D"
+    )
+    lags = network.edge_lag.copy()
+    lags[edge] = -np.inf
+    schedule = IncrementalCPM(network, lags=lags)
+    c = network.index["C"]
+
+    off = schedule.update_many({c: 20.0}, {}, {})
+    on = schedule.update_many({}, {}, {edge: 8.0})
+
+    durations = network.durations.copy()
+    durations[c] = 20
+    assert off.project_finish == 22
+    lags[edge] = 8.0
+    full = network.compute(
+        durations, weights=network.edge_weights(durations) - network.edge_lag + lags
+    )
+    assert on.project_finish == pytest.approx(full.project_finish) == 30
+    np.testing.assert_allclose(schedule.result().early_start, full.early_start)
+    np.testing.assert_allclose(schedule.result().late_start, full.late_start)
+
+
+def test_invalid_updates():
+    schedule = IncrementalCPM(_network())
+
+    with pytest.raises(KeyError):
+        schedule.update("missing", duration=1)
+    with pytest.raises(ValueError):
+        schedule.update("A", duration=-1)
+
+
+def test_schedule_store_evicts_least_recent():
+    store = ScheduleStore(max_entries=2)
+    schedules = [IncrementalCPM(_network()) for _ in range(3)]
+
+    store.put("p1", schedules[0])
+    store.put("p2", schedules[1])
+    assert store.get("p1") is schedules[0]
+    store.put("p3", schedules[2])
+
+    assert store.get("p2") is None
+    assert store.get("p1") is schedules[0]
+    assert store.get("p3") is schedules[2]
+    store.put("p3", schedules[2], source="sig")
+    assert store.entry("p3") == (schedules[2], "sig")
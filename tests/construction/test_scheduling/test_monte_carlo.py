@@ -0,0 +1,190 @@
+"""Tests for the vectorized network Monte Carlo engine."""
+
+import numpy as np
+import pytest
+
+from construction.scheduling import monte_carlo
+from construction.scheduling.monte_carlo import draw_uniforms, simulate, triangular_ppf
+from construction.scheduling.network import ActivitySpec, ScheduleNetwork
+
+
+def _chain_and_branch():
+    # Long chain A -> B -> D dominates the short branch A -> C -> D
+    return ScheduleNetwork(
+        [
+            ActivitySpec("A", "A", 8, 10, 12),
+            ActivitySpec("B", "B", 18, 20, 25, ("A",)),
+            ActivitySpec("C", "C", 2, 3, 4, ("A",)),
+            ActivitySpec("D", "D", 4, 5, 6, ("B", "C")),
+        ]
+    )
+
+
+def test_triangular_ppf_matches_distribution():
+    low, mode, high = np.array([2.0]), np.array([5.0]), np.array([11.0])
+    u = np.random.default_rng(0).random((1, 200_000))
+    samples = triangular_ppf(u, low, mode, high)[0]
+
+    assert samples.min() >= 2.0
+    assert samples.max() <= 11.0
+    assert samples.mean() == pytest.approx((2 + 5 + 11) / 3, abs=0.02)
+
+
+def test_criticality_index():
+    result = simulate(_chain_and_branch(), 2000, seed=1)
+    ci = result.criticality_index()
+
+    assert ci["A"] == 1.0
+    assert ci["B"] == 1.0
+    assert ci["D"] == 1.0
+    assert "C" not in ci
+    assert result.finish_digest.min >= 30
+
+
+def test_merge_bias_shifts_finish():
+    """Two equal parallel paths finish later on average than either alone."""
+    single = ScheduleNetwork([ActivitySpec("P", "P", 10, 15, 30)])
+    merged = ScheduleNetwork(
+        [ActivitySpec("P", "P", 10, 15, 30), ActivitySpec("Q", "Q", 10, 15, 30)]
+    )
+    one = simulate(single, 20_000, seed=2)
+    two = simulate(merged, 20_000, seed=2)
+
+    assert two.mean_finish > one.mean_finish + 1.5
+    assert two.criticality.sum() == pytest.approx(1.0, abs=0.01)
+
+
+def test_chunking_does_not_change_statistics():
+    network = _chain_and_branch()
+    whole = simulate(network, 3000, seed=3)
+    chunked = simulate(network, 3000, seed=3, chunk_size=7)
+
+    assert chunked.iterations == 3000
+    assert chunked.mean_finish == pytest.approx(whole.mean_finish, abs=0.3)
+    np.testing.assert_allclose(chunked.criticality, whole.criticality, atol=0.02)
+
+
+def test_large_random_network():
+    rng = np.random.default_rng(4)
+    specs = []
+    for i in range(3000):
+        preds = {f"A{j}" for j in rng.integers(max(0, i - 50), i, size=2)} if i else set()
+        mode = float(rng.integers(2, 20))
+        specs.append(ActivitySpec(f"A{i}", f"A{i}", mode * 0.8, mode, mode * 1.5, tuple(preds)))
+    network = ScheduleNetwork(specs)
+
+    result = simulate(network, 500, seed=5)
+
+    assert result.finish_digest.min >= network.deterministic_finish() * 0.8
+    assert np.all((result.criticality >= 0) & (result.criticality <= 1))
+    # Every iteration has at least one start-to-finish critical chain
+    assert result.criticality.max() == 1.0
+
+
+@pytest.mark.parametrize("sampling", ["lhs", "stratified"])
+def test_stratified_uniforms_cover_every_stratum(sampling):
+    u = draw_uniforms(np.random.default_rng(6), 3, 50, sampling)
+
+    assert u.shape == (3, 50)
+    for row in u:
+        np.testing.assert_array_equal(np.sort(np.floor(row * 50)), np.arange(50))
+
+
+def test_unknown_sampling_method_rejected():
+    with pytest.raises(ValueError, match="sampling"):
+        simulate(_chain_and_branch(), 100, sampling="sobol")
+
+
+def test_convergence_stops_early_and_reports_error():
+    result = simulate(
+        _chain_and_branch(),
+        50_000,
+        seed=7,
+        sampling="lhs",
+        tolerance=0.25,
+        batch_size=500,
+    )
+
+    assert result.converged is True
+    assert result.iterations < 50_000
+    assert result.iterations % 500 == 0
+    assert set(result.percentile_error) == {0.5, 0.8, 0.95}
+    assert max(result.percentile_error.values()) <= 0.25
+
+
+def test_convergence_cap_reports_not_converged():
+    result = simulate(
+        _chain_and_branch(), 1000, seed=8, tolerance=1e-6, batch_size=250
+    )
+
+    assert result.converged is False
+    assert result.iterations == 1000
+    assert all(err > 0 for err in result.percentile_error.values())
+
+
+def _assert_identical(a, b):
+    np.testing.assert_array_equal(a.finish_digest.means, b.finish_digest.means)
+    np.testing.assert_array_equal(a.finish_digest.weights, b.finish_digest.weights)
+    np.testing.assert_array_equal(a.overrun_counts, b.overrun_counts)
+    np.testing.assert_array_equal(a.criticality, b.criticality)
+    np.testing.assert_array_equal(a.mean_overrun, b.mean_overrun)
+    np.testing.assert_array_equal(a.mean_total_float, b.mean_total_float)
+    assert a.percentile_error == b.percentile_error
+
+
+def test_seed_reproduces_run_exactly():
+    first = simulate(_chain_and_branch(), 2500, seed=11, sampling="lhs")
+    again = simulate(_chain_and_branch(), 2500, seed=first.seed, sampling="lhs")
+    other = simulate(_chain_and_branch(), 2500, seed=12, sampling="lhs")
+
+    _assert_identical(first, again)
+    assert first.mean_finish != other.mean_finish
+
+
+def test_unseeded_run_reports_reproducible_seed():
+    first = simulate(_chain_and_branch(), 1500)
+    again = simulate(_chain_and_branch(), 1500, seed=first.seed)
+
+    assert first.seed is not None
+    _assert_identical(first, again)
+
+
+def test_process_pool_matches_in_process(monkeypatch):
+    monkeypatch.setattr(monte_carlo, "_PARALLEL_MIN_CELLS", 0)
+    network = _chain_and_branch()
+    serial = simulate(network, 5000, seed=13, tolerance=0.2, batch_size=500)
+    pooled = simulate(network, 5000, seed=13, tolerance=0.2, batch_size=500, workers=2)
+
+    _assert_identical(serial, pooled)
+    assert pooled.converged == serial.converged
+
+
+def test_streaming_percentiles_match_exact_samples():
+    result = simulate(_chain_and_branch(), 20_000, seed=14, keep_samples=True)
+    exact = np.percentile(result.finish_days, [50, 80, 95])
+
+    np.testing.assert_allclose(result.finish_digest.quantile([0.5, 0.8, 0.95]), exact, atol=0.02)
+    assert result.iterations == 20_000
+    assert result.mean_finish == pytest.approx(result.finish_days.mean())
+
+
+def test_streaming_run_keeps_no_samples():
+    result = simulate(_chain_and_branch(), 5000, seed=15)
+    counts, edges = result.finish_histogram(bins=10)
+
+    assert result.finish_days is None
+    assert counts.sum() == 5000
+    assert edges[0] == result.finish_digest.min
+    assert 0.0 < result.finish_cdf(float(result.percentiles([0.5])[0])) < 1.0
+
+
+def test_activity_overrun_histogram():
+    result = simulate(_chain_and_branch(), 4000, seed=16, histogram_bins=10)
+    counts, edges = result.overrun_histogram("B")
+
+    assert counts.sum() == 4000
+    assert edges[0] == -2.0
+    assert edges[-1] == 5.0
+    # Triangular(18, 20, 25) peaks next to the mode, tailing off to the right
+    assert np.argmax(counts) in (2, 3)
+    assert counts[0] < counts[2] and counts[-1] < counts[3]
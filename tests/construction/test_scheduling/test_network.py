@@ -0,0 +1,113 @@
+"""Tests for the array-backed schedule network."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from construction.scheduling.network import (
+    ActivitySpec,
+    ScheduleNetwork,
+    latest_start,
+    longest_path,
+)
+
+
+def _spec(activity_id, mode, preds=()):
+    return ActivitySpec(activity_id, activity_id, mode, mode, mode, tuple(preds))
+
+
+@pytest.fixture
+def diamond():
+    # A -> B -> D, A -> C -> D
+    return ScheduleNetwork(
+        [
+            _spec("D", 2, ["B", "C"]),
+            _spec("B", 5, ["A"]),
+            _spec("C", 3, ["A"]),
+            _spec("A", 4),
+        ]
+    )
+
+
+def test_levels_are_topological(diamond):
+    assert diamond.n_levels == 3
+    assert diamond.ids[diamond.level(0)] == ["A"]
+    assert sorted(diamond.ids[diamond.level(1)]) == ["B", "C"]
+    assert diamond.ids[diamond.level(2)] == ["D"]
+    for src, dst in zip(diamond.edge_src, diamond.edge_dst, strict=True):
+        assert src < dst
+
+
+def test_longest_path_and_float(diamond):
+    durations = diamond.mode_days[:, np.newaxis]
+    early_finish = longest_path(diamond, durations)
+    finish = early_finish.max(axis=0)
+    late_start = latest_start(diamond, durations, finish)
+    total_float = late_start - (early_finish - durations)
+
+    ef = dict(zip(diamond.ids, early_finish[:, 0], strict=True))
+    tf = dict(zip(diamond.ids, total_float[:, 0], strict=True))
+    assert ef == {"A": 4, "B": 9, "C": 7, "D": 11}
+    assert tf == {"A": 0, "B": 0, "C": 2, "D": 0}
+    assert diamond.deterministic_finish() == 11
+
+
+def test_cycle_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        ScheduleNetwork([_spec("A", 1, ["B"]), _spec("B", 1, ["A"])])
+
+
+def test_invalid_distribution_rejected():
+    with pytest.raises(ValueError, match="min <= mode <= max"):
+        ScheduleNetwork([ActivitySpec("A", "A", 5, 3, 8)])
+
+
+def test_from_records_rows_and_overrides():
+    rows = [
+        SimpleNamespace(
+            external_id="A1000",
+            name="Mobilization",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 21),
+            predecessors=None,
+        ),
+        SimpleNamespace(
+            external_id="A1010",
+            name="Piling",
+            start_date=date(2024, 1, 22),
+            end_date=date(2024, 2, 1),
+            predecessors=["A1000", "X-UNKNOWN"],
+        ),
+    ]
+    network = ScheduleNetwork.from_records(
+        rows, overrides={"Piling": {"min": 8, "mode": 10, "max": 30}}
+    )
+
+    i, j = network.index["A1000"], network.index["A1010"]
+    assert network.mode_days[i] == 20
+    assert network.min_days[i] == pytest.approx(17)
+    assert network.max_days[j] == 30
+    assert list(network.edge_src) == [i]
+    assert network.deterministic_finish() == 30
+
+
+def test_fingerprint_ignores_input_order(diamond):
+    reordered = ScheduleNetwork(
+        [_spec("A", 4), _spec("C", 3, ["A"]), _spec("B", 5, ["A"]), _spec("D", 2, ["B", "C"])]
+    )
+    changed = ScheduleNetwork(
+        [_spec("A", 4), _spec("C", 3, ["A"]), _spec("B", 6, ["A"]), _spec("D", 2, ["B", "C"])]
+    )
+
+    assert reordered.fingerprint == diamond.fingerprint
+    assert changed.fingerprint != diamond.fingerprint
+
+
+def test_downstream_subgraph(diamond):
+    ids = lambda nodes: {diamond.ids[k] for k in nodes}  # noqa: E731
+
+    assert ids(diamond.downstream([diamond.index["C"]])) == {"C", "D"}
+    assert ids(diamond.downstream([diamond.index["A"]])) == {"A", "B", "C", "D"}
+    assert ids(diamond.downstream([])) == set()
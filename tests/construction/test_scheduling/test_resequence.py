@@ -0,0 +1,188 @@
+"""Tests for the crew-constrained resequencing search."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from construction.scheduling.calendars import SEVEN_DAY
+from construction.scheduling.cpm import CPMActivity, CPMNetwork, Relationship
+from construction.scheduling.resequence import Resequencer, crew_capacities
+
+
+def _network(*activities):
+    return CPMNetwork(activities, calendar=SEVEN_DAY, start=date(2026, 3, 2))
+
+
+def _assert_feasible(resequencer, alternative, capacities):
+    """Links (with the alternative's relaxations), crews and the Tier rule hold."""
+    net = resequencer.network
+    start = alternative.start
+    duration = np.ceil(net.durations).astype(np.int64)
+    relaxed = {(c.predecessor, c.successor): c.overlap_lag for c in alternative.changes}
+    for e in range(len(net.edge_src)):
+        u, v = int(net.edge_src[e]), int(net.edge_dst[e])
+        lag = relaxed.get((net.ids[u], net.ids[v]))
+        if lag is None:
+            w = net._pred_end[e] * duration[u] + net.edge_lag[e] - net._succ_end[e] * duration[v]
+        else:
+            w = lag
+        assert start[v] >= start[u] + w
+    finish = int((start + duration).max())
+    for trade, capacity in capacities.items():
+        usage = np.zeros(finish + 1, dtype=np.int64)
+        for k in range(len(net)):
+            if net.trades[k] == trade:
+                usage[start[k] : start[k] + duration[k]] += min(net.crew_sizes[k], capacity)
+        assert usage.max() <= capacity
+    tier = np.zeros(finish + 1, dtype=np.int64)
+    for k in np.flatnonzero(net.tier_critical):
+        tier[start[k] : start[k] + duration[k]] += 1
+    assert tier.max() <= 1
+    assert alternative.finish == finish
+
+
+def test_serial_sgs_levels_crews():
+    # Two independent 10-day activities need 6 of 8 electricians each
+    network = _network(
+        CPMActivity("A", "Feeders", 10, trade="electrical", crew_size=6),
+        CPMActivity("B", "Branch", 10, trade="electrical", crew_size=6),
+        CPMActivity("C", "Piping", 10, trade="mechanical", crew_size=6),
+    )
+    resequencer = Resequencer(network, capacities={"electrical": 8, "mechanical": 8})
+
+    finish, start = resequencer.schedule()
+
+    starts = {activity_id: int(start[k]) for activity_id, k in network.index.items()}
+    assert finish == 20
+    assert sorted([starts["A"], starts["B"]]) == [0, 10] and starts["C"] == 0
+
+
+def test_fast_tracking_saves_days_on_the_driving_chain():
+    network = _network(
+        CPMActivity("A", "Steel", 20, trade="ironwork", crew_size=10),
+        CPMActivity("B", "MEP rough-in", 10, (Relationship("A"),), trade="mechanical"),
+        CPMActivity("C", "Close-in", 6, (Relationship("B"),)),
+    )
+    resequencer = Resequencer(network, {"ironwork": 10, "mechanical": 10})
+
+    result = resequencer.search()
+
+    assert result.baseline_finish == 36
+    assert result.exhausted
+    # B may start once A is half done, C once B is half done
+    assert [(a.finish, a.days_saved) for a in result.alternatives] == [(21, 15), (26, 10)]
+    best, quick = result.alternatives
+    assert [(c.predecessor, c.successor, c.overlap_lag) for c in best.changes] == [
+        ("A", "B", 10),
+        ("B", "C", 5),
+    ]
+    assert [(c.predecessor, c.successor) for c in quick.changes] == [("A", "B")]
+    rows = result.records()
+    assert [row["rank"] for row in rows] == [1, 2]
+    assert rows[0]["changes"][0]["new_type"] == "SS"
+    assert rows[1]["moved_activities"] == ["B", "C"]
+    for alternative in result.alternatives:
+        _assert_feasible(resequencer, alternative, {"ironwork": 10, "mechanical": 10})
+
+
+def test_crews_limit_the_overlap():
+    # A and B share one crew, so overlapping them saves nothing
+    network = _network(
+        CPMActivity("A", "Loop 1 piping", 10, trade="mechanical", crew_size=6),
+        CPMActivity(
+            "B", "Loop 2 piping", 10, (Relationship("A"),), trade="mechanical", crew_size=6
+        ),
+    )
+
+    assert Resequencer(network, {"mechanical": 8}).search().alternatives == []
+    assert Resequencer(network, {"mechanical": 12}).search().alternatives[0].days_saved == 5
+
+
+def test_tier_critical_activities_are_never_parallelized():
+    network = _network(
+        CPMActivity("A", "Cooling loop A", 10, tier_critical=True),
+        CPMActivity("B", "Cooling loop B", 10, tier_critical=True),
+        CPMActivity("C", "Loop B commissioning", 4, (Relationship("B"),), tier_critical=True),
+        CPMActivity("D", "Controls", 6, (Relationship("C"),)),
+    )
+    resequencer = Resequencer(network)
+
+    result = resequencer.search()
+
+    # The CPM runs both loops at once; the Tier rule runs them one after another
+    assert network.compute().project_finish == 20
+    assert result.baseline_finish == 30
+    # C -> D can be fast-tracked, links into C cannot
+    assert result.alternatives[0].days_saved == 2
+    for alternative in result.alternatives:
+        assert {c.successor for c in alternative.changes} == {"D"}
+        _assert_feasible(resequencer, alternative, {})
+
+
+def test_pruned_alternatives_report_their_own_finish():
+    # Fast-tracking A -> B pulls C forward into the pump skid's crew window;
+    # the climb keeps that change, pruning it finishes a day earlier
+    network = _network(
+        CPMActivity("A", "Chiller set", 8, trade="mechanical", crew_size=8),
+        CPMActivity("B", "Grout cure", 12, (Relationship("A"),)),
+        CPMActivity(
+            "C", "Chiller piping", 7, (Relationship("B"),), trade="mechanical", crew_size=8
+        ),
+        CPMActivity("D", "Pump skid", 5, trade="mechanical", crew_size=8),
+    )
+    resequencer = Resequencer(network, {"mechanical": 8})
+
+    result = resequencer.search()
+
+    assert result.baseline_finish == 27
+    best = result.alternatives[0]
+    assert [(c.predecessor, c.successor) for c in best.changes] == [("B", "C")]
+    assert best.finish == 21
+    for alternative in result.alternatives:
+        _assert_feasible(resequencer, alternative, {"mechanical": 8})
+
+
+def test_search_on_a_large_network_respects_the_budget():
+    rng = np.random.default_rng(5)
+    trades = ["electrical", "mechanical", "concrete", None]
+    activities = []
+    for i in range(2000):
+        links = sorted(set(rng.integers(max(0, i - 30), i, size=2).tolist())) if i else []
+        activities.append(
+            CPMActivity(
+                f"A{i}",
+                f"A{i}",
+                float(rng.integers(1, 15)),
+                tuple(Relationship(f"A{j}", "FS" if j % 5 else "SS", 1.0) for j in links),
+                tier_critical=i % 101 == 0,
+                trade=trades[i % 4],
+                crew_size=int(rng.integers(2, 8)),
+            )
+        )
+    capacities = {"electrical": 16, "mechanical": 12, "concrete": 10}
+    resequencer = Resequencer(_network(*activities), capacities)
+
+    result = resequencer.search(time_budget=0.5, max_alternatives=3)
+
+    assert result.alternatives
+    assert len(result.alternatives) <= 3
+    saved = [alternative.days_saved for alternative in result.alternatives]
+    assert saved == sorted(saved, reverse=True) and saved[-1] > 0
+    for alternative in result.alternatives:
+        _assert_feasible(resequencer, alternative, capacities)
+
+
+def test_crew_capacities_sums_headcount_per_trade():
+    class Row:
+        def __init__(self, trade, headcount):
+            self.trade, self.headcount = trade, headcount
+
+    assert crew_capacities(
+        [{"trade": "electrical", "headcount": 12}, Row("electrical", 6), Row("mechanical", 9)]
+    ) == {"electrical": 18, "mechanical": 9}
+
+
+def test_invalid_overlap():
+    with pytest.raises(ValueError):
+        Resequencer(_network(CPMActivity("A", "A", 1)), overlap=0)
@@ -0,0 +1,180 @@
+"""Tests for fingerprinted, cached simulation runs."""
+
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock
+
+from ai_agent.tool_cache import CachePolicy, ToolResultCache
+from construction.scheduling.network import ScheduleNetwork
+from construction.scheduling.service import (
+    SIMULATION_CACHE_NAME,
+    DatabaseSimulationStore,
+    SimulationService,
+    simulation_fingerprint,
+)
+from construction.tools.monte_carlo import MonteCarloSimulationTool
+from construction.tools.schedule import project_activity_records
+
+ACTIVITIES = [
+    {
+        "id": "A",
+        "name": "Site Prep",
+        "min": 8,
+        "mode": 10,
+        "max": 12,
+        "start_date": date(2026, 3, 2),
+    },
+    {"id": "B", "name": "Steel", "min": 18, "mode": 20, "max": 25, "predecessors": ["A"]},
+    {"id": "C", "name": "MEP", "min": 4, "mode": 5, "max": 6, "predecessors": ["B"]},
+]
+
+
+class FakeStore:
+    def __init__(self, activities=None):
+        self.activities = activities
+        self.results: dict[str, dict] = {}
+
+    async def load_activities(self, project_id):
+        return self.activities
+
+    async def get(self, fingerprint):
+        return self.results.get(fingerprint)
+
+    async def put(self, fingerprint, project_id, result):
+        self.results[fingerprint] = result
+
+
+def _service(store=None):
+    cache = ToolResultCache({SIMULATION_CACHE_NAME: CachePolicy(ttl=60)})
+    tool = MonteCarloSimulationTool()
+    tool.execute_structured = MagicMock(wraps=tool.execute_structured)
+    return SimulationService(cache, store=store, tool=tool)
+
+
+def _fingerprint(**changes):
+    args = {
+        "network": ScheduleNetwork.from_records(ACTIVITIES),
+        "overrides": None,
+        "iterations": 1000,
+        "seed": 7,
+        "start_date": date(2026, 3, 2),
+    }
+    args.update(changes)
+    return simulation_fingerprint(**args)
+
+
+def test_fingerprint_tracks_run_inputs():
+    base = _fingerprint()
+
+    assert _fingerprint() == base
+    assert _fingerprint(seed=8) != base
+    assert _fingerprint(iterations=2000) != base
+    assert _fingerprint(overrides={"B": {"max": 40}}) != base
+    assert _fingerprint(start_date=date(2026, 4, 1)) != base
+    changed = [dict(a) for a in ACTIVITIES]
+    changed[1]["max"] = 30
+    assert _fingerprint(network=ScheduleNetwork.from_records(changed)) != base
+
+
+async def test_repeat_request_is_served_from_cache():
+    service = _service(FakeStore(ACTIVITIES))
+
+    first = await service.simulate("proj-1", iterations=1000)
+    second = await service.simulate("proj-1", iterations=1000)
+
+    assert not first.is_error
+    assert second.data == first.data
+    assert first.data["fingerprint"]
+    assert first.data["p50_completion"] >= "2026-03-02"
+    assert service.tool.execute_structured.call_count == 1
+    assert service.stats() == {"hits": 1, "misses": 1, "coalesced": 0}
+
+
+async def test_concurrent_requests_share_one_run():
+    service = _service()
+
+    results = await asyncio.gather(
+        *(service.simulate("proj-1", iterations=1000, activities=ACTIVITIES) for _ in range(4))
+    )
+
+    assert len({r.data["fingerprint"] for r in results}) == 1
+    assert service.tool.execute_structured.call_count == 1
+    assert service.stats()["coalesced"] == 3
+
+
+async def test_changed_inputs_run_again():
+    service = _service(FakeStore(ACTIVITIES))
+
+    base = await service.simulate("proj-1", iterations=1000)
+    delayed = await service.simulate(
+        "proj-1", iterations=1000, overrides={"Steel": {"min": 28, "mode": 30, "max": 35}}
+    )
+
+    assert delayed.data["fingerprint"] != base.data["fingerprint"]
+    assert delayed.data["p50_completion"] > base.data["p50_completion"]
+    assert service.tool.execute_structured.call_count == 2
+
+
+async def test_stored_result_skips_simulation():
+    store = FakeStore(ACTIVITIES)
+    first = await _service(store).simulate("proj-1", iterations=1000)
+
+    # A fresh process: empty in-memory cache, same durable store
+    service = _service(store)
+    again = await service.simulate("proj-1", iterations=1000)
+
+    assert again.data == first.data
+    assert service.tool.execute_structured.call_count == 0
+    assert store.results[first.data["fingerprint"]]["run_params"]["seed"] == first.data["seed"]
+
+
+async def test_default_seed_is_stable_per_project():
+    service = _service()
+
+    a = await service.simulate("proj-1", iterations=500, activities=ACTIVITIES)
+    b = await service.simulate("proj-2", iterations=500, activities=ACTIVITIES)
+
+    assert a.data["seed"] != b.data["seed"]
+    assert a.data["fingerprint"] != b.data["fingerprint"]
+
+
+async def test_projects_sharing_a_run_keep_their_own_id():
+    store = FakeStore()
+    service = _service(store)
+
+    a = await service.simulate("proj-1", iterations=500, seed=7, activities=ACTIVITIES)
+    b = await service.simulate("proj-2", iterations=500, seed=7, activities=ACTIVITIES)
+
+    assert service.tool.execute_structured.call_count == 1
+    assert (a.data["project_id"], b.data["project_id"]) == ("proj-1", "proj-2")
+    assert "project_id" not in store.results[a.data["fingerprint"]]
+
+
+async def test_falls_back_to_the_project_cpm_schedule():
+    service = _service(FakeStore())
+
+    result = await service.simulate("proj-cpm", iterations=500)
+
+    network = ScheduleNetwork.from_records(project_activity_records("proj-cpm"))
+    assert result.data["baseline_duration_days"] == network.deterministic_finish()
+    assert "Redundant Cooling Loop Install" in result.data["criticality_index"]
+
+
+async def test_invalid_schedule_is_an_error():
+    service = _service()
+
+    result = await service.simulate(
+        "proj-1", activities=[{"id": "A", "name": "A", "min": 5, "mode": 2, "max": 6}]
+    )
+
+    assert result.is_error
+    assert service.tool.execute_structured.call_count == 0
+
+
+async def test_database_store_ignores_non_uuid_projects():
+    factory = MagicMock()
+    store = DatabaseSimulationStore(session_factory=factory)
+
+    assert await store.load_activities("PROJ-001") is None
+    await store.put("fp", "PROJ-001", {"iterations": 1})
+    factory.assert_not_called()
@@ -0,0 +1,58 @@
+"""Tests for the mergeable t-digest."""
+
+import numpy as np
+import pytest
+
+from construction.scheduling.sketch import TDigest
+
+
+def test_quantiles_track_exact_percentiles():
+    values = np.random.default_rng(0).gamma(4.0, 5.0, 50_000)
+    digest = TDigest()
+    for chunk in np.array_split(values, 50):
+        digest.update(chunk)
+
+    exact = np.percentile(values, [1, 50, 80, 95, 99])
+    np.testing.assert_allclose(digest.quantile([0.01, 0.5, 0.8, 0.95, 0.99]), exact, rtol=2e-3)
+    assert digest.count == 50_000
+    assert len(digest) < 400
+    assert digest.min == values.min()
+    assert digest.max == values.max()
+
+
+def test_merged_digests_match_single_stream():
+    values = np.random.default_rng(1).normal(100.0, 10.0, 20_000)
+    whole = TDigest()
+    whole.update(values)
+    merged = TDigest()
+    for chunk in np.array_split(values, 8):
+        part = TDigest()
+        part.update(chunk)
+        merged.merge(part)
+
+    levels = [0.5, 0.8, 0.95]
+    np.testing.assert_allclose(merged.quantile(levels), whole.quantile(levels), atol=0.05)
+    assert merged.count == whole.count
+
+
+def test_cdf_inverts_quantile():
+    digest = TDigest()
+    digest.update(np.random.default_rng(2).uniform(0.0, 10.0, 10_000))
+
+    assert digest.cdf(digest.quantile(0.8)) == pytest.approx(0.8, abs=1e-3)
+    assert digest.cdf(-1.0) == 0.0
+    assert digest.cdf(11.0) == 1.0
+
+
+def test_small_samples_are_exact():
+    digest = TDigest()
+    digest.update(np.array([3.0, 1.0, 2.0]))
+
+    assert digest.quantile(0.5) == 2.0
+    assert digest.quantile(0.0) == 1.0
+    assert digest.quantile(1.0) == 3.0
+
+
+def test_empty_digest_rejects_queries():
+    with pytest.raises(ValueError, match="empty"):
+        TDigest().quantile(0.5)
@@ -0,0 +1,176 @@
+"""Tests for schedule snapshots and the snapshot diff."""
+
+import time
+from datetime import date
+
+import numpy as np
+import pytest
+
+from construction.scheduling.calendars import SEVEN_DAY
+from construction.scheduling.cpm import CPMActivity, CPMNetwork, Relationship
+from construction.scheduling.snapshot import (
+    BASELINE,
+    UPDATE,
+    ScheduleSnapshot,
+    SnapshotStore,
+    diff_snapshots,
+)
+
+
+def _activities(**changes):
+    # A -> B -> D, A -(SS 2)-> C -(FF 1)-> D
+    activities = {
+        "A": CPMActivity("A", "Excavate", 10),
+        "B": CPMActivity("B", "Footings", 5, (Relationship("A"),)),
+        "C": CPMActivity("C", "Underground", 3, (Relationship("A", "SS", 2),)),
+        "D": CPMActivity("D", "Slab", 4, (Relationship("B"), Relationship("C", "FF", 1))),
+    }
+    activities.update(changes)
+    return [a for a in activities.values() if a is not None]
+
+
+def _snapshot(activities, **kwargs):
+    network = CPMNetwork(activities, calendar=SEVEN_DAY, start=date(2026, 3, 2))
+    return ScheduleSnapshot.from_result(network.compute(), **kwargs)
+
+
+def test_snapshot_is_sorted_and_read_only():
+    snapshot = _snapshot(list(reversed(_activities())), label="Baseline", kind=BASELINE)
+
+    assert snapshot.ids.tolist() == ["A", "B", "C", "D"]
+    assert snapshot.start[1] == np.datetime64("2026-03-12")
+    assert snapshot.project_finish == date(2026, 3, 20)
+    links = zip(snapshot.ids[snapshot.edge_pred], snapshot.ids[snapshot.edge_succ], strict=True)
+    assert sorted(p + s for p, s in links) == ["AB", "AC", "BD", "CD"]
+    with pytest.raises(ValueError):
+        snapshot.total_float[0] = 1.0
+    assert snapshot.info()["relationships"] == 4
+
+
+def test_bytes_round_trip():
+    snapshot = _snapshot(_activities(), label="Update 3")
+
+    restored = ScheduleSnapshot.from_bytes(snapshot.to_bytes())
+
+    assert restored.info() == snapshot.info()
+    for name in ("ids", "names", "start", "finish", "total_float", "edge_lag"):
+        np.testing.assert_array_equal(getattr(restored, name), getattr(snapshot, name))
+    assert not diff_snapshots(snapshot, restored).changed.any()
+
+
+def test_diff_finds_activity_changes_and_float_erosion():
+    base = _snapshot(_activities())
+    current = _snapshot(
+        _activities(
+            C=CPMActivity("C", "Underground", 6, (Relationship("A", "SS", 2),)),
+            B=None,
+            E=CPMActivity("E", "Backfill", 2, (Relationship("C"),)),
+            D=CPMActivity("D", "Slab on grade", 4, (Relationship("C", "FF", 1),)),
+        )
+    )
+
+    diff = diff_snapshots(base, current)
+
+    counts = diff.counts()
+    assert (counts["added"], counts["removed"]) == (1, 1)
+    assert current.ids[diff.added].tolist() == ["E"]
+    assert base.ids[diff.removed].tolist() == ["B"]
+    records = {r["id"]: r for r in diff.records()}
+    assert set(records) == {"C", "D"}
+    # C now drives the finish through E; D was renamed and lost its link to B
+    assert records["C"]["duration_delta_days"] == 3.0
+    assert records["C"]["float_erosion_days"] > 0 and records["C"]["is_critical"]
+    assert records["D"]["name"] == "Slab on grade"
+    assert diff.finish_delta_days == (current.project_finish - base.project_finish).days
+    common = current.ids[diff.current_common]
+    assert common[diff.became_critical].tolist() == ["C"]
+    assert common[diff.no_longer_critical].tolist() == ["D"]
+
+    delta = diff.to_delta()
+    assert delta["baseline_end"] == base.project_finish
+    assert delta["float_consumed"]["C"] == records["C"]["float_erosion_days"]
+
+
+def test_diff_finds_logic_changes():
+    base = _snapshot(_activities())
+    current = _snapshot(
+        _activities(
+            C=CPMActivity("C", "Underground", 3, (Relationship("A", "SS", 4),)),
+            D=CPMActivity("D", "Slab", 4, (Relationship("C", "FF", 1),)),
+            B=CPMActivity("B", "Footings", 5, (Relationship("A"), Relationship("C", "SS"))),
+        )
+    )
+
+    changes = diff_snapshots(base, current).logic_changes()
+
+    assert {
+        "change": "added",
+        "predecessor": "C",
+        "successor": "B",
+        "type": "SS",
+        "lag": 0.0,
+    } in changes
+    assert {
+        "change": "removed",
+        "predecessor": "B",
+        "successor": "D",
+        "type": "FS",
+        "lag": 0.0,
+    } in changes
+    (modified,) = [c for c in changes if c["change"] == "modified"]
+    assert (modified["predecessor"], modified["successor"]) == ("A", "C")
+    assert (modified["lag_was"], modified["lag"]) == (2.0, 4.0)
+
+
+def test_store_references_and_eviction():
+    store = SnapshotStore(max_per_project=3, max_projects=1)
+    baseline = _snapshot(_activities(), kind=BASELINE)
+    updates = [_snapshot(_activities(), label=f"U{i}", kind=UPDATE) for i in range(3)]
+    for snapshot in (baseline, *updates):
+        store.add("p", snapshot)
+
+    assert store.snapshots("p") == [baseline, updates[1], updates[2]]
+    assert store.get("p", "baseline") is baseline
+    assert store.get("p", "latest") is updates[2]
+    assert store.get("p", "previous") is updates[1]
+    assert store.get("p", updates[1].id) is updates[1]
+    assert store.get("p", "missing") is None
+
+    store.add("q", baseline)
+    assert store.snapshots("p") == []
+
+
+def test_diff_of_50k_activities_is_fast():
+    # 100 layers of 500; each activity follows two in the layer before
+    rng = np.random.default_rng(7)
+    n, width = 50_000, 500
+    durations = rng.integers(1, 15, n).astype(float)
+    picks = rng.integers(0, width, (n, 2))
+
+    def snapshot(durations, rewired=()):
+        activities = []
+        for i in range(n):
+            layer = (i // width - 1) * width
+            preds = () if layer < 0 else {layer + k for k in picks[i]}
+            if i in rewired:
+                preds = {layer + (k + 1) % width for k in preds}
+            links = tuple(Relationship(f"A{k}") for k in sorted(preds))
+            activities.append(CPMActivity(f"A{i}", f"A{i}", durations[i], links))
+        network = CPMNetwork(activities, calendar=SEVEN_DAY, start=date(2026, 3, 2))
+        return ScheduleSnapshot.from_result(network.compute())
+
+    base = snapshot(durations)
+    slipped = durations.copy()
+    slipped[rng.integers(0, n, 500)] += 3
+    current = snapshot(slipped, rewired=set(range(width, n, 97)))
+
+    started = time.perf_counter()
+    diff = diff_snapshots(base, current)
+    diff.summary()
+    diff.to_delta()
+    elapsed = time.perf_counter() - started
+
+    counts = diff.counts()
+    assert counts["changed"] >= 490 and counts["links_added"] > 0
+    assert counts["links_added"] == counts["links_removed"]
+    assert elapsed < 1.0
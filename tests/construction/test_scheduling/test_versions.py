@@ -0,0 +1,104 @@
+"""Tests for the schedule version service."""
+
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+
+from construction.scheduling import versions
+from construction.scheduling.snapshot import SnapshotStore
+from construction.scheduling.versions import ScheduleVersionService
+from construction.tools import schedule
+
+PROJECT = str(uuid.UUID("00000000-0000-0000-0000-000000000007"))
+
+
+class FakeRepository:
+    """ScheduleRepository over an in-memory table of version rows."""
+
+    rows: ClassVar[dict] = {}
+
+    def __init__(self, session):
+        pass
+
+    async def list_versions(self, project_id):
+        rows = [r for r in self.rows.values() if r.project_id == project_id]
+        return sorted(rows, key=lambda r: r.taken_at)
+
+    async def get_by_id(self, model_cls, id):
+        return self.rows.get(id)
+
+    async def create(self, model_cls, **kwargs):
+        self.rows[kwargs["id"]] = SimpleNamespace(**kwargs)
+
+
+@asynccontextmanager
+async def _session():
+    yield SimpleNamespace(commit=_noop)
+
+
+async def _noop():
+    pass
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    monkeypatch.setattr(FakeRepository, "rows", {})
+    monkeypatch.setattr(versions, "ScheduleRepository", FakeRepository)
+    schedule._SCHEDULES.clear()
+    yield FakeRepository
+    schedule._SCHEDULES.clear()
+
+
+async def test_snapshots_are_stored_and_loaded_back(repository):
+    service = ScheduleVersionService(SnapshotStore(), session_factory=lambda: _session())
+
+    baseline = await service.take(PROJECT, label="Baseline")
+    update = await service.take(PROJECT, label="Update 1")
+
+    assert (baseline.kind, update.kind) == ("baseline", "update")
+    assert [row.label for row in repository.rows.values()] == ["Baseline", "Update 1"]
+
+    # A fresh process only has the database rows
+    restarted = ScheduleVersionService(SnapshotStore(), session_factory=lambda: _session())
+    history = await restarted.history(PROJECT)
+    assert [info["id"] for info in history] == [baseline.id, update.id]
+    assert history[0]["relationships"] == len(baseline.edge_pred)
+
+    loaded = await restarted.get(PROJECT, "baseline")
+    assert loaded.id == baseline.id
+    assert loaded.ids.tolist() == baseline.ids.tolist()
+    assert restarted.snapshots.get(PROJECT, baseline.id) is loaded
+
+    diff = await restarted.compare(PROJECT, "baseline", "latest")
+    assert not diff.changed.any()
+
+
+async def test_compare_with_live_schedule_and_missing_refs(repository):
+    service = ScheduleVersionService(SnapshotStore(), persist=False)
+    await service.take("PROJ-001")
+    schedule.ScheduleQueryTool().execute_structured(
+        action="update_activity",
+        project_id="PROJ-001",
+        activity_id="ACT-001",
+        data={"duration": 12},
+    )
+
+    diff = await service.compare("PROJ-001")
+
+    assert diff.finish_delta_days > 0
+    with pytest.raises(LookupError):
+        await service.compare("PROJ-001", base="previous")
+
+
+async def test_database_failure_backs_off(repository):
+    factory = MagicMock(side_effect=ConnectionError("down"))
+    service = ScheduleVersionService(SnapshotStore(), session_factory=factory)
+
+    snapshot = await service.take(PROJECT)
+
+    assert await service.get(PROJECT, "latest") is snapshot
+    assert factory.call_count == 1
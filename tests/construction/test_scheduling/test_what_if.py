@@ -0,0 +1,90 @@
+"""Tests for incremental what-if simulation with common random numbers."""
+
+import numpy as np
+import pytest
+
+from construction.scheduling.network import ActivitySpec, ScheduleNetwork
+from construction.scheduling.what_if import BaselineStore, ScenarioBaseline
+
+
+def _specs(**changes):
+    # A -> B -> D -> E, A -> C -> D, plus an unrelated F
+    specs = {
+        "A": ActivitySpec("A", "Site Prep", 8, 10, 12),
+        "B": ActivitySpec("B", "Steel", 18, 20, 25, ("A",)),
+        "C": ActivitySpec("C", "Duct Bank", 2, 3, 4, ("A",)),
+        "D": ActivitySpec("D", "MEP", 4, 5, 6, ("B", "C")),
+        "E": ActivitySpec("E", "Commissioning", 3, 4, 6, ("D",)),
+        "F": ActivitySpec("F", "Landscaping", 5, 6, 8),
+    }
+    for activity_id, (low, mode, high) in changes.items():
+        spec = specs[activity_id]
+        specs[activity_id] = ActivitySpec(spec.id, spec.name, low, mode, high, spec.predecessors)
+    return list(specs.values())
+
+
+@pytest.fixture
+def baseline():
+    return ScenarioBaseline(ScheduleNetwork(_specs()), iterations=2000, seed=21)
+
+
+def test_incremental_matches_full_resimulation(baseline):
+    result = baseline.what_if({"C": {"min": 20, "mode": 24, "max": 30}})
+    full = ScenarioBaseline(ScheduleNetwork(_specs(C=(20, 24, 30))), iterations=2000, seed=21)
+
+    np.testing.assert_array_equal(result.finish_days, full.finish_days)
+    assert result.affected == ["C"]
+    # C, D and E; A, B and F come from the baseline
+    assert result.recomputed == 3
+
+
+def test_unchanged_override_has_zero_delta(baseline):
+    result = baseline.what_if({"Duct Bank": {"mode": 3}})
+
+    assert np.all(result.delta_days == 0.0)
+    assert result.probability_later() == 0.0
+
+
+def test_delay_on_driving_chain_shifts_every_iteration(baseline):
+    result = baseline.what_if({"B": {"delay_days": 7}})
+    base, scenario = result.percentiles([0.5, 0.8])
+
+    np.testing.assert_allclose(result.delta_days, 7.0, atol=1e-4)
+    np.testing.assert_allclose(scenario - base, 7.0, atol=1e-4)
+
+
+def test_delay_within_float_is_absorbed(baseline):
+    # C has ~17 days of float behind B
+    result = baseline.what_if({"C": {"delay_days": 5}})
+
+    assert result.mean_delta == 0.0
+    assert result.recomputed == 3
+
+
+def test_lhs_and_random_streams_both_reproduce():
+    network = ScheduleNetwork(_specs())
+    for sampling in ("random", "lhs"):
+        first = ScenarioBaseline(network, 500, seed=3, sampling=sampling)
+        again = ScenarioBaseline(network, 500, seed=3, sampling=sampling)
+        np.testing.assert_array_equal(first.finish_days, again.finish_days)
+
+
+def test_unknown_activity_rejected(baseline):
+    with pytest.raises(KeyError, match="Nope"):
+        baseline.what_if({"Nope": {"delay_days": 1}})
+
+
+def test_invalid_override_rejected(baseline):
+    with pytest.raises(ValueError, match="min <= mode <= max"):
+        baseline.what_if({"B": {"mode": 30}})
+
+
+def test_store_reuses_seeded_baselines():
+    store = BaselineStore(max_entries=1)
+    network = ScheduleNetwork(_specs())
+
+    first = store.get(network, 500, seed=1)
+    assert store.get(ScheduleNetwork(list(reversed(_specs()))), 500, seed=1) is first
+    assert store.get(network, 500, seed=2) is not first
+    assert store.get(network, 500, seed=1) is not first
+    assert store.get(network, 500) is not store.get(network, 500)
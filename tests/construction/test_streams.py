@@ -0,0 +1,171 @@
+"""Tests for the Redis Streams inter-agent transport."""
+
+import pytest
+import redis.asyncio as redis
+
+from construction.config import ConstructionSettings
+from construction.redis_.pubsub import AgentPubSub
+from construction.redis_.streams import AgentStreamBus, build_agent_bus
+
+
+class FakeRedis:
+    """The stream commands the bus uses, for one consumer group per stream."""
+
+    def __init__(self):
+        self.keys: set[str] = set()
+        self.streams: dict[str, list[tuple[bytes, dict]]] = {}
+        self.groups: dict[str, str] = {}
+        # stream -> entry id -> [consumer, times delivered, idle ms]
+        self.pending: dict[str, dict[bytes, list]] = {}
+        self.last_read: dict[str, int] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        async def run(keys, args):
+            if keys[0] in self.keys:
+                return 0
+            self.keys.add(keys[0])
+            await self.xadd(keys[1], {b"data": args[2].encode()})
+            return 1
+
+        return run
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        entries = self.streams.setdefault(name, [])
+        entry_id = f"{len(entries) + 1}-0".encode()
+        entries.append((entry_id, fields))
+        return entry_id
+
+    async def xgroup_create(self, name, groupname, id="$", mkstream=False):
+        if name in self.groups:
+            raise redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+        self.groups[name] = groupname
+        self.streams.setdefault(name, [])
+        self.last_read[name] = len(self.streams[name])
+        self.pending[name] = {}
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        replies = []
+        for name in streams:
+            start = self.last_read[name]
+            entries = self.streams[name][start : start + count]
+            self.last_read[name] = start + len(entries)
+            for entry_id, _ in entries:
+                self.pending[name][entry_id] = [consumername, 1, 0]
+            if entries:
+                replies.append([name.encode(), entries])
+        return replies
+
+    async def xack(self, name, groupname, *ids):
+        return sum(self.pending[name].pop(entry_id, None) is not None for entry_id in ids)
+
+    async def xpending_range(self, name, groupname, min, max, count, idle=None):
+        return [
+            {"message_id": entry_id, "consumer": c, "times_delivered": n}
+            for entry_id, (c, n, idle_ms) in self.pending[name].items()
+            if idle_ms >= idle
+        ][:count]
+
+    async def xclaim(self, name, groupname, consumername, min_idle_time, message_ids):
+        claimed = []
+        for entry_id, fields in self.streams[name]:
+            if entry_id.decode() in message_ids:
+                state = self.pending[name][entry_id]
+                state[:] = [consumername, state[1] + 1, 0]
+                claimed.append((entry_id, fields))
+        return claimed
+
+    def age(self, ms):
+        for entries in self.pending.values():
+            for state in entries.values():
+                state[2] += ms
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self._redis, n)(*a, **k) for n, a, k in self._calls]
+
+
+async def test_consumers_in_a_group_share_a_channel():
+    fake = FakeRedis()
+    seen = {"a": [], "b": []}
+    workers = {name: AgentStreamBus(fake, consumer=name, batch=2) for name in seen}
+    for name, bus in workers.items():
+        await bus.subscribe("channel:agent_events", _collect(seen[name]))
+
+    for i in range(4):
+        await workers["a"].publish("channel:agent_events", {"n": i})
+    await workers["a"].publish("channel:agent_events", {"n": 0})
+    await workers["a"].poll()
+    await workers["b"].poll()
+
+    assert seen == {"a": [0, 1], "b": [2, 3]}
+    assert fake.pending["channel:agent_events"] == {}
+
+
+async def test_failed_entry_is_reclaimed_then_dead_lettered():
+    fake = FakeRedis()
+    flaky = AgentStreamBus(fake, consumer="flaky")
+    healthy = AgentStreamBus(fake, consumer="healthy")
+    flaky.max_deliveries = healthy.max_deliveries = 2
+
+    async def fail(data):
+        raise RuntimeError("boom")
+
+    received = []
+    await flaky.subscribe("channel:escalation", fail)
+    await healthy.subscribe("channel:escalation", _collect(received))
+    await flaky.publish("channel:escalation", {"n": 1})
+    await flaky.publish("channel:escalation", {"n": 2})
+
+    await flaky.poll()
+    assert len(fake.pending["channel:escalation"]) == 2
+    # Not idle long enough to claim yet
+    assert await healthy.reclaim() == 0
+    fake.age(healthy.claim_idle_ms)
+    assert await healthy.reclaim() == 2
+    assert received == [1, 2] and fake.pending["channel:escalation"] == {}
+
+    await flaky.publish("channel:escalation", {"n": 3})
+    await flaky.poll()
+    fake.age(flaky.claim_idle_ms)
+    await flaky.reclaim()
+    fake.age(flaky.claim_idle_ms)
+    await flaky.reclaim()
+    assert fake.pending["channel:escalation"] == {}
+    assert [fields for _, fields in fake.streams["channel:escalation:dead"]] == [
+        {b"data": b'{"n": 3}'}
+    ]
+
+
+async def test_build_agent_bus_picks_transport():
+    fake = FakeRedis()
+    fake.pubsub = lambda: None
+
+    assert isinstance(build_agent_bus(fake, ConstructionSettings()), AgentPubSub)
+    streams = ConstructionSettings(event_transport="streams")
+    assert isinstance(build_agent_bus(fake, streams), AgentStreamBus)
+    with pytest.raises(ValueError, match="Unknown event transport"):
+        build_agent_bus(fake, ConstructionSettings(event_transport="kafka"))
+
+
+def _collect(into):
+    async def callback(data):
+        into.append(data["n"])
+
+    return callback
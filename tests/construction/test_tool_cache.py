@@ -0,0 +1,62 @@
+"""Tests for the Redis-backed tool result cache wiring."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import redis.asyncio as redis
+
+from construction.redis_.tool_cache import (
+    DEFAULT_CACHE_POLICIES,
+    RedisToolCacheBackend,
+    get_tool_cache,
+)
+
+
+async def test_backend_round_trip():
+    client = MagicMock()
+    client.get = AsyncMock(return_value=b'{"data":1}')
+    client.set = AsyncMock()
+    backend = RedisToolCacheBackend(client)
+
+    assert await backend.get("weather_forecast:abc") == '{"data":1}'
+    await backend.set("weather_forecast:abc", "{}", 1.5)
+
+    client.get.assert_awaited_once_with("toolcache:weather_forecast:abc")
+    client.set.assert_awaited_once_with("toolcache:weather_forecast:abc", "{}", px=1500)
+
+
+async def test_backend_backs_off_after_connection_error():
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=redis.ConnectionError("refused"))
+    backend = RedisToolCacheBackend(client)
+
+    try:
+        await backend.get("k")
+    except redis.ConnectionError:
+        pass
+
+    assert await backend.get("k") is None
+    assert client.get.await_count == 1
+
+
+def test_get_tool_cache_applies_ttl_overrides():
+    settings = MagicMock(
+        tool_cache_ttls={"risk_database": 30, "weather_forecast": 0, "icc_codes": 600},
+        tool_cache_max_entries=10,
+        tool_cache_redis=False,
+    )
+    get_tool_cache.cache_clear()
+    try:
+        with patch(
+            "construction.redis_.tool_cache.get_construction_settings",
+            return_value=settings,
+        ):
+            cache = get_tool_cache()
+    finally:
+        get_tool_cache.cache_clear()
+
+    assert "weather_forecast" not in cache.policies
+    assert cache.policies["risk_database"].ttl == 30
+    assert cache.policies["risk_database"].actions == frozenset({"query"})
+    assert cache.policies["icc_codes"].ttl == 600
+    assert cache.policies["osha_search"] == DEFAULT_CACHE_POLICIES["osha_search"]
+    assert cache.backend is None
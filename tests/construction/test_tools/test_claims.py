@@ -2,8 +2,79 @@
 
 import json
 
+import pytest
+
+from construction.tools import schedule
 from construction.tools.claims import ClaimsQuery
 
+# Fragnets on the default project schedule: the owner's redesign holds MEP
+# rough-in 14 days, rock removal precedes the foundation pour and the
+# hurricane shutdown stops steel erection 10 days in, concurrent with the
+# redesign
+DELAY_EVENTS = [
+    {
+        "id": "CLM-001",
+        "party": "Owner",
+        "description": "Owner-directed redesign of cooling loop",
+        "activities": [
+            {
+                "id": "RFI-042",
+                "name": "Owner RFI #42 response",
+                "duration": 5,
+                "predecessors": [
+                    {"id": "ACT-001", "type": "FS", "lag": 18}
+                ],
+            },
+            {
+                "id": "ASK-REV3",
+                "name": "Arch revision ASK-Rev3",
+                "duration": 13,
+                "predecessors": ["RFI-042"],
+            },
+        ],
+        "ties": [{"predecessor": "ASK-REV3", "successor": "ACT-003"}],
+    },
+    {
+        "id": "CLM-002",
+        "party": "Unassigned",
+        "description": "Unexpected rock in foundation excavation",
+        "activity": "ACT-001",
+        "days": 8,
+    },
+    {
+        "id": "CLM-003",
+        "party": "Force Majeure",
+        "description": "Hurricane warning site shutdown",
+        "activities": [
+            {
+                "id": "SHUTDOWN",
+                "name": "Hurricane shutdown",
+                "duration": 3,
+                "predecessors": [
+                    {"id": "ACT-001", "type": "FS", "lag": 10}
+                ],
+            },
+        ],
+        "ties": [
+            {
+                "predecessor": "SHUTDOWN",
+                "successor": "ACT-002",
+                "type": "FF",
+                "lag": 12,
+            }
+        ],
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_schedules():
+    schedule._SCHEDULES.clear()
+    schedule._SNAPSHOTS.clear()
+    yield
+    schedule._SCHEDULES.clear()
+    schedule._SNAPSHOTS.clear()
+
 
 def test_schema():
     """Tool schema has expected properties."""
@@ -50,14 +121,94 @@ def test_delay_analysis():
     """Delay analysis returns TIA and windows results."""
     tool = ClaimsQuery()
     result = tool.execute(
-        action="delay_analysis", project_id="PRJ-001"
+        action="delay_analysis",
+        project_id="PRJ-001",
+        events=DELAY_EVENTS,
     )
     data = json.loads(result)
     assert "delay_analyses" in data
     analyses = data["delay_analyses"]
     assert len(analyses) == 2
     assert analyses[0]["analysis_type"] == "TIA"
-    assert analyses[0]["critical_delay_days"] == 14.0
+    assert analyses[1]["analysis_type"] == "windows"
+    # Redesign 14 + rock 8; the shutdown hides behind the redesign
+    assert analyses[0]["critical_delay_days"] == 22.0
+    assert analyses[0]["concurrent_delay_days"] == 3.0
+    assert analyses[0]["responsible_party"] == "Owner"
+    owner = data["party_totals"]["Owner"]
+    assert owner["critical_delay_days"] == 14.0
+    assert owner["sole_delay_days"] == 11.0
+    assert data["party_totals"]["Force Majeure"][
+        "sole_delay_days"
+    ] == 0.0
+
+
+def test_delay_analysis_custom_events():
+    """Supplied events are tied into the supplied schedule."""
+    tool = ClaimsQuery()
+    result = tool.execute(
+        action="delay_analysis",
+        project_id="PRJ-DELAY",
+        analysis_type="tia",
+        activities=[
+            {"id": "A", "name": "Excavate", "duration": 5},
+            {
+                "id": "B",
+                "name": "Footings",
+                "duration": 5,
+                "predecessors": ["A"],
+            },
+        ],
+        events=[
+            {
+                "id": "E1",
+                "party": "Owner",
+                "activity": "A",
+                "days": 4,
+            }
+        ],
+    )
+    data = json.loads(result)
+    (analysis,) = data["delay_analyses"]
+    assert analysis["critical_delay_days"] == 4.0
+    assert analysis["affected_activities"] == ["A"]
+    assert data["party_totals"]["Owner"]["events"] == 1
+
+
+def test_delay_analysis_unknown_activity():
+    """Events tied to activities not in the schedule are errors."""
+    tool = ClaimsQuery()
+    result = tool.execute(
+        action="delay_analysis",
+        project_id="PRJ-001",
+        events=[{"id": "E1", "activity": "NOPE", "days": 4}],
+    )
+    assert result.startswith("Error:")
+    assert "NOPE" in result
+
+
+def test_delay_analysis_needs_events():
+    """Without events there is nothing to analyze, not a canned claim."""
+    result = ClaimsQuery().execute_structured(
+        action="delay_analysis", project_id="PRJ-001"
+    )
+    assert result.is_error
+    assert "needs events" in result.to_text()
+
+
+def test_delay_analysis_checks_ties_against_the_schedule():
+    """Every link to an activity the analyzed schedule lacks is reported."""
+    result = ClaimsQuery().execute_structured(
+        action="delay_analysis",
+        project_id="PRJ-OTHER",
+        activities=[{"id": "A", "name": "Excavate", "duration": 5}],
+        events=DELAY_EVENTS,
+    )
+    assert result.is_error
+    text = result.to_text()
+    assert "'CLM-001' activity 'RFI-042' follows unknown activity 'ACT-001'" in text
+    assert "'CLM-001' ties to unknown activity 'ACT-003'" in text
+    assert "'CLM-002' ties to unknown activity 'ACT-001'" in text
 
 
 def test_notices():
@@ -2,7 +2,7 @@
 
 import json
 
-from construction.tools.monte_carlo import MonteCarloSimulationTool
+from construction.tools.monte_carlo import MonteCarloSimulationTool, ScheduleWhatIfTool
 
 
 def test_monte_carlo_schema():
@@ -111,7 +111,127 @@ def test_simulation_float_consumed_has_entries():
     data = json.loads(result)
 
     fc = data["float_consumed"]
-    assert "Foundation Pour" in fc
-    assert "Commissioning" in fc
+    assert "Foundation Pour - Zone A" in fc
+    assert "Redundant Cooling Loop Install" in fc
     # Non-critical activities also tracked
-    assert "Exterior Envelope" in fc
+    assert "Landscaping - Phase 1" in fc
+
+
+def test_simulation_reports_criticality_index():
+    """Criticality index reflects the project's CPM schedule network."""
+    tool = MonteCarloSimulationTool()
+    data = tool.execute_structured(
+        project_id="PROJ-001", iterations=2000
+    ).data
+
+    ci = data["criticality_index"]
+    assert ci["Foundation Pour - Zone A"] == 1.0
+    assert ci["Redundant Cooling Loop Install"] == 1.0
+    # Landscaping has weeks of float and is never critical
+    assert "Landscaping - Phase 1" not in ci
+    assert data["baseline_duration_days"] == 90.0
+
+
+def test_simulation_custom_network():
+    """Callers can pass their own predecessor graph."""
+    tool = MonteCarloSimulationTool()
+    data = tool.execute_structured(
+        project_id="PROJ-002",
+        iterations=500,
+        activities=[
+            {"id": "A", "name": "Design", "min": 5, "mode": 5, "max": 5},
+            {
+                "id": "B",
+                "name": "Build",
+                "min": 10,
+                "mode": 10,
+                "max": 10,
+                "predecessors": ["A"],
+            },
+        ],
+    ).data
+
+    assert data["baseline_duration_days"] == 15.0
+    assert data["criticality_index"] == {"Design": 1.0, "Build": 1.0}
+
+
+def test_simulation_convergence_mode():
+    """With a tolerance the tool reports iterations actually used."""
+    tool = MonteCarloSimulationTool()
+    data = tool.execute_structured(
+        project_id="PROJ-001",
+        iterations=20000,
+        sampling="lhs",
+        tolerance_days=1.0,
+    ).data
+
+    assert data["converged"] is True
+    assert data["sampling"] == "lhs"
+    assert data["max_iterations"] == 20000
+    assert data["iterations"] < 20000
+    assert set(data["percentile_error_days"]) == {"p50", "p80", "p95"}
+    assert max(data["percentile_error_days"].values()) <= 1.0
+
+
+def test_simulation_seed_is_reproducible():
+    """Passing back a reported seed reproduces the run."""
+    tool = MonteCarloSimulationTool()
+    first = tool.execute_structured(project_id="PROJ-001", iterations=2000).data
+    again = tool.execute_structured(
+        project_id="PROJ-001", iterations=2000, seed=first["seed"]
+    ).data
+
+    for key in ("p50_completion", "p80_completion", "p95_completion",
+                "confidence", "float_consumed", "histogram"):
+        assert again[key] == first[key]
+
+
+def test_what_if_delay_on_critical_activity():
+    """A delay on the driving path moves every percentile by about the delay."""
+    tool = ScheduleWhatIfTool()
+    data = tool.execute_structured(
+        project_id="PROJ-001",
+        iterations=2000,
+        activity_durations={"ACT-004": {"delay_days": 6}},
+    ).data
+
+    assert data["affected_activities"] == ["ACT-004"]
+    assert data["recomputed_activities"] == 1
+    assert data["total_activities"] == 6
+    for level in ("p50", "p80", "p95"):
+        assert data["percentiles"][level]["delta_days"] == 6.0
+    assert data["probability_later"] == 1.0
+
+
+def test_what_if_shares_baseline_between_calls():
+    """Repeated what-ifs on one project reuse its baseline samples."""
+    tool = ScheduleWhatIfTool()
+    first = tool.execute_structured(
+        project_id="PROJ-WI",
+        iterations=1000,
+        activity_durations={"ACT-005": {"delay_days": 2}},
+    ).data
+    second = tool.execute_structured(
+        project_id="PROJ-WI",
+        iterations=1000,
+        activity_durations={"ACT-005": {"delay_days": 4}},
+    ).data
+
+    assert first["seed"] == second["seed"]
+    assert (
+        first["percentiles"]["p50"]["baseline_days"]
+        == second["percentiles"]["p50"]["baseline_days"]
+    )
+    # Landscaping has float, so a small slip moves the finish less than itself
+    assert 0 <= first["mean_delta_days"] <= second["mean_delta_days"] < 4
+
+
+def test_what_if_unknown_activity_is_error():
+    tool = ScheduleWhatIfTool()
+    result = tool.execute_structured(
+        project_id="PROJ-001",
+        activity_durations={"Nonexistent": {"delay_days": 3}},
+    )
+
+    assert result.is_error
+    assert "Nonexistent" in result.to_text()
@@ -1,6 +1,7 @@
 """Tests for the OSHA search tool."""
 
 import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.tools.osha import OshaSearch
 
@@ -96,3 +97,21 @@ def test_execute_error_handling():
     assert "Error" in result
     assert "DB unavailable" in result
     tool._mock_search = original
+
+
+@patch("construction.tools.osha.get_construction_settings")
+@patch(
+    "construction.tools.osha.OSHAClient.search_inspections",
+    new_callable=AsyncMock,
+)
+async def test_aexecute_live(mock_search, mock_settings):
+    """Live lookups call the OSHA enforcement API client."""
+    mock_settings.return_value = MagicMock(regulatory_live_lookups=True)
+    mock_search.return_value = [{"activity_nr": "123456"}]
+
+    result = await OshaSearch().aexecute(establishment="ACME", state="TX")
+
+    assert result.data["total_results"] == 1
+    mock_search.assert_awaited_once_with(
+        establishment="ACME", state="TX", sic=None
+    )
@@ -2,7 +2,23 @@
 
 import json
 
-from construction.tools.schedule import ScheduleQueryTool
+import pytest
+
+from construction.tools import schedule
+from construction.tools.schedule import (
+    ScheduleCompareTool,
+    ScheduleQueryTool,
+    ScheduleResequenceTool,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_schedules():
+    schedule._SCHEDULES.clear()
+    schedule._SNAPSHOTS.clear()
+    yield
+    schedule._SCHEDULES.clear()
+    schedule._SNAPSHOTS.clear()
 
 
 def test_schedule_tool_schema():
@@ -31,10 +47,41 @@ def test_get_critical_path():
     assert data["project_id"] == "PROJ-001"
     cp = data["critical_path"]
     assert len(cp["activities"]) == 4
-    assert cp["total_duration_days"] == 107
+    assert cp["total_duration_days"] == 76
     for act in cp["activities"]:
         assert act["is_critical"] is True
     assert "ACT-001" in cp["float_summary"]
+    assert [a["id"] for a in cp["activities"]] == [
+        "ACT-001", "ACT-002", "ACT-003", "ACT-004"
+    ]
+
+
+def test_get_critical_path_from_activities():
+    tool = ScheduleQueryTool()
+    result = tool.execute_structured(
+        action="get_critical_path",
+        project_id="PROJ-001",
+        activities=[
+            {"id": "A", "name": "Pour", "duration": 5},
+            {
+                "id": "B",
+                "name": "Cure",
+                "duration": 3,
+                "predecessors": [
+                    {"id": "A", "type": "SS", "lag": 1}
+                ],
+            },
+            {
+                "id": "C",
+                "name": "Strip",
+                "duration": 2,
+                "predecessors": ["A"],
+            },
+        ],
+    )
+    cp = result.data["critical_path"]
+    assert [a["id"] for a in cp["activities"]] == ["A", "C"]
+    assert cp["total_duration_days"] == 7
 
 
 def test_get_activity():
@@ -73,6 +120,72 @@ def test_update_activity():
     assert "end_date" in data["updated_fields"]
 
 
+def test_update_activity_repropagates_schedule():
+    tool = ScheduleQueryTool()
+    result = tool.execute_structured(
+        action="update_activity",
+        project_id="PROJ-001",
+        activity_id="ACT-006",
+        data={"duration": 20},
+    ).data
+
+    assert result["finish_delta_days"] == 3.0
+    assert result["became_critical"] == ["ACT-006"]
+    assert "ACT-005" not in result["changed_activities"]
+
+    # Later queries see the edited schedule
+    cp = tool.execute_structured(
+        action="get_critical_path", project_id="PROJ-001"
+    ).data["critical_path"]
+    assert cp["total_duration_days"] == 79
+    assert "ACT-006" in cp["float_summary"]
+
+
+def test_supplied_activities_update_the_cached_schedule():
+    tool = ScheduleQueryTool()
+    rows = schedule.default_schedule_records()
+
+    def finish(activities):
+        return tool.execute_structured(
+            action="get_critical_path",
+            project_id="PROJ-DB",
+            activities=activities,
+        ).data["critical_path"]["total_duration_days"]
+
+    assert finish(rows) == 76
+    cached = schedule._SCHEDULES.get("PROJ-DB")
+    tool.execute_structured(
+        action="update_activity",
+        project_id="PROJ-DB",
+        activity_id="ACT-006",
+        data={"duration": 20},
+        activities=rows,
+    )
+    # The same rows again keep the edit rather than rebuilding
+    assert finish(rows) == 79
+    # A changed row is applied to the cached schedule
+    rows[0] = {**rows[0], "duration": 12}
+    assert finish(rows) == 81
+    assert schedule._SCHEDULES.get("PROJ-DB") is cached
+
+    # A changed link rebuilds the network from the rows
+    rows[5] = {**rows[5], "predecessors": ["ACT-002"]}
+    assert finish(rows) == 78
+    assert schedule._SCHEDULES.get("PROJ-DB") is not cached
+
+
+def test_update_activity_unknown():
+    tool = ScheduleQueryTool()
+    result = tool.execute_structured(
+        action="update_activity",
+        project_id="PROJ-001",
+        activity_id="ACT-999",
+        data={"duration": 5},
+    )
+    assert result.is_error
+    assert "ACT-999" in result.to_text()
+
+
 def test_update_activity_missing_id():
     tool = ScheduleQueryTool()
     result = tool.execute(
@@ -91,9 +204,27 @@ def test_get_float_report():
     data = json.loads(result)
     assert data["project_id"] == "PROJ-001"
     report = data["float_report"]
-    assert len(report) == 3
+    assert len(report) == 6
     statuses = {r["status"] for r in report}
     assert statuses == {"critical", "healthy", "warning"}
+    floats = [r["total_float"] for r in report]
+    assert floats == sorted(floats)
+    elevator = next(
+        r for r in report if r["activity_id"] == "ACT-006"
+    )
+    assert elevator["total_float"] == 3.0
+    assert elevator["status"] == "warning"
+
+
+def test_get_activity_unknown():
+    tool = ScheduleQueryTool()
+    result = tool.execute_structured(
+        action="get_activity",
+        project_id="PROJ-001",
+        activity_id="ACT-999",
+    )
+    assert result.is_error
+    assert "ACT-999" in result.to_text()
 
 
 def test_unknown_action():
@@ -103,3 +234,123 @@ def test_unknown_action():
     )
     assert "Error" in result
     assert "invalid_action" in result
+
+
+def test_resequence_default_schedule():
+    tool = ScheduleResequenceTool()
+    result = tool.execute_structured(project_id="PROJ-001")
+    data = result.data
+    assert data["baseline_duration_days"] == 76
+    assert data["search_complete"] is True
+    best = data["alternatives"][0]
+    assert best["days_saved"] == 11
+    # Links into tier-critical activities are never relaxed
+    assert [
+        (c["predecessor"], c["successor"])
+        for c in best["changes"]
+    ] == [("ACT-002", "ACT-003")]
+    assert best["tier_critical_moved"] == ["ACT-004"]
+
+
+def test_resequence_respects_crews():
+    tool = ScheduleResequenceTool()
+    activities = [
+        {
+            "id": "A",
+            "name": "Loop 1 piping",
+            "duration": 10,
+            "trade": "mechanical",
+            "crew_size": 6,
+        },
+        {
+            "id": "B",
+            "name": "Loop 2 piping",
+            "duration": 10,
+            "trade": "mechanical",
+            "crew_size": 6,
+            "predecessors": ["A"],
+        },
+    ]
+    tight = tool.execute_structured(
+        project_id="P",
+        activities=activities,
+        crews=[{"trade": "mechanical", "headcount": 8}],
+    )
+    assert tight.data["alternatives"] == []
+    roomy = tool.execute_structured(
+        project_id="P",
+        activities=activities,
+        crews=[
+            {"trade": "mechanical", "headcount": 8},
+            {"trade": "mechanical", "headcount": 4},
+        ],
+    )
+    assert roomy.data["crews"] == {"mechanical": 12}
+    assert roomy.data["alternatives"][0]["days_saved"] == 5
+
+
+def test_resequence_after_update_uses_current_durations():
+    query = ScheduleQueryTool()
+    query.execute_structured(
+        action="update_activity",
+        project_id="PROJ-001",
+        activity_id="ACT-002",
+        data={"duration": 30},
+    )
+    data = ScheduleResequenceTool().execute_structured(
+        project_id="PROJ-001"
+    ).data
+    assert data["baseline_duration_days"] == 84
+    # Half of the longer steel erection can now overlap
+    assert data["alternatives"][0]["days_saved"] == 15
+
+
+def test_resequence_invalid_overlap():
+    result = ScheduleResequenceTool().execute_structured(
+        project_id="PROJ-001", overlap=2
+    )
+    assert result.is_error
+
+
+def test_compare_against_baseline_snapshot():
+    tool = ScheduleCompareTool()
+    first = tool.execute_structured(
+        action="snapshot", project_id="PROJ-001", label="BL"
+    ).data["snapshot"]
+    second = tool.execute_structured(
+        action="snapshot", project_id="PROJ-001"
+    ).data["snapshot"]
+    assert (first["kind"], second["kind"]) == ("baseline", "update")
+
+    ScheduleQueryTool().execute_structured(
+        action="update_activity",
+        project_id="PROJ-001",
+        activity_id="ACT-006",
+        data={"duration": 20},
+    )
+    data = tool.execute_structured(
+        action="compare", project_id="PROJ-001"
+    ).data
+
+    assert data["base"]["id"] == first["id"]
+    assert data["current"]["label"] == "current"
+    assert data["project_finish_delta_days"] > 0
+    assert data["became_critical"] == ["ACT-006"]
+    changed = {a["id"]: a for a in data["changed_activities"]}
+    assert changed["ACT-006"]["duration_delta_days"] == 6.0
+    assert changed["ACT-006"]["float_erosion_days"] == 3.0
+    assert data["delta"]["float_consumed"] == {"ACT-006": 3.0}
+    assert data["delta"]["projected_end"] > data["delta"]["baseline_end"]
+
+    listed = tool.execute_structured(
+        action="list", project_id="PROJ-001"
+    ).data["snapshots"]
+    assert [s["id"] for s in listed] == [first["id"], second["id"]]
+
+
+def test_compare_missing_snapshot():
+    result = ScheduleCompareTool().execute_structured(
+        action="compare", project_id="PROJ-001", base="previous"
+    )
+    assert result.is_error
+    assert "previous" in result.to_text()
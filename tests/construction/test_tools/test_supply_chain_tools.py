@@ -1,6 +1,7 @@
 """Tests for the supply chain monitor tool."""
 
 import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.tools.supply_chain_tools import SupplyChainMonitor
 
@@ -149,3 +150,28 @@ def test_unknown_action():
     )
     assert "Error" in result
     assert "unknown action" in result
+
+
+@patch("construction.tools.supply_chain_tools.get_construction_settings")
+@patch(
+    "construction.tools.supply_chain_tools.Terminal49Client.get_milestones",
+    new_callable=AsyncMock,
+)
+@patch(
+    "construction.tools.supply_chain_tools.Terminal49Client.get_shipment",
+    new_callable=AsyncMock,
+)
+async def test_track_shipment_live(mock_shipment, mock_milestones, mock_settings):
+    """track_shipment queries Terminal49 when an API key is configured."""
+    mock_settings.return_value = MagicMock(terminal49_api_key="t49-key")
+    mock_shipment.return_value = {"id": "abc", "attributes": {"status": "in_transit"}}
+    mock_milestones.return_value = [{"event": "vessel_departed"}]
+
+    result = await SupplyChainMonitor().aexecute(
+        action="track_shipment", project_id="PRJ-001", shipment_id="abc"
+    )
+
+    shipment = result.data["shipments"][0]
+    assert shipment["details"]["attributes"]["status"] == "in_transit"
+    assert shipment["milestones"] == [{"event": "vessel_departed"}]
+    mock_shipment.assert_awaited_once_with("abc")
@@ -1,7 +1,7 @@
 """Tests for the weather forecast tool."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from construction.tools.weather import WeatherForecast
 
@@ -69,30 +69,33 @@ def test_execute_caps_at_14_days(mock_settings):
     assert len(data["forecast"]) == 14
 
 
+_ONECALL = {
+    "daily": [
+        {
+            "dt": 1700000000,
+            "temp": {"max": 80, "min": 60},
+            "pop": 0.2,
+            "rain": 5.0,
+            "wind_speed": 12,
+            "wind_gust": 25,
+            "weather": [{"description": "scattered clouds"}],
+        }
+    ],
+    "alerts": [],
+}
+
+
 @patch("construction.tools.weather.get_construction_settings")
-@patch("construction.tools.weather.httpx")
-def test_execute_live_api(mock_httpx_mod, mock_settings):
+@patch(
+    "construction.tools.weather.OpenWeatherMapClient.get_daily_forecast",
+    new_callable=AsyncMock,
+)
+def test_execute_live_api(mock_forecast, mock_settings):
     """Execute calls OpenWeatherMap when API key is configured."""
     mock_settings.return_value = MagicMock(
         openweathermap_api_key="test-key-123"
     )
-    mock_resp = MagicMock()
-    mock_resp.json.return_value = {
-        "daily": [
-            {
-                "dt": 1700000000,
-                "temp": {"max": 80, "min": 60},
-                "pop": 0.2,
-                "rain": 5.0,
-                "wind_speed": 12,
-                "wind_gust": 25,
-                "weather": [{"description": "scattered clouds"}],
-            }
-        ],
-        "alerts": [],
-    }
-    mock_resp.raise_for_status = MagicMock()
-    mock_httpx_mod.get.return_value = mock_resp
+    mock_forecast.return_value = _ONECALL
 
     tool = WeatherForecast()
     result = tool.execute(latitude=29.76, longitude=-95.37, days=1)
@@ -100,7 +103,27 @@ def test_execute_live_api(mock_httpx_mod, mock_settings):
 
     assert len(data["forecast"]) == 1
     assert data["forecast"][0]["temp_high_f"] == 80
-    mock_httpx_mod.get.assert_called_once()
+    mock_forecast.assert_awaited_once_with(29.76, -95.37)
+
+
+@patch("construction.tools.weather.get_construction_settings")
+@patch(
+    "construction.tools.weather.OpenWeatherMapClient.get_daily_forecast",
+    new_callable=AsyncMock,
+)
+async def test_aexecute_live_api(mock_forecast, mock_settings):
+    """aexecute awaits the async client on the running loop."""
+    mock_settings.return_value = MagicMock(
+        openweathermap_api_key="test-key-123"
+    )
+    mock_forecast.return_value = _ONECALL
+
+    result = await WeatherForecast().aexecute(
+        latitude=29.76, longitude=-95.37, days=1
+    )
+
+    assert result.data["forecast"][0]["description"] == "scattered clouds"
+    mock_forecast.assert_awaited_once()
 
 
 @patch("construction.tools.weather.get_construction_settings")
@@ -111,9 +134,10 @@ def test_execute_live_api_error(mock_settings):
     )
 
     with patch(
-        "construction.tools.weather.httpx"
-    ) as mock_httpx:
-        mock_httpx.get.side_effect = Exception("Connection timeout")
+        "construction.tools.weather.OpenWeatherMapClient.get_daily_forecast",
+        new_callable=AsyncMock,
+    ) as mock_forecast:
+        mock_forecast.side_effect = Exception("Connection timeout")
         tool = WeatherForecast()
         result = tool.execute(
             latitude=29.76, longitude=-95.37
@@ -0,0 +1,306 @@
+"""Tests for cross-agent trigger queues and the trigger executor."""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+
+from construction.agents.orchestrator import Orchestrator
+from construction.agents.rules import load_rules
+from construction.agents.runtime import (
+    OrchestratorRuntime,
+    build_agents,
+    start_orchestrator_runtime,
+)
+from construction.agents.triggers import LocalTriggerQueue, TriggerExecutor
+from construction.config import ConstructionSettings
+from construction.redis_.pubsub import AGENT_EVENTS
+from construction.redis_.trigger_queue import (
+    RedisTriggerQueue,
+    build_trigger_executor,
+)
+from construction.schemas.common import AgentEvent
+from construction.schemas.orchestrator import CrossAgentTrigger
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeAgent:
+    def __init__(self, gate: asyncio.Event | None = None):
+        self.contexts = []
+        self.cancelled = 0
+        self.gate = gate
+
+    async def run(self, context):
+        self.contexts.append(context)
+        if self.gate:
+            try:
+                await self.gate.wait()
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+
+
+class FakeRedis:
+    """The sorted set and list commands the Redis trigger queue uses."""
+
+    def __init__(self):
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.lists: dict[str, list[bytes]] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def zadd(self, name, mapping, lt=False):
+        zset = self.zsets.setdefault(name, {})
+        for member, score in mapping.items():
+            if not lt or member not in zset or score < zset[member]:
+                zset[member] = score
+
+    async def zrangebyscore(self, name, low, high, start=0, num=None, withscores=False):
+        items = sorted(self.zsets.get(name, {}).items(), key=lambda kv: kv[1])
+        return [(m.encode(), s) for m, s in items][start : start + num]
+
+    async def zrem(self, name, member):
+        return int(self.zsets.get(name, {}).pop(member, None) is not None)
+
+    async def rpush(self, name, value):
+        self.lists.setdefault(name, []).append(value.encode())
+
+    async def lrange(self, name, start, end):
+        return list(self.lists.get(name, []))
+
+    async def delete(self, name):
+        return int(self.lists.pop(name, None) is not None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self._redis, n)(*a, **k) for n, a, k in self._calls]
+
+
+def _trigger(agent="critical_path", action="reoptimize", priority=3, **data):
+    return CrossAgentTrigger(
+        source_agent="supply_chain",
+        source_event_type="critical_delay",
+        target_agent=agent,
+        target_action=action,
+        data=data,
+        priority=priority,
+    )
+
+
+async def test_triggers_coalesce_within_the_window():
+    clock = Clock()
+    queue = LocalTriggerQueue(window=30, clock=clock)
+
+    await queue.push([_trigger(delay_days=d, project_id="P1") for d in range(5)])
+    await queue.push([_trigger(project_id="P2")])
+
+    assert len(queue) == 2
+    assert await queue.pop() is None
+    clock.now += 30
+    batch = await queue.pop()
+    assert (batch.target_agent, batch.target_action, batch.count) == (
+        "critical_path",
+        "reoptimize",
+        5,
+    )
+    assert batch.data == {"delay_days": 4, "project_id": "P1"}
+    assert batch.sources == ["supply_chain.critical_delay"]
+    assert batch.context()["coalesced_triggers"] == 5
+
+
+async def test_queue_orders_by_priority_and_runs_safety_at_once():
+    clock = Clock()
+    queue = LocalTriggerQueue(window=30, clock=clock)
+
+    await queue.push([_trigger("supply_chain", "expedite_check", 4)])
+    await queue.push([_trigger("workforce", "affected_workers", 2)])
+    await queue.push([_trigger("site_logistics", "halt_operations", 1)])
+
+    assert (await queue.pop(busy={"site_logistics"})).target_agent == "site_logistics"
+    assert await queue.pop() is None
+    clock.now += 30
+    assert await queue.pop(busy={"workforce"}) is not None
+    assert (await queue.pop()).target_agent == "workforce"
+
+
+async def test_executor_coalesces_and_limits_concurrency():
+    gate = asyncio.Event()
+    agent = FakeAgent(gate)
+    executor = TriggerExecutor(
+        LocalTriggerQueue(window=0), {"critical_path": agent}, concurrency={"critical_path": 1}
+    )
+
+    await executor.submit([_trigger(project_id="P1") for _ in range(5)])
+    await executor.submit([_trigger(project_id="P2")])
+    await executor.dispatch()
+    await asyncio.sleep(0)
+
+    # One run per project, one at a time
+    assert len(executor.running("critical_path")) == 1
+    assert agent.contexts[0]["coalesced_triggers"] == 5
+    gate.set()
+    await executor.drain()
+    assert [c["project_id"] for c in agent.contexts] == ["P1", "P2"]
+    assert (executor.stats.triggers, executor.stats.runs, executor.stats.coalesced) == (6, 2, 4)
+
+
+async def test_safety_trigger_preempts_lower_priority_run():
+    gate = asyncio.Event()
+    agent = FakeAgent(gate)
+    executor = TriggerExecutor(LocalTriggerQueue(window=0), {"site_logistics": agent})
+
+    await executor.submit([_trigger("site_logistics", "schedule_adjustment", 3)])
+    await executor.dispatch()
+    await asyncio.sleep(0)
+    await executor.submit([_trigger("site_logistics", "halt_operations", 1)])
+    await executor.dispatch()
+
+    assert [b.target_action for b in executor.running()] == ["halt_operations"]
+    assert agent.cancelled == 1 and executor.stats.preempted == 1
+    gate.set()
+    await executor.drain()
+    assert [c["trigger_action"] for c in agent.contexts] == [
+        "schedule_adjustment",
+        "halt_operations",
+        "schedule_adjustment",
+    ]
+
+
+async def test_failed_run_and_unknown_agent():
+    class Broken:
+        async def run(self, context):
+            raise RuntimeError("boom")
+
+    executor = TriggerExecutor(LocalTriggerQueue(window=0), {"critical_path": Broken()})
+
+    await executor.submit([_trigger(), _trigger("nobody", "wake")])
+    await executor.drain()
+
+    assert executor.stats.failed == 1 and executor.stats.unknown_agent == 1
+    assert executor.running() == []
+
+
+async def test_redis_queue_coalesces_and_claims(monkeypatch):
+    redis = FakeRedis()
+    queue = RedisTriggerQueue(redis, window=30)
+    now = [1_800_000_000_000]
+    monkeypatch.setattr("construction.redis_.trigger_queue._now_ms", lambda: now[0])
+
+    await queue.push([_trigger(project_id="P1", delay_days=d) for d in range(3)])
+    await queue.push([_trigger("compliance", "focused_check", 1)])
+
+    safety = await queue.pop(busy={"compliance"})
+    assert (safety.target_agent, safety.priority) == ("compliance", 1)
+    assert await queue.pop() is None
+    now[0] += 30_000
+    batch = await queue.pop()
+    assert (batch.count, batch.data["delay_days"]) == (3, 2)
+    assert redis.zsets["triggers:queue"] == {} and redis.lists == {}
+
+    await queue.requeue(batch)
+    assert (await queue.pop()).count == 3
+
+
+async def test_orchestrator_submits_triggers():
+    settings = ConstructionSettings(trigger_coalesce_window=0)
+    agent = FakeAgent()
+    executor = build_trigger_executor({"critical_path": agent}, settings)
+    orchestrator = Orchestrator(settings, None, None, {}, executor=executor)
+    event = AgentEvent(
+        event_id=str(uuid.uuid4()),
+        source_agent="supply_chain",
+        event_type="critical_delay",
+        severity="warning",
+        timestamp=datetime.now(UTC),
+        data={"impact_dollars": 1000},
+        confidence=0.9,
+    )
+
+    for _ in range(3):
+        await orchestrator.handle_event(event)
+    await executor.drain()
+
+    assert len(agent.contexts) == 1
+    assert agent.contexts[0]["triggered_by"] == ["supply_chain.critical_delay"]
+
+
+class FakeBus:
+    def __init__(self):
+        self.callbacks = {}
+        self.listening = False
+
+    async def subscribe(self, channel, callback):
+        self.callbacks[channel] = callback
+
+    async def start_listening(self):
+        self.listening = True
+
+    async def stop(self):
+        self.listening = False
+
+
+async def test_runtime_runs_triggers_for_bus_events():
+    settings = ConstructionSettings(trigger_coalesce_window=0)
+    agent = FakeAgent()
+    executor = build_trigger_executor({"critical_path": agent}, settings)
+    bus = FakeBus()
+    runtime = OrchestratorRuntime(
+        Orchestrator(settings, None, bus, {}, executor=executor), bus, executor
+    )
+    event = AgentEvent(
+        event_id=str(uuid.uuid4()),
+        source_agent="supply_chain",
+        event_type="critical_delay",
+        severity="warning",
+        timestamp=datetime.now(UTC),
+        data={"impact_dollars": 1000},
+        confidence=0.9,
+    )
+
+    await runtime.start()
+    await bus.callbacks[AGENT_EVENTS](event.model_dump(mode="json"))
+    await executor.drain()
+    await runtime.stop()
+
+    assert len(agent.contexts) == 1
+    assert not bus.listening and executor._loop_task is None
+
+
+def test_build_agents_covers_rule_targets():
+    settings = ConstructionSettings()
+    agents = build_agents(settings)
+
+    assert {t.agent for rule in load_rules(settings) for t in rule.targets} <= agents.keys()
+    assert agents["compliance"] is agents["compliance_verifier"]
+
+
+async def test_runtime_is_skipped_without_redis():
+    client = redis.Redis(host="127.0.0.1", port=1, retry=Retry(NoBackoff(), 0))
+
+    assert await start_orchestrator_runtime(ConstructionSettings(), client, agents={}) is None
+    await client.aclose()
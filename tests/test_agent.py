@@ -1,10 +1,25 @@
 """Tests for the Agent class and tools."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from ai_agent.agent import Agent
+import pytest
+
+from ai_agent.agent import Agent, get_tool_executor, shutdown_tool_executors
 from ai_agent.config import Settings
-from ai_agent.tools import Calculator, CurrentTime, ToolRegistry, WebSearch
+from ai_agent.tool_cache import CachePolicy, ToolResultCache
+from ai_agent.tools import (
+    AsyncTool,
+    Calculator,
+    CurrentTime,
+    StructuredTool,
+    ToolRegistry,
+    ToolResult,
+    WebSearch,
+    shutdown_tool_bridge,
+)
 
 
 def make_settings(**overrides) -> Settings:
@@ -44,6 +59,63 @@ def test_tool_registry_to_api_format():
         assert "input_schema" in t
 
 
+def test_tool_registry_cached_api_format_is_frozen():
+    registry = ToolRegistry()
+    registry.register(Calculator())
+    registry.register(CurrentTime())
+
+    cached = registry.to_cached_api_format()
+    assert registry.to_cached_api_format() is cached
+    assert cached[-1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in cached[0]
+    # The uncached format is left untouched
+    assert all("cache_control" not in t for t in registry.to_api_format())
+
+    registry.register(WebSearch())
+    refrozen = registry.to_cached_api_format()
+    assert refrozen is not cached
+    assert len(refrozen) == 3
+    assert refrozen[-1]["name"] == "web_search"
+
+
+class _ReportTool(StructuredTool):
+    name = "report"
+    description = "Returns a structured report."
+
+    def __init__(self):
+        self.payload = {"activities": [{"id": "ACT-001", "float": 0.0}], "note": "ok — done"}
+
+    def get_input_schema(self) -> dict:
+        return {"type": "object", "properties": {}}
+
+    def execute_structured(self, **kwargs) -> ToolResult:
+        return ToolResult(self.payload)
+
+
+def test_structured_tool_returns_data_without_copy():
+    tool = _ReportTool()
+    result = tool.execute_structured()
+    assert result.data is tool.payload
+    assert not result.is_error
+
+
+def test_structured_tool_compact_text():
+    tool = _ReportTool()
+    text = tool.execute()
+    assert text == '{"activities":[{"id":"ACT-001","float":0.0}],"note":"ok — done"}'
+    assert json.loads(text) == tool.payload
+    result = tool.execute_structured()
+    assert result.to_text() is result.to_text()  # rendered once, then cached
+
+
+def test_text_tool_structured_wrapper():
+    calc = Calculator()
+    result = calc.execute_structured(expression="6 * 7")
+    assert result.to_text() == "42"
+    assert result.data is None
+    assert calc.execute_structured(expression="1 +").is_error
+
+
 def test_calculator_basic_ops():
     calc = Calculator()
     assert calc.execute(expression="2 + 3") == "5"
@@ -172,6 +244,57 @@ def test_agent_reset():
         assert agent.conversation == []
 
 
+def test_agent_prompt_caching_request_and_usage():
+    """System prompt and tools are sent as cacheable prefixes; usage is tallied."""
+    settings = make_settings()
+    registry = ToolRegistry()
+    registry.register(Calculator())
+
+    with patch("ai_agent.agent.Anthropic") as mock_cls:
+        mock_client = MagicMock()
+        mock_cls.return_value = mock_client
+
+        text_block = MagicMock()
+        text_block.type = "text"
+        text_block.text = "Hi"
+        mock_response = MagicMock()
+        mock_response.content = [text_block]
+        mock_response.stop_reason = "end_of_turn"
+        mock_response.usage.input_tokens = 12
+        mock_response.usage.output_tokens = 5
+        mock_response.usage.cache_creation_input_tokens = 0
+        mock_response.usage.cache_read_input_tokens = 1500
+        mock_client.messages.create.return_value = mock_response
+
+        agent = Agent(settings=settings, tool_registry=registry, system_prompt="Be brief.")
+        agent.chat("Hello")
+
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs["system"] == [
+            {"type": "text", "text": "Be brief.", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert kwargs["tools"] is registry.to_cached_api_format()
+        assert agent.last_usage == {
+            "input_tokens": 12,
+            "output_tokens": 5,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 1500,
+        }
+
+
+def test_agent_prompt_caching_disabled():
+    settings = make_settings(prompt_caching=False)
+    registry = ToolRegistry()
+    registry.register(Calculator())
+
+    with patch("ai_agent.agent.Anthropic"):
+        agent = Agent(settings=settings, tool_registry=registry, system_prompt="Be brief.")
+        kwargs = agent._request_kwargs(agent._tools_param())
+
+    assert kwargs["system"] == "Be brief."
+    assert "cache_control" not in kwargs["tools"][0]
+
+
 # --- Agent agentic loop tests ---
 
 
@@ -226,6 +349,42 @@ def test_agent_tool_use_loop():
         assert tool_result_msg["content"][0]["content"] == "4"
 
 
+class _CountingCalculator(Calculator):
+    def __init__(self):
+        self.calls = 0
+
+    def execute(self, **kwargs) -> str:
+        self.calls += 1
+        return super().execute(**kwargs)
+
+
+def test_agent_chat_tool_calls_use_the_registry_cache():
+    """chat() runs tools through the registry, so repeated calls hit its cache."""
+    calculator = _CountingCalculator()
+    registry = ToolRegistry(cache=ToolResultCache({"calculator": CachePolicy(ttl=60)}))
+    registry.register(calculator)
+
+    with patch("ai_agent.agent.Anthropic") as mock_cls:
+        mock_client = MagicMock()
+        mock_cls.return_value = mock_client
+        tool_response = MagicMock()
+        tool_response.content = [
+            _tool_use_block("calculator", "tool_1", {"expression": "2 + 2"}),
+            _tool_use_block("calculator", "tool_2", {"expression": "2 + 2"}),
+        ]
+        tool_response.stop_reason = "tool_use"
+        final_response = MagicMock()
+        final_response.content = []
+        final_response.stop_reason = "end_of_turn"
+        mock_client.messages.create.side_effect = [tool_response, final_response]
+
+        agent = Agent(settings=make_settings(), tool_registry=registry)
+        agent.chat("What is 2 + 2, twice?")
+
+    assert [call["result"] for call in agent.last_tool_calls] == ["4", "4"]
+    assert calculator.calls == 1
+
+
 def test_agent_unknown_tool():
     """If Claude requests an unknown tool, return an error message."""
     settings = make_settings()
@@ -263,3 +422,158 @@ def test_agent_unknown_tool():
 
         assert result == "Sorry, that tool is not available."
         assert agent.last_tool_calls[0]["result"].startswith("Error:")
+
+
+# --- Async agentic loop tests ---
+
+
+class _BarrierTool(CurrentTime):
+    """Sync tool that only finishes once every tool sharing its barrier runs."""
+
+    def __init__(self, name: str, barrier: threading.Barrier):
+        self.name = name
+        self.barrier = barrier
+
+    def execute(self, **kwargs) -> str:
+        # Raises BrokenBarrierError unless the other tools run alongside
+        self.barrier.wait()
+        return f"{self.name} done"
+
+
+class _AsyncEchoTool(AsyncTool):
+    """Async tool awaited directly on the event loop."""
+
+    name = "async_echo"
+    description = "Echo text back."
+
+    def get_input_schema(self) -> dict:
+        return {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    async def aexecute(self, **kwargs) -> ToolResult:
+        await asyncio.sleep(0.01)
+        return ToolResult.from_text(f"echo {kwargs['text']}")
+
+
+def _tool_use_block(name: str, block_id: str, tool_input: dict | None = None):
+    block = MagicMock()
+    block.type = "tool_use"
+    block.name = name
+    block.input = tool_input or {}
+    block.id = block_id
+    return block
+
+
+async def test_agent_achat_runs_tools_concurrently():
+    """All tool_use blocks of a turn run at once and keep tool_use_id order."""
+    settings = make_settings()
+    registry = ToolRegistry()
+    barrier = threading.Barrier(2, timeout=5)
+    registry.register(_BarrierTool("slow_a", barrier))
+    registry.register(_BarrierTool("slow_b", barrier))
+    registry.register(_AsyncEchoTool())
+
+    with patch("ai_agent.agent.AsyncAnthropic") as mock_cls:
+        mock_client = MagicMock()
+        mock_cls.return_value = mock_client
+
+        tool_response = MagicMock()
+        tool_response.content = [
+            _tool_use_block("slow_a", "tu_1"),
+            _tool_use_block("slow_b", "tu_2"),
+            _tool_use_block("async_echo", "tu_3", {"text": "hi"}),
+            _tool_use_block("missing", "tu_4"),
+        ]
+        tool_response.stop_reason = "tool_use"
+
+        text_block = MagicMock()
+        text_block.type = "text"
+        text_block.text = "All done."
+        final_response = MagicMock()
+        final_response.content = [text_block]
+        final_response.stop_reason = "end_of_turn"
+
+        mock_client.messages.create = AsyncMock(side_effect=[tool_response, final_response])
+
+        agent = Agent(settings=settings, tool_registry=registry)
+        result = await agent.achat("Run everything")
+
+    assert result == "All done."
+    tool_results = agent.conversation[2]["content"]
+    assert [r["tool_use_id"] for r in tool_results] == ["tu_1", "tu_2", "tu_3", "tu_4"]
+    assert [r["content"] for r in tool_results[:3]] == [
+        "slow_a done",
+        "slow_b done",
+        "echo hi",
+    ]
+    assert tool_results[3]["content"].startswith("Error: unknown tool")
+    assert [c["tool"] for c in agent.last_tool_calls] == [
+        "slow_a",
+        "slow_b",
+        "async_echo",
+        "missing",
+    ]
+
+
+def test_tool_executor_is_shared_until_shutdown():
+    """Agents share one sync-tool pool per size; shutdown releases it."""
+    pool = get_tool_executor(3)
+
+    assert get_tool_executor(3) is pool
+    shutdown_tool_executors()
+    assert pool._shutdown
+    assert get_tool_executor(3) is not pool
+    shutdown_tool_executors()
+
+
+async def test_registry_aexecute_dispatch():
+    """Async tools are awaited natively; sync tools run off the loop thread."""
+    registry = ToolRegistry()
+    registry.register(_AsyncEchoTool())
+    registry.register(Calculator())
+
+    echoed = await registry.aexecute("async_echo", {"text": "hi"})
+    summed = await registry.aexecute("calculator", {"expression": "2 + 3"})
+    missing = await registry.aexecute("nope", {})
+
+    assert echoed.to_text() == "echo hi"
+    assert summed.to_text() == "5"
+    assert missing.is_error
+
+
+class _LoopTool(AsyncTool):
+    name = "loop"
+    description = "Reports the loop it ran on."
+
+    def get_input_schema(self) -> dict:
+        return {"type": "object", "properties": {}}
+
+    async def aexecute(self, **kwargs) -> ToolResult:
+        return ToolResult(asyncio.get_running_loop())
+
+
+def test_async_tool_sync_bridge():
+    """execute() drives aexecute to completion outside an event loop."""
+    assert _AsyncEchoTool().execute(text="sync") == "echo sync"
+
+
+def test_async_tool_sync_bridge_reuses_one_loop_until_shutdown():
+    tool = _LoopTool()
+    loop = tool.execute_structured().data
+
+    assert tool.execute_structured().data is loop
+    closed = []
+
+    async def cleanup():
+        closed.append(asyncio.get_running_loop())
+
+    shutdown_tool_bridge(cleanup)
+
+    assert closed == [loop] and loop.is_closed()
+    assert tool.execute_structured().data is not loop
+    shutdown_tool_bridge()
+
+
+async def test_async_tool_sync_bridge_refuses_a_running_loop():
+    """Blocking a coroutine on execute() would stall its loop; aexecute is the way."""
+    with pytest.raises(RuntimeError, match="aexecute"):
+        _AsyncEchoTool().execute(text="nested")
@@ -0,0 +1,85 @@
+"""Tests for the shared Anthropic client registry."""
+
+import asyncio
+
+import pytest
+from anthropic import Anthropic, AsyncAnthropic
+
+from ai_agent.agent import Agent
+from ai_agent.clients import (
+    aclose_shared_clients,
+    close_shared_clients,
+    get_shared_client,
+)
+from ai_agent.config import Settings
+
+
+def make_settings(**overrides) -> Settings:
+    defaults = {"anthropic_api_key": "test-key", "max_tokens": 100}
+    defaults.update(overrides)
+    return Settings(**defaults)
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    close_shared_clients()
+    yield
+    close_shared_clients()
+
+
+def test_sync_client_shared_across_agents():
+    settings = make_settings()
+    first = Agent(settings=settings)
+    second = Agent(settings=make_settings())
+
+    assert first.client is second.client
+    assert get_shared_client(Anthropic, settings) is first.client
+
+
+def test_pool_config_applied():
+    settings = make_settings(http_max_connections=7, http_max_keepalive_connections=3)
+    client = get_shared_client(Anthropic, settings)
+    pool = client._client._transport._pool
+
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+
+
+def test_distinct_keys_get_distinct_clients():
+    a = get_shared_client(Anthropic, make_settings(anthropic_api_key="key-a"))
+    b = get_shared_client(Anthropic, make_settings(anthropic_api_key="key-b"))
+    c = get_shared_client(Anthropic, make_settings(anthropic_api_key="key-a", http2=False))
+
+    assert a is not b
+    assert a is not c
+
+
+async def test_async_client_shared_within_loop():
+    settings = make_settings()
+    first = Agent(settings=settings)
+    second = Agent(settings=settings)
+
+    client = first.async_client
+    assert client is second.async_client
+    assert isinstance(client, AsyncAnthropic)
+
+    await aclose_shared_clients()
+    assert client.is_closed()
+    assert first.async_client is not client
+
+
+def test_async_client_scoped_per_event_loop():
+    settings = make_settings()
+
+    async def lookup():
+        return get_shared_client(AsyncAnthropic, settings)
+
+    loop_a = asyncio.new_event_loop()
+    loop_b = asyncio.new_event_loop()
+    try:
+        client_a = loop_a.run_until_complete(lookup())
+        assert loop_a.run_until_complete(lookup()) is client_a
+        assert loop_b.run_until_complete(lookup()) is not client_a
+    finally:
+        loop_a.close()
+        loop_b.close()
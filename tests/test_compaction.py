@@ -0,0 +1,134 @@
+"""Tests for token-budgeted conversation compaction."""
+
+from unittest.mock import MagicMock, patch
+
+from ai_agent.agent import Agent
+from ai_agent.compaction import (
+    ConversationCompactor,
+    estimate_tokens,
+    split_turns,
+)
+from ai_agent.config import Settings
+
+
+def _tool_turn(prompt: str, tool_id: str, payload: str) -> list[dict]:
+    """A user prompt, a tool_use request, its result, and a final answer."""
+    return [
+        {"role": "user", "content": prompt},
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "tool_use", "id": tool_id, "name": "risk_database", "input": {}},
+            ],
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": tool_id, "content": payload},
+            ],
+        },
+        {"role": "assistant", "content": [{"type": "text", "text": "Done."}]},
+    ]
+
+
+def _conversation(turns: int, payload_chars: int = 4000) -> list[dict]:
+    messages = []
+    for i in range(turns):
+        messages += _tool_turn(f"Analyze risks run {i}", f"tu_{i}", "x" * payload_chars)
+    return messages
+
+
+def _tool_pairs_valid(messages: list[dict]) -> bool:
+    """Every tool_use id has a matching tool_result in the next message."""
+    for i, msg in enumerate(messages):
+        if msg["role"] != "assistant" or not isinstance(msg["content"], list):
+            continue
+        use_ids = {b["id"] for b in msg["content"] if b.get("type") == "tool_use"}
+        if not use_ids:
+            continue
+        nxt = messages[i + 1]["content"]
+        result_ids = {b["tool_use_id"] for b in nxt if b.get("type") == "tool_result"}
+        if use_ids != result_ids:
+            return False
+    return True
+
+
+def test_split_turns_keeps_tool_pairs_together():
+    turns = split_turns(_conversation(3))
+    assert len(turns) == 3
+    assert all(len(turn) == 4 for turn in turns)
+
+
+def test_under_budget_is_noop():
+    messages = _conversation(2, payload_chars=100)
+    result = ConversationCompactor(token_budget=10_000).compact(messages)
+    assert not result.compacted
+    assert result.messages == messages
+    assert result.tokens_before == result.tokens_after
+
+
+def test_elides_stale_tool_results_first():
+    messages = _conversation(4)
+    budget = estimate_tokens(messages) * 2 // 3
+    result = ConversationCompactor(token_budget=budget, keep_recent_turns=2).compact(messages)
+
+    assert result.elided_results == 2
+    assert result.dropped_turns == 0
+    assert result.tokens_after < result.tokens_before
+    assert _tool_pairs_valid(result.messages)
+    stale = result.messages[2]["content"][0]["content"]
+    assert stale.startswith("[elided 4000 chars")
+    # Recent turns keep their payloads
+    assert result.messages[-2]["content"][0]["content"] == "x" * 4000
+    # The caller's list is untouched
+    assert messages[2]["content"][0]["content"] == "x" * 4000
+
+
+def test_drops_oldest_turns_when_elision_is_not_enough():
+    messages = _conversation(6)
+    result = ConversationCompactor(token_budget=2_100, keep_recent_turns=2).compact(messages)
+
+    assert result.elided_results > 0
+    assert result.dropped_turns > 0
+    assert result.tokens_after <= 2_100
+    assert result.messages[0]["role"] == "user"
+    assert result.messages[0]["content"].startswith("[Earlier conversation compacted")
+    assert "Analyze risks run 0" in result.summary
+    assert _tool_pairs_valid(result.messages)
+    assert len(split_turns(result.messages)) >= 2
+
+
+def test_sliding_window_policy():
+    messages = _conversation(5, payload_chars=10)
+    compactor = ConversationCompactor(token_budget=0, max_turns=2, summarizer=lambda t: "S")
+    result = compactor.compact(messages)
+
+    assert result.dropped_turns == 3
+    assert len(split_turns(result.messages)) == 2
+    assert result.messages[0]["content"] == "S\n\nAnalyze risks run 3"
+
+
+def test_agent_compacts_before_each_chat():
+    settings = Settings(
+        anthropic_api_key="test-key",
+        max_tokens=100,
+        context_token_budget=1_500,
+        context_keep_turns=1,
+    )
+    with patch("ai_agent.agent.Anthropic") as mock_cls:
+        text_block = MagicMock()
+        text_block.type = "text"
+        text_block.text = "ok"
+        response = MagicMock()
+        response.content = [text_block]
+        response.stop_reason = "end_of_turn"
+        mock_cls.return_value.messages.create.return_value = response
+
+        agent = Agent(settings=settings)
+        agent.conversation = _conversation(3)
+        agent.chat("Next question")
+
+    assert agent.last_compaction.tokens_before > 1_500
+    assert agent.last_compaction.tokens_after <= 1_500
+    assert agent.conversation[-2] == {"role": "user", "content": "Next question"}
+    assert _tool_pairs_valid(agent.conversation)
@@ -0,0 +1,216 @@
+"""Tests for the shared tool result cache."""
+
+import asyncio
+
+import pytest
+
+from ai_agent.tool_cache import CachePolicy, ToolResultCache, cache_key
+from ai_agent.tools import AsyncTool, ToolRegistry, ToolResult
+
+
+class _CountingTool(AsyncTool):
+    """Async tool that records how many times it actually ran."""
+
+    name = "forecast"
+    description = "Fake forecast."
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def get_input_schema(self) -> dict:
+        return {"type": "object", "properties": {}}
+
+    async def aexecute(self, **kwargs) -> ToolResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if kwargs.get("fail"):
+            return ToolResult.error("Error: upstream down")
+        return ToolResult({"lat": kwargs.get("lat"), "call": self.calls})
+
+
+class _DictBackend:
+    """In-memory stand-in for the Redis tier."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self.store[key] = value
+
+
+def _registry(tool, **cache_kwargs) -> ToolRegistry:
+    policies = cache_kwargs.pop("policies", {"forecast": CachePolicy(ttl=60)})
+    registry = ToolRegistry(cache=ToolResultCache(policies, **cache_kwargs))
+    registry.register(tool)
+    return registry
+
+
+def test_cache_key_normalizes_input():
+    assert cache_key("t", {"a": 1, "b": 2}) == cache_key("t", {"b": 2, "a": 1})
+    assert cache_key("t", {"a": 1, "b": None}) == cache_key("t", {"a": 1})
+    assert cache_key("t", {"a": 1}) != cache_key("u", {"a": 1})
+
+
+async def test_hit_after_miss():
+    tool = _CountingTool()
+    registry = _registry(tool)
+
+    first = await registry.aexecute("forecast", {"lat": 29.7})
+    second = await registry.aexecute("forecast", {"lat": 29.7})
+    other = await registry.aexecute("forecast", {"lat": 30.1})
+
+    assert first is second
+    assert other.data["call"] == 2
+    assert tool.calls == 2
+    assert registry.cache.stats()["forecast"] == {"hits": 1, "misses": 2, "coalesced": 0}
+
+
+def test_sync_execute_goes_through_the_cache():
+    tool = _CountingTool()
+    registry = _registry(tool)
+
+    first = registry.execute("forecast", {"lat": 29.7})
+    second = registry.execute("forecast", {"lat": 29.7})
+
+    assert first is second
+    assert tool.calls == 1
+    assert registry.execute("missing", {}).is_error
+
+
+async def test_concurrent_calls_coalesce():
+    tool = _CountingTool(delay=0.05)
+    registry = _registry(tool)
+
+    results = await asyncio.gather(
+        *(registry.aexecute("forecast", {"lat": 29.7}) for _ in range(5))
+    )
+
+    assert tool.calls == 1
+    assert all(r is results[0] for r in results)
+    assert registry.cache.stats()["forecast"]["coalesced"] == 4
+
+
+async def test_ttl_expiry():
+    tool = _CountingTool()
+    registry = _registry(tool, policies={"forecast": CachePolicy(ttl=0.01)})
+
+    await registry.aexecute("forecast", {"lat": 1})
+    await asyncio.sleep(0.02)
+    await registry.aexecute("forecast", {"lat": 1})
+
+    assert tool.calls == 2
+
+
+async def test_errors_and_unlisted_tools_not_cached():
+    tool = _CountingTool()
+    registry = _registry(tool, policies={})
+
+    await registry.aexecute("forecast", {"lat": 1})
+    await registry.aexecute("forecast", {"lat": 1})
+    assert tool.calls == 2
+
+    registry = _registry(tool)
+    await registry.aexecute("forecast", {"fail": True})
+    await registry.aexecute("forecast", {"fail": True})
+    assert tool.calls == 4
+
+
+async def test_write_actions_bypass_and_invalidate():
+    tool = _CountingTool()
+    registry = _registry(
+        tool, policies={"forecast": CachePolicy(ttl=60, actions=frozenset({"query"}))}
+    )
+
+    await registry.aexecute("forecast", {"action": "query"})
+    await registry.aexecute("forecast", {"action": "update"})
+    await registry.aexecute("forecast", {"action": "query"})
+
+    assert tool.calls == 3
+
+
+async def test_write_is_visible_through_the_backend():
+    class _Store(_CountingTool):
+        value = 1
+
+        async def aexecute(self, **kwargs) -> ToolResult:
+            self.calls += 1
+            if kwargs.get("action") == "update":
+                self.value += 1
+            return ToolResult({"v": self.value})
+
+    backend = _DictBackend()
+    tool = _Store()
+    policies = {"forecast": CachePolicy(ttl=60, actions=frozenset({"query"}))}
+    worker_a = _registry(tool, policies=policies, backend=backend)
+    worker_b = _registry(tool, policies=policies, backend=backend)
+
+    assert (await worker_a.aexecute("forecast", {"action": "query"})).data == {"v": 1}
+    await worker_a.aexecute("forecast", {"action": "update"})
+
+    assert (await worker_a.aexecute("forecast", {"action": "query"})).data == {"v": 2}
+    # Another worker reads the new generation's shared entry
+    assert (await worker_b.aexecute("forecast", {"action": "query"})).data == {"v": 2}
+    assert tool.calls == 3
+
+
+async def test_lru_eviction():
+    tool = _CountingTool()
+    registry = _registry(tool, max_entries=2)
+
+    for lat in (1, 2, 3, 1):
+        await registry.aexecute("forecast", {"lat": lat})
+
+    assert tool.calls == 4
+
+
+async def test_backend_shared_between_caches():
+    backend = _DictBackend()
+    tool_a, tool_b = _CountingTool(), _CountingTool()
+    worker_a = _registry(tool_a, backend=backend)
+    worker_b = _registry(tool_b, backend=backend)
+
+    first = await worker_a.aexecute("forecast", {"lat": 29.7})
+    second = await worker_b.aexecute("forecast", {"lat": 29.7})
+
+    assert tool_b.calls == 0
+    assert second.data == first.data
+    assert worker_b.cache.stats()["forecast"]["hits"] == 1
+
+
+async def test_backend_failure_falls_back_to_tool():
+    class _Broken:
+        async def get(self, key):
+            raise ConnectionError("down")
+
+        async def set(self, key, value, ttl):
+            raise ConnectionError("down")
+
+    tool = _CountingTool()
+    registry = _registry(tool, backend=_Broken())
+
+    result = await registry.aexecute("forecast", {"lat": 1})
+
+    assert result.data["call"] == 1
+
+
+async def test_tool_exception_propagates_to_waiters():
+    class _Boom(_CountingTool):
+        async def aexecute(self, **kwargs) -> ToolResult:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+    registry = _registry(_Boom())
+
+    results = await asyncio.gather(
+        registry.aexecute("forecast", {}),
+        registry.aexecute("forecast", {}),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await registry.aexecute("forecast", {})